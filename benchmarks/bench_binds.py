@@ -0,0 +1,96 @@
+"""
+Benchmark da consulta de binds feita a cada gesto reconhecido.
+
+O "antes" reproduz `__execute_acao_gesto` antigo: `do_bind_exist`, `get_bind`, `get_time_pressed` e
+`get_toggle`, cada um relendo `binds_salvas.json`. O "depois" usa `DataBindsSalvas.get_bind_record`.
+O banco usado contém as 26 binds de Libras embutidas mais `--custom` binds sintéticas.
+"""
+from common import preparar_ambiente, medir, imprimir_resultado
+import tempfile
+import argparse
+import random
+import json
+import time
+import os
+
+preparar_ambiente()
+
+from src.data.binds.data_binds_salvas import DataBindsSalvas
+
+
+def criar_banco(caminho: str, quantidade_custom: int) -> list:
+    """
+    Cria um banco de binds com as binds de Libras embutidas e binds custom sintéticas.
+
+    Returns:
+        list: Os nomes de todos os gestos do banco.
+    """
+    with open(DataBindsSalvas.data_file, "r") as file:
+        binds = {nome: dados for nome, dados in json.load(file).items() if nome.startswith("Libras_")}
+
+    gerador = random.Random(42)
+    teclas = "abcdefghijklmnopqrstuvwxyz0123456789"
+    for i in range(quantidade_custom):
+        binds[f"custom_{i}"] = {
+            "bind": gerador.choice(teclas),
+            "modo_toggle": gerador.random() < 0.5,
+            "tempo_pressionado": gerador.randint(0, 10),
+            "customizable": True
+        }
+
+    with open(caminho, "w") as file:
+        json.dump(binds, file, indent=4)
+    return list(binds)
+
+
+def consulta_antiga(nome: str) -> tuple:
+    """
+    Consulta no formato antigo: quatro leituras completas do arquivo JSON.
+    """
+    resultado = None
+    for _ in range(4):
+        with open(DataBindsSalvas.data_file, "r") as file:
+            binds = json.load(file)
+        resultado = binds.get(nome)
+    if resultado is None:
+        return None
+    return resultado.get("bind"), resultado.get("tempo_pressionado", 5), resultado.get("modo_toggle", False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--custom", type=int, default=3000)
+    parser.add_argument("--consultas", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        caminho = os.path.join(temp_dir, "binds_salvas.json")
+        nomes = criar_banco(caminho, args.custom)
+        DataBindsSalvas.data_file = caminho
+
+        inicio = time.perf_counter()
+        DataBindsSalvas.read_database()
+        compilacao_ms = (time.perf_counter() - inicio) * 1e3
+        print(f"{len(nomes)} binds compiladas em {compilacao_ms:.2f} ms")
+
+        gerador = random.Random(7)
+        consultas = [gerador.choice(nomes) for _ in range(1024)]
+
+        def iterar(funcao):
+            indice = [0]
+            def chamada():
+                funcao(consultas[indice[0] & 1023])
+                indice[0] += 1
+            return chamada
+
+        for nome in consultas[:50]:
+            record = DataBindsSalvas.get_bind_record(nome)
+            assert consulta_antiga(nome) == (record.bind, record.tempo_pressionado, record.modo_toggle)
+
+        antes = medir(iterar(consulta_antiga), max(args.consultas // 20, 10))
+        depois = medir(iterar(DataBindsSalvas.get_bind_record), args.consultas * 50)
+        imprimir_resultado("consulta de bind por gesto", antes, depois)
+
+
+if __name__ == "__main__":
+    main()
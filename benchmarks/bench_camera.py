@@ -0,0 +1,60 @@
+"""
+Teste de carga do pipeline completo da `Camera` (captura -> MediaPipe -> gestos -> renderização)
+sem webcam, usando uma fonte de frames sintética, um vídeo ou uma pasta de imagens.
+
+Exemplos:
+
+    python benchmarks/bench_camera.py --segundos 5
+    python benchmarks/bench_camera.py --video gravacao.mp4 --rapido
+"""
+from common import preparar_ambiente
+import argparse
+import asyncio
+import json
+import time
+
+preparar_ambiente()
+
+from src.camera.frame_source import SyntheticSource, VideoFileSource, ImageDirSource
+from src.camera.camera_manager import Camera
+
+
+async def executar(source, segundos: float) -> dict:
+    camera = Camera(source)
+    await camera.start()
+    inicio = time.perf_counter()
+    while time.perf_counter() - inicio < segundos and not source.esgotado:
+        await asyncio.sleep(0.1)
+    decorrido = time.perf_counter() - inicio
+    camera.stop()
+
+    metricas = camera.get_metricas()
+    metricas["fps_captura"] = metricas["frames_capturados"] / decorrido
+    metricas["fps_inferencia"] = metricas["inferencia_ms"]["total"] / decorrido
+    return metricas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=5.0)
+    parser.add_argument("--video", help="Arquivo de video usado como fonte.")
+    parser.add_argument("--imagens", help="Pasta de imagens usada como fonte.")
+    parser.add_argument("--largura", type=int, default=640)
+    parser.add_argument("--altura", type=int, default=480)
+    parser.add_argument("--rapido", action="store_true", help="Le os frames o mais rapido possivel, sem respeitar o FPS.")
+    args = parser.parse_args()
+
+    tempo_real = not args.rapido
+    if args.video:
+        source = VideoFileSource(args.video, tempo_real=tempo_real)
+    elif args.imagens:
+        source = ImageDirSource(args.imagens, tempo_real=tempo_real)
+    else:
+        source = SyntheticSource(args.largura, args.altura, tempo_real=tempo_real)
+
+    metricas = asyncio.run(executar(source, args.segundos))
+    print(json.dumps(metricas, indent=2))
+
+
+if __name__ == "__main__":
+    main()
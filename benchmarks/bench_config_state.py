@@ -0,0 +1,95 @@
+"""
+Micro-benchmark do custo por frame do ConfigRouter/ConfigStateManager.
+
+Um frame com duas mãos faz duas escritas (`nome_gesto_direita`/`nome_gesto_esquerda`, vindas do
+GestureReader/GestureInterpretador) e duas leituras (`Camera.__draw_hand`). O "antes" reproduz o
+acesso antigo, que abria e decodificava `estado_atual.json` a cada chamada.
+"""
+from common import preparar_ambiente, medir, imprimir_resultado
+import tempfile
+import argparse
+import json
+import os
+
+preparar_ambiente()
+
+from src.data.configs.states.config_states_manager import ConfigStateManager
+from src.logger.logger import Logger
+
+data_logger = Logger.configure_json_data_logger()
+
+
+class LegacyFileStateStore:
+    """
+    Reprodução do ConfigStateManager antigo: cada leitura e escrita faz round-trip no arquivo JSON.
+    """
+    def __init__(self, file_path: str, state: dict):
+        self.config_file = file_path
+        with open(self.config_file, "w") as file:
+            json.dump(state, file, indent=4)
+
+    def read_atribute(self, atributo: str) -> str:
+        with open(self.config_file, "r") as file:
+            valor = json.load(file).get(atributo, "")
+        data_logger.info(f"Atributo '{atributo}' lido com valor: '{valor}'")
+        return valor
+
+    def update_atribute(self, atributo: str, novo_valor: str) -> None:
+        with open(self.config_file, "r") as file:
+            config = json.load(file)
+        if config.get(atributo) == novo_valor:
+            data_logger.info(f"Atributo '{atributo}' ja esta atualizado com valor: '{novo_valor}'")
+            return
+        config[atributo] = novo_valor
+        with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(self.config_file), delete=False) as temp_file:
+            json.dump(config, temp_file, indent=4)
+            temp_file_path = temp_file.name
+        os.replace(temp_file_path, self.config_file)
+        data_logger.info(f"Atributo '{atributo}' atualizado para: '{novo_valor}'")
+
+
+def simular_frames(store, gestos: list):
+    """
+    Retorna uma função que simula um frame com duas mãos a cada chamada.
+    """
+    contador = [0]
+
+    def frame():
+        gesto = gestos[contador[0] % len(gestos)]
+        contador[0] += 1
+        store.update_atribute("nome_gesto_direita", gesto)
+        store.update_atribute("nome_gesto_esquerda", "MAO")
+        store.read_atribute("nome_gesto_direita")
+        store.read_atribute("nome_gesto_esquerda")
+
+    return frame
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+
+    # Gestos mudando a cada frame (pior caso) e o mesmo gesto mantido (caso comum)
+    cenarios = {
+        "gesto muda a cada frame": ["Libras_A", "Libras_B", "Libras_C"],
+        "gesto mantido": ["Libras_A"],
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for nome, gestos in cenarios.items():
+            legacy = LegacyFileStateStore(os.path.join(temp_dir, "legacy.json"), {
+                "nome_gesto_direita": "MAO", "nome_gesto_esquerda": "MAO",
+                "x_ultima_pos_cursor": 0, "y_ultima_pos_cursor": 0
+            })
+            store = ConfigStateManager(os.path.join(temp_dir, "estado_atual.json"))
+
+            antes = medir(simular_frames(legacy, gestos), args.frames)
+            depois = medir(simular_frames(store, gestos), args.frames)
+            store.flush()
+
+            imprimir_resultado(f"por frame ({nome})", antes, depois)
+
+
+if __name__ == "__main__":
+    main()
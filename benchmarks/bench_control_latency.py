@@ -0,0 +1,114 @@
+"""
+Latência de ida e volta das mensagens de controle (`ping`) do `DataWebsocketServer` enquanto a
+detecção inicia e enquanto o stream de frames roda, com um cliente de frames conectado.
+
+Compara o stream original (espera do primeiro frame com `time.sleep` no event loop e loop de envio
+sem pausa) com o stream atual, que espera os frames novos pelo `AsyncFrameSignal`.
+
+    python benchmarks/bench_control_latency.py --segundos 4
+"""
+from common import preparar_ambiente
+import argparse
+import asyncio
+import json
+import time
+
+preparar_ambiente()
+
+import websockets
+
+from src.camera.frame_source import SyntheticSource
+from src.camera.camera_stream import CameraStream
+from src.pipeline.metrics import RollingStats
+from src.websockets.frames_websocket.frame_protocol import FrameProtocol
+from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+from src.websockets.data_websocket.data_websocket import DataWebsocketServer
+
+
+class StreamLegado(CameraStream):
+    """
+    `start_stream` e loop de envio originais.
+    """
+
+    async def start_stream(self) -> None:
+        self.stop_flag.clear()
+        await self.camera_capture.start()
+        while self.camera_capture.frame is None:
+            time.sleep(0.25)
+        asyncio.create_task(self.__stream_frames_legado())
+
+    async def __stream_frames_legado(self) -> None:
+        loop = asyncio.get_event_loop()
+
+        def codificar():
+            seq, timestamp, frame = self.camera_capture.frame_renderizado
+            return FrameProtocol.codificar(frame, seq, timestamp)
+
+        while not self.stop_flag.is_set():
+            frame = await loop.run_in_executor(None, codificar)
+            await self.frames_sender.send_frame(frame)
+            time.sleep(0.00001)
+
+
+async def cliente_frames(porta: int, parar: asyncio.Event) -> None:
+    async with websockets.connect(f"ws://localhost:{porta}", max_size=None) as websocket:
+        await websocket.send(json.dumps({"FORMAT": "binary"}))
+        while not parar.is_set():
+            try:
+                await asyncio.wait_for(websocket.recv(), 0.2)
+            except asyncio.TimeoutError:
+                pass
+
+
+async def pingar(websocket, stats: RollingStats, segundos: float) -> None:
+    inicio = time.perf_counter()
+    while time.perf_counter() - inicio < segundos:
+        enviado = time.perf_counter()
+        await websocket.send(json.dumps({"ping": True}))
+        while "pong" not in json.loads(await websocket.recv()):
+            pass
+        stats.adicionar((time.perf_counter() - enviado) * 1000)
+        await asyncio.sleep(0.01)
+
+
+async def executar(classe_stream, porta: int, segundos: float) -> dict:
+    frames_server = FramesWebsocketServer(porta + 1)
+    data_server = DataWebsocketServer(porta, frames_server)
+    data_server.camera_stream = classe_stream(frames_server, SyntheticSource(1280, 720, fps=30.0))
+    parar = asyncio.Event()
+    inicializacao, stream = RollingStats(), RollingStats()
+
+    async with websockets.serve(data_server.handler, "localhost", porta), \
+            websockets.serve(frames_server.handler, "localhost", porta + 1, max_size=None):
+        tarefa_frames = asyncio.create_task(cliente_frames(porta + 1, parar))
+        async with websockets.connect(f"ws://localhost:{porta}") as controle, \
+                websockets.connect(f"ws://localhost:{porta}") as pings:
+            await controle.send(json.dumps({"START_DETECTION": True}))
+            await pingar(pings, inicializacao, 1.5)
+            await pingar(pings, stream, segundos)
+            await controle.send(json.dumps({"STOP_DETECTION": True}))
+            await asyncio.sleep(0.3)
+        parar.set()
+        await tarefa_frames
+
+    return {"inicializacao": inicializacao.resumo(), "stream": stream.resumo()}
+
+
+def imprimir(nome: str, resultado: dict) -> None:
+    for fase, resumo in resultado.items():
+        print(f"{nome:<16} {fase:<14} pings: {resumo['total']:4d} | RTT p50 {resumo['p50']:7.2f} ms | "
+              f"p95 {resumo['p95']:7.2f} ms | max {resumo['max']:7.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=4.0)
+    parser.add_argument("--porta", type=int, default=8780)
+    args = parser.parse_args()
+
+    imprimir("stream original", asyncio.run(executar(StreamLegado, args.porta, args.segundos)))
+    imprimir("stream atual", asyncio.run(executar(CameraStream, args.porta + 2, args.segundos)))
+
+
+if __name__ == "__main__":
+    main()
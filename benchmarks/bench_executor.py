@@ -0,0 +1,77 @@
+"""
+Benchmark do LatestFrameExecutor contra uma thread por frame.
+
+Simula o loop de detecção enviando frames das duas mãos a 30 fps, com uma interpretação que às
+vezes demora mais que o intervalo entre frames (como quando um input é executado). Mede quantas
+threads ficam vivas, quantos frames são descartados e a latência do envio até o fim da interpretação.
+"""
+from common import preparar_ambiente
+import argparse
+import threading
+import time
+
+preparar_ambiente()
+
+from src.pipeline.latest_frame_executor import LatestFrameExecutor
+from src.pipeline.metrics import RollingStats
+
+FPS = 30.0
+
+
+def interpretar(frame: int) -> None:
+    # A cada 10 frames, a interpretação demora ~4 frames
+    time.sleep(0.13 if frame % 10 == 0 else 0.005)
+
+
+def simular(enviar, segundos: float) -> int:
+    """
+    Envia frames das duas mãos a 30 fps e retorna o maior número de threads vivas observado.
+    """
+    pico = threading.active_count()
+    for frame in range(int(FPS * segundos)):
+        for mao in ("Right", "Left"):
+            enviar(mao, frame)
+        pico = max(pico, threading.active_count())
+        time.sleep(1 / FPS)
+    return pico
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--segundos", type=float, default=3.0)
+    args = parser.parse_args()
+
+    base = threading.active_count()
+
+    latencias = RollingStats(capacidade=4096)
+    threads = []
+
+    def por_thread(mao, frame):
+        enviado = time.perf_counter()
+
+        def tarefa():
+            interpretar(frame)
+            latencias.adicionar((time.perf_counter() - enviado) * 1000)
+
+        thread = threading.Thread(target=tarefa)
+        thread.start()
+        threads.append(thread)
+
+    pico = simular(por_thread, args.segundos)
+    for thread in threads:
+        thread.join()
+    resumo = latencias.resumo()
+    print(f"thread por frame   threads criadas: {len(threads):5d} | pico de threads: {pico - base:3d} | "
+          f"latencia p50 {resumo['p50']:.1f} ms, p95 {resumo['p95']:.1f} ms")
+
+    executor = LatestFrameExecutor(max_workers=2, nome="bench")
+    pico = simular(lambda mao, frame: executor.submit(mao, interpretar, frame), args.segundos)
+    executor.shutdown()
+    metricas = executor.metricas()
+    print(f"LatestFrameExecutor threads: {len(executor.workers):3d} | pico de threads: {pico - base:3d} | "
+          f"latencia p50 {metricas['latencia_ms']['p50']:.1f} ms, p95 {metricas['latencia_ms']['p95']:.1f} ms | "
+          f"descartados {metricas['descartados']}/{metricas['submetidos']}")
+
+
+if __name__ == "__main__":
+    main()
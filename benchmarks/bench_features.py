@@ -0,0 +1,51 @@
+"""
+Benchmark da extração de features.
+
+Compara o GestureFeatureExtractor (array (21, 3) + NumPy) com a extração anterior, que
+percorria os landmarks um a um para cada feature (ver `tests/legacy_features.py`). Mede tanto uma
+mão por chamada (loop ao vivo) quanto lotes de mãos (frames gravados). A paridade entre as duas
+é verificada nos testes (`tests/test_gesture_features.py`).
+"""
+from common import preparar_ambiente, medir, imprimir_resultado, REPO_ROOT
+from fixtures import gerar_landmarks, como_landmark_list
+import argparse
+import sys
+import os
+
+preparar_ambiente()
+sys.path.insert(0, os.path.join(REPO_ROOT, "tests"))
+
+from legacy_features import LegacyFeatureExtractor
+from src.gestures.gesture_features import GestureFeatureExtractor, landmarks_para_array
+import numpy as np
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--maos", type=int, default=2000)
+    args = parser.parse_args()
+
+    maos = [como_landmark_list(pontos) for pontos in gerar_landmarks(args.maos, semente=5)]
+
+    legacy = LegacyFeatureExtractor()
+    extractor = GestureFeatureExtractor()
+
+    indice = [0]
+
+    def antes():
+        legacy.extrair(maos[indice[0] % len(maos)])
+        indice[0] += 1
+
+    def depois():
+        extractor.extrair(landmarks_para_array(maos[indice[0] % len(maos)]))
+        indice[0] += 1
+
+    antes_us = medir(antes, args.maos)
+    imprimir_resultado("features por mao", antes_us, medir(depois, args.maos))
+
+    lote = np.stack([landmarks_para_array(mao) for mao in maos])
+    imprimir_resultado(f"features por mao (lote de {len(lote)})", antes_us, medir(lambda: extractor.extrair_mascaras(lote), 20, aquecimento=2) / len(lote))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Fan-out do servidor de frames com vários clientes, um deles parado (não lê as mensagens).
+
+Compara o envio original (um `await send` por cliente, em sequência, re-serializando o JSON) com as
+filas por cliente do `FramesWebsocketServer`: quantos frames o loop do stream consegue entregar e
+quantos os clientes rápidos recebem.
+
+    python benchmarks/bench_frame_broadcast.py --clientes 4 --segundos 5
+"""
+from common import preparar_ambiente
+import argparse
+import asyncio
+import base64
+import json
+import time
+
+preparar_ambiente()
+
+import numpy as np
+import websockets
+
+from src.websockets.frames_websocket.frame_protocol import FrameProtocol
+from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+
+
+class ServidorLegado:
+    """
+    Envio original: cada frame é enviado a cada cliente em sequência, serializando o JSON por cliente.
+    """
+
+    def __init__(self):
+        self.connections = set()
+
+    async def handler(self, websocket) -> None:
+        self.connections.add(websocket)
+        try:
+            async for _ in websocket:
+                pass
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.connections.discard(websocket)
+
+    async def send_frame(self, frame) -> None:
+        frame_base64 = base64.b64encode(frame.jpeg).decode('utf-8')
+        for websocket in list(self.connections):
+            try:
+                await websocket.send(json.dumps({"frame": frame_base64}))
+            except Exception:
+                self.connections.discard(websocket)
+
+
+async def cliente_rapido(porta: int, recebidos: list, indice: int, parar: asyncio.Event) -> None:
+    async with websockets.connect(f"ws://localhost:{porta}", max_size=None) as websocket:
+        while not parar.is_set():
+            try:
+                await asyncio.wait_for(websocket.recv(), 0.2)
+                recebidos[indice] += 1
+            except asyncio.TimeoutError:
+                pass
+
+
+async def executar(servidor, porta: int, clientes: int, segundos: float, frame) -> dict:
+    recebidos = [0] * clientes
+    parar = asyncio.Event()
+    async with websockets.serve(servidor.handler, "localhost", porta, max_size=None):
+        # Cliente parado: não lê, e a fila interna de 1 mensagem faz o TCP encher rapidamente
+        parado = await websockets.connect(f"ws://localhost:{porta}", max_size=None, max_queue=1)
+        tarefas = [asyncio.create_task(cliente_rapido(porta, recebidos, i, parar)) for i in range(clientes)]
+        await asyncio.sleep(0.3)
+
+        enviados = 0
+        inicio = time.perf_counter()
+        while time.perf_counter() - inicio < segundos:
+            try:
+                await asyncio.wait_for(servidor.send_frame(frame), segundos)
+            except asyncio.TimeoutError:
+                break
+            enviados += 1
+            await asyncio.sleep(1 / 60)
+        decorrido = time.perf_counter() - inicio
+
+        parar.set()
+        await asyncio.gather(*tarefas)
+        lentos = [m for m in servidor.get_metricas().values() if m["lento"]] if hasattr(servidor, "get_metricas") else []
+        parado.transport.abort()
+
+    return {
+        "fps_stream": enviados / decorrido,
+        "fps_clientes_rapidos": [r / decorrido for r in recebidos],
+        "lentos": lentos,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clientes", type=int, default=4, help="Quantidade de clientes rapidos, alem do cliente parado.")
+    parser.add_argument("--segundos", type=float, default=5.0)
+    parser.add_argument("--porta", type=int, default=8766)
+    args = parser.parse_args()
+
+    imagem = np.random.default_rng(0).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+    frame = FrameProtocol.codificar(imagem, 1, time.time(), qualidade_jpeg=70)
+    print(f"{args.clientes} clientes rapidos + 1 parado, frames de {len(frame.binario)} bytes, stream a 60 fps")
+
+    legado = asyncio.run(executar(ServidorLegado(), args.porta, args.clientes, args.segundos, frame))
+    print(f"envio sequencial   stream: {legado['fps_stream']:6.1f} fps | clientes rapidos: "
+          + ", ".join(f"{fps:5.1f}" for fps in legado["fps_clientes_rapidos"]) + " fps")
+
+    servidor = FramesWebsocketServer(args.porta)
+    novo = asyncio.run(executar(servidor, args.porta + 1, args.clientes, args.segundos, frame))
+    print(f"filas por cliente  stream: {novo['fps_stream']:6.1f} fps | clientes rapidos: "
+          + ", ".join(f"{fps:5.1f}" for fps in novo["fps_clientes_rapidos"]) + " fps")
+    for metricas in novo["lentos"]:
+        print(f"cliente lento detectado: enviados {metricas['enviados']}, descartados {metricas['descartados']}/{metricas['enfileirados']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Compara o transporte de frames do `FramesWebsocketServer`: JPEG em base64 dentro de JSON (formato
+original) contra a mensagem binária (cabeçalho + JPEG).
+
+Mede bytes por frame e o tempo de preparo da mensagem, e confere, com um servidor local de verdade,
+que um cliente que pede {"FORMAT": "binary"} recebe o mesmo JPEG que um cliente JSON.
+
+    python benchmarks/bench_frame_transport.py
+"""
+from common import preparar_ambiente, medir, imprimir_resultado
+import argparse
+import asyncio
+import base64
+import json
+import time
+
+preparar_ambiente()
+
+import numpy as np
+import websockets
+import cv2
+
+from src.camera.frame_source import SyntheticSource
+from src.websockets.frames_websocket.frame_protocol import FrameProtocol, FRAME_HEADER
+from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+
+
+def gerar_frame(largura: int, altura: int) -> np.ndarray:
+    """
+    Frame sintético com ruído de sensor, para que o JPEG tenha um tamanho próximo ao de uma webcam.
+    """
+    source = SyntheticSource(largura, altura, tempo_real=False)
+    source.abrir()
+    frame = source.ler()
+    ruido = np.random.default_rng(0).normal(0, 6, frame.shape)
+    return np.clip(frame + ruido, 0, 255).astype(np.uint8)
+
+
+def mensagem_legada(frame: np.ndarray) -> str:
+    """
+    Caminho original: imencode -> base64 -> str -> json.dumps por cliente.
+    """
+    _, buffer = cv2.imencode('.jpg', frame)
+    frame_base64 = base64.b64encode(buffer).decode('utf-8')
+    return json.dumps({"frame": frame_base64})
+
+
+async def conferir_servidor(frame: np.ndarray, porta: int) -> None:
+    servidor = FramesWebsocketServer(porta)
+    async with websockets.serve(servidor.handler, "localhost", porta):
+        async with websockets.connect(f"ws://localhost:{porta}") as cliente_json, \
+                websockets.connect(f"ws://localhost:{porta}") as cliente_binario:
+            await cliente_binario.send(json.dumps({"FORMAT": "binary"}))
+            resposta = json.loads(await cliente_binario.recv())
+            assert resposta["status"] == "success", resposta
+
+            codificado = FrameProtocol.codificar(frame, 7, time.time())
+            await servidor.send_frame(codificado)
+
+            texto = await cliente_json.recv()
+            binario = await cliente_binario.recv()
+            seq, _, largura, altura, _, jpeg = FrameProtocol.decodificar(binario)
+            assert (seq, largura, altura) == (7, frame.shape[1], frame.shape[0])
+            assert base64.b64decode(json.loads(texto)["frame"]) == bytes(jpeg)
+            print(f"Servidor local: cliente JSON e cliente binario receberam o mesmo JPEG ({len(jpeg)} bytes)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--largura", type=int, default=640)
+    parser.add_argument("--altura", type=int, default=480)
+    parser.add_argument("--repeticoes", type=int, default=200)
+    parser.add_argument("--porta", type=int, default=8765)
+    args = parser.parse_args()
+
+    frame = gerar_frame(args.largura, args.altura)
+    _, jpeg = cv2.imencode('.jpg', frame)
+    legada = mensagem_legada(frame)
+    binaria = FrameProtocol.codificar(frame, 1, time.time()).binario
+
+    print(f"Frame {args.largura}x{args.altura}, JPEG de {jpeg.size} bytes")
+    print(f"{'bytes por frame':<40} json/base64: {len(legada.encode()):10d} | binario: {len(binaria):10d} "
+          f"(cabecalho de {FRAME_HEADER.size} bytes) | {len(legada.encode()) / len(binaria):4.2f}x")
+
+    # Custo do preparo da mensagem, sem o imencode (igual nos dois caminhos)
+    antes = medir(lambda: json.dumps({"frame": base64.b64encode(jpeg).decode('utf-8')}), args.repeticoes)
+    depois = medir(lambda: FrameProtocol.codificar(frame, 1, 0.0), args.repeticoes) - medir(lambda: cv2.imencode('.jpg', frame), args.repeticoes)
+    imprimir_resultado("preparo da mensagem (sem imencode)", antes, max(depois, 0.01))
+
+    antes = medir(lambda: mensagem_legada(frame), args.repeticoes)
+    depois = medir(lambda: FrameProtocol.codificar(frame, 1, 0.0), args.repeticoes)
+    imprimir_resultado("imencode + mensagem", antes, depois)
+
+    asyncio.run(conferir_servidor(frame, args.porta))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Intervalo de inferência (`InferenceStride`): detecção de mão a cada N frames, com os landmarks dos
+frames intermediários mantidos ou extrapolados, contra a detecção em todo frame.
+
+Para cada configuração, mede o custo de detecção por frame e compara, frame a frame, com a detecção
+em todo frame: distância dos landmarks, distância da ponta do indicador (usada pelo mouse_tracking)
+e concordância do gesto reconhecido. Usa dois vídeos sintéticos 1280x720 a 30 fps: mão em
+movimento e mão parada (`fixtures.gerar_video_maos`).
+
+    python benchmarks/bench_inference_stride.py --frames 300
+"""
+from common import preparar_ambiente
+from fixtures import gerar_video_maos
+import argparse
+import tempfile
+import time
+import os
+
+preparar_ambiente()
+
+import numpy as np
+import cv2
+
+from src.gestures.gesture_reader import GestureReader
+from src.gestures.gesture_recognizer import GestureRecognizer
+from src.gestures.inference_stride import InferenceStride, InferenceStrideConfig
+
+FPS = 30.0
+CONFIGURACOES = {
+    "stride 2": InferenceStrideConfig(stride=2),
+    "stride 3 mantido": InferenceStrideConfig(stride=3, horizonte=0.0),
+    "stride 3 extrapolado": InferenceStrideConfig(stride=3),
+    "adaptativo 1..4": InferenceStrideConfig(adaptativo=True, stride_max=4),
+}
+
+
+def primeira_mao(results) -> tuple:
+    """
+    Retorna (mão, pontos (21, 3)) da primeira mão dos resultados, ou (None, None).
+    """
+    for landmarks, handedness in zip(results.multi_hand_landmarks or [], results.multi_handedness or []):
+        return handedness.classification[0].label, np.array([(lm.x, lm.y, lm.z) for lm in landmarks.landmark], dtype=np.float32)
+    return None, None
+
+
+def processar(caminho: str, config: InferenceStrideConfig = None) -> tuple:
+    """
+    Roda a detecção sobre o vídeo, a cada frame (sem `config`) ou com o intervalo de inferência.
+
+    Returns:
+        tuple: (mãos por frame, tempo total de detecção em ms, quantidade de detecções).
+    """
+    reader = GestureReader()
+    stride = InferenceStride(config) if config else None
+    cap = cv2.VideoCapture(caminho)
+    maos, gasto, deteccoes = [], 0.0, 0
+    n = 0
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        instante = n / FPS
+        if stride is None or stride.deve_inferir():
+            inicio = time.perf_counter()
+            results = reader.detect_hand(frame)
+            gasto += (time.perf_counter() - inicio) * 1000
+            deteccoes += 1
+            if stride is not None:
+                stride.registrar(results, instante)
+        else:
+            results = stride.estimar(instante)
+        maos.append(primeira_mao(results))
+        n += 1
+    cap.release()
+    return maos, gasto, deteccoes
+
+
+def comparar(nome: str, referencia: list, maos: list, gasto: float, deteccoes: int, recognizer: GestureRecognizer) -> None:
+    escala = np.array([1280, 720])
+    distancias, pontas, iguais, total, ausentes = [], [], 0, 0, 0
+    for (mao_r, pontos_r), (mao, pontos) in zip(referencia, maos):
+        if mao_r is None:
+            continue
+        if mao is None:
+            ausentes += 1
+            continue
+        diferenca = np.abs(pontos[:, :2] - pontos_r[:, :2]) * escala
+        distancias.append(diferenca.mean())
+        pontas.append(np.linalg.norm(diferenca[8]))
+        total += 1
+        iguais += recognizer.reconhecer(pontos, mao) == recognizer.reconhecer(pontos_r, mao_r)
+    frames = len(maos)
+    print(f"  {nome:<22} deteccoes {deteccoes / frames * 100:5.1f}% dos frames | {gasto / frames:6.2f} ms/frame | "
+          f"landmarks {np.mean(distancias) if distancias else 0:6.2f} px | ponta do indicador p95 "
+          f"{np.percentile(pontas, 95) if pontas else 0:6.2f} px | gesto igual {iguais / max(total, 1) * 100:5.1f}% | "
+          f"sem mao {ausentes}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    recognizer = GestureRecognizer()
+    with tempfile.TemporaryDirectory() as pasta:
+        for video, movimento in (("mao em movimento", 3.0), ("mao parada", 0.0)):
+            caminho = gerar_video_maos(os.path.join(pasta, f"maos_{movimento}.mp4"), args.frames, fps=FPS, movimento=movimento)
+            referencia, gasto, deteccoes = processar(caminho)
+            print(f"{video} ({args.frames} frames):")
+            comparar("todo frame", referencia, referencia, gasto, deteccoes, recognizer)
+            for nome, config in CONFIGURACOES.items():
+                comparar(nome, referencia, *processar(caminho, config), recognizer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Backends de input do `ExecuteInput`.
+
+1. Montagem das estruturas do SendInput: uma estrutura INPUT nova por evento (como o `Keyboard` e o
+   `Mouse` faziam) contra a escrita no array pré-alocado do `SendInputBackend`. Só a parte em Python
+   é medida (com as estruturas de mouse, que não dependem da user32), para rodar fora do Windows.
+2. `ExecuteInput` com o `RecordingInputBackend`: latência entre `executar_input` e o evento de
+   pressionar, duração do pressionamento, sequência dos eventos e custo do `mouse_tracking`.
+
+    python benchmarks/bench_input_backend.py --inputs 200
+"""
+from common import preparar_ambiente, medir, imprimir_resultado
+import argparse
+import tempfile
+import ctypes
+import time
+import os
+
+preparar_ambiente()
+
+import numpy as np
+
+from src.data.configs.config_router import ConfigRouter
+from src.data.configs.states.config_states_manager import ConfigStateManager
+from src.inputs.c_structures.c_constants import INPUT_MOUSE, MOUSEEVENTF_MOVE
+from src.inputs.c_structures.c_mouse_input import MOUSEINPUT, INPUT
+from src.inputs.input_backend import RecordingInputBackend, InputEvent, EVENTO_MOVIMENTO, EVENTO_TECLA
+from src.inputs.execute_input import ExecuteInput
+from src.inputs.input import Input
+from src.logger.logger import Logger
+
+
+def montagem_estruturas() -> None:
+    evento = InputEvent(EVENTO_MOVIMENTO, dx=3, dy=-2)
+
+    def por_evento() -> None:
+        mi = MOUSEINPUT(dx=evento.dx, dy=evento.dy, mouseData=0, dwFlags=MOUSEEVENTF_MOVE, time=0, dwExtraInfo=0)
+        inputs = [INPUT(type=INPUT_MOUSE, mi=mi)]
+        ctypes.byref(inputs[0])
+
+    estruturas = (INPUT * 16)()
+
+    def pre_alocado() -> None:
+        estrutura = estruturas[0]
+        estrutura.type = INPUT_MOUSE
+        mi = estrutura.mi
+        mi.dx = evento.dx
+        mi.dy = evento.dy
+        mi.mouseData = 0
+        mi.dwFlags = MOUSEEVENTF_MOVE
+        mi.time = 0
+        mi.dwExtraInfo = 0
+
+    imprimir_resultado("estrutura INPUT por evento", medir(por_evento, 50000), medir(pre_alocado, 50000))
+
+
+def execute_input(quantidade: int) -> None:
+    backend = RecordingInputBackend()
+    executor = ExecuteInput(backend)
+    teclas = ["a", "b", "space", "m1", "m2"]
+
+    chamadas = []
+    for i in range(quantidade):
+        while executor.input_em_andamento:
+            time.sleep(0.0005)
+        chamadas.append(time.perf_counter())
+        executor.executar_input(f"gesto_{i}", Input(teclas[i % len(teclas)], 0, False))
+        time.sleep(0.02)
+    time.sleep(0.05)
+
+    eventos = backend.eventos()
+    pressionados = [r for r in eventos if r.evento.pressionado]
+    liberados = [r for r in eventos if not r.evento.pressionado]
+    latencias = np.array([(r.instante - chamada) * 1000 for r, chamada in zip(pressionados, chamadas)])
+    duracoes = np.array([(l.instante - p.instante) * 1000 for p, l in zip(pressionados, liberados)])
+    sequencia_ok = all(p.evento.codigo == l.evento.codigo and p.lote < l.lote for p, l in zip(pressionados, liberados))
+
+    print(f"ExecuteInput + RecordingInputBackend ({quantidade} inputs de teclado e mouse):")
+    print(f"  executar_input ate o evento: p50 {np.percentile(latencias, 50):.3f} ms | p95 {np.percentile(latencias, 95):.3f} ms")
+    print(f"  pressionado por: p50 {np.percentile(duracoes, 50):.2f} ms | {len(pressionados)} pressionamentos, "
+          f"{len(liberados)} liberacoes, {backend.lotes} lotes | sequencia correta: {sequencia_ok}")
+    teclado = sum(r.evento.tipo == EVENTO_TECLA for r in eventos)
+    print(f"  eventos: {teclado} de teclado, {len(eventos) - teclado} de mouse")
+
+    backend.limpar()
+    tracking = medir(lambda: executor.executar_mouse_tracking(0.5 + np.random.uniform(-0.01, 0.01), 0.5), 2000)
+    print(f"  executar_mouse_tracking: {tracking:.1f} us por chamada, cursor virtual em {backend.posicao_cursor()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--inputs", type=int, default=200)
+    args = parser.parse_args()
+
+    montagem_estruturas()
+    with tempfile.TemporaryDirectory() as pasta:
+        # O mouse_tracking grava a última posição do cursor no estado: usa um arquivo temporário
+        ConfigRouter.state_manager = ConfigStateManager(os.path.join(pasta, "estado_atual.json"))
+        execute_input(args.inputs)
+        ConfigRouter.flush()
+    Logger.encerrar()
+
+
+if __name__ == "__main__":
+    main()
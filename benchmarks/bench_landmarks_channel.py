@@ -0,0 +1,121 @@
+"""
+Canal só de landmarks (`LandmarksWebsocketServer`) para clientes que não precisam do vídeo.
+
+Mede o tamanho de um registro de landmarks (binário e JSON) contra o frame JPEG do stream de vídeo,
+confere a ida e volta do protocolo binário e roda o pipeline completo (fonte sintética -> MediaPipe ->
+render) com um cliente de vídeo ou com um cliente só de landmarks, contando os JPEGs codificados.
+
+    python benchmarks/bench_landmarks_channel.py --segundos 4
+"""
+from common import preparar_ambiente
+from fixtures import gerar_landmarks
+import argparse
+import asyncio
+import time
+
+preparar_ambiente()
+
+import numpy as np
+import websockets
+
+from src.camera.frame_source import SyntheticSource
+from src.camera.stream_profile import StreamProfile
+from src.camera.camera_stream import CameraStream
+from src.websockets.frames_websocket.frame_protocol import FrameProtocol
+from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+from src.websockets.landmarks_websocket.landmark_protocol import LandmarkProtocol
+from src.websockets.landmarks_websocket.landmarks_websocket import LandmarksWebsocketServer
+
+codificados = {"jpeg": 0}
+_codificar_original = FrameProtocol.codificar
+
+
+def _codificar_contando(*args, **kwargs):
+    codificados["jpeg"] += 1
+    return _codificar_original(*args, **kwargs)
+
+
+FrameProtocol.codificar = staticmethod(_codificar_contando)
+
+
+def tamanhos() -> None:
+    pontos = gerar_landmarks(2, semente=1)
+    maos = [("Left", "A", pontos[0]), ("Right", "Mao aberta", pontos[1])]
+    registro = LandmarkProtocol.codificar(7, time.time(), maos)
+
+    seq, _, lidas = LandmarkProtocol.decodificar(registro.binario)
+    assert seq == 7 and [(m, g) for m, g, _ in lidas] == [(m, g) for m, g, _ in maos]
+    assert all(np.array_equal(p, q) for (_, _, p), (_, _, q) in zip(lidas, maos))
+
+    frame = SyntheticSource(640, 480, tempo_real=False)
+    frame.abrir()
+    jpeg = FrameProtocol.codificar(frame.ler(), 0, 0.0, qualidade_jpeg=StreamProfile().jpeg_quality)
+    codificados["jpeg"] = 0
+    print(f"registro de 2 maos: binario {len(registro.binario)} B | JSON {len(registro.json())} B | "
+          f"frame JPEG 640x480 {len(jpeg.binario)} B (ida e volta binaria conferida)")
+
+
+async def cliente(porta: int, formato: str, recebidos: dict, parar: asyncio.Event) -> None:
+    async with websockets.connect(f"ws://localhost:{porta}", max_size=None) as websocket:
+        await websocket.send(f'{{"FORMAT": "{formato}"}}')
+        while not parar.is_set():
+            try:
+                mensagem = await asyncio.wait_for(websocket.recv(), 0.2)
+            except asyncio.TimeoutError:
+                continue
+            recebidos["mensagens"] += 1
+            recebidos["bytes"] += len(mensagem)
+
+
+async def executar(porta: int, segundos: float, video: bool) -> dict:
+    frames_server = FramesWebsocketServer(porta)
+    landmarks_server = LandmarksWebsocketServer(porta + 1)
+    stream = CameraStream(frames_server, SyntheticSource(1280, 720, fps=30.0), StreamProfile(), landmarks_server)
+    recebidos = {"mensagens": 0, "bytes": 0}
+    parar = asyncio.Event()
+
+    async with websockets.serve(frames_server.handler, "localhost", porta, max_size=None), \
+            websockets.serve(landmarks_server.handler, "localhost", porta + 1):
+        alvo = porta if video else porta + 1
+        tarefa_cliente = asyncio.create_task(cliente(alvo, "binary", recebidos, parar))
+        await asyncio.sleep(0.2)
+        await stream.start_stream()
+
+        codificados["jpeg"] = 0
+        recebidos["mensagens"] = recebidos["bytes"] = 0
+        inicio_cpu = time.process_time()
+        inicio = time.perf_counter()
+        await asyncio.sleep(segundos)
+        decorrido = time.perf_counter() - inicio
+        cpu = time.process_time() - inicio_cpu
+
+        parar.set()
+        await stream.stop_stream()
+        await tarefa_cliente
+
+    return {
+        "mensagens": recebidos["mensagens"] / decorrido,
+        "kb": recebidos["bytes"] / decorrido / 1024,
+        "jpeg": codificados["jpeg"] / decorrido,
+        "cpu": cpu / decorrido,
+    }
+
+
+def imprimir(nome: str, r: dict) -> None:
+    print(f"{nome:<26} recebido {r['mensagens']:5.1f} msg/s, {r['kb']:7.1f} KB/s | "
+          f"JPEGs codificados {r['jpeg']:5.1f}/s | CPU do processo {r['cpu'] * 100:5.0f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=4.0)
+    parser.add_argument("--porta", type=int, default=8790)
+    args = parser.parse_args()
+
+    tamanhos()
+    imprimir("cliente de video", asyncio.run(executar(args.porta, args.segundos, video=True)))
+    imprimir("cliente so de landmarks", asyncio.run(executar(args.porta + 2, args.segundos, video=False)))
+
+
+if __name__ == "__main__":
+    main()
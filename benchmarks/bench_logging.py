@@ -0,0 +1,125 @@
+"""
+Custo do logging no caminho do frame: `RotatingFileHandler` síncrono (configuração original) contra
+a fila com uma thread de escrita, loggers em cache e limite de mensagens por ponto do código.
+
+Simula o que a thread de inferência registra por frame (classificação das duas mãos e leituras de
+atributos) e mede o tempo por chamada na thread chamadora, com o disco normal e com um disco lento
+(cada escrita leva `--atraso-disco` ms). Mede também o custo de `Logger.configure_input_logger()`,
+chamado a cada tecla e movimento do mouse.
+
+    python benchmarks/bench_logging.py --frames 600
+"""
+from common import preparar_ambiente, medir, imprimir_resultado
+from logging.handlers import RotatingFileHandler
+import argparse
+import tempfile
+import logging
+import time
+import os
+
+preparar_ambiente()
+
+import numpy as np
+
+from src.logger.logger import Logger
+
+
+class DiscoLento(RotatingFileHandler):
+    atraso = 0.0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        time.sleep(self.atraso)
+        super().emit(record)
+
+
+def logger_original(nome: str, caminho: str, classe=RotatingFileHandler) -> logging.Logger:
+    """
+    Reproduz o `Logger._configure_logger` original: `getLogger` + `hasHandlers` e escrita síncrona.
+    """
+    if not os.path.exists(os.path.dirname(caminho)):
+        os.makedirs(os.path.dirname(caminho))
+    logger = logging.getLogger(nome)
+    logger.setLevel(logging.INFO)
+    if not logger.hasHandlers():
+        handler = classe(caminho, maxBytes=5 * 1024 * 1024, backupCount=3)
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(message)s'))
+        logger.addHandler(handler)
+    return logger
+
+
+def frame(gestos: logging.Logger, dados: logging.Logger, tempos: list, lazy: bool) -> None:
+    """
+    As mensagens de um frame: classificação de duas mãos e três leituras de atributos.
+    """
+    for classificacao in ("Right", "Left"):
+        inicio = time.perf_counter()
+        if lazy:
+            gestos.info("Mao classificada como: %s.", classificacao)
+        else:
+            gestos.info(f"Mao classificada como: {classificacao}.")
+        tempos.append(time.perf_counter() - inicio)
+    for atributo, valor in (("mouse_tracking", "False"), ("gesto_mao_direita", "A"), ("gesto_mao_esquerda", "")):
+        inicio = time.perf_counter()
+        if lazy:
+            dados.info("Atributo '%s' lido com valor: '%s'", atributo, valor)
+        else:
+            dados.info(f"Atributo '{atributo}' lido com valor: '{valor}'")
+        tempos.append(time.perf_counter() - inicio)
+
+
+def rodar(gestos: logging.Logger, dados: logging.Logger, frames: int, lazy: bool) -> tuple:
+    """
+    Roda os frames a 30 fps e retorna (tempos por chamada em us, duração de um frame de mensagens em us).
+    """
+    tempos, por_frame = [], []
+    for _ in range(frames):
+        inicio = time.perf_counter()
+        frame(gestos, dados, tempos, lazy)
+        por_frame.append(time.perf_counter() - inicio)
+        time.sleep(max(0.0, 1 / 30 - por_frame[-1]))
+    return np.array(tempos) * 1e6, np.array(por_frame) * 1e6
+
+
+def imprimir(nome: str, tempos: np.ndarray, por_frame: np.ndarray) -> None:
+    print(f"  {nome:<34} chamada media {tempos.mean():8.1f} us | p99 {np.percentile(tempos, 99):8.1f} us | "
+          f"max {tempos.max():8.1f} us | frame p99 {np.percentile(por_frame, 99):8.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--atraso-disco", type=float, default=2.0)
+    args = parser.parse_args()
+    DiscoLento.atraso = args.atraso_disco / 1000
+
+    with tempfile.TemporaryDirectory() as pasta:
+        originais = {
+            "disco normal": (logger_original("orig_gestos", os.path.join(pasta, "g.log")),
+                             logger_original("orig_dados", os.path.join(pasta, "d.log"))),
+            "disco lento": (logger_original("lento_gestos", os.path.join(pasta, "gl.log"), DiscoLento),
+                            logger_original("lento_dados", os.path.join(pasta, "dl.log"), DiscoLento)),
+        }
+        gestos, dados = Logger.configure_gestures_logger(), Logger.configure_json_data_logger()
+        arquivos = dict(Logger._roteador.arquivos)
+
+        for disco, (orig_gestos, orig_dados) in originais.items():
+            print(f"{disco} ({args.frames} frames a 30 fps, 5 mensagens por frame):")
+            imprimir("sincrono (original)", *rodar(orig_gestos, orig_dados, args.frames, lazy=False))
+
+            if disco == "disco lento":
+                for nome in ("gestures", "data"):
+                    Logger._roteador.arquivos[nome] = DiscoLento(os.path.join(pasta, f"{nome}_fila.log"))
+            imprimir("fila + limite por ponto do codigo", *rodar(gestos, dados, args.frames, lazy=True))
+            Logger._roteador.arquivos.update(arquivos)
+
+        suprimidas = sum(f.suprimidas for logger in (gestos, dados) for f in logger.filters)
+        print(f"  mensagens suprimidas pelo limite: {suprimidas}")
+
+        antes = medir(lambda: logger_original("input_orig", os.path.join(pasta, "i.log")), 20000)
+        depois = medir(Logger.configure_input_logger, 20000)
+        imprimir_resultado("configure_input_logger()", antes, depois)
+        Logger.encerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark e verificação de paridade do GestureMatcher.
+
+O "antes" reproduz a filtragem antiga de `_interpretar_libras`/`_interpretar_gesto_custom`
+(listas refeitas a cada atributo) seguida do `__verify_gesto` (que juntava os dicionários de
+Libras e custom a cada frame). A paridade é conferida para todas as combinações de features.
+"""
+from common import preparar_ambiente, medir, imprimir_resultado
+import argparse
+import random
+import time
+
+preparar_ambiente()
+
+from src.gestures.gesture_matcher import GestureMatcher, FEATURES_ESTATICAS, VALORES_FIXOS
+from src.data.gestures.data_libras_gestures import DataLibrasGestures
+from src.data.gestures.data_custom_gestures import DataCustomGestures
+
+
+def gesto_do_indice(mascara: int) -> dict:
+    """
+    Monta o dicionário de features (na ordem do interpretador) a partir de uma máscara de bits.
+    """
+    gesto_atual = {feature: bool(mascara >> i & 1) for i, feature in enumerate(FEATURES_ESTATICAS)}
+    gesto_atual.update(VALORES_FIXOS)
+    return gesto_atual
+
+
+def filtragem_antiga(gestos: dict, relevantes: dict, outros_gestos: dict, outros_relevantes: dict, gesto_atual: dict) -> str:
+    """
+    Reprodução da filtragem e verificação antigas (considerando apenas os atributos estáticos na verificação).
+    """
+    candidatos = list(gestos.keys())
+    for key in gesto_atual:
+        if len(candidatos) == 1:
+            break
+        candidatos = [gesto for gesto in candidatos if gestos[gesto].get(key) == gesto_atual[key]]
+
+    if len(candidatos) != 1:
+        return None
+
+    dict_relevantes = {**relevantes, **outros_relevantes}
+    dict_gestos = {**gestos, **outros_gestos}
+    candidato = candidatos[0]
+    for atributo in dict_relevantes[candidato]:
+        if atributo in FEATURES_ESTATICAS and gesto_atual[atributo] != dict_gestos[candidato][atributo]:
+            return None
+    return candidato
+
+
+def gerar_gestos_custom(quantidade: int) -> tuple:
+    """
+    Gera um banco sintético de gestos custom.
+    """
+    gerador = random.Random(42)
+    gestos, relevantes = {}, {}
+    for i in range(quantidade):
+        nome = f"custom_{i}"
+        gestos[nome] = {feature: gerador.random() < 0.5 for feature in FEATURES_ESTATICAS}
+        gestos[nome].update(VALORES_FIXOS)
+        relevantes[nome] = gerador.sample(FEATURES_ESTATICAS, gerador.randint(3, len(FEATURES_ESTATICAS)))
+    return gestos, relevantes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--custom", type=int, default=500)
+    parser.add_argument("--frames", type=int, default=5000)
+    args = parser.parse_args()
+
+    bancos = {
+        "libras": (DataLibrasGestures().get_gestos(), DataLibrasGestures().get_atributos_relevantes()),
+        "custom (arquivo)": (DataCustomGestures().get_gestos(), DataCustomGestures().get_atributos_relevantes()),
+        f"custom sintetico ({args.custom})": gerar_gestos_custom(args.custom),
+    }
+
+    combinacoes = [gesto_do_indice(mascara) for mascara in range(1 << len(FEATURES_ESTATICAS))]
+
+    for nome, (gestos, relevantes) in bancos.items():
+        inicio = time.perf_counter()
+        matcher = GestureMatcher(gestos, relevantes)
+        compilacao_ms = (time.perf_counter() - inicio) * 1e3
+
+        divergencias = sum(
+            1 for gesto_atual in combinacoes
+            if filtragem_antiga(gestos, relevantes, {}, {}, gesto_atual) != matcher.buscar_candidato(matcher.codificar_features(gesto_atual))
+        )
+        print(f"[{nome}] compilado em {compilacao_ms:.2f} ms | divergencias: {divergencias}/{len(combinacoes)}")
+
+        gerador = random.Random(1)
+        amostra = [gerador.choice(combinacoes) for _ in range(1024)]
+        indice = [0]
+
+        def antes():
+            filtragem_antiga(gestos, relevantes, bancos["custom (arquivo)"][0], bancos["custom (arquivo)"][1], amostra[indice[0] & 1023])
+            indice[0] += 1
+
+        def depois():
+            gesto_atual = amostra[indice[0] & 1023]
+            candidato = matcher.buscar_candidato(matcher.codificar_features(gesto_atual))
+            if candidato is not None:
+                matcher.verificar_gesto(candidato, gesto_atual)
+            indice[0] += 1
+
+        imprimir_resultado(f"match por frame [{nome}]", medir(antes, args.frames), medir(depois, args.frames))
+
+
+if __name__ == "__main__":
+    main()
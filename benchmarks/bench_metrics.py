@@ -0,0 +1,131 @@
+"""
+Métricas do pipeline: custo da instrumentação no caminho do frame e a mensagem `GET_METRICS`.
+
+1. Custo de `RollingStats.adicionar` (agora com o instante de cada amostra, para o fps) contra a
+   versão anterior, e o custo por frame dos temporizadores do pipeline.
+2. Pipeline real: um vídeo com mãos passa pela câmera, com um cliente de frames conectado; um
+   cliente de controle pede `GET_METRICS` (com o arquivo do Prometheus) pelo `DataWebsocketServer`
+   e mede a ida e volta. Imprime os percentis e o fps de cada estágio.
+
+    python benchmarks/bench_metrics.py --segundos 6
+"""
+from common import preparar_ambiente, medir, imprimir_resultado
+from fixtures import gerar_video_maos
+import argparse
+import tempfile
+import threading
+import asyncio
+import json
+import time
+import os
+
+preparar_ambiente()
+
+import numpy as np
+import websockets
+
+from src.camera.frame_source import VideoFileSource
+from src.camera.camera_stream import CameraStream
+from src.pipeline.metrics import RollingStats
+from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+from src.websockets.data_websocket.data_websocket import DataWebsocketServer, PASTA_METRICAS
+
+# Temporizadores por frame: captura, inferência, gestos, desenho, render, 2 latências, codificação, envio
+TEMPORIZADORES_POR_FRAME = 9
+
+
+class RollingStatsAnterior:
+    """
+    `RollingStats.adicionar` antes do fps por medida.
+    """
+
+    def __init__(self, capacidade: int = 512):
+        self.amostras = np.zeros(capacidade, dtype=np.float64)
+        self.total = 0
+        self.lock = threading.Lock()
+
+    def adicionar(self, valor: float) -> None:
+        with self.lock:
+            self.amostras[self.total % len(self.amostras)] = valor
+            self.total += 1
+
+
+def custo_instrumentacao() -> None:
+    anterior, atual = RollingStatsAnterior(), RollingStats()
+    antes = medir(lambda: anterior.adicionar(12.5), 200000)
+    depois = medir(lambda: atual.adicionar(12.5), 200000)
+    imprimir_resultado("RollingStats.adicionar", antes, depois)
+    print(f"{'':<40} {TEMPORIZADORES_POR_FRAME} temporizadores por frame: {depois * TEMPORIZADORES_POR_FRAME:.1f} us "
+          f"({depois * TEMPORIZADORES_POR_FRAME / 33333 * 100:.3f}% de um frame a 30 fps)")
+    resumo = medir(atual.resumo, 2000)
+    print(f"{'RollingStats.resumo (512 amostras)':<40} {resumo:.1f} us")
+
+
+async def cliente_frames(porta: int, parar: asyncio.Event) -> None:
+    async with websockets.connect(f"ws://localhost:{porta}", max_size=None) as websocket:
+        await websocket.send(json.dumps({"FORMAT": "binary"}))
+        while not parar.is_set():
+            try:
+                await asyncio.wait_for(websocket.recv(), 0.2)
+            except asyncio.TimeoutError:
+                pass
+
+
+async def executar(video: str, porta: int, segundos: float, arquivo: str) -> tuple:
+    frames_server = FramesWebsocketServer(porta + 1)
+    data_server = DataWebsocketServer(porta, frames_server)
+    data_server.camera_stream = CameraStream(frames_server, VideoFileSource(video, tempo_real=True, repetir=True))
+    parar = asyncio.Event()
+    tempos = RollingStats()
+
+    async with websockets.serve(data_server.handler, "localhost", porta), \
+            websockets.serve(frames_server.handler, "localhost", porta + 1, max_size=None):
+        tarefa_frames = asyncio.create_task(cliente_frames(porta + 1, parar))
+        async with websockets.connect(f"ws://localhost:{porta}", max_size=None) as controle:
+            await controle.send(json.dumps({"START_DETECTION": True}))
+            await asyncio.sleep(segundos)
+            for _ in range(20):
+                enviado = time.perf_counter()
+                await controle.send(json.dumps({"GET_METRICS": arquivo}))
+                while "metrics" not in (resposta := json.loads(await controle.recv())):
+                    pass
+                tempos.adicionar((time.perf_counter() - enviado) * 1000)
+                await asyncio.sleep(0.05)
+            await controle.send(json.dumps({"STOP_DETECTION": True}))
+            await asyncio.sleep(0.3)
+        parar.set()
+        await tarefa_frames
+    return resposta["metrics"], tempos.resumo()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=6.0)
+    parser.add_argument("--porta", type=int, default=8790)
+    args = parser.parse_args()
+
+    custo_instrumentacao()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        video = gerar_video_maos(os.path.join(pasta, "maos.mp4"), 150, fps=30.0)
+        arquivo = "bench_metrics.prom"     # Gravado pelo servidor em PASTA_METRICAS
+        metricas, tempos = asyncio.run(executar(video, args.porta, args.segundos, arquivo))
+        caminho = os.path.join(PASTA_METRICAS, arquivo)
+        with open(caminho) as file:
+            linhas = file.read().splitlines()
+        os.remove(caminho)
+
+    print(f"GET_METRICS (com o arquivo do Prometheus): ida e volta p50 {tempos['p50']:.2f} ms | p95 {tempos['p95']:.2f} ms | "
+          f"{len(json.dumps(metricas))} bytes de JSON | {len(linhas)} linhas no arquivo")
+    estagios = {f"camera.{nome}": resumo for nome, resumo in metricas["camera"].items() if nome.endswith("_ms")}
+    estagios |= {f"stream.{nome}": metricas["stream"][nome] for nome in ("codificacao_ms", "envio_ms")}
+    estagios |= {f"{nome}.execucao_ms": executor["execucao_ms"] for nome, executor in metricas["interpretacao"].items()}
+    for nome, resumo in estagios.items():
+        print(f"  {nome:<34} p50 {resumo['p50']:7.2f} | p95 {resumo['p95']:7.2f} | p99 {resumo['p99']:7.2f} ms | {resumo['fps']:5.1f} fps")
+    print(f"  frames_descartados {metricas['camera']['frames_descartados']} | fila do interpretador "
+          f"{metricas['interpretacao']['interpretador']['fila']} | clientes {len(metricas['stream']['clientes'])}")
+    print("  " + "\n  ".join(linha for linha in linhas if "inferencia_ms" in linha))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark e verificação da categorização de movimento pelo histórico de landmarks.
+
+Para cada gesto com movimento, uma pose sintética que cai no gesto é mantida parada por um
+segundo e depois deslocada. Verifica que o gesto não é reconhecido com a mão parada, que é
+reconhecido poucos frames depois do início do movimento, e mede o custo por frame (a implementação
+anterior bloqueava uma thread por 1 segundo para cada frame candidato).
+"""
+from common import preparar_ambiente, medir
+from fixtures import gerar_landmarks
+import numpy as np
+import argparse
+import sys
+
+preparar_ambiente()
+
+from src.gestures.gesture_recognizer import GestureRecognizer
+from src.gestures.landmark_history import LandmarkHistory
+
+FPS = 30.0
+
+# Deformação aplicada à pose a cada frame do movimento (progresso de 0 a 1)
+DEFORMACOES = {
+    "wrist_rotate": lambda pontos, t: np.column_stack([(pontos[:, 0] - pontos[0, 0]) * (1 + 0.4 * t) + pontos[0, 0], pontos[:, 1:]]),
+    "y_index_tip_changes": lambda pontos, t: pontos - [0.0, 0.25 * t, 0.0],
+    "x_index_tip_changes": lambda pontos, t: pontos + [0.2 * t, 0.0, 0.0],
+    "pinky_pos_changes": lambda pontos, t: pontos - [0.0, 0.3 * t, 0.0],
+    "": lambda pontos, t: pontos + [0.2 * t, 0.0, 0.0],
+}
+
+
+def encontrar_poses(recognizer: GestureRecognizer) -> dict:
+    """
+    Procura, entre poses sintéticas, uma pose para cada gesto de Libras com movimento.
+    """
+    pontos = gerar_landmarks(40000, semente=3)
+    mascaras = recognizer.feature_extractor.extrair_mascaras(pontos).tolist()
+    matcher = recognizer.libras_matcher
+    poses = {}
+    for indice, mascara in enumerate(mascaras):
+        candidato = matcher.tabela[mascara]
+        if candidato is not None and matcher.tem_movimento(candidato) and candidato not in poses:
+            poses[candidato] = pontos[indice]
+    return poses
+
+
+def main() -> None:
+    argparse.ArgumentParser(description=__doc__).parse_args()
+
+    recognizer = GestureRecognizer()
+    matcher = recognizer.libras_matcher
+    poses = encontrar_poses(recognizer)
+    com_movimento = [nome for nome in matcher.gestos if matcher.tem_movimento(nome)]
+    print(f"Gestos com movimento: {com_movimento}; poses sinteticas encontradas: {sorted(poses)}")
+
+    falhas = 0
+    for nome, pose in sorted(poses.items()):
+        deformar = DEFORMACOES[matcher.tipo_de_movimento(nome)]
+        historico = LandmarkHistory()
+        parado = movendo = None
+        for frame in range(int(FPS * 2)):
+            t = max(0.0, (frame - FPS) / (FPS / 2))
+            pontos = deformar(pose.astype(np.float64), min(t, 1.0)).astype(np.float32)
+            historico.adicionar(pontos, frame / FPS)
+            reconhecido = recognizer.reconhecer(pontos, "Right", historico) == nome
+            if frame < FPS and reconhecido and parado is None:
+                parado = frame
+            if frame >= FPS and reconhecido and movendo is None:
+                movendo = frame - int(FPS)
+        if parado is not None or movendo is None:
+            falhas += 1
+        print(f"{nome:<10} reconhecido parado: {'nao' if parado is None else f'frame {parado}'} | frames ate reconhecer o movimento: {movendo}")
+
+    # Regras de movimento isoladas, para os gestos cuja pose sintética não foi encontrada (ex.: X depende de `bent_index`)
+    pose = gerar_landmarks(1, semente=1)[0].astype(np.float64)
+    for tipo, deformar in DEFORMACOES.items():
+        historico = LandmarkHistory()
+        parado = movendo = None
+        for frame in range(int(FPS * 2)):
+            t = max(0.0, (frame - FPS) / (FPS / 2))
+            historico.adicionar(deformar(pose, min(t, 1.0)), frame / FPS)
+            _, detectado = recognizer.movement_detector.categorizar(historico, tipo)
+            if frame < FPS and detectado and parado is None:
+                parado = frame
+            if frame >= FPS and detectado and movendo is None:
+                movendo = frame - int(FPS)
+        if parado is not None or movendo is None:
+            falhas += 1
+        print(f"regra {tipo or '(qualquer)':<20} detectada parada: {'nao' if parado is None else f'frame {parado}'} | frames ate detectar: {movendo}")
+
+    pose = poses[sorted(poses)[0]]
+    historico = LandmarkHistory()
+    for frame in range(64):
+        historico.adicionar(pose, frame / FPS)
+    gesto_atual = recognizer.extrair_features(pose)
+    candidato = sorted(poses)[0]
+    custo = medir(lambda: recognizer.verificar_candidato("Right", candidato, dict(gesto_atual), historico), 5000)
+    print(f"categorizacao de movimento por frame: {custo:.2f} us (antes: thread bloqueada por 1000000 us)")
+
+    if falhas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
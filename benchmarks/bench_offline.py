@@ -0,0 +1,63 @@
+"""
+Benchmark e verificação do modo offline (`src/main/offline.py`).
+
+Grava uma sequência sintética de landmarks em JSONL e em NPZ, reconhece as duas gravações em lote
+e confere, frame a frame, que o resultado é o mesmo do reconhecimento de um frame por vez.
+"""
+from common import preparar_ambiente, medir, imprimir_resultado
+from fixtures import gerar_gravacao
+import argparse
+import tempfile
+import sys
+import os
+
+preparar_ambiente()
+
+from src.gestures.landmark_stream import LandmarkStream, LandmarkRecording
+from src.gestures.gesture_recognizer import GestureRecognizer
+from offline import reconhecer_gravacao
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+
+    gravacao = LandmarkRecording(*gerar_gravacao(args.frames, semente=11))
+    recognizer = GestureRecognizer()
+
+    esperado = [recognizer.reconhecer(pontos, mao) for pontos, mao in zip(gravacao.pontos, gravacao.maos.tolist())]
+    obtido = recognizer.reconhecer_lote(gravacao.pontos, gravacao.maos)
+    divergencias = sum(a != b for a, b in zip(esperado, obtido))
+    reconhecidos = sum(gesto is not None for gesto in obtido)
+    print(f"Frames com gesto reconhecido: {reconhecidos}/{len(obtido)}")
+    print(f"Divergencias entre lote e frame a frame: {divergencias}")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        for extensao in ("jsonl", "npz"):
+            caminho = os.path.join(pasta, f"gravacao.{extensao}")
+            LandmarkStream.salvar(caminho, gravacao)
+            carregada = LandmarkStream.carregar(caminho)
+            if (carregada.pontos != gravacao.pontos).any() or carregada.maos.tolist() != gravacao.maos.tolist():
+                print(f"Gravacao {extensao} nao confere apos salvar e carregar.")
+                divergencias += 1
+
+            with open(os.devnull, "w") as saida:
+                resumo = reconhecer_gravacao(caminho, saida, 4096)
+            print(f"offline {extensao:<6} {resumo['frames']} frames em {resumo['segundos'] * 1000:.1f} ms ({resumo['fps']:.0f} frames/s)")
+
+    indice = [0]
+
+    def frame_a_frame():
+        recognizer.reconhecer(gravacao.pontos[indice[0] % len(gravacao)], gravacao.maos[indice[0] % len(gravacao)])
+        indice[0] += 1
+
+    lote = gravacao.pontos[:4096], gravacao.maos[:4096]
+    imprimir_resultado("reconhecimento por frame", medir(frame_a_frame, 2000), medir(lambda: recognizer.reconhecer_lote(*lote), 10, aquecimento=1) / len(lote[0]))
+
+    if divergencias:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark do pipeline em estágios (captura -> inferência -> renderização) contra o loop serial.
+
+Simula uma câmera a 30 fps com buffer de 4 frames (como o backend do OpenCV) e uma inferência mais
+lenta que o intervalo entre frames. No loop serial, a câmera entrega frames antigos do buffer; no
+pipeline, a captura esvazia o buffer continuamente e a inferência sempre pega o frame mais recente.
+"""
+from common import preparar_ambiente
+from collections import deque
+import argparse
+import threading
+import time
+
+preparar_ambiente()
+
+from src.pipeline.frame_slot import FrameSlot
+from src.pipeline.metrics import RollingStats
+
+FPS = 30.0
+BUFFER_CAMERA = 4
+
+
+class CameraSimulada:
+    """
+    Câmera que produz um frame a cada 1/FPS segundos em um buffer limitado (descarta os novos quando cheio,
+    como os drivers de webcam). Cada frame é o instante em que foi "exposto".
+    """
+
+    def __init__(self):
+        self.buffer = deque()
+        self.inicio = time.perf_counter()
+        self.produzidos = 0
+
+    def read(self) -> float:
+        while True:
+            agora = time.perf_counter()
+            devidos = int((agora - self.inicio) * FPS)
+            while self.produzidos < devidos:
+                self.produzidos += 1
+                if len(self.buffer) < BUFFER_CAMERA:
+                    self.buffer.append(self.inicio + self.produzidos / FPS)
+            if self.buffer:
+                return self.buffer.popleft()
+            time.sleep(self.inicio + (self.produzidos + 1) / FPS - agora)
+
+
+def inferencia(tempo: float) -> None:
+    time.sleep(tempo)
+
+
+def serial(segundos: float, tempo_inferencia: float) -> tuple:
+    camera = CameraSimulada()
+    latencias = RollingStats(capacidade=4096)
+    processados = 0
+    while time.perf_counter() - camera.inicio < segundos:
+        exposto = camera.read()
+        inferencia(tempo_inferencia)
+        latencias.adicionar((time.perf_counter() - exposto) * 1000)
+        processados += 1
+    return processados, latencias.resumo()
+
+
+def em_estagios(segundos: float, tempo_inferencia: float) -> tuple:
+    camera = CameraSimulada()
+    latencias = RollingStats(capacidade=4096)
+    slot = FrameSlot()
+    parar = threading.Event()
+    processados = [0]
+
+    def captura():
+        while not parar.is_set():
+            slot.publicar(camera.read())
+        slot.fechar()
+
+    def inferir():
+        ultimo = 0
+        while not parar.is_set():
+            ultimo, exposto = slot.aguardar(ultimo, timeout=0.5)
+            if exposto is None:
+                continue
+            inferencia(tempo_inferencia)
+            latencias.adicionar((time.perf_counter() - exposto) * 1000)
+            processados[0] += 1
+
+    threads = [threading.Thread(target=captura), threading.Thread(target=inferir)]
+    for thread in threads:
+        thread.start()
+    time.sleep(segundos)
+    parar.set()
+    for thread in threads:
+        thread.join()
+    return processados[0], latencias.resumo()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--segundos", type=float, default=3.0)
+    parser.add_argument("--inferencia-ms", type=float, default=45.0)
+    args = parser.parse_args()
+
+    for nome, executar in (("serial", serial), ("em estagios", em_estagios)):
+        processados, resumo = executar(args.segundos, args.inferencia_ms / 1000)
+        print(f"{nome:<12} frames inferidos: {processados:4d} | glass-to-landmark p50 {resumo['p50']:6.1f} ms, "
+              f"p95 {resumo['p95']:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Custo do placeholder de câmera desligada (`public/assets/camera_off.png`) no stream de frames.
+
+Compara o caminho original (resolve o caminho, `os.path.exists`, `cv2.imread`, JPEG e base64 a cada
+iteração de um loop sem pausa) com o placeholder em cache reenviado a cada `INTERVALO_PLACEHOLDER`.
+
+    python benchmarks/bench_placeholder.py --segundos 3
+"""
+from common import preparar_ambiente, medir, imprimir_resultado
+import argparse
+import asyncio
+import base64
+import time
+import os
+
+preparar_ambiente()
+
+import cv2
+
+from src.camera.frame_source import SyntheticSource
+from src.camera.camera_stream import CameraStream
+from src.camera.stream_profile import StreamProfile
+from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+
+PLACEHOLDER = os.path.join("src", "main", "src", "camera", "..", "..", "..", "..", "public", "assets", "camera_off.png")
+
+
+def placeholder_legado() -> str:
+    caminho = os.path.abspath(PLACEHOLDER)
+    if not os.path.exists(caminho):
+        raise FileNotFoundError(caminho)
+    frame = cv2.imread(caminho)
+    _, buffer = cv2.imencode('.jpg', frame)
+    return base64.b64encode(buffer).decode('utf-8')
+
+
+class ServidorContador(FramesWebsocketServer):
+    """
+    Servidor de frames sem rede, com um cliente simulado, que apenas conta os frames entregues.
+    """
+
+    def __init__(self):
+        super().__init__(0)
+        self.entregues = 0
+
+    async def send_frame(self, frame) -> None:
+        self.entregues += 1
+
+    def has_subscribers(self) -> bool:
+        return True
+
+    async def aguardar_assinantes(self, timeout: float = None) -> bool:
+        return True
+
+    def get_fps_pedido(self) -> float:
+        return None
+
+
+async def loop_legado(segundos: float) -> tuple:
+    loop = asyncio.get_event_loop()
+    enviados = 0
+    inicio = time.perf_counter()
+    while time.perf_counter() - inicio < segundos:
+        frame = await loop.run_in_executor(None, placeholder_legado)
+        if frame == "": continue
+        enviados += 1
+        time.sleep(0.00001)
+    return enviados, time.perf_counter() - inicio
+
+
+async def loop_atual(segundos: float) -> tuple:
+    servidor = ServidorContador()
+    # Fonte de um único frame: depois dele o pipeline encerra e o stream passa a enviar o placeholder
+    stream = CameraStream(servidor, SyntheticSource(640, 480, tempo_real=False, quantidade=1), StreamProfile())
+    await stream.start_stream()
+    while stream.camera_capture.pipeline_ativo():
+        await asyncio.sleep(0.05)
+    entregues = servidor.entregues
+    inicio = time.perf_counter()
+    await asyncio.sleep(segundos)
+    decorrido = time.perf_counter() - inicio
+    await stream.stop_stream()
+    return servidor.entregues - entregues, decorrido
+
+
+def executar(corrotina, segundos: float) -> tuple:
+    inicio_cpu = time.process_time()
+    enviados, decorrido = asyncio.run(corrotina(segundos))
+    return enviados / decorrido, (time.process_time() - inicio_cpu) / decorrido
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=3.0)
+    args = parser.parse_args()
+
+    stream = CameraStream(ServidorContador(), SyntheticSource(), StreamProfile())
+    stream.get_placeholder()
+    imprimir_resultado("placeholder por chamada", medir(placeholder_legado, 100), medir(stream.get_placeholder, 10000))
+
+    fps, cpu = executar(loop_legado, args.segundos)
+    print(f"{'loop original':<40} placeholders enviados: {fps:8.1f}/s | CPU do processo: {cpu * 100:5.1f}%")
+    fps, cpu = executar(loop_atual, args.segundos)
+    print(f"{'loop atual (camera desligada)':<40} placeholders enviados: {fps:8.1f}/s | CPU do processo: {cpu * 100:5.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Preparação da entrada da detecção de mão (`FramePreprocessor`) em 640x480, 1280x720 e 1920x1080.
+
+Compara o caminho original (`cv2.flip` na leitura do frame e `cv2.cvtColor` no `detect_hand`, cada um
+alocando um frame novo na resolução da câmera) com o pré-processamento em buffers reutilizados, na
+resolução original e reduzido para 640 pixels de largura. Mede ms por frame e a memória alocada por
+frame (pico do tracemalloc), e o `detect_hand` completo sobre um frame com uma mão.
+
+    python benchmarks/bench_preprocess.py
+"""
+from common import preparar_ambiente, medir
+from fixtures import desenhar_mao, _pose, _BASES
+import tracemalloc
+
+preparar_ambiente()
+
+import numpy as np
+import cv2
+
+from src.pipeline.frame_preprocessor import FramePreprocessor
+from src.gestures.gesture_reader import GestureReader
+
+RESOLUCOES = ((640, 480), (1280, 720), (1920, 1080))
+
+
+def caminho_original(frame: np.ndarray) -> np.ndarray:
+    return cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
+
+
+def alocado_por_frame(funcao, repeticoes: int = 20) -> float:
+    """
+    Retorna a memória alocada (pico acima do uso atual) em uma chamada, em KB, na média de `repeticoes`.
+    """
+    funcao()
+    tracemalloc.start()
+    total = 0
+    for _ in range(repeticoes):
+        tracemalloc.reset_peak()
+        atual = tracemalloc.get_traced_memory()[0]
+        funcao()
+        total += tracemalloc.get_traced_memory()[1] - atual
+    tracemalloc.stop()
+    return total / repeticoes / 1024
+
+
+def frame_com_mao(largura: int, altura: int) -> np.ndarray:
+    frame = np.full((altura, largura, 3), (90, 110, 100), dtype=np.uint8)
+    desenhar_mao(frame, _pose({dedo: 0.1 for dedo in _BASES}), (largura / 2, altura / 2), altura * 0.45)
+    return cv2.GaussianBlur(frame, (5, 5), 0)
+
+
+def detectar(reader: GestureReader, frame: np.ndarray, original: bool):
+    if original:
+        # detect_hand original: a entrada já chega espelhada e a conversão aloca outro frame
+        return reader.hands.process(caminho_original(frame))
+    return reader.detect_hand(frame)
+
+
+def main() -> None:
+    print(f"{'':<12} {'caminho':<22} {'ms/frame':>9} {'KB alocados/frame':>18} {'detect_hand ms':>15}")
+    for largura, altura in RESOLUCOES:
+        frame = frame_com_mao(largura, altura)
+        casos = {
+            "original": (lambda: caminho_original(frame), None),
+            "buffers, original": (None, FramePreprocessor(espelhar=True)),
+            "buffers, 640 px": (None, FramePreprocessor(largura_max=640, espelhar=True)),
+        }
+        for nome, (funcao, preprocessor) in casos.items():
+            if preprocessor is not None:
+                funcao = lambda p=preprocessor: p.preparar(frame)
+            ms = medir(funcao, 200) / 1000
+            kb = alocado_por_frame(funcao)
+
+            reader = GestureReader()
+            if preprocessor is not None:
+                reader.preprocessor = preprocessor
+            detectar(reader, frame, preprocessor is None)
+            deteccao = medir(lambda: detectar(reader, frame, preprocessor is None), 30, aquecimento=5) / 1000
+            print(f"{largura}x{altura:<7} {nome:<22} {ms:9.3f} {kb:18.1f} {deteccao:15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Renderização e codificação sob demanda: o pipeline completo (fonte sintética 1280x720 a 30 fps ->
+MediaPipe -> render -> stream) sem clientes de vídeo, com um cliente sem limite e com um cliente
+que pede {"MAX_FPS": 10}.
+
+O caso "original" reproduz o pipeline anterior: todos os frames inferidos são desenhados e
+codificados, haja ou não alguém assistindo.
+
+    python benchmarks/bench_render_demand.py --segundos 4
+"""
+from common import preparar_ambiente
+import argparse
+import asyncio
+import json
+import time
+
+preparar_ambiente()
+
+import websockets
+
+from src.camera.camera_manager import Camera
+from src.camera.frame_source import SyntheticSource
+from src.camera.stream_profile import StreamProfile
+from src.camera.camera_stream import CameraStream
+from src.websockets.frames_websocket.frame_protocol import FrameProtocol
+from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+
+codificados = {"jpeg": 0}
+_codificar_original = FrameProtocol.codificar
+
+
+def _codificar_contando(*args, **kwargs):
+    codificados["jpeg"] += 1
+    return _codificar_original(*args, **kwargs)
+
+
+FrameProtocol.codificar = staticmethod(_codificar_contando)
+
+
+class CameraSempreRenderiza(Camera):
+    """
+    Ignora a demanda do stream e renderiza todos os frames, como antes.
+    """
+
+    @property
+    def fps_render(self):
+        return None
+
+    @fps_render.setter
+    def fps_render(self, valor):
+        pass
+
+
+class ServidorSemClientes(FramesWebsocketServer):
+    """
+    Servidor sem conexões que, como o original, recebe todos os frames codificados.
+    """
+
+    async def send_frame(self, frame) -> None:
+        pass
+
+    def get_fps_pedido(self) -> float:
+        return None
+
+
+async def cliente(porta: int, max_fps, recebidos: dict, parar: asyncio.Event) -> None:
+    async with websockets.connect(f"ws://localhost:{porta}", max_size=None) as websocket:
+        await websocket.send(json.dumps({"FORMAT": "binary", "MAX_FPS": max_fps}))
+        while not parar.is_set():
+            try:
+                mensagem = await asyncio.wait_for(websocket.recv(), 0.2)
+            except asyncio.TimeoutError:
+                continue
+            if isinstance(mensagem, bytes):
+                recebidos["frames"] += 1
+
+
+async def executar(porta: int, segundos: float, caso: str) -> dict:
+    servidor = ServidorSemClientes(porta) if caso == "original" else FramesWebsocketServer(porta)
+    stream = CameraStream(servidor, SyntheticSource(1280, 720, fps=30.0), StreamProfile())
+    if caso == "original":
+        stream.camera_capture.__class__ = CameraSempreRenderiza
+    recebidos = {"frames": 0}
+    parar = asyncio.Event()
+
+    async with websockets.serve(servidor.handler, "localhost", porta, max_size=None):
+        tarefa_cliente = None
+        if caso in ("cliente", "cliente 10 fps"):
+            tarefa_cliente = asyncio.create_task(cliente(porta, 10 if caso == "cliente 10 fps" else None, recebidos, parar))
+            await asyncio.sleep(0.2)
+        await stream.start_stream()
+        await asyncio.sleep(0.5)
+
+        metricas = stream.camera_capture.get_metricas()
+        renders, inferencias = metricas["render_ms"]["total"], metricas["inferencia_ms"]["total"]
+        codificados["jpeg"] = 0
+        recebidos["frames"] = 0
+        inicio_cpu = time.process_time()
+        inicio = time.perf_counter()
+        await asyncio.sleep(segundos)
+        decorrido = time.perf_counter() - inicio
+        cpu = time.process_time() - inicio_cpu
+        metricas = stream.camera_capture.get_metricas()
+
+        parar.set()
+        await stream.stop_stream()
+        if tarefa_cliente:
+            await tarefa_cliente
+
+    return {
+        "inferencia": (metricas["inferencia_ms"]["total"] - inferencias) / decorrido,
+        "render": (metricas["render_ms"]["total"] - renders) / decorrido,
+        "jpeg": codificados["jpeg"] / decorrido,
+        "recebido": recebidos["frames"] / decorrido,
+        "cpu": cpu / decorrido,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=4.0)
+    parser.add_argument("--porta", type=int, default=8800)
+    args = parser.parse_args()
+
+    for n, caso in enumerate(("original", "sem clientes", "cliente", "cliente 10 fps")):
+        r = asyncio.run(executar(args.porta + n, args.segundos, caso))
+        print(f"{caso:<16} inferencia {r['inferencia']:5.1f}/s | render {r['render']:5.1f}/s | JPEG {r['jpeg']:5.1f}/s | "
+              f"recebido {r['recebido']:5.1f} fps | CPU do processo {r['cpu'] * 100:5.0f}%")
+
+
+if __name__ == "__main__":
+    main()
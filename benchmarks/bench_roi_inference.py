@@ -0,0 +1,101 @@
+"""
+Inferência na região das mãos (`GestureReader.iniciar_modo_roi`) contra a inferência no frame completo,
+frame a frame sobre o mesmo vídeo: tempo de `detect_hand`, mãos detectadas, distância entre os
+landmarks dos dois modos e concordância do gesto reconhecido.
+
+Sem `--video`, grava antes um vídeo sintético 1280x720 de uma mão desenhada (`fixtures.gerar_video_maos`).
+
+    python benchmarks/bench_roi_inference.py --frames 600
+    python benchmarks/bench_roi_inference.py --video gravacao.mp4
+"""
+from common import preparar_ambiente
+from fixtures import gerar_video_maos
+import argparse
+import tempfile
+import time
+import os
+
+preparar_ambiente()
+
+import numpy as np
+import cv2
+
+from src.gestures.gesture_reader import GestureReader
+from src.gestures.gesture_features import landmarks_para_array
+from src.gestures.gesture_recognizer import GestureRecognizer
+from src.pipeline.metrics import RollingStats
+
+
+def primeira_mao(reader: GestureReader, results) -> tuple:
+    """
+    Retorna (mão, pontos (21, 3)) da primeira mão detectada, ou (None, None).
+    """
+    for hand_landmarks, handedness in zip(reader.get_hand_landmarks(results), results.multi_handedness or []):
+        return handedness.classification[0].label, landmarks_para_array(hand_landmarks)
+    return None, None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="Arquivo de video usado como fonte.")
+    parser.add_argument("--frames", type=int, default=600, help="Frames do video sintetico.")
+    args = parser.parse_args()
+
+    pasta = None
+    caminho = args.video
+    if caminho is None:
+        pasta = tempfile.TemporaryDirectory()
+        caminho = gerar_video_maos(os.path.join(pasta.name, "maos.mp4"), args.frames)
+
+    completo, roi = GestureReader(), GestureReader()
+    roi.iniciar_modo_roi()
+    recognizer = GestureRecognizer()
+    tempos = {"completo": RollingStats(capacidade=100000), "roi": RollingStats(capacidade=100000)}
+    deteccoes = {"completo": 0, "roi": 0, "ambos": 0, "divergentes": 0}
+    gestos = {"iguais": 0, "total": 0}
+    distancias = []
+
+    cap = cv2.VideoCapture(caminho)
+    largura = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
+    altura = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+    frames = 0
+    while True:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames += 1
+        maos = {}
+        for nome, reader in (("completo", completo), ("roi", roi)):
+            inicio = time.perf_counter()
+            results = reader.detect_hand(frame)
+            tempos[nome].adicionar((time.perf_counter() - inicio) * 1000)
+            maos[nome] = primeira_mao(reader, results)
+            deteccoes[nome] += maos[nome][0] is not None
+
+        (mao_c, pontos_c), (mao_r, pontos_r) = maos["completo"], maos["roi"]
+        if (mao_c is None) != (mao_r is None):
+            deteccoes["divergentes"] += 1
+        elif mao_c is not None:
+            deteccoes["ambos"] += 1
+            distancias.append(np.abs((pontos_c[:, :2] - pontos_r[:, :2]) * (largura, altura)).mean())
+            gestos["total"] += 1
+            gestos["iguais"] += recognizer.reconhecer(pontos_c, mao_c) == recognizer.reconhecer(pontos_r, mao_r)
+    cap.release()
+    if pasta is not None:
+        pasta.cleanup()
+
+    print(f"{frames} frames de {caminho if args.video else 'video sintetico'} ({int(largura)}x{int(altura)})")
+    for nome, stats in tempos.items():
+        r = stats.resumo()
+        print(f"  {nome:<9} detect_hand: media {r['media']:6.2f} ms | p50 {r['p50']:6.2f} ms | p95 {r['p95']:6.2f} ms | "
+              f"frames com mao: {deteccoes[nome]}")
+    print(f"  modo roi: {roi.roi.metricas()}")
+    print(f"  deteccao divergente em {deteccoes['divergentes']} frames ({deteccoes['divergentes'] / max(frames, 1) * 100:.1f}%)")
+    if distancias:
+        print(f"  distancia media entre os landmarks dos dois modos: {np.mean(distancias):.2f} px (p95 {np.percentile(distancias, 95):.2f} px)")
+    print(f"  gesto reconhecido igual em {gestos['iguais']} de {gestos['total']} frames com mao nos dois modos "
+          f"({gestos['iguais'] / max(gestos['total'], 1) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Stream de frames da `CameraStream` com o pipeline completo (fonte sintética -> MediaPipe -> render)
+e um servidor de frames local com um cliente.
+
+Compara o loop original (codifica e envia o frame atual o mais rápido possível, repetindo frames
+iguais, JPEG com a qualidade padrão) com o perfil de stream (limite de fps, largura máxima, qualidade
+do JPEG e frames repetidos ignorados). Depois, simula o controle adaptativo com clientes congestionados.
+
+    python benchmarks/bench_stream_profile.py --segundos 5
+"""
+from common import preparar_ambiente
+import argparse
+import asyncio
+import time
+
+preparar_ambiente()
+
+import websockets
+import cv2
+
+from src.camera.frame_source import SyntheticSource
+from src.camera.stream_profile import StreamProfile, AdaptiveStreamController
+from src.camera.camera_stream import CameraStream
+from src.websockets.frames_websocket.frame_protocol import FrameProtocol
+from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+
+
+async def loop_legado(stream: CameraStream, servidor: FramesWebsocketServer, parar: asyncio.Event) -> None:
+    """
+    Loop original: codifica o frame atual no executor padrão e envia, sem limite de fps.
+    """
+    loop = asyncio.get_event_loop()
+
+    def codificar():
+        seq, timestamp, frame = stream.camera_capture.frame_renderizado
+        return FrameProtocol.codificar(frame, seq, timestamp)
+
+    while not parar.is_set():
+        frame = await loop.run_in_executor(None, codificar)
+        await servidor.send_frame(frame)
+        await asyncio.sleep(0)
+
+
+async def cliente(porta: int, recebidos: dict, parar: asyncio.Event) -> None:
+    async with websockets.connect(f"ws://localhost:{porta}", max_size=None) as websocket:
+        await websocket.send('{"FORMAT": "binary"}')
+        await websocket.recv()
+        while not parar.is_set():
+            try:
+                mensagem = await asyncio.wait_for(websocket.recv(), 0.2)
+            except asyncio.TimeoutError:
+                continue
+            recebidos["frames"] += 1
+            recebidos["bytes"] += len(mensagem)
+
+
+async def executar(porta: int, segundos: float, profile: StreamProfile, legado: bool = False) -> dict:
+    servidor = FramesWebsocketServer(porta)
+    stream = CameraStream(servidor, SyntheticSource(1280, 720, fps=30.0), profile)
+    recebidos = {"frames": 0, "bytes": 0}
+    parar = asyncio.Event()
+
+    async with websockets.serve(servidor.handler, "localhost", porta, max_size=None):
+        tarefa_cliente = asyncio.create_task(cliente(porta, recebidos, parar))
+        await asyncio.sleep(0.2)
+
+        if legado:
+            await stream.camera_capture.start()
+            while stream.camera_capture.frame_renderizado is None:
+                await asyncio.sleep(0.05)
+            tarefa_stream = asyncio.create_task(loop_legado(stream, servidor, parar))
+        else:
+            await stream.start_stream()
+
+        inicio_cpu = time.process_time()
+        inicio = time.perf_counter()
+        while time.perf_counter() - inicio < segundos:
+            await asyncio.sleep(0.25)
+        decorrido = time.perf_counter() - inicio
+        cpu = time.process_time() - inicio_cpu
+
+        parar.set()
+        if legado:
+            await tarefa_stream
+            stream.camera_capture.stop()
+        else:
+            await stream.stop_stream()
+        await tarefa_cliente
+
+    metricas = stream.camera_capture.get_metricas()
+    return {
+        "fps_camera": metricas["render_ms"]["total"] / decorrido,
+        "fps_inferencia": metricas["inferencia_ms"]["total"] / decorrido,
+        "fps_recebido": recebidos["frames"] / decorrido,
+        "kb_por_s": recebidos["bytes"] / decorrido / 1024,
+        "cpu": cpu / decorrido,
+    }
+
+
+def simular_controle() -> None:
+    """
+    Controle adaptativo com uma sequência de estados dos clientes: 3 s congestionados
+    (um frame ainda na fila a cada envio, 60 ms de latência), depois 6 s livres.
+    """
+    controller = AdaptiveStreamController(StreamProfile())
+    instante = 0.0
+    ultimo = None
+    print("controle adaptativo (3 s congestionado, depois livre):")
+    while instante < 9.0:
+        congestionado = instante < 3.0
+        configuracao = controller.atualizar(60.0 if congestionado else 5.0, 1 if congestionado else 0)
+        if configuracao != ultimo:
+            print(f"  t={instante:4.1f}s degrau {controller.nivel}: {configuracao.largura_max}px, "
+                  f"qualidade {configuracao.qualidade_jpeg}, {configuracao.fps:.1f} fps")
+            ultimo = configuracao
+        instante += 1 / configuracao.fps
+
+
+def imprimir(nome: str, r: dict) -> None:
+    print(f"{nome:<22} camera {r['fps_camera']:5.1f} fps | inferencia {r['fps_inferencia']:5.1f} fps | "
+          f"recebido {r['fps_recebido']:6.1f} fps, {r['kb_por_s']:8.0f} KB/s | CPU do processo {r['cpu'] * 100:5.0f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=5.0)
+    parser.add_argument("--porta", type=int, default=8770)
+    args = parser.parse_args()
+    print(f"Fonte sintetica 1280x720 a 30 fps, {cv2.getNumThreads()} threads do OpenCV")
+
+    imprimir("loop original", asyncio.run(executar(args.porta, args.segundos, StreamProfile(), legado=True)))
+    imprimir("perfil padrao", asyncio.run(executar(args.porta + 1, args.segundos, StreamProfile())))
+    imprimir("perfil 15 fps, 480px", asyncio.run(executar(args.porta + 2, args.segundos, StreamProfile(max_fps=15, max_width=480))))
+
+    simular_controle()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Telemetria binária por frame (`TelemetryRecorder` / `TelemetryReader`).
+
+1. Custo por evento na thread do pipeline: linha de texto síncrona com o dicionário de features (como
+   o "Gesto de libras interpretado: {...}" original), a mesma linha pela fila de logging, e um
+   evento de 48 bytes no arquivo mapeado em memória.
+2. Análise em escala: um arquivo com a capacidade padrão cheia (~1M eventos, algumas horas de
+   operação) é carregado e resumido (histogramas e linha do tempo dos gestos).
+3. Pipeline real: a Camera roda sobre um vídeo sintético com mãos, com a telemetria ligada, e o
+   arquivo gravado é lido de volta.
+
+    python benchmarks/bench_telemetry.py --segundos 10
+"""
+from common import preparar_ambiente, medir
+from fixtures import gerar_video_maos
+from logging.handlers import RotatingFileHandler
+import argparse
+import tempfile
+import asyncio
+import logging
+import time
+import os
+
+preparar_ambiente()
+
+import numpy as np
+
+from src.camera.camera_manager import Camera
+from src.camera.frame_source import VideoFileSource
+from src.gestures.gesture_matcher import FEATURES_ESTATICAS
+from src.logger.logger import Logger
+from src.telemetry.telemetry_recorder import TelemetryRecorder, EVENTO, CABECALHO, TIPO_FRAME, TIPO_GESTO, FLAG_INFERIDO, FLAG_RECONHECIDO
+from src.telemetry.telemetry_reader import TelemetryReader
+
+GESTO_ATUAL = {feature: bool(i % 3 == 0) for i, feature in enumerate(FEATURES_ESTATICAS)} | {"has_movement": False, "type_of_movement": ""}
+
+
+def custo_por_evento(pasta: str) -> None:
+    sincrono = logging.getLogger("telemetria_sincrono")
+    sincrono.setLevel(logging.INFO)
+    handler = RotatingFileHandler(os.path.join(pasta, "gestos.log"), maxBytes=5 * 1024 * 1024, backupCount=3)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(message)s'))
+    sincrono.addHandler(handler)
+    fila = Logger.configure_gestures_logger()
+    recorder = TelemetryRecorder(os.path.join(pasta, "custo.bin"), capacidade=1 << 16)
+    agora = time.perf_counter()
+
+    casos = {
+        "texto sincrono (original)": lambda: sincrono.info(f"Gesto de libras interpretado: {GESTO_ATUAL}"),
+        "texto pela fila de logging": lambda: fila.info(f"Gesto de libras interpretado: {GESTO_ATUAL}"),
+        "evento de frame": lambda: recorder.registrar_frame(1, agora, 1, True, 21.5, 30.2),
+        "evento de gesto": lambda: recorder.registrar_gesto(1, agora, "Right", 0b1001001, "A", False),
+    }
+    print("Custo por evento na thread chamadora:")
+    for nome, funcao in casos.items():
+        print(f"  {nome:<28} {medir(funcao, 20000):7.2f} us")
+    recorder.fechar()
+    print(f"  tamanho: texto ~{len(f'Gesto de libras interpretado: {GESTO_ATUAL}') + 70} bytes por linha, evento {EVENTO.itemsize} bytes")
+
+
+def analise_em_escala(pasta: str) -> None:
+    """
+    Preenche um arquivo com a capacidade padrão: 30 fps, um evento de frame e um de gesto (mão direita) por frame.
+    """
+    caminho = os.path.join(pasta, "horas.bin")
+    recorder = TelemetryRecorder(caminho)
+    capacidade = recorder.capacidade
+    recorder.fechar()
+
+    rng = np.random.default_rng(0)
+    frames = capacidade // 2
+    eventos = np.zeros(capacidade, dtype=EVENTO)
+    instantes = time.time() - frames / 30 + np.arange(frames) / 30
+    eventos["instante"][0::2] = eventos["instante"][1::2] = instantes
+    eventos["seq"][0::2] = eventos["seq"][1::2] = np.arange(frames)
+    eventos["tipo"][0::2], eventos["tipo"][1::2] = TIPO_FRAME, TIPO_GESTO
+    eventos["maos"][0::2] = 1
+    eventos["flags"][0::2] = FLAG_INFERIDO
+    eventos["inferencia_ms"][0::2] = rng.gamma(9, 2.5, frames)
+    eventos["latencia_ms"][0::2] = eventos["inferencia_ms"][0::2] + rng.gamma(2, 2, frames)
+    eventos["latencia_ms"][1::2] = eventos["latencia_ms"][0::2] + rng.gamma(2, 1, frames)
+    eventos["mao"][1::2] = 1
+    gestos = np.array([b"A", b"B", b"", b"L", b"mouse_tracking"])[(np.arange(frames) // 90) % 5]
+    eventos["gesto"][1::2] = gestos
+    eventos["flags"][1::2] = np.where(gestos != b"", FLAG_RECONHECIDO, 0)
+    with open(caminho, "r+b") as file:
+        file.seek(CABECALHO.itemsize)
+        eventos.tofile(file)
+        cabecalho = np.fromfile(caminho, dtype=CABECALHO, count=1)
+        cabecalho["escritos"] = capacidade
+        file.seek(0)
+        cabecalho.tofile(file)
+
+    inicio = time.perf_counter()
+    leitor = TelemetryReader(caminho)
+    carregado = time.perf_counter()
+    latencias = leitor.latencias()
+    histograma = leitor.histograma(leitor.frames()["inferencia_ms"])
+    trechos = leitor.linha_do_tempo("Right")
+    fim = time.perf_counter()
+    print(f"Analise de {capacidade} eventos ({frames / 30 / 3600:.1f} h a 30 fps, {os.path.getsize(caminho) / 2**20:.0f} MB):")
+    print(f"  carregar {(carregado - inicio) * 1000:.0f} ms | latencias + histograma + linha do tempo {(fim - carregado) * 1000:.0f} ms")
+    print(f"  inferencia p50 {latencias['inferencia_ms']['p50']:.1f} ms p99 {latencias['inferencia_ms']['p99']:.1f} ms | "
+          f"{len(histograma)} faixas | {len(trechos)} trechos na linha do tempo")
+
+
+async def pipeline(caminho_video: str, caminho: str, segundos: float) -> Camera:
+    camera = Camera(VideoFileSource(caminho_video, tempo_real=True, repetir=True))
+    camera.fps_render = 0
+    await camera.start()
+    camera.iniciar_telemetria(caminho)
+    await asyncio.sleep(segundos)
+    camera.stop()
+    return camera
+
+
+def pipeline_real(pasta: str, segundos: float) -> None:
+    video = gerar_video_maos(os.path.join(pasta, "maos.mp4"), 150, fps=30.0)
+    caminho = os.path.join(pasta, "pipeline.bin")
+    camera = asyncio.run(pipeline(video, caminho, segundos))
+
+    leitor = TelemetryReader(caminho)
+    frames, gestos = leitor.frames(), leitor.gestos()
+    latencias = leitor.latencias()
+    print(f"Pipeline real ({segundos:.0f} s, video 1280x720 a 30 fps):")
+    print(f"  {len(frames)} eventos de frame (capturados pela Camera: {camera.get_metricas()['frames_capturados']}), "
+          f"{len(gestos)} eventos de gesto, {os.path.getsize(caminho) / 2**20:.0f} MB reservados")
+    print(f"  deteccao p50 {latencias['inferencia_ms']['p50']:.1f} ms | captura ate gesto p95 {latencias['captura_ate_gesto_ms']['p95']:.1f} ms")
+    for mao in ("Right", "Left"):
+        trechos = leitor.linha_do_tempo(mao)
+        contagem = {}
+        for trecho in trechos:
+            contagem[trecho.gesto or "MAO"] = contagem.get(trecho.gesto or "MAO", 0) + trecho.frames
+        print(f"  linha do tempo ({mao}): {len(trechos)} trechos, frames por gesto {contagem}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segundos", type=float, default=10.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        custo_por_evento(pasta)
+        analise_em_escala(pasta)
+        pipeline_real(pasta, args.segundos)
+    Logger.encerrar()
+
+
+if __name__ == "__main__":
+    main()
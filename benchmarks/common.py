@@ -0,0 +1,51 @@
+"""
+Utilitários compartilhados pelos benchmarks do LibrasController.
+
+Os benchmarks devem ser executados a partir da raiz do repositório, por exemplo:
+
+    python benchmarks/bench_config_state.py
+"""
+import time
+import sys
+import os
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def preparar_ambiente() -> None:
+    """
+    Coloca `src/main` no sys.path (para os imports `src.*`) e muda o diretório atual
+    para a raiz do repositório, de onde os caminhos relativos dos arquivos de dados são resolvidos.
+    """
+    main_dir = os.path.join(REPO_ROOT, "src", "main")
+    if main_dir not in sys.path:
+        sys.path.insert(0, main_dir)
+    os.chdir(REPO_ROOT)
+
+
+def medir(funcao, repeticoes: int, aquecimento: int = 10) -> float:
+    """
+    Mede o tempo médio de uma chamada.
+
+    Args:
+        funcao: Função sem argumentos a ser medida.
+        repeticoes (int): Quantidade de chamadas medidas.
+        aquecimento (int): Quantidade de chamadas descartadas antes da medição.
+
+    Returns:
+        float: Tempo médio por chamada, em microssegundos.
+    """
+    for _ in range(aquecimento):
+        funcao()
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1e6
+
+
+def imprimir_resultado(nome: str, antes_us: float, depois_us: float) -> None:
+    """
+    Imprime a comparação entre o tempo antes e depois de uma otimização.
+    """
+    ganho = antes_us / depois_us if depois_us else float("inf")
+    print(f"{nome:<40} antes: {antes_us:10.2f} us | depois: {depois_us:10.2f} us | {ganho:6.1f}x")
@@ -0,0 +1,165 @@
+"""
+Geração de fixtures de landmarks para os benchmarks.
+
+As poses são sintéticas, mas anatomicamente plausíveis: cada dedo tem um grau de flexão sorteado,
+a mão é rotacionada, escalada e transladada, e recebe ruído. A geração é determinística para uma
+mesma semente, então os resultados dos benchmarks são comparáveis entre execuções.
+"""
+from types import SimpleNamespace
+import numpy as np
+import cv2
+
+# Mão direita aberta, pulso na origem, y crescendo para baixo (como no MediaPipe)
+_BASES = {
+    "thumb": (-0.05, -0.03),
+    "index": (-0.04, -0.14),
+    "middle": (0.0, -0.15),
+    "ring": (0.04, -0.14),
+    "pinky": (0.075, -0.12),
+}
+_SEGMENTOS = (0.05, 0.035, 0.03)
+_DIRECOES = {
+    "thumb": np.array([-0.7, -0.7]),
+    "index": np.array([-0.15, -1.0]),
+    "middle": np.array([0.0, -1.0]),
+    "ring": np.array([0.12, -1.0]),
+    "pinky": np.array([0.25, -1.0]),
+}
+
+
+def _pose(flexoes: dict) -> np.ndarray:
+    """
+    Monta os 21 landmarks (x, y) de uma mão com o grau de flexão de cada dedo (0 = esticado, 1 = fechado).
+    """
+    pontos = np.zeros((21, 2))
+    for i, dedo in enumerate(_BASES):
+        base = np.array(_BASES[dedo])
+        pontos[1 + 4 * i] = base
+        direcao = _DIRECOES[dedo]
+        angulo = 0.0
+        atual = base
+        for j, comprimento in enumerate(_SEGMENTOS):
+            # Cada articulação dobra em direção à palma proporcionalmente à flexão
+            angulo += flexoes[dedo] * (1.2 if dedo != "thumb" else 0.9)
+            sinal = -1.0 if dedo == "thumb" else 1.0
+            rotacao = np.array([[np.cos(angulo), -sinal * np.sin(angulo)], [sinal * np.sin(angulo), np.cos(angulo)]])
+            atual = atual + rotacao @ direcao * comprimento
+            pontos[2 + 4 * i + j] = atual
+    return pontos
+
+
+def gerar_landmarks(quantidade: int, semente: int = 0) -> np.ndarray:
+    """
+    Gera poses de mão sintéticas.
+
+    Args:
+        quantidade (int): Quantidade de mãos.
+        semente (int): Semente do gerador aleatório.
+
+    Returns:
+        np.ndarray: Array (quantidade, 21, 3) float32 com coordenadas normalizadas.
+    """
+    gerador = np.random.default_rng(semente)
+    saida = np.empty((quantidade, 21, 3), dtype=np.float32)
+    for n in range(quantidade):
+        flexoes = {dedo: float(gerador.choice([0.0, 0.15, 0.6, 1.0, 1.3])) for dedo in _BASES}
+        pontos = _pose(flexoes)
+
+        angulo = gerador.normal(0.0, 0.25)
+        if gerador.random() < 0.1:
+            angulo += np.pi  # Mão apontando para baixo
+        escala = gerador.uniform(0.8, 1.4)
+        rotacao = np.array([[np.cos(angulo), -np.sin(angulo)], [np.sin(angulo), np.cos(angulo)]])
+        pontos = pontos @ rotacao.T * escala
+        pontos += gerador.uniform([0.3, 0.45], [0.7, 0.8])
+        pontos += gerador.normal(0.0, 0.004, pontos.shape)
+
+        saida[n, :, :2] = pontos
+        saida[n, :, 2] = gerador.normal(0.0, 0.02, 21)
+    return saida
+
+
+def como_landmark_list(pontos: np.ndarray):
+    """
+    Embrulha um array (21, 3) em um objeto com a mesma interface de `NormalizedLandmarkList`
+    (`.landmark[i].x/.y/.z`), para alimentar código que espera a saída do MediaPipe.
+    """
+    return SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in pontos])
+
+
+def gerar_gravacao(quantidade: int, semente: int = 0, fps: float = 30.0) -> tuple:
+    """
+    Gera uma gravação sintética, alternando a mão lida a cada frame.
+
+    Returns:
+        tuple: (timestamps (N,), maos (N,), pontos (N, 21, 3)), no formato de `LandmarkRecording`.
+    """
+    timestamps = np.arange(quantidade, dtype=np.float64) / fps
+    maos = np.array(["Right", "Left"])[np.arange(quantidade) % 2]
+    return timestamps, maos, gerar_landmarks(quantidade, semente)
+
+
+_COR_PELE = (120, 160, 215)
+_COR_CONTORNO = (70, 100, 150)
+_DEDOS_DESENHO = (([0, 1, 2, 3, 4], 0.12), ([5, 6, 7, 8], 0.1), ([9, 10, 11, 12], 0.1), ([13, 14, 15, 16], 0.095), ([17, 18, 19, 20], 0.08))
+
+
+def desenhar_mao(frame: np.ndarray, pontos: np.ndarray, centro: tuple, tamanho: float) -> None:
+    """
+    Desenha no frame uma mão chapada com antebraço (palma e dedos com a cor da pele, com contorno)
+    a partir de landmarks (21, 2). O desenho é simples, mas o MediaPipe o reconhece como mão.
+
+    Args:
+        frame (np.ndarray): O frame BGR, alterado no próprio array.
+        pontos (np.ndarray): Landmarks (21, 2) da mão, em qualquer escala.
+        centro (tuple): O centro da mão no frame, em pixels.
+        tamanho (float): A altura da mão no frame, em pixels.
+    """
+    xy = pontos - pontos.mean(axis=0)
+    xy = xy / np.ptp(xy, axis=0).max() * tamanho + np.asarray(centro)
+    q = np.round(xy).astype(np.int32)
+    palma = cv2.convexHull(q[[0, 1, 2, 5, 9, 13, 17]])
+    antebraco = (tuple(q[0]), tuple(q[0] + (q[0] - q[9]) * 3 // 2))
+    for cor, borda in ((_COR_CONTORNO, 6), (_COR_PELE, 0)):
+        cv2.fillConvexPoly(frame, palma, cor, cv2.LINE_AA)
+        cv2.line(frame, *antebraco, cor, int(0.3 * tamanho) + borda, cv2.LINE_AA)
+        for cadeia, espessura in _DEDOS_DESENHO:
+            for a, b in zip(cadeia, cadeia[1:]):
+                cv2.line(frame, tuple(q[a]), tuple(q[b]), cor, int(espessura * tamanho) + borda, cv2.LINE_AA)
+    cv2.fillConvexPoly(frame, palma, _COR_PELE, cv2.LINE_AA)
+
+
+def gerar_video_maos(caminho: str, quantidade: int, largura: int = 1280, altura: int = 720, fps: float = 30.0,
+                     semente: int = 0, movimento: float = 1.0) -> str:
+    """
+    Grava um vídeo de uma mão que se move pelo frame abrindo e fechando os dedos. A cada 5 segundos,
+    a mão some por meio segundo, para exercitar a perda e a retomada do rastreamento.
+
+    Args:
+        caminho (str): O arquivo de vídeo de destino (.mp4).
+        quantidade (int): Quantidade de frames.
+        movimento (float): Escala da velocidade da mão e dos dedos (0 = mão parada, como em uma letra estática).
+
+    Returns:
+        str: O caminho do vídeo gravado.
+    """
+    gerador = np.random.default_rng(semente)
+    fases = gerador.uniform(0, 2 * np.pi, len(_BASES))
+    fundo = np.empty((altura, largura, 3), dtype=np.uint8)
+    fundo[:] = (90, 110, 100)
+    fundo += gerador.integers(0, 12, fundo.shape, dtype=np.uint8)
+
+    escritor = cv2.VideoWriter(caminho, cv2.VideoWriter_fourcc(*"mp4v"), fps, (largura, altura))
+    try:
+        for n in range(quantidade):
+            frame = fundo.copy()
+            if n % int(5 * fps) < int(4.5 * fps):
+                t = n / fps * movimento
+                flexoes = {dedo: 0.15 * (1 + np.sin(0.8 * t + fase)) for dedo, fase in zip(_BASES, fases)}
+                centro = (largura * (0.5 + 0.25 * np.sin(0.35 * t)), altura * (0.5 + 0.12 * np.sin(0.5 * t)))
+                desenhar_mao(frame, _pose(flexoes), centro, altura * (0.42 + 0.05 * np.sin(0.3 * t)))
+                frame = cv2.GaussianBlur(frame, (5, 5), 0)
+            escritor.write(frame)
+    finally:
+        escritor.release()
+    return caminho
@@ -0,0 +1,516 @@
+"""
+Suíte de benchmarks de ponta a ponta do pipeline de detecção, com relatório em JSON e comparação
+com uma linha de base.
+
+Cada suíte roda em um processo próprio (para o pico de RSS ser só dela), sobre fixtures
+determinísticas (vídeo com mãos e landmarks sintéticos de `fixtures`), com a injeção de inputs
+substituída por um stub que só conta as chamadas:
+
+    gesture_reader          GestureReader.detect_hand + read_gesture sobre o vídeo
+    gesture_interpretador   GestureInterpretador.interpretar sobre uma gravação de landmarks
+    config_store            ConfigRouter (estado e configurações básicas) com arquivos temporários
+    bind_store              DataBindsSalvas.get_bind_record e a recarga do arquivo de binds
+    stream_encode           CameraStream.get_frame (JPEG) sobre os frames do vídeo
+
+De cada suíte são medidos o fps, os percentis (p50/p95/p99) de cada estágio, as alocações do
+Python/NumPy (tracemalloc, em uma passada separada da medição de tempo) e o pico de RSS.
+
+    python benchmarks/run_benchmarks.py --saida resultados.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json     # sai com 1 se houver regressão
+    python benchmarks/run_benchmarks.py --salvar-baseline benchmarks/baseline.json
+
+A linha de base só é comparável com execuções na mesma máquina: regrave-a ao trocar de máquina.
+"""
+from common import preparar_ambiente, REPO_ROOT
+from fixtures import gerar_video_maos, gerar_gravacao, como_landmark_list
+import subprocess
+import tracemalloc
+import argparse
+import platform
+import tempfile
+import shutil
+import json
+import time
+import sys
+import os
+
+VERSAO_RELATORIO = 1
+
+# Frames do vídeo usado pelas suítes gesture_reader e stream_encode (1280x720, 30 fps)
+FRAMES_VIDEO = 150
+
+
+class InputStub:
+    """
+    Substitui o `ExecuteInput`: conta os inputs em vez de injetá-los no sistema.
+    """
+
+    def __init__(self):
+        self.inputs = 0
+        self.mouse_tracking = 0
+
+    def executar_input(self, gesto: str, input) -> bool:
+        self.inputs += 1
+        return True
+
+    def executar_mouse_tracking(self, x_coords: float, y_coords: float) -> None:
+        self.mouse_tracking += 1
+
+    def get_metricas(self) -> dict:
+        return {}
+
+
+class SyncExecutor:
+    """
+    Substitui o `LatestFrameExecutor` do interpretador: executa cada tarefa na hora, na thread
+    chamadora, e mede a duração por chave. Assim nenhum frame é descartado e a suíte é determinística.
+    """
+
+    def __init__(self):
+        self.duracoes = {}
+
+    def submit(self, chave, funcao, *args) -> bool:
+        inicio = time.perf_counter()
+        funcao(*args)
+        self.duracoes.setdefault(chave, []).append((time.perf_counter() - inicio) * 1000)
+        return True
+
+    def metricas(self) -> dict:
+        return {}
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+def percentis(valores: list) -> dict:
+    """
+    Retorna `media`, `p50`, `p95`, `p99` e `max` dos valores (ms).
+    """
+    import numpy as np
+    if not valores:
+        return {"media": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    amostras = np.asarray(valores, dtype=np.float64)
+    p50, p95, p99 = np.percentile(amostras, [50, 95, 99]).tolist()
+    return {"media": float(amostras.mean()), "p50": p50, "p95": p95, "p99": p99, "max": float(amostras.max())}
+
+
+def medir_alocacao(passo, iteracoes: int) -> dict:
+    """
+    Mede as alocações rastreadas pelo tracemalloc (objetos Python e buffers do NumPy/OpenCV).
+
+    Args:
+        passo: Função chamada com o índice da iteração.
+        iteracoes (int): Quantidade de iterações medidas.
+
+    Returns:
+        dict: `pico_por_iteracao_kb` (maior memória temporária de uma iteração) e `retido_kb`
+        (crescimento da memória ao fim das iterações, ex.: caches e vazamentos).
+    """
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        pico = 0
+        for i in range(iteracoes):
+            inicio, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            passo(i)
+            _, pico_iteracao = tracemalloc.get_traced_memory()
+            pico = max(pico, pico_iteracao - inicio)
+        final, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"pico_por_iteracao_kb": pico / 1024, "retido_kb": max(0, final - base) / 1024}
+
+
+def pico_rss_mb() -> float:
+    """
+    Retorna o pico de memória residente do processo atual, em MB.
+    """
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + \
+                       [(nome, ctypes.c_size_t) for nome in ("PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage",
+                                                             "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage",
+                                                             "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+
+        contadores = PROCESS_MEMORY_COUNTERS()
+        contadores.cb = ctypes.sizeof(contadores)
+        ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(contadores), contadores.cb)
+        return contadores.PeakWorkingSetSize / 2**20
+
+    import resource
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 2**20 if sys.platform == "darwin" else pico / 1024  # bytes no macOS, KB no Linux
+
+
+def executar_estagios(estagios: dict, iteracoes: int, aquecimento: int) -> tuple:
+    """
+    Executa os estágios de uma suíte em sequência, a cada iteração, medindo cada um.
+
+    Args:
+        estagios (dict): Nome do estágio -> função chamada com o índice da iteração.
+        iteracoes (int): Quantidade de iterações medidas.
+        aquecimento (int): Iterações descartadas antes da medição.
+
+    Returns:
+        tuple: (fps, {estágio: percentis em ms}).
+    """
+    for i in range(aquecimento):
+        for funcao in estagios.values():
+            funcao(i)
+
+    tempos = {nome: [] for nome in estagios}
+    inicio_total = time.perf_counter()
+    for i in range(iteracoes):
+        for nome, funcao in estagios.items():
+            inicio = time.perf_counter()
+            funcao(i)
+            tempos[nome].append((time.perf_counter() - inicio) * 1000)
+    total = time.perf_counter() - inicio_total
+    return iteracoes / total, {nome: percentis(valores) for nome, valores in tempos.items()}
+
+
+def ler_frames(video: str) -> list:
+    import cv2
+    captura = cv2.VideoCapture(video)
+    frames = []
+    while True:
+        lido, frame = captura.read()
+        if not lido:
+            break
+        frames.append(frame)
+    captura.release()
+    return frames
+
+
+def isolar_arquivos(pasta: str) -> None:
+    """
+    Aponta os arquivos de estado, configurações básicas e binds para cópias temporárias, para que
+    a suíte não altere os dados do repositório.
+    """
+    from src.data.configs.config_router import ConfigRouter
+    from src.data.configs.states.config_states_manager import ConfigStateManager
+    from src.data.configs.basic.basic_configs_manager import BasicConfigManager
+    from src.data.binds.data_binds_salvas import DataBindsSalvas
+
+    ConfigRouter.state_manager = ConfigStateManager(os.path.join(pasta, "estado_atual.json"))
+    BasicConfigManager.config_file = os.path.join(pasta, "config_basica.json")
+    binds = os.path.join(pasta, "binds_salvas.json")
+    shutil.copyfile(DataBindsSalvas.data_file, binds)
+    DataBindsSalvas.data_file = binds
+
+
+def suite_gesture_reader(video: str) -> dict:
+    from src.gestures.gesture_reader import GestureReader
+
+    frames = ler_frames(video)
+    reader = GestureReader()
+    interpretador = reader.interpretador
+    interpretador.execute_input = InputStub()
+    interpretador.executor.shutdown()
+    interpretador.executor = SyncExecutor()
+    resultados = {}
+
+    def detectar(i: int) -> None:
+        resultados["atual"] = reader.detect_hand(frames[i % len(frames)])
+
+    def ler(i: int) -> None:
+        reader.read_gesture(resultados["atual"], i, time.perf_counter())
+
+    # Duas passadas pelo vídeo: o rastreamento do MediaPipe depende da sequência dos frames
+    fps, estagios = executar_estagios({"detect_hand_ms": detectar, "read_gesture_ms": ler}, 2 * len(frames), 10)
+    alocacao = medir_alocacao(lambda i: (detectar(i), ler(i)), 30)
+    maos = sum(len(duracoes) for duracoes in interpretador.executor.duracoes.values())
+    reader.hands.close()
+    return {
+        "fps": fps,
+        "estagios": estagios,
+        "alocacao": alocacao,
+        "contadores": {"frames": 2 * len(frames), "maos_interpretadas": maos, "inputs": interpretador.execute_input.inputs},
+    }
+
+
+def suite_gesture_interpretador(video: str) -> dict:
+    from src.gestures.gesture_interpretador import GestureInterpretador
+
+    _, maos, pontos = gerar_gravacao(3000, semente=0)
+    landmarks = [como_landmark_list(p) for p in pontos]
+    interpretador = GestureInterpretador()
+    interpretador.execute_input = stub = InputStub()
+    interpretador.executor.shutdown()
+    interpretador.executor = executor = SyncExecutor()
+
+    def interpretar(i: int) -> None:
+        interpretador.interpretar(landmarks[i], maos[i], i, time.perf_counter())
+
+    fps, estagios = executar_estagios({"interpretar_ms": interpretar}, len(landmarks), 20)
+    alocacao = medir_alocacao(interpretar, 300)
+
+    # Tempo da interpretação em si (busca e verificação do gesto), sem a extração das features
+    estagios["libras_ms"] = percentis(executor.duracoes.get(interpretador.libras_hand, [])[20:])
+    estagios["custom_ms"] = percentis(executor.duracoes.get(interpretador.custom_gesture_hand, [])[20:])
+    return {
+        "fps": fps,
+        "estagios": estagios,
+        "alocacao": alocacao,
+        "contadores": {"maos": len(landmarks), "inputs": stub.inputs, "mouse_tracking": stub.mouse_tracking},
+    }
+
+
+def suite_config_store(video: str) -> dict:
+    from src.data.configs.config_router import ConfigRouter
+
+    gestos = ["Libras_A", "Libras_A", "Libras_A", "Libras_B", "Libras_L", "MAO"]
+
+    def frame(i: int) -> None:
+        # O que o pipeline faz por frame com duas mãos: grava e lê o gesto de cada mão
+        ConfigRouter.update_atribute("nome_gesto_direita", gestos[i % len(gestos)])
+        ConfigRouter.update_atribute("nome_gesto_esquerda", "MAO")
+        ConfigRouter.read_atribute("nome_gesto_direita")
+        ConfigRouter.read_atribute("nome_gesto_esquerda")
+
+    def configuracao_basica(i: int) -> None:
+        ConfigRouter.read_atribute("inference_width")
+
+    def flush(i: int) -> None:
+        if i % 100 == 0:
+            ConfigRouter.flush()
+
+    fps, estagios = executar_estagios({"frame_ms": frame, "basic_read_ms": configuracao_basica}, 20000, 100)
+    _, estagios_flush = executar_estagios({"flush_ms": lambda i: (frame(i), ConfigRouter.flush())}, 300, 10)
+    alocacao = medir_alocacao(lambda i: (frame(i), configuracao_basica(i), flush(i)), 2000)
+    return {"fps": fps, "estagios": estagios | estagios_flush, "alocacao": alocacao, "contadores": {}}
+
+
+def suite_bind_store(video: str) -> dict:
+    from src.data.binds.data_binds_salvas import DataBindsSalvas
+
+    nomes = [nome for nome in DataBindsSalvas.get_all_binds()] + ["mouse_tracking", "gesto_sem_bind"]
+    encontrados = sum(DataBindsSalvas.get_bind_record(nome) is not None for nome in nomes)
+
+    def consultar(i: int) -> None:
+        DataBindsSalvas.get_bind_record(nomes[i % len(nomes)])
+
+    def recarregar(i: int) -> None:
+        # O que acontece quando o arquivo é alterado (ex.: pela interface): a tabela é relida e compilada
+        DataBindsSalvas.read_database()
+
+    fps, estagios = executar_estagios({"get_bind_record_ms": consultar}, 50000, 100)
+    _, estagios_recarga = executar_estagios({"recarregar_ms": recarregar}, 300, 10)
+    alocacao = medir_alocacao(lambda i: (consultar(i), recarregar(i) if i % 100 == 0 else None), 2000)
+    return {
+        "fps": fps,
+        "estagios": estagios | estagios_recarga,
+        "alocacao": alocacao,
+        "contadores": {"binds": len(nomes) - 2, "encontrados": encontrados},
+    }
+
+
+def suite_stream_encode(video: str) -> dict:
+    from src.camera.camera_stream import CameraStream
+    from src.camera.frame_source import SyntheticSource
+    from src.camera.stream_profile import StreamProfile, StreamSettings
+    from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+
+    frames = ler_frames(video)
+    stream = CameraStream(FramesWebsocketServer(0), SyntheticSource(1280, 720), profile=StreamProfile())
+    camera = stream.camera_capture
+    configuracoes = {largura: StreamSettings(30.0, largura, 80) for largura in (640, 1280)}
+    tamanhos = {largura: 0 for largura in configuracoes}
+
+    def codificar(largura: int):
+        def passo(i: int) -> None:
+            camera.frame_renderizado = (i, time.time(), frames[i % len(frames)])
+            tamanhos[largura] += len(stream.get_frame(configuracoes[largura]).binario)
+        return passo
+
+    estagios = {f"get_frame_{largura}_ms": codificar(largura) for largura in configuracoes}
+    fps, estagios = executar_estagios(estagios, 2 * len(frames), 10)
+    alocacao = medir_alocacao(lambda i: [passo(i) for passo in map(codificar, configuracoes)], 30)
+    stream.encoder.shutdown()
+    quantidade = 2 * len(frames) + 10 + 30
+    return {
+        "fps": fps,
+        "estagios": estagios,
+        "alocacao": alocacao,
+        "contadores": {f"bytes_por_frame_{largura}": tamanho // quantidade for largura, tamanho in tamanhos.items()},
+    }
+
+
+SUITES = {
+    "gesture_reader": suite_gesture_reader,
+    "gesture_interpretador": suite_gesture_interpretador,
+    "config_store": suite_config_store,
+    "bind_store": suite_bind_store,
+    "stream_encode": suite_stream_encode,
+}
+
+
+def executar_suite_interna(nome: str, video: str, saida: str) -> None:
+    """
+    Executa uma suíte no processo atual e grava o resultado em `saida` (modo `--interno`).
+    """
+    preparar_ambiente()
+    from src.logger.logger import Logger
+
+    with tempfile.TemporaryDirectory() as pasta:
+        isolar_arquivos(pasta)
+        inicio = time.perf_counter()
+        resultado = SUITES[nome](video)
+        resultado["duracao_s"] = time.perf_counter() - inicio
+        resultado["rss_pico_mb"] = pico_rss_mb()
+
+        from src.data.configs.config_router import ConfigRouter
+        ConfigRouter.flush()
+    Logger.encerrar()
+    with open(saida, "w") as file:
+        json.dump(resultado, file)
+
+
+def ambiente() -> dict:
+    import numpy as np
+    import cv2
+    try:
+        import mediapipe
+        versao_mediapipe = mediapipe.__version__
+    except ImportError:
+        versao_mediapipe = None
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "mediapipe": versao_mediapipe,
+        "plataforma": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "commit": commit,
+    }
+
+
+def executar(suites: list) -> dict:
+    """
+    Executa as suítes, cada uma em um processo, e monta o relatório.
+    """
+    relatorio = {"versao": VERSAO_RELATORIO, "data": time.strftime("%Y-%m-%dT%H:%M:%S"), "ambiente": ambiente(), "suites": {}}
+    with tempfile.TemporaryDirectory() as pasta:
+        video = gerar_video_maos(os.path.join(pasta, "maos.mp4"), FRAMES_VIDEO, semente=0)
+        for nome in suites:
+            saida = os.path.join(pasta, f"{nome}.json")
+            processo = subprocess.run([sys.executable, os.path.abspath(__file__), "--interno", nome, "--video", video, "--saida", saida],
+                                      capture_output=True, text=True)
+            if processo.returncode != 0 or not os.path.isfile(saida):
+                print(processo.stderr[-4000:], file=sys.stderr)
+                raise RuntimeError(f"A suite {nome} falhou (codigo {processo.returncode})")
+            with open(saida) as file:
+                relatorio["suites"][nome] = json.load(file)
+            imprimir_suite(nome, relatorio["suites"][nome])
+    return relatorio
+
+
+def imprimir_suite(nome: str, resultado: dict) -> None:
+    alocacao = resultado["alocacao"]
+    print(f"{nome}: {resultado['fps']:.1f} it/s | RSS pico {resultado['rss_pico_mb']:.0f} MB | "
+          f"alocacao pico {alocacao['pico_por_iteracao_kb']:.1f} KB/it, retido {alocacao['retido_kb']:.1f} KB | {resultado['duracao_s']:.1f} s")
+    for estagio, resumo in resultado["estagios"].items():
+        print(f"  {estagio:<22} p50 {resumo['p50']:8.3f} | p95 {resumo['p95']:8.3f} | p99 {resumo['p99']:8.3f} ms")
+    if resultado["contadores"]:
+        print(f"  {resultado['contadores']}")
+
+
+# Multiplicador da tolerância de cada percentil comparado: as caudas variam mais entre execuções.
+# O p99 fica só no relatório, sem disparar regressões.
+TOLERANCIA_PERCENTIS = {"p50": 1.0, "p95": 2.0}
+
+# Piso (ms) dos estágios que gravam em disco, cujo tempo depende mais do disco que do código
+PISO_ESTAGIOS_DISCO = {"config_store.flush_ms": 2.0}
+
+
+def metricas_comparaveis(relatorio: dict) -> dict:
+    """
+    Achata o relatório nas métricas comparadas com a linha de base.
+
+    Returns:
+        dict: Caminho da métrica (ex.: `gesture_reader.detect_hand_ms.p95`) -> (valor, maior é melhor,
+            multiplicador da tolerância, piso absoluto). O piso é a menor diferença considerada
+            regressão, para que ruído em valores pequenos não a dispare.
+    """
+    metricas = {}
+    for suite, resultado in relatorio["suites"].items():
+        metricas[f"{suite}.fps"] = (resultado["fps"], True, 1.0, 0.0)
+        for estagio, resumo in resultado["estagios"].items():
+            for percentil, multiplicador in TOLERANCIA_PERCENTIS.items():
+                piso = PISO_ESTAGIOS_DISCO.get(f"{suite}.{estagio}", 0.02)
+                metricas[f"{suite}.{estagio}.{percentil}"] = (resumo[percentil], False, multiplicador, piso)
+        for nome, valor in resultado["alocacao"].items():
+            metricas[f"{suite}.alocacao.{nome}"] = (valor, False, 1.0, 16.0)
+        metricas[f"{suite}.rss_pico_mb"] = (resultado["rss_pico_mb"], False, 1.0, 10.0)
+    return metricas
+
+
+def comparar(relatorio: dict, baseline: dict, tolerancia: float) -> list:
+    """
+    Compara o relatório com a linha de base.
+
+    Args:
+        relatorio (dict): O relatório desta execução.
+        baseline (dict): O relatório da linha de base.
+        tolerancia (float): Piora relativa tolerada (ex.: 0.25 = 25%).
+
+    Returns:
+        list: As regressões, como tuplas (métrica, valor da linha de base, valor atual).
+    """
+    atuais, anteriores = metricas_comparaveis(relatorio), metricas_comparaveis(baseline)
+    regressoes = []
+    for nome, (valor, maior_melhor, multiplicador, piso) in atuais.items():
+        if nome not in anteriores:
+            continue
+        anterior = anteriores[nome][0]
+        piora = anterior - valor if maior_melhor else valor - anterior
+        if piora > piso and piora > tolerancia * multiplicador * abs(anterior):
+            regressoes.append((nome, anterior, valor))
+    return regressoes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suites", nargs="+", choices=list(SUITES), default=list(SUITES))
+    parser.add_argument("--saida", help="Arquivo JSON do relatorio.")
+    parser.add_argument("--baseline", help="Relatorio da linha de base para comparar; sai com codigo 1 se houver regressao.")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="Piora relativa tolerada em cada metrica.")
+    parser.add_argument("--salvar-baseline", metavar="ARQUIVO", help="Grava o relatorio como a nova linha de base.")
+    parser.add_argument("--interno", choices=list(SUITES), help=argparse.SUPPRESS)
+    parser.add_argument("--video", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.interno:
+        executar_suite_interna(args.interno, args.video, args.saida)
+        return
+
+    relatorio = executar(args.suites)
+    for caminho in (args.saida, args.salvar_baseline):
+        if caminho:
+            with open(caminho, "w") as file:
+                json.dump(relatorio, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline.get("ambiente", {}).get("plataforma") != relatorio["ambiente"]["plataforma"]:
+            print(f"Aviso: linha de base gravada em outra plataforma ({baseline.get('ambiente', {}).get('plataforma')})")
+        regressoes = comparar(relatorio, baseline, args.tolerancia)
+        for nome, anterior, atual in regressoes:
+            print(f"REGRESSAO {nome}: {anterior:.3f} -> {atual:.3f}")
+        if regressoes:
+            sys.exit(1)
+        print(f"Sem regressoes em relacao a {args.baseline} (tolerancia {args.tolerancia:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,17 @@ import sys
 logger = Logger.configure_application_logger()
 error_logger = Logger.configure_error_logger()
 
-async def main(data_port: int, frames_port: int) -> None:
+async def main(data_port: int, frames_port: int, landmarks_port: int = None) -> None:
     """
     Inicializa o LibrasController com os servidores WebSocket.
 
     Args:
         data_port (int): Porta para o servidor WebSocket de dados.
         frames_port (int): Porta para o servidor WebSocket de frames.
+        landmarks_port (int): Porta opcional para o servidor WebSocket de landmarks.
     """
     logger.info("Iniciando LibrasController...")
-    main_loop = MainLoop(data_port, frames_port)
+    main_loop = MainLoop(data_port, frames_port, landmarks_port)
 
     try:
         await main_loop.start()
@@ -26,9 +27,11 @@ async def main(data_port: int, frames_port: int) -> None:
     finally:
         await main_loop.stop()
         logger.info("LibrasController encerrado.")
+        Logger.encerrar()
 
 if __name__ == "__main__":
     port1 = int(sys.argv[1])  
     port2 = int(sys.argv[2])  
+    port3 = int(sys.argv[3]) if len(sys.argv) > 3 else None
     
-    asyncio.run(main(port1, port2))
\ No newline at end of file
+    asyncio.run(main(port1, port2, port3))
\ No newline at end of file
@@ -0,0 +1,61 @@
+from src.gestures.gesture_recognizer import GestureRecognizer
+from src.gestures.landmark_stream import LandmarkStream
+import argparse
+import json
+import time
+import sys
+
+def reconhecer_gravacao(caminho: str, saida, tamanho_lote: int) -> dict:
+    """
+    Reconhece os gestos de uma gravação de landmarks, sem câmera e sem executar inputs.
+
+    Args:
+        caminho (str): A gravação (`.jsonl` ou `.npz`).
+        saida: Arquivo de texto onde o resultado de cada frame é escrito, em JSONL.
+        tamanho_lote (int): Quantidade de frames reconhecidos por lote.
+
+    Returns:
+        dict: Resumo do processamento (frames, segundos, frames por segundo e contagem de cada gesto).
+    """
+    recognizer = GestureRecognizer()
+    gravacao = LandmarkStream.carregar(caminho)
+
+    historicos = {}  # Histórico de cada mão, mantido entre os lotes para categorizar os gestos com movimento
+    contagem = {}
+    inicio = time.perf_counter()
+    for comeco in range(0, len(gravacao), tamanho_lote):
+        fim = comeco + tamanho_lote
+        gestos = recognizer.reconhecer_lote(gravacao.pontos[comeco:fim], gravacao.maos[comeco:fim], gravacao.timestamps[comeco:fim], historicos)
+
+        linhas = []
+        for indice, (timestamp, mao, gesto) in enumerate(zip(gravacao.timestamps[comeco:fim].tolist(), gravacao.maos[comeco:fim].tolist(), gestos), start=comeco):
+            contagem[gesto] = contagem.get(gesto, 0) + 1
+            linhas.append(json.dumps({"frame": indice, "timestamp": timestamp, "mao": mao, "gesto": gesto}))
+        if saida is not None and linhas:
+            saida.write("\n".join(linhas) + "\n")
+    segundos = time.perf_counter() - inicio
+
+    return {
+        "frames": len(gravacao),
+        "segundos": segundos,
+        "fps": len(gravacao) / segundos if segundos else 0.0,
+        "gestos": {str(gesto): total for gesto, total in contagem.items()},
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconhece os gestos de uma gravacao de landmarks (modo offline, sem camera e sem inputs).")
+    parser.add_argument("gravacao", help="Arquivo .jsonl ou .npz com os landmarks gravados.")
+    parser.add_argument("--saida", help="Arquivo JSONL com o gesto de cada frame. Padrao: stdout.")
+    parser.add_argument("--sem-frames", action="store_true", help="Nao escreve o resultado de cada frame, apenas o resumo.")
+    parser.add_argument("--lote", type=int, default=4096, help="Quantidade de frames reconhecidos por lote.")
+    args = parser.parse_args()
+
+    if args.sem_frames:
+        resumo = reconhecer_gravacao(args.gravacao, None, args.lote)
+    elif args.saida:
+        with open(args.saida, "w") as file:
+            resumo = reconhecer_gravacao(args.gravacao, file, args.lote)
+    else:
+        resumo = reconhecer_gravacao(args.gravacao, sys.stdout, args.lote)
+
+    print(json.dumps(resumo), file=sys.stderr)
@@ -1,10 +1,16 @@
 from src.data.configs.config_router import ConfigRouter
 from src.gestures.gesture_reader import GestureReader
-from pygrabber.dshow_graph import FilterGraph
+from src.gestures.gesture_features import landmarks_para_array
+from src.gestures.inference_stride import InferenceStride, InferenceStrideConfig
+from src.pipeline.frame_slot import FrameSlot
+from src.pipeline.frame_signal import AsyncFrameSignal
+from src.pipeline.metrics import RollingStats
+from src.camera.frame_source import FrameSource, CameraSource
+from src.telemetry.telemetry_recorder import TelemetryRecorder
 from src.logger.logger import Logger
 import threading
-import pythoncom  
 import traceback
+import asyncio
 import time
 import cv2
 
@@ -12,21 +18,33 @@ LEFT = "Left"
 RIGHT = "Right"
 WINDOW_NAME = "LibrasController"
 FONT = cv2.FONT_HERSHEY_SIMPLEX
+FOLGA_RENDER = 0.005    # Tolerância (s) no intervalo entre renderizações, para o jitter da fonte
 
 class Camera:
     """
     Classe responsável por capturar vídeo da câmera, detectar gestos e exibir os frames processados.
     """
-    def __init__(self):
+    def __init__(self, source: FrameSource = None):
         """
         Inicializa o CameraReader com os componentes de captura de vídeo, leitor de gestos e configuração.
+
+        Args:
+            source (FrameSource): A fonte de frames. Se não informada, usa a câmera selecionada nas configurações.
         """
         self.stop_flag = threading.Event()  
-        self.cap: cv2.VideoCapture = None
+        self.source = source                        # Fonte fixa passada pelo chamador
+        self.source_ativa: FrameSource = None       # Fonte aberta no processo de detecção atual
         self.frame: cv2.Mat = None
+        self.frame_renderizado: tuple = None        # (seq da captura, instante da captura desde a época, frame)
+        self.frame_pronto = AsyncFrameSignal()      # Acorda o stream no event loop a cada frame renderizado
+        self.landmarks_server = None                # Recebe os landmarks de cada frame (LandmarksWebsocketServer)
+        self.telemetria: TelemetryRecorder = None   # Registro opcional dos eventos de cada frame
+        self.fps_render: float = None               # Demanda de frames renderizados: None para todos, 0 para nenhum
         self.crop_hand_mode: bool = False
 
         self.gesture_reader = GestureReader()
+        self.gesture_reader.preprocessor.espelhar = True    # A detecção vê a mesma imagem espelhada da exibição
+        self.inference_stride = InferenceStride()   # Em quais frames a detecção roda; os demais são estimados
 
         self.nome_gesto_direita: str = "MAO"
         self.nome_gesto_esquerda: str = "MAO"
@@ -37,54 +55,290 @@ class Camera:
         self.logger = Logger.configure_application_logger()
         self.error_logger = Logger.configure_error_logger()
 
+        # Pipeline: captura -> inferência -> renderização, ligados por canais de tamanho 1
+        self.captura_slot = FrameSlot()
+        self.inferencia_slot = FrameSlot()
+        self.pipeline_threads: list[threading.Thread] = []
+        self.metricas = {
+            nome: RollingStats()
+            for nome in ("captura_ms", "inferencia_ms", "gestos_ms", "desenho_ms", "render_ms", "glass_to_landmark_ms", "glass_to_frame_ms")
+        }
+        self.frames_descartados = {"inferencia": 0, "render": 0, "sem_demanda": 0}
+
+        self.camera_nome: str = ""
+        ConfigRouter.subscribe("camera_selecionada", self.__atualizar_camera_selecionada)
+        ConfigRouter.subscribe("inference_stride", self.__atualizar_inference_stride)
+        ConfigRouter.subscribe("inference_width", self.__atualizar_inference_width)
+
+    def __atualizar_camera_selecionada(self, atributo: str, camera_nome: str) -> None:
+        """
+        Callback inscrito no ConfigRouter para receber as mudanças da câmera selecionada.
+
+        Args:
+            atributo (str): O nome do atributo alterado.
+            camera_nome (str): O nome da câmera selecionada.
+        """
+        self.camera_nome = camera_nome
+
+    def __atualizar_inference_width(self, atributo: str, valor) -> None:
+        """
+        Callback inscrito no ConfigRouter para receber as mudanças da largura de inferência (0 = resolução da câmera).
+        """
+        try:
+            largura = int(valor or 0)
+        except (ValueError, TypeError):
+            self.error_logger.error(f"Largura de inferencia invalida nas configuracoes, mantendo a atual: {valor}")
+            return
+        self.gesture_reader.preprocessor.configurar(max(0, largura))
+
+    def __atualizar_inference_stride(self, atributo: str, valor) -> None:
+        """
+        Callback inscrito no ConfigRouter para receber as mudanças do intervalo de inferência.
+        """
+        try:
+            config = InferenceStrideConfig.from_config(valor)
+        except (ValueError, TypeError) as e:
+            self.error_logger.error(f"Intervalo de inferencia invalido nas configuracoes, mantendo o atual: {e}")
+            return
+        self.inference_stride.configurar(config)
+        self.logger.info(f"Intervalo de inferencia: {config._asdict()}")
+
     async def start(self) -> None:
-        camera_nome = ConfigRouter.read_atribute("camera_selecionada")
         self.logger.info("Processo de deteccao iniciado.")
         self.stop_flag.clear()
         try:
-            self.select_camera_by_name(camera_nome)
-
-            def detection_loop():
-                try:
-                    self.logger.info("Iniciando loop de deteccao.")
-                    while not self.stop_flag.is_set():
-                        unready_frame: cv2.Mat = self.read_frame()
-                        if unready_frame is None:
-                            time.sleep(0.01) 
-                            continue
-
-                        results = self.gesture_reader.detect_hand(unready_frame)
-                        unready_frame = self.__draw_hand(unready_frame, results)
-
-                        if self.crop_hand_mode:
-                            unready_frame = self.__crop_hand(unready_frame, results)
-                            
-                        self.frame = unready_frame
-
-                        if results.multi_hand_landmarks and not self.crop_hand_mode:
-                            self.gesture_reader.read_gesture(results)
-                    self.logger.info("Saindo do loop de deteccao.")
-                except Exception as e:
-                    self.error_logger.error(f"Erro no loop de deteccao: {traceback.format_exc()} || {e}")
-
-            self.detection_thread = threading.Thread(target=detection_loop)
-            self.detection_thread.daemon = True  
-            self.detection_thread.start()
+            # Abrir a câmera pode levar alguns segundos (DirectShow): roda fora do event loop
+            loop = asyncio.get_running_loop()
+            if self.source is not None:
+                await loop.run_in_executor(None, self.select_source, self.source)
+            else:
+                await loop.run_in_executor(None, self.select_camera_by_name, self.camera_nome)
+
+            # Cada execução recomeça a sequência dos frames e a contagem dos descartados
+            self.captura_slot.reabrir()
+            self.inferencia_slot.reabrir()
+            self.frames_descartados = {nome: 0 for nome in self.frames_descartados}
+            self.gesture_reader.interpretador.iniciar()
+
+            self.pipeline_threads = [
+                threading.Thread(target=self.__capture_loop, name="camera-captura", daemon=True),
+                threading.Thread(target=self.__inference_loop, name="camera-inferencia", daemon=True),
+                threading.Thread(target=self.__render_loop, name="camera-render", daemon=True),
+            ]
+            for thread in self.pipeline_threads:
+                thread.start()
 
         except Exception as e:
             error_message = f"Erro durante a captura de video: {traceback.format_exc()}"
             self.error_logger.error(error_message)
             raise RuntimeError(error_message)
 
+    def __capture_loop(self) -> None:
+        """
+        Estágio de captura: lê a câmera continuamente e publica sempre o frame mais recente,
+        para que o buffer da câmera não acumule frames atrasados enquanto a inferência trabalha.
+        """
+        try:
+            self.logger.info("Iniciando loop de captura.")
+            while not self.stop_flag.is_set():
+                inicio = time.perf_counter()
+                frame: cv2.Mat = self.read_frame()
+                if frame is None:
+                    if self.source_ativa.esgotado:
+                        self.logger.info(f"Fonte de frames encerrada: {self.source_ativa.nome}")
+                        break
+                    time.sleep(0.01)
+                    continue
+                capturado = time.perf_counter()
+                self.metricas["captura_ms"].adicionar((capturado - inicio) * 1000)
+                self.captura_slot.publicar((capturado, frame))
+            self.logger.info("Saindo do loop de captura.")
+        except Exception as e:
+            self.error_logger.error(f"Erro no loop de captura: {traceback.format_exc()} || {e}")
+        finally:
+            self.captura_slot.fechar()
+
+    def __inference_loop(self) -> None:
+        """
+        Estágio de inferência: detecta as mãos no frame mais recente e interpreta os gestos.
+
+        Com um intervalo de inferência maior que 1, a detecção só roda em parte dos frames; nos demais,
+        os landmarks são estimados (`InferenceStride`) e seguem o mesmo caminho dos detectados.
+        """
+        try:
+            self.logger.info("Iniciando loop de deteccao.")
+            ultimo_seq = 0
+            while not self.stop_flag.is_set():
+                seq, item = self.captura_slot.aguardar(ultimo_seq, timeout=0.5)
+                if item is None:
+                    if self.captura_slot.fechado:
+                        break
+                    continue
+                self.frames_descartados["inferencia"] += seq - ultimo_seq - 1
+                ultimo_seq = seq
+                capturado, frame = item
+
+                inicio = time.perf_counter()
+                inferido = self.inference_stride.deve_inferir()
+                if inferido:
+                    results = self.gesture_reader.detect_hand(frame)
+                    detectado = time.perf_counter()
+                    self.inference_stride.registrar(results, capturado)
+                    self.metricas["inferencia_ms"].adicionar((detectado - inicio) * 1000)
+                else:
+                    results = self.inference_stride.estimar(capturado)
+                    detectado = time.perf_counter()
+                self.metricas["glass_to_landmark_ms"].adicionar((detectado - capturado) * 1000)
+
+                telemetria = self.telemetria
+                if telemetria is not None:
+                    telemetria.registrar_frame(seq, capturado, len(results.multi_hand_landmarks or ()), inferido,
+                                               (detectado - inicio) * 1000 if inferido else 0.0, (detectado - capturado) * 1000)
+
+                if results.multi_hand_landmarks and not self.crop_hand_mode:
+                    self.gesture_reader.read_gesture(results, seq, capturado)
+                self.metricas["gestos_ms"].adicionar((time.perf_counter() - detectado) * 1000)
+
+                landmarks_server = self.landmarks_server
+                if landmarks_server is not None and landmarks_server.has_subscribers():
+                    landmarks_server.publicar(seq, time.time() - (time.perf_counter() - capturado), self.__extrair_maos(results))
+
+                self.inferencia_slot.publicar((capturado, seq, frame, results))
+            self.logger.info("Saindo do loop de deteccao.")
+        except Exception as e:
+            self.error_logger.error(f"Erro no loop de deteccao: {traceback.format_exc()} || {e}")
+        finally:
+            self.inferencia_slot.fechar()
+
+    def __render_loop(self) -> None:
+        """
+        Estágio de renderização: desenha as mãos detectadas (e corta o frame no CROP_HAND_MODE)
+        e disponibiliza o frame pronto para o stream.
+
+        Só renderiza os frames pedidos em `fps_render`: sem ninguém assistindo (0), os frames
+        inferidos são descartados sem desenho nem corte, e a detecção segue sozinha.
+        """
+        try:
+            self.logger.info("Iniciando loop de renderizacao.")
+            ultimo_seq = 0
+            proximo_render = 0.0
+            while not self.stop_flag.is_set():
+                seq, item = self.inferencia_slot.aguardar(ultimo_seq, timeout=0.5)
+                if item is None:
+                    if self.inferencia_slot.fechado:
+                        break
+                    continue
+                self.frames_descartados["render"] += seq - ultimo_seq - 1
+                ultimo_seq = seq
+                capturado, seq_captura, frame, results = item
+
+                inicio = time.perf_counter()
+                fps_render = self.fps_render
+                if fps_render is not None:
+                    if fps_render <= 0 or inicio < proximo_render - FOLGA_RENDER:
+                        self.frames_descartados["sem_demanda"] += 1
+                        continue
+                    proximo_render = max(proximo_render + 1 / fps_render, inicio)
+
+                # A captura e a inferência já terminaram com este frame: a exibição é espelhada nele mesmo
+                frame = cv2.flip(frame, 1, dst=frame)
+                desenho = time.perf_counter()
+                frame = self.__draw_hand(frame, results)
+                self.metricas["desenho_ms"].adicionar((time.perf_counter() - desenho) * 1000)
+                if self.crop_hand_mode:
+                    frame = self.__crop_hand(frame, results)
+                renderizado = time.perf_counter()
+                self.frame = frame
+                self.frame_renderizado = (seq_captura, time.time() - (renderizado - capturado), frame)
+                self.frame_pronto.notificar(seq_captura)
+
+                self.metricas["render_ms"].adicionar((renderizado - inicio) * 1000)
+                self.metricas["glass_to_frame_ms"].adicionar((renderizado - capturado) * 1000)
+            self.logger.info("Saindo do loop de renderizacao.")
+        except Exception as e:
+            self.error_logger.error(f"Erro no loop de renderizacao: {traceback.format_exc()} || {e}")
+
+    def __extrair_maos(self, results) -> list:
+        """
+        Extrai os landmarks e o gesto reconhecido mais recente de cada mão detectada.
+
+        Args:
+            results: Os resultados da detecção de mão.
+
+        Returns:
+            list: Tuplas (mão, nome do gesto, pontos (21, 3) float32).
+        """
+        maos = []
+        for hand_landmarks, handedness in zip(self.gesture_reader.get_hand_landmarks(results), results.multi_handedness or []):
+            mao = self.gesture_reader.classify_hand(handedness)
+            gesto = ConfigRouter().read_atribute("nome_gesto_esquerda" if mao == LEFT else "nome_gesto_direita")
+            maos.append((mao, gesto, landmarks_para_array(hand_landmarks)))
+        return maos
+
+    def iniciar_telemetria(self, caminho: str) -> None:
+        """
+        Começa a registrar os eventos de cada frame (detecção e interpretação) em um arquivo de telemetria.
+        Uma telemetria em andamento é encerrada antes.
+
+        Args:
+            caminho (str): O arquivo da telemetria. Um arquivo existente do mesmo formato é continuado.
+        """
+        self.parar_telemetria()
+        self.telemetria = TelemetryRecorder(caminho)
+        self.gesture_reader.interpretador.telemetria = self.telemetria
+        self.logger.info(f"Telemetria iniciada em: {caminho}")
+
+    def parar_telemetria(self) -> None:
+        """
+        Encerra a telemetria em andamento, se houver.
+        """
+        telemetria, self.telemetria = self.telemetria, None
+        if telemetria is not None:
+            self.gesture_reader.interpretador.telemetria = None
+            telemetria.fechar()
+            self.logger.info(f"Telemetria salva em: {telemetria.caminho} ({telemetria.escritos} eventos)")
+
+    def pipeline_ativo(self) -> bool:
+        """
+        Verifica se alguma thread do pipeline ainda está rodando.
+        """
+        return any(thread.is_alive() for thread in self.pipeline_threads)
+
+    def get_metricas(self) -> dict:
+        """
+        Retorna o tempo de cada estágio do pipeline, as latências desde a captura e os frames descartados.
+
+        Returns:
+            dict: Resumo (ms, percentis e fps) de cada medida e a quantidade de frames descartados por estágio.
+        """
+        metricas = {nome: stats.resumo() for nome, stats in self.metricas.items()}
+        metricas["ativo"] = self.pipeline_ativo()
+        metricas["frames_capturados"] = self.captura_slot.seq
+        metricas["frames_descartados"] = dict(self.frames_descartados)
+        metricas["inference_stride"] = self.inference_stride.metricas()
+        roi = self.gesture_reader.roi
+        if roi is not None:
+            metricas["roi"] = roi.metricas()
+        return metricas
+
     def stop(self) -> None:
         """
         Para a captura de vídeo e libera a câmera.
         """
         self.stop_flag.set()
-        self.detection_thread.join()
-        if self.cap:
-            self.cap.release()
-            self.cap = None
+        self.captura_slot.fechar()
+        self.inferencia_slot.fechar()
+        for thread in self.pipeline_threads:
+            thread.join()
+        self.pipeline_threads = []
+        self.gesture_reader.interpretador.encerrar()   # Termina as interpretações pendentes antes de fechar a telemetria
+        self.gesture_reader.parar_gravacao()
+        self.parar_telemetria()
+        self.logger.info(f"Metricas do pipeline: {self.get_metricas()}")
+        self.logger.info(f"Metricas da interpretacao: {self.gesture_reader.interpretador.get_metricas()}")
+        if self.source_ativa:
+            self.source_ativa.fechar()
+            self.source_ativa = None
         self.logger.info("Camera liberada.")
         self.logger.info("Objetos e recursos limpos.")
 
@@ -150,12 +404,7 @@ class Camera:
         Returns:
             list: Uma lista com os nomes dos dispositivos de câmera.
         """
-        pythoncom.CoInitialize()
-        try:
-            graph = FilterGraph()
-            return graph.get_input_devices()
-        finally:
-            pythoncom.CoUninitialize()
+        return CameraSource.listar_cameras()
             
     def select_camera_by_name(self, camera_nome: str) -> None:
         """
@@ -167,37 +416,38 @@ class Camera:
         Raises:
             ValueError: Se a câmera com o nome fornecido não for encontrada.
         """
-        dispositivos_video = self.list_cameras()
-        if camera_nome in dispositivos_video:
-            index = dispositivos_video.index(camera_nome)
-            self.cap = cv2.VideoCapture(index)
-            if not self.cap.isOpened():
-                error_message = f"Não foi possível abrir a câmera: {camera_nome}"
-                self.error_logger.error(error_message)
-                raise ValueError(error_message)
-            self.logger.info(f"Camera selecionada e aberta: {camera_nome}")
-        else:
-            error_message = f"Camera '{camera_nome}' nao encontrada."
-            self.error_logger.error(error_message)
-            raise ValueError(error_message)
+        self.select_source(CameraSource(camera_nome))
+
+    def select_source(self, source: FrameSource) -> None:
+        """
+        Abre a fonte de frames usada pelo processo de detecção.
+
+        Args:
+            source (FrameSource): A fonte de frames.
+
+        Raises:
+            ValueError: Se a fonte não puder ser aberta.
+        """
+        if self.source_ativa is not None and self.source_ativa is not source:
+            self.source_ativa.fechar()
+        source.abrir()
+        self.source_ativa = source
 
     def read_frame(self) -> cv2.Mat:
         """
-        Lê o frame da webcam.
+        Lê o frame da fonte de frames, sem espelhar: a inferência espelha a sua entrada no `FramePreprocessor`,
+        e a renderização espelha o frame exibido.
 
         Returns:
-            cv2.Mat: O frame lido.
+            cv2.Mat: O frame lido, ou None se não houver frame disponível.
 
         Raises:
             SystemError: Se houver erro ao capturar o frame da câmera.
         """
-        if self.is_camera_opened():
-            ret, frame = self.cap.read()
-        if not ret:
-            error_message = "Erro ao capturar a imagem da camera."
-            self.error_logger.error(error_message)
-            raise SystemError(error_message)
-        return cv2.flip(frame, 1)
+        frame = self.source_ativa.ler() if self.source_ativa is not None else None
+        if frame is None:
+            return None
+        return frame
 
     def __draw_hand(self, frame: cv2.Mat, results) -> cv2.Mat:
         """
@@ -295,7 +545,7 @@ class Camera:
         Returns:
             bool: True se a câmera estiver aberta, False caso contrário.
         """
-        return self.cap is not None and self.cap.isOpened()
+        return self.source_ativa is not None and self.source_ativa.is_opened()
 
     def start_crop_hand_mode(self) -> None:
         """
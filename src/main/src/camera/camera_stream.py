@@ -1,31 +1,82 @@
 import os
 import cv2
 import time
-import base64
 import asyncio
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from src.logger.logger import Logger
 from src.camera.camera_manager import Camera
+from src.camera.frame_source import FrameSource
+from src.camera.stream_profile import StreamProfile, StreamSettings, AdaptiveStreamController
+from src.data.configs.config_router import ConfigRouter
+from src.pipeline.metrics import RollingStats
 from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+from src.websockets.frames_websocket.frame_protocol import FrameProtocol, EncodedFrame, FLAG_PLACEHOLDER
+from src.websockets.landmarks_websocket.landmarks_websocket import LandmarksWebsocketServer
 
 logger = Logger().configure_application_logger()
 data_logger = Logger().configure_json_data_logger()
 error_logger = Logger().configure_error_logger()
 
+INTERVALO_PLACEHOLDER = 1.0  # Segundos entre reenvios do placeholder enquanto a câmera está desligada
+
 class CameraStream:
-    def __init__(self, frames_server: FramesWebsocketServer):
+    def __init__(self, frames_server: FramesWebsocketServer, source: FrameSource = None, profile: StreamProfile = None,
+                 landmarks_server: LandmarksWebsocketServer = None):
+        """
+        Args:
+            frames_server (FramesWebsocketServer): O servidor que envia os frames.
+            source (FrameSource): A fonte de frames. Se não informada, usa a câmera selecionada nas configurações.
+            profile (StreamProfile): Os limites do stream. Se não informado, usa o perfil salvo nas configurações.
+            landmarks_server (LandmarksWebsocketServer): O servidor que envia os landmarks de cada frame, se houver.
+        """
         self.frames_sender = frames_server
-        self.camera_capture = Camera()
+        self.camera_capture = Camera(source)
+        self.camera_capture.landmarks_server = landmarks_server
         self.stop_flag = threading.Event()
 
+        # A codificação dos frames roda em uma única thread dedicada, para que o preview nunca
+        # ocupe mais de um núcleo nem dispute as threads do executor padrão
+        self.encoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stream-encode")
+        self.controller = AdaptiveStreamController(profile or StreamProfile())
+
+        self.placeholder_bgr: cv2.Mat = None    # camera_off.png decodificado uma única vez
+        self.placeholders = {}                  # (largura máxima, qualidade) -> placeholder codificado
+        self.metricas = {nome: RollingStats() for nome in ("codificacao_ms", "envio_ms")}
+        if profile is None:
+            ConfigRouter.subscribe("stream_profile", self.__atualizar_profile)
+
+    def __atualizar_profile(self, atributo: str, valor) -> None:
+        """
+        Callback inscrito no ConfigRouter para receber as mudanças do perfil de stream.
+        """
+        try:
+            self.set_profile(StreamProfile.from_config(valor))
+        except (ValueError, TypeError) as e:
+            error_logger.error(f"Perfil de stream invalido nas configuracoes, mantendo o atual: {e}")
+
+    def set_profile(self, profile: StreamProfile) -> None:
+        """
+        Troca o perfil do stream, recomeçando o controle adaptativo do degrau mais alto.
+
+        Args:
+            profile (StreamProfile): O novo perfil.
+        """
+        self.controller = AdaptiveStreamController(profile)
+        logger.info(f"Perfil de stream: {profile._asdict()}")
+
     async def start_stream(self) -> None:
         """Inicia a captura de frames da câmera."""
         logger.info("Tentando iniciar o stream da camera.")
         self.stop_flag.clear()
         if self.camera_capture:
+            self.camera_capture.fps_render = None   # Renderiza o primeiro frame, mesmo sem clientes de vídeo
+            seq_anterior = self.camera_capture.frame_pronto.seq
             await self.camera_capture.start()
-            while self.__get_cv2_frame() is None:
-                time.sleep(0.25)
+            while await self.camera_capture.frame_pronto.aguardar(seq_anterior, timeout=1.0) == seq_anterior:
+                if not self.camera_capture.pipeline_ativo():
+                    error_logger.error("O pipeline da camera encerrou antes do primeiro frame.")
+                    return
             data_logger.info("Primeiro frame encontrado.")
             asyncio.create_task(self.__stream_frames())
 
@@ -36,49 +87,138 @@ class CameraStream:
         logger.info("Parando a captura de frames.")
 
     async def __stream_frames(self) -> None:
-        """Loop de captura e envio dos frames"""
+        """
+        Loop de codificação e envio dos frames, limitado ao fps do perfil e ao maior fps pedido pelos clientes.
+        Frames que já foram enviados (mesmo número de sequência) não são codificados de novo: o loop
+        dorme até a renderização avisar que há um frame novo.
+
+        O mesmo limite é repassado à renderização da câmera: enquanto não há clientes de vídeo, nada é
+        desenhado nem codificado, e o loop apenas espera algum se conectar.
+        """
         loop = asyncio.get_event_loop()
+        ultimo_seq = None
+        proximo_envio = loop.time()
+        proximo_placeholder = loop.time()
         while not self.stop_flag.is_set():
-            frame = await loop.run_in_executor(None, self.get_frame)
-            if frame == "": continue
+            espera = proximo_envio - loop.time()
+            if espera > 0:
+                await asyncio.sleep(espera)
+
+            renderizado = self.camera_capture.frame_renderizado
+            configuracao = self.controller.configuracao
+            fps = self.frames_sender.get_fps_pedido()
+            fps = configuracao.fps if fps is None else min(fps, configuracao.fps)
+            self.camera_capture.fps_render = fps
+            if not fps:
+                # Sem clientes de vídeo, nenhum frame é desenhado nem codificado
+                await self.frames_sender.aguardar_assinantes(timeout=0.5)
+                continue
+
+            if renderizado is None or not self.camera_capture.pipeline_ativo():
+                # Câmera desligada: o placeholder (já codificado) é reenviado só a cada INTERVALO_PLACEHOLDER,
+                # e nesse meio tempo o loop dorme até um frame novo ou o próximo envio do placeholder
+                espera = proximo_placeholder - loop.time()
+                if espera > 0:
+                    await self.camera_capture.frame_pronto.aguardar(self.camera_capture.frame_pronto.seq, timeout=espera)
+                    continue
+                frame = await loop.run_in_executor(self.encoder, self.get_placeholder, configuracao)
+                proximo_placeholder = loop.time() + INTERVALO_PLACEHOLDER
+                ultimo_seq = None
+            elif renderizado[0] == ultimo_seq:
+                await self.camera_capture.frame_pronto.aguardar(ultimo_seq, timeout=0.5)
+                continue
+            else:
+                frame = await loop.run_in_executor(self.encoder, self.get_frame, configuracao)
+                ultimo_seq = frame.seq if frame is not None else ultimo_seq
+            if frame is None: continue
+
+            self.controller.atualizar(*self.frames_sender.get_congestionamento())
+            inicio = time.perf_counter()
             await self.frames_sender.send_frame(frame)
-            time.sleep(0.00001)
+            self.metricas["envio_ms"].adicionar((time.perf_counter() - inicio) * 1000)
+            proximo_envio = max(proximo_envio + 1 / fps, loop.time())
 
-    def get_frame(self) -> str:
-        """Retorna o frame atual convertido para jpeg"""
-        frame = self.__get_cv2_frame()
-        if frame is not None:
-            jpeg_frame = self.__convert_cv2_mat_to_string(frame)
-            return jpeg_frame
+    def get_frame(self, configuracao: StreamSettings = None) -> EncodedFrame:
+        """
+        Retorna o frame atual codificado em JPEG, ou o placeholder de câmera desligada.
 
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        png_placeholder_path = os.path.abspath(os.path.join(current_dir, '../../../../public/assets/camera_off.png'))
+        Args:
+            configuracao (StreamSettings): Largura máxima e qualidade do JPEG. Se não informada, usa a atual do stream.
+        """
+        configuracao = configuracao or self.controller.configuracao
+        renderizado = self.camera_capture.frame_renderizado
+        if renderizado is not None:
+            seq, timestamp, frame = renderizado
+            inicio = time.perf_counter()
+            codificado = self.__encode_frame(frame, seq, timestamp, configuracao)
+            self.metricas["codificacao_ms"].adicionar((time.perf_counter() - inicio) * 1000)
+            return codificado
 
-        if not os.path.exists(png_placeholder_path):
-            raise FileNotFoundError(f"Frame '{png_placeholder_path}' nao encontrado!")
+        return self.get_placeholder(configuracao)
 
-        png_placeholder_frame = cv2.imread(png_placeholder_path)
-        if png_placeholder_frame is not None:
-            png_placeholder = self.__convert_cv2_mat_to_string(png_placeholder_frame)
-        return png_placeholder
+    def get_metricas(self) -> dict:
+        """
+        Retorna as métricas de todo o caminho de um frame: estágios da câmera, interpretação e inputs,
+        codificação e envio do stream e as filas de cada cliente de vídeo.
 
-    def __get_cv2_frame(self) -> cv2.Mat:
+        Returns:
+            dict: As métricas, com os tempos em percentis (ms) e fps por medida.
         """
-        Obtém um frame capturado e o converte.
-        Returns: o frame (cv2.Mat) capturado se estiver disponível, caso contrário, retorna None.
+        camera = self.camera_capture
+        return {
+            "camera": camera.get_metricas(),
+            "interpretacao": camera.gesture_reader.interpretador.get_metricas(),
+            "stream": {
+                **{nome: stats.resumo() for nome, stats in self.metricas.items()},
+                "fps_render": camera.fps_render,
+                "configuracao": self.controller.configuracao._asdict(),
+                "clientes": self.frames_sender.get_metricas(),
+            },
+            "landmarks": camera.landmarks_server.get_metricas() if camera.landmarks_server is not None else {},
+        }
+
+    def get_placeholder(self, configuracao: StreamSettings = None) -> EncodedFrame:
         """
-        return self.camera_capture.frame if self.camera_capture.frame is not None else None
+        Retorna o placeholder de câmera desligada, codificado uma única vez para cada largura e qualidade.
 
-    def __convert_cv2_mat_to_string(self, frame: cv2.Mat) -> str:
+        Args:
+            configuracao (StreamSettings): Largura máxima e qualidade do JPEG. Se não informada, usa a atual do stream.
+
+        Raises:
+            FileNotFoundError: Se a imagem do placeholder não existir.
         """
-        Converte um frame (cv2.Mat) para string (base64).
+        configuracao = configuracao or self.controller.configuracao
+        chave = (configuracao.largura_max, configuracao.qualidade_jpeg)
+        placeholder = self.placeholders.get(chave)
+        if placeholder is not None:
+            return placeholder
+
+        if self.placeholder_bgr is None:
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            png_placeholder_path = os.path.abspath(os.path.join(current_dir, '../../../../public/assets/camera_off.png'))
+
+            if not os.path.exists(png_placeholder_path):
+                raise FileNotFoundError(f"Frame '{png_placeholder_path}' nao encontrado!")
+            self.placeholder_bgr = cv2.imread(png_placeholder_path)
+
+        placeholder = self.__encode_frame(self.placeholder_bgr, 0, time.time(), configuracao, FLAG_PLACEHOLDER)
+        if placeholder is not None:
+            self.placeholders[chave] = placeholder
+        return placeholder
+
+    def __encode_frame(self, frame: cv2.Mat, seq: int, timestamp: float, configuracao: StreamSettings, flags: int = 0) -> EncodedFrame:
+        """
+        Reduz o frame (cv2.Mat) para a largura máxima do stream e o codifica em JPEG, com o cabeçalho do formato binário.
+
+        Returns:
+            EncodedFrame: O frame codificado, ou None se a codificação falhar.
         """
         try:
-            if frame is None: 
-                raise TypeError("O frame deve estar no formato cv2.Mat")
-            _, buffer = cv2.imencode('.jpg', frame)
-            frame_base64 = base64.b64encode(buffer).decode('utf-8')
-            return frame_base64
+            altura, largura = frame.shape[:2]
+            if largura > configuracao.largura_max:
+                nova_altura = max(1, round(altura * configuracao.largura_max / largura))
+                frame = cv2.resize(frame, (configuracao.largura_max, nova_altura), interpolation=cv2.INTER_AREA)
+            return FrameProtocol.codificar(frame, seq, timestamp, flags, configuracao.qualidade_jpeg)
         except Exception as e:
             error_logger.error(f"Falha na conversao de frame para JPEG: {e}")
-            return ""
+            return None
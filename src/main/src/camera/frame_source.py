@@ -0,0 +1,298 @@
+from src.logger.logger import Logger
+from abc import ABC, abstractmethod
+import numpy as np
+import time
+import cv2
+import os
+
+EXTENSOES_IMAGEM = (".png", ".jpg", ".jpeg", ".bmp")
+
+class FrameSource(ABC):
+    """
+    Origem dos frames lidos pelo pipeline da `Camera`.
+
+    `ler` retorna o próximo frame BGR, ou None quando não há frame disponível. Fontes finitas
+    (arquivo de vídeo, pasta de imagens) marcam `esgotado` quando acabam.
+    """
+
+    def __init__(self, nome: str):
+        self.nome = nome
+        self.esgotado = False
+        self.logger = Logger.configure_application_logger()
+        self.error_logger = Logger.configure_error_logger()
+
+    @abstractmethod
+    def abrir(self) -> None:
+        """
+        Abre a fonte de frames.
+
+        Raises:
+            ValueError: Se a fonte não puder ser aberta.
+        """
+        pass
+
+    @abstractmethod
+    def ler(self) -> cv2.Mat:
+        """
+        Lê o próximo frame.
+
+        Returns:
+            cv2.Mat: O frame BGR, ou None se não houver frame disponível.
+        """
+        pass
+
+    @abstractmethod
+    def fechar(self) -> None:
+        """
+        Libera os recursos da fonte.
+        """
+        pass
+
+    @abstractmethod
+    def is_opened(self) -> bool:
+        """
+        Verifica se a fonte está aberta.
+        """
+        pass
+
+class _Ritmo:
+    """
+    Controla o ritmo de leitura das fontes que não são câmeras: em tempo real, espera o instante de
+    cada frame; caso contrário, entrega os frames o mais rápido possível.
+    """
+
+    def __init__(self, fps: float, tempo_real: bool):
+        self.intervalo = 1.0 / fps if fps > 0 else 0.0
+        self.tempo_real = tempo_real
+        self.proximo = None
+
+    def esperar(self) -> None:
+        if not self.tempo_real:
+            return
+        agora = time.perf_counter()
+        if self.proximo is None or agora - self.proximo > self.intervalo:
+            self.proximo = agora  # Primeiro frame, ou a leitura atrasou: não tenta compensar
+        elif self.proximo > agora:
+            time.sleep(self.proximo - agora)
+        self.proximo += self.intervalo
+
+class CameraSource(FrameSource):
+    """
+    Webcam selecionada pelo nome do dispositivo (enumerada pelo DirectShow, apenas no Windows).
+    """
+
+    def __init__(self, camera_nome: str):
+        super().__init__(camera_nome)
+        self.cap: cv2.VideoCapture = None
+
+    @staticmethod
+    def listar_cameras() -> list[str]:
+        """
+        Lista todas as câmeras disponíveis no sistema.
+
+        Returns:
+            list: Uma lista com os nomes dos dispositivos de câmera.
+        """
+        from pygrabber.dshow_graph import FilterGraph
+        import pythoncom
+
+        pythoncom.CoInitialize()
+        try:
+            graph = FilterGraph()
+            return graph.get_input_devices()
+        finally:
+            pythoncom.CoUninitialize()
+
+    def abrir(self) -> None:
+        dispositivos_video = CameraSource.listar_cameras()
+        if self.nome not in dispositivos_video:
+            error_message = f"Camera '{self.nome}' nao encontrada."
+            self.error_logger.error(error_message)
+            raise ValueError(error_message)
+
+        self.cap = cv2.VideoCapture(dispositivos_video.index(self.nome))
+        if not self.cap.isOpened():
+            error_message = f"Não foi possível abrir a câmera: {self.nome}"
+            self.error_logger.error(error_message)
+            raise ValueError(error_message)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self.logger.info(f"Camera selecionada e aberta: {self.nome}")
+
+    def ler(self) -> cv2.Mat:
+        if not self.is_opened():
+            return None
+        ret, frame = self.cap.read()
+        if not ret:
+            error_message = "Erro ao capturar a imagem da camera."
+            self.error_logger.error(error_message)
+            raise SystemError(error_message)
+        return frame
+
+    def fechar(self) -> None:
+        if self.cap:
+            self.cap.release()
+            self.cap = None
+
+    def is_opened(self) -> bool:
+        return self.cap is not None and self.cap.isOpened()
+
+class VideoFileSource(FrameSource):
+    """
+    Arquivo de vídeo, lido no ritmo do próprio vídeo ou o mais rápido possível.
+    """
+
+    def __init__(self, caminho: str, tempo_real: bool = True, repetir: bool = False):
+        """
+        Args:
+            caminho (str): O caminho do arquivo de vídeo.
+            tempo_real (bool): Entrega os frames no FPS do vídeo; se False, o mais rápido possível.
+            repetir (bool): Volta ao início quando o vídeo acaba.
+        """
+        super().__init__(caminho)
+        self.caminho = caminho
+        self.tempo_real = tempo_real
+        self.repetir = repetir
+        self.cap: cv2.VideoCapture = None
+        self.ritmo: _Ritmo = None
+
+    def abrir(self) -> None:
+        self.cap = cv2.VideoCapture(self.caminho)
+        if not self.cap.isOpened():
+            error_message = f"Nao foi possivel abrir o video: {self.caminho}"
+            self.error_logger.error(error_message)
+            raise ValueError(error_message)
+        self.ritmo = _Ritmo(self.cap.get(cv2.CAP_PROP_FPS) or 30.0, self.tempo_real)
+        self.esgotado = False
+        self.logger.info(f"Video aberto como fonte de frames: {self.caminho}")
+
+    def ler(self) -> cv2.Mat:
+        if not self.is_opened():
+            return None
+        self.ritmo.esperar()
+        ret, frame = self.cap.read()
+        if not ret and self.repetir:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read()
+        if not ret:
+            self.esgotado = True
+            return None
+        return frame
+
+    def fechar(self) -> None:
+        if self.cap:
+            self.cap.release()
+            self.cap = None
+
+    def is_opened(self) -> bool:
+        return self.cap is not None and self.cap.isOpened()
+
+class ImageDirSource(FrameSource):
+    """
+    Pasta de imagens, lidas em ordem alfabética como frames de um vídeo.
+    """
+
+    def __init__(self, pasta: str, fps: float = 30.0, tempo_real: bool = True, repetir: bool = False):
+        """
+        Args:
+            pasta (str): A pasta com as imagens.
+            fps (float): O ritmo dos frames em tempo real.
+            tempo_real (bool): Entrega os frames no ritmo de `fps`; se False, o mais rápido possível.
+            repetir (bool): Volta à primeira imagem quando as imagens acabam.
+        """
+        super().__init__(pasta)
+        self.pasta = pasta
+        self.fps = fps
+        self.tempo_real = tempo_real
+        self.repetir = repetir
+        self.arquivos: list[str] = []
+        self.indice = 0
+        self.ritmo: _Ritmo = None
+
+    def abrir(self) -> None:
+        if not os.path.isdir(self.pasta):
+            error_message = f"Pasta de imagens nao encontrada: {self.pasta}"
+            self.error_logger.error(error_message)
+            raise ValueError(error_message)
+        self.arquivos = sorted(
+            os.path.join(self.pasta, arquivo) for arquivo in os.listdir(self.pasta)
+            if arquivo.lower().endswith(EXTENSOES_IMAGEM)
+        )
+        if not self.arquivos:
+            error_message = f"Nenhuma imagem encontrada em: {self.pasta}"
+            self.error_logger.error(error_message)
+            raise ValueError(error_message)
+        self.indice = 0
+        self.esgotado = False
+        self.ritmo = _Ritmo(self.fps, self.tempo_real)
+        self.logger.info(f"Pasta de imagens aberta como fonte de frames: {self.pasta} ({len(self.arquivos)} imagens)")
+
+    def ler(self) -> cv2.Mat:
+        if not self.is_opened():
+            return None
+        if self.indice >= len(self.arquivos):
+            if not self.repetir:
+                self.esgotado = True
+                return None
+            self.indice = 0
+        self.ritmo.esperar()
+        frame = cv2.imread(self.arquivos[self.indice])
+        self.indice += 1
+        return frame
+
+    def fechar(self) -> None:
+        self.arquivos = []
+
+    def is_opened(self) -> bool:
+        return bool(self.arquivos)
+
+class SyntheticSource(FrameSource):
+    """
+    Gerador de frames sintéticos (gradiente em movimento com o número do frame), para testes de carga sem câmera.
+    """
+
+    def __init__(self, largura: int = 640, altura: int = 480, fps: float = 30.0, tempo_real: bool = True, quantidade: int = None):
+        """
+        Args:
+            largura (int): A largura dos frames.
+            altura (int): A altura dos frames.
+            fps (float): O ritmo dos frames em tempo real.
+            tempo_real (bool): Entrega os frames no ritmo de `fps`; se False, o mais rápido possível.
+            quantidade (int): Quantidade de frames gerados antes de a fonte se esgotar. Sem limite se None.
+        """
+        super().__init__(f"sintetica {largura}x{altura}@{fps:g}")
+        self.largura = largura
+        self.altura = altura
+        self.fps = fps
+        self.tempo_real = tempo_real
+        self.quantidade = quantidade
+        self.gerados = 0
+        self.base: np.ndarray = None
+        self.ritmo: _Ritmo = None
+
+    def abrir(self) -> None:
+        gradiente = np.linspace(0, 255, self.largura, dtype=np.float32)
+        self.base = np.empty((self.altura, self.largura, 3), dtype=np.uint8)
+        self.base[..., 0] = gradiente
+        self.base[..., 1] = np.linspace(0, 255, self.altura, dtype=np.float32)[:, np.newaxis]
+        self.base[..., 2] = 128
+        self.gerados = 0
+        self.esgotado = False
+        self.ritmo = _Ritmo(self.fps, self.tempo_real)
+
+    def ler(self) -> cv2.Mat:
+        if not self.is_opened():
+            return None
+        if self.quantidade is not None and self.gerados >= self.quantidade:
+            self.esgotado = True
+            return None
+        self.ritmo.esperar()
+        frame = np.roll(self.base, self.gerados * 4, axis=1)
+        cv2.putText(frame, str(self.gerados), (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
+        self.gerados += 1
+        return frame
+
+    def fechar(self) -> None:
+        self.base = None
+
+    def is_opened(self) -> bool:
+        return self.base is not None
@@ -0,0 +1,156 @@
+from typing import NamedTuple
+
+VALORES_BOOLEANOS = {"true": True, "1": True, "sim": True, "false": False, "0": False, "nao": False}
+
+class StreamProfile(NamedTuple):
+    """
+    Limites do stream de frames enviado para a interface.
+    """
+    max_fps: float = 30.0
+    max_width: int = 640
+    jpeg_quality: int = 80
+    adaptativo: bool = True     # Reduz qualidade, resolução e fps quando os clientes não acompanham
+
+    @staticmethod
+    def from_config(valor) -> "StreamProfile":
+        """
+        Cria o perfil a partir do valor salvo nas configurações básicas.
+
+        Args:
+            valor: Um dicionário com os campos do perfil. Campos ausentes (ou um valor vazio) usam o padrão.
+
+        Returns:
+            StreamProfile: O perfil validado.
+
+        Raises:
+            ValueError: Se algum campo tiver um valor inválido.
+        """
+        if not valor:
+            return StreamProfile()
+        if not isinstance(valor, dict):
+            raise ValueError(f"Perfil de stream invalido: {valor}")
+
+        desconhecidos = set(valor) - set(StreamProfile._fields)
+        if desconhecidos:
+            raise ValueError(f"Campos desconhecidos no perfil de stream: {sorted(desconhecidos)}")
+
+        profile = StreamProfile()._replace(**valor)
+        if not 1 <= profile.max_fps <= 120:
+            raise ValueError(f"max_fps deve estar entre 1 e 120: {profile.max_fps}")
+        if not 160 <= profile.max_width <= 3840:
+            raise ValueError(f"max_width deve estar entre 160 e 3840: {profile.max_width}")
+        if not 10 <= profile.jpeg_quality <= 100:
+            raise ValueError(f"jpeg_quality deve estar entre 10 e 100: {profile.jpeg_quality}")
+        return profile._replace(max_fps=float(profile.max_fps), max_width=int(profile.max_width),
+                                jpeg_quality=int(profile.jpeg_quality), adaptativo=StreamProfile.ler_booleano(profile.adaptativo))
+
+    @staticmethod
+    def ler_booleano(valor) -> bool:
+        """
+        Converte o valor de `adaptativo` salvo nas configurações (um bool, 0/1 ou o texto "true"/"false").
+
+        Args:
+            valor: O valor salvo.
+
+        Returns:
+            bool: O valor convertido.
+
+        Raises:
+            ValueError: Se o valor não representar um booleano.
+        """
+        if isinstance(valor, bool):
+            return valor
+        if isinstance(valor, int) and valor in (0, 1):
+            return bool(valor)
+        if isinstance(valor, str) and valor.strip().lower() in VALORES_BOOLEANOS:
+            return VALORES_BOOLEANOS[valor.strip().lower()]
+        raise ValueError(f"adaptativo deve ser true ou false: {valor}")
+
+class StreamSettings(NamedTuple):
+    """
+    Configuração efetiva do stream em um dado momento.
+    """
+    fps: float
+    largura_max: int
+    qualidade_jpeg: int
+
+# Degraus do controle adaptativo: (escala da largura, redução da qualidade do JPEG, escala do fps).
+# Primeiro cai a qualidade, depois a resolução e, por último, o fps.
+NIVEIS_ADAPTATIVOS = (
+    (1.0, 0, 1.0),
+    (1.0, 15, 1.0),
+    (0.75, 15, 1.0),
+    (0.75, 30, 1.0),
+    (0.5, 30, 0.75),
+    (0.5, 40, 0.5),
+)
+
+QUALIDADE_MINIMA = 30
+LARGURA_MINIMA = 160
+FPS_MINIMO = 5.0
+
+class AdaptiveStreamController:
+    """
+    Ajusta a configuração do stream a partir da latência de envio e da fila dos clientes.
+
+    Há congestionamento quando ainda existe frame esperando envio no momento em que um novo é
+    entregue, ou quando a latência de envio passa do intervalo entre frames. Congestionado, o
+    controle desce um degrau (no máximo um a cada `frames_para_descer` frames, para a mudança
+    ter efeito antes de ser avaliada); após `frames_para_subir` frames sem congestionamento, sobe um.
+    """
+
+    def __init__(self, profile: StreamProfile, frames_para_descer: int = 5, frames_para_subir: int = 60):
+        """
+        Args:
+            profile (StreamProfile): O perfil com os limites máximos.
+            frames_para_descer (int): Frames mínimos entre duas descidas de degrau.
+            frames_para_subir (int): Frames seguidos sem congestionamento para subir um degrau.
+        """
+        self.profile = profile
+        self.frames_para_descer = frames_para_descer
+        self.frames_para_subir = frames_para_subir
+        self.nivel = 0
+        self.frames_no_nivel = 0
+        self.frames_livres = 0
+        self.configuracao = self.__calcular(0)
+
+    def __calcular(self, nivel: int) -> StreamSettings:
+        escala_largura, reducao_qualidade, escala_fps = NIVEIS_ADAPTATIVOS[nivel]
+        return StreamSettings(
+            # O piso de fps nunca passa do max_fps do perfil (ex.: um perfil de 2 fps continua em 2 fps)
+            fps=max(min(FPS_MINIMO, self.profile.max_fps), self.profile.max_fps * escala_fps),
+            largura_max=max(LARGURA_MINIMA, int(self.profile.max_width * escala_largura)),
+            qualidade_jpeg=max(min(QUALIDADE_MINIMA, self.profile.jpeg_quality), self.profile.jpeg_quality - reducao_qualidade),
+        )
+
+    def atualizar(self, latencia_ms: float, backlog: int) -> StreamSettings:
+        """
+        Registra o estado dos clientes após o envio de um frame e retorna a configuração para o próximo.
+
+        Args:
+            latencia_ms (float): A latência recente de envio do cliente mais lento, em ms.
+            backlog (int): A maior quantidade de frames esperando envio entre os clientes.
+
+        Returns:
+            StreamSettings: A configuração para o próximo frame.
+        """
+        if not self.profile.adaptativo:
+            return self.configuracao
+
+        self.frames_no_nivel += 1
+        congestionado = backlog > 0 or latencia_ms > 1000 / self.configuracao.fps
+        if congestionado:
+            self.frames_livres = 0
+            if self.nivel < len(NIVEIS_ADAPTATIVOS) - 1 and self.frames_no_nivel >= self.frames_para_descer:
+                self.__mudar_nivel(self.nivel + 1)
+        else:
+            self.frames_livres += 1
+            if self.nivel > 0 and self.frames_livres >= self.frames_para_subir:
+                self.__mudar_nivel(self.nivel - 1)
+        return self.configuracao
+
+    def __mudar_nivel(self, nivel: int) -> None:
+        self.nivel = nivel
+        self.frames_no_nivel = 0
+        self.frames_livres = 0
+        self.configuracao = self.__calcular(nivel)
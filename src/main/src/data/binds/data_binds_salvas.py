@@ -1,4 +1,7 @@
 from src.logger.logger import Logger
+from typing import NamedTuple
+import threading
+import time
 import os
 import json
 
@@ -6,9 +9,92 @@ logger = Logger.configure_application_logger()
 data_logger = Logger.configure_json_data_logger()
 error_logger = Logger.configure_error_logger()
 
+class BindRecord(NamedTuple):
+    """
+    Registro imutável com os dados da bind de um gesto.
+    """
+    bind: str
+    tempo_pressionado: int
+    modo_toggle: bool
+    customizable: bool
+
 class DataBindsSalvas:
-    data_file = "src/main/src/data/binds/binds_salvas.json" 
+    data_file = "src/main/src/data/binds/binds_salvas.json"
     binds_dict = {}  # Armazena (bind, tempo_pressionado, modo_toggle, customizable) para cada chave
+    bind_table = {}  # Índice compilado a partir de binds_dict: nome do gesto -> BindRecord
+
+    intervalo_verificacao = 0.5  # Segundos entre verificações do mtime do arquivo
+    data_mtime: int = None
+    ultima_verificacao: float = 0.0
+    lock = threading.RLock()
+
+    @staticmethod
+    def __compilar_tabela(binds_dict: dict) -> dict:
+        """
+        Compila o dicionário de binds em uma tabela de registros imutáveis, já com os valores padrão aplicados.
+
+        Args:
+            binds_dict (dict): O conteúdo do banco de dados de binds.
+
+        Returns:
+            dict: Dicionário nome do gesto -> BindRecord.
+        """
+        return {
+            nome_do_gesto: BindRecord(
+                bind=dados.get('bind', None),
+                tempo_pressionado=dados.get('tempo_pressionado', 5),
+                modo_toggle=dados.get('modo_toggle', False),
+                customizable=dados.get('customizable', False)
+            )
+            for nome_do_gesto, dados in binds_dict.items()
+        }
+
+    @staticmethod
+    def __get_mtime() -> int:
+        """
+        Retorna o mtime do banco de dados de binds, ou None se o arquivo não existir.
+        """
+        try:
+            return os.stat(DataBindsSalvas.data_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def __ensure_loaded(forcar: bool = False) -> None:
+        """
+        Garante que a tabela de binds esteja carregada e a recarrega caso o arquivo tenha sido alterado externamente.
+        O mtime é verificado no máximo uma vez a cada `intervalo_verificacao` segundos.
+
+        Args:
+            forcar (bool): Verifica o mtime mesmo que o intervalo ainda não tenha passado.
+        """
+        with DataBindsSalvas.lock:
+            if DataBindsSalvas.data_mtime is None:
+                DataBindsSalvas.read_database()
+                return
+
+            agora = time.monotonic()
+            if not forcar and agora - DataBindsSalvas.ultima_verificacao < DataBindsSalvas.intervalo_verificacao:
+                return
+            DataBindsSalvas.ultima_verificacao = agora
+
+            if DataBindsSalvas.__get_mtime() != DataBindsSalvas.data_mtime:
+                DataBindsSalvas.read_database()
+
+    @staticmethod
+    def get_bind_record(nome_do_gesto: str) -> BindRecord:
+        """
+        Obtém, em uma única consulta, todos os dados da bind associada ao gesto.
+
+        Args:
+            nome_do_gesto (str): O nome do gesto a ser recuperado.
+
+        Returns:
+            BindRecord: Os dados da bind associada ao gesto.
+            None: Caso o gesto não exista no banco de dados de binds.
+        """
+        DataBindsSalvas.__ensure_loaded()
+        return DataBindsSalvas.bind_table.get(nome_do_gesto)
 
     @staticmethod
     def do_bind_exist(nome_do_gesto: str) -> bool:
@@ -22,17 +108,16 @@ class DataBindsSalvas:
             bool: True se o gesto foi encontrado no banco de dados de binds.
             bool: False caso contrário.
         """
-        DataBindsSalvas.read_database()
-        return nome_do_gesto in DataBindsSalvas.binds_dict
+        return DataBindsSalvas.get_bind_record(nome_do_gesto) is not None
 
     @staticmethod
     def get_all_binds() -> dict:
         """
         Retorna toda a lista de binds.
         """
-        DataBindsSalvas.read_database()
+        DataBindsSalvas.__ensure_loaded()
         return DataBindsSalvas.binds_dict
-    
+
     @staticmethod
     def get_bind(nome_do_gesto: str) -> str:
         """
@@ -45,8 +130,8 @@ class DataBindsSalvas:
             str: A bind associada ao gesto.
             None: Caso o gesto não exista no banco de dados de binds.
         """
-        DataBindsSalvas.read_database()
-        return DataBindsSalvas.binds_dict.get(nome_do_gesto, {}).get('bind', None)
+        record = DataBindsSalvas.get_bind_record(nome_do_gesto)
+        return record.bind if record else None
 
     @staticmethod
     def get_time_pressed(nome_do_gesto: str) -> int:
@@ -60,8 +145,8 @@ class DataBindsSalvas:
             int: O tempo pressionado associado ao gesto.
             int: 5, caso a informação não exista no banco de dados de binds.
         """
-        DataBindsSalvas.read_database()
-        return DataBindsSalvas.binds_dict.get(nome_do_gesto, {}).get('tempo_pressionado', 5)
+        record = DataBindsSalvas.get_bind_record(nome_do_gesto)
+        return record.tempo_pressionado if record else 5
 
     @staticmethod
     def get_toggle(nome_do_gesto: str) -> bool:
@@ -75,9 +160,9 @@ class DataBindsSalvas:
             bool: O valor de 'modo_toggle' associado ao gesto.
             bool: False, caso a informação não exista no banco de dados de binds.
         """
-        DataBindsSalvas.read_database()
-        return DataBindsSalvas.binds_dict.get(nome_do_gesto, {}).get('modo_toggle', False)
-    
+        record = DataBindsSalvas.get_bind_record(nome_do_gesto)
+        return record.modo_toggle if record else False
+
     @staticmethod
     def get_customizable(nome_do_gesto: str) -> bool:
         """
@@ -90,31 +175,39 @@ class DataBindsSalvas:
             bool: O valor de 'customizable' associado ao gesto.
             bool: False, caso a informação não exista no banco de dados de binds.
         """
-        DataBindsSalvas.read_database()
-        return DataBindsSalvas.binds_dict.get(nome_do_gesto, {}.get('customizable', False))
+        record = DataBindsSalvas.get_bind_record(nome_do_gesto)
+        return record.customizable if record else False
 
     @staticmethod
     def read_database() -> None:
         """
-        Obtém todos os dados salvos no banco de dados de binds.
+        Obtém todos os dados salvos no banco de dados de binds e recompila a tabela de binds.
         """
         if not os.path.isfile(DataBindsSalvas.data_file):
             msg = f"O arquivo {DataBindsSalvas.data_file} não existe."
             error_logger.info(msg)
             raise FileExistsError(msg)
 
-        with open(DataBindsSalvas.data_file, 'r') as file:
-            DataBindsSalvas.binds_dict = json.load(file)
+        with DataBindsSalvas.lock:
+            mtime = DataBindsSalvas.__get_mtime()
+            with open(DataBindsSalvas.data_file, 'r') as file:
+                DataBindsSalvas.binds_dict = json.load(file)
+            DataBindsSalvas.bind_table = DataBindsSalvas.__compilar_tabela(DataBindsSalvas.binds_dict)
+            DataBindsSalvas.data_mtime = mtime
+            DataBindsSalvas.ultima_verificacao = time.monotonic()
 
     @staticmethod
     def save_database() -> None:
         """
-        Salva os dados no banco de dados de binds.
+        Salva os dados no banco de dados de binds e recompila a tabela de binds.
         """
         try:
-            with open(DataBindsSalvas.data_file, 'w') as file:
-                json.dump(DataBindsSalvas.binds_dict, file, indent=4)
-                data_logger.info("Dados salvos com sucesso.")
+            with DataBindsSalvas.lock:
+                with open(DataBindsSalvas.data_file, 'w') as file:
+                    json.dump(DataBindsSalvas.binds_dict, file, indent=4)
+                DataBindsSalvas.bind_table = DataBindsSalvas.__compilar_tabela(DataBindsSalvas.binds_dict)
+                DataBindsSalvas.data_mtime = DataBindsSalvas.__get_mtime()
+            data_logger.info("Dados salvos com sucesso.")
         except Exception as e:
             error_logger.info(f"Não foi possível salvar no banco de dados: {e}")
 
@@ -123,7 +216,7 @@ class DataBindsSalvas:
         """
         Salva uma nova bind no banco de dados de binds.
         """
-        DataBindsSalvas.read_database()
+        DataBindsSalvas.__ensure_loaded(forcar=True)
 
         if DataBindsSalvas.do_bind_exist(nome_do_gesto) and not sobreescrever:
             msg = f"O gesto '{nome_do_gesto}' ja existe no banco de dados e a autorizacao para sobreescrever eh False."
@@ -136,14 +229,14 @@ class DataBindsSalvas:
             "tempo_pressionado": tempo_pressionado,
             "customizable": DataBindsSalvas.binds_dict[nome_do_gesto]["customizable"]
         }
-        
+
         gesto_atual = DataBindsSalvas.binds_dict[nome_do_gesto]
         data_logger.info(f"Gesto salvo no database: bind: {gesto_atual['bind']}; "
                                                     f"tempo: {gesto_atual['tempo_pressionado']}; "
                                                     f"toggle: {gesto_atual['modo_toggle']}")
 
         DataBindsSalvas.save_database()
-        
+
     @staticmethod
     def remove_bind(nome_do_gesto: str) -> None:
         """
@@ -152,10 +245,10 @@ class DataBindsSalvas:
         Args:
             nome_do_gesto (str): O nome do gesto a ser removido.
         """
-        DataBindsSalvas.read_database()
+        DataBindsSalvas.__ensure_loaded(forcar=True)
         if not DataBindsSalvas.do_bind_exist(nome_do_gesto):
             return
 
         del DataBindsSalvas.binds_dict[nome_do_gesto]
 
-        DataBindsSalvas.save_database()
\ No newline at end of file
+        DataBindsSalvas.save_database()
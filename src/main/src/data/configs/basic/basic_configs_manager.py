@@ -1,26 +1,47 @@
-from src.logger.logger import Logger  
+from src.logger.logger import Logger
+import threading
+import inspect
+import weakref
 import json
+import time
 import os
 
 class BasicConfigManager:
     """
     Classe para gerenciar as configurações básicas, como a câmera selecionada.
     Salva e recupera dados de um arquivo JSON.
+
+    As configurações ficam em um cache compartilhado pelo processo, recarregado apenas quando o
+    `mtime` do arquivo muda ou quando `update_atribute` escreve um novo valor. Interessados em um
+    atributo podem se inscrever com `subscribe` e recebem as mudanças sem precisar ler o arquivo.
     """
-    
+
     config_file = "src/main/src/data/configs/basic/config_basica.json"
     default_config = {
         "camera_selecionada": "",
         "webcam_width": 640,
-        "webcam_height": 480
+        "webcam_height": 480,
+        "stream_profile": {},
+        "inference_stride": {},
+        "inference_width": 0
     }
 
+    intervalo_verificacao = 0.5  # Segundos entre verificações do mtime do arquivo
+
+    cache: dict = None
+    cache_mtime: float = None
+    ultima_verificacao: float = 0.0
+    lock = threading.RLock()
+
+    subscribers = {}  # Armazena as referências dos callbacks inscritos em cada atributo
+    watcher_thread: threading.Thread = None
+
     config_logger = Logger.configure_json_data_logger()
     error_logger = Logger.configure_error_logger()
-    
+
     @staticmethod
     def __verify_database() -> None:
-        """ 
+        """
         Verifica se o arquivo de configuração existe; se não, cria com as configurações padrão.
         """
         if not os.path.exists(BasicConfigManager.config_file):
@@ -28,6 +49,119 @@ class BasicConfigManager:
                 json.dump(BasicConfigManager.default_config, file, indent=4)
             BasicConfigManager.config_logger.info("Arquivo de configuracao criado com as configuracoes padrao.")
 
+    @staticmethod
+    def __get_mtime() -> float:
+        """
+        Retorna o mtime do arquivo de configuração, ou None se o arquivo não existir.
+        """
+        try:
+            return os.stat(BasicConfigManager.config_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def __reload() -> dict:
+        """
+        Recarrega o cache a partir do arquivo de configuração.
+
+        Returns:
+            dict: Os atributos cujo valor mudou em relação ao cache anterior.
+        """
+        BasicConfigManager.__verify_database()
+        mtime = BasicConfigManager.__get_mtime()
+        with open(BasicConfigManager.config_file, "r") as file:
+            config = json.load(file)
+
+        antigo = BasicConfigManager.cache or {}
+        BasicConfigManager.cache = config
+        BasicConfigManager.cache_mtime = mtime
+        BasicConfigManager.ultima_verificacao = time.monotonic()
+        BasicConfigManager.config_logger.info("Configuracoes basicas carregadas do arquivo.")
+
+        return {atributo: valor for atributo, valor in config.items() if antigo.get(atributo) != valor}
+
+    @staticmethod
+    def __check_for_changes(forcar: bool = False) -> dict:
+        """
+        Garante que o cache esteja carregado e o recarrega caso o arquivo tenha sido alterado externamente.
+        O mtime é verificado no máximo uma vez a cada `intervalo_verificacao` segundos.
+
+        Args:
+            forcar (bool): Verifica o mtime mesmo que o intervalo ainda não tenha passado.
+
+        Returns:
+            dict: Os atributos cujo valor mudou.
+        """
+        with BasicConfigManager.lock:
+            if BasicConfigManager.cache is None:
+                BasicConfigManager.__reload()
+                return {}
+
+            agora = time.monotonic()
+            if not forcar and agora - BasicConfigManager.ultima_verificacao < BasicConfigManager.intervalo_verificacao:
+                return {}
+            BasicConfigManager.ultima_verificacao = agora
+
+            if BasicConfigManager.__get_mtime() == BasicConfigManager.cache_mtime:
+                return {}
+            return BasicConfigManager.__reload()
+
+    @staticmethod
+    def __refresh() -> dict:
+        """
+        Atualiza o cache se necessário e notifica os inscritos sobre as mudanças.
+
+        Returns:
+            dict: O cache atual.
+        """
+        mudancas = BasicConfigManager.__check_for_changes()
+        if mudancas:
+            BasicConfigManager.__notify(mudancas)
+        return BasicConfigManager.cache
+
+    @staticmethod
+    def __notify(mudancas: dict) -> None:
+        """
+        Chama os callbacks inscritos nos atributos alterados.
+
+        Args:
+            mudancas (dict): Os atributos alterados e seus novos valores.
+        """
+        for atributo, valor in mudancas.items():
+            with BasicConfigManager.lock:
+                referencias = list(BasicConfigManager.subscribers.get(atributo, []))
+            for referencia in referencias:
+                callback = referencia()
+                if callback is None:
+                    BasicConfigManager.unsubscribe(atributo, referencia)
+                    continue
+                try:
+                    callback(atributo, valor)
+                except Exception as e:
+                    error_message = f"Erro ao notificar a mudanca do atributo '{atributo}': {e}"
+                    BasicConfigManager.error_logger.error(error_message)
+                    BasicConfigManager.config_logger.error(error_message)
+
+    @staticmethod
+    def __watch() -> None:
+        """
+        Loop do watcher: verifica periodicamente o mtime do arquivo enquanto houver inscritos.
+        """
+        while True:
+            time.sleep(BasicConfigManager.intervalo_verificacao)
+            with BasicConfigManager.lock:
+                if not any(BasicConfigManager.subscribers.values()):
+                    BasicConfigManager.watcher_thread = None
+                    return
+            try:
+                mudancas = BasicConfigManager.__check_for_changes(forcar=True)
+                if mudancas:
+                    BasicConfigManager.__notify(mudancas)
+            except Exception as e:
+                error_message = f"Erro ao verificar o arquivo de configuracao: {e}"
+                BasicConfigManager.error_logger.error(error_message)
+                BasicConfigManager.config_logger.error(error_message)
+
     @staticmethod
     def get_atributes() -> list:
         """
@@ -37,25 +171,35 @@ class BasicConfigManager:
             list: Lista contendo as chaves dos atributos padrão.
         """
         return list(BasicConfigManager.default_config.keys())
-    
+
+    @staticmethod
+    def has_atribute(atributo: str) -> bool:
+        """
+        Verifica se o atributo é gerenciado por esta classe.
+
+        Args:
+            atributo (str): O nome do atributo.
+
+        Returns:
+            bool: True se o atributo for conhecido, False caso contrário.
+        """
+        return atributo in BasicConfigManager.default_config
+
     @staticmethod
     def read_atribute(atributo: str) -> str:
-        """ 
-        Lê o valor de um atributo salvo dentro do arquivo de configuração.
-        
+        """
+        Lê o valor de um atributo das configurações em cache.
+
         Args:
             atributo (str): O nome do atributo a ser lido.
 
         Returns:
             str: O valor do atributo, ou uma string vazia se não encontrado.
         """
-        BasicConfigManager.__verify_database()
         try:
-            with open(BasicConfigManager.config_file, "r") as file:
-                config = json.load(file)
-                valor = config.get(atributo, "")
-                BasicConfigManager.config_logger.info(f"Atributo '{atributo}' lido com valor: '{valor}'")
-                return valor
+            valor = BasicConfigManager.__refresh().get(atributo, "")
+            BasicConfigManager.config_logger.info("Atributo '%s' lido com valor: '%s'", atributo, valor)
+            return valor
         except Exception as e:
             error_message = f"Ocorreu um erro ao ler o arquivo JSON: {e}"
             BasicConfigManager.error_logger.error(error_message)
@@ -66,27 +210,35 @@ class BasicConfigManager:
     def update_atribute(atributo: str, novo_valor: str) -> None:
         """
         Atualiza o valor de um atributo no arquivo de configuração.
-        
+
         Args:
             atributo (str): O nome do atributo a ser atualizado.
             novo_valor (str): O novo valor para o atributo.
         """
-        BasicConfigManager.__verify_database()
         try:
-            with open(BasicConfigManager.config_file, "r") as file:
-                config = json.load(file)
-            
-            if config.get(atributo) == novo_valor:
+            mudancas = BasicConfigManager.__check_for_changes()
+            with BasicConfigManager.lock:
+                config = BasicConfigManager.cache
+                atualizado = config.get(atributo) == novo_valor
+
+                if not atualizado:
+                    config = dict(config)
+                    config[atributo] = novo_valor
+
+                    with open(BasicConfigManager.config_file, "w") as file:
+                        json.dump(config, file, indent=4)
+
+                    BasicConfigManager.cache = config
+                    BasicConfigManager.cache_mtime = BasicConfigManager.__get_mtime()
+
+            # Os callbacks (ex.: a câmera reabrindo a captura) rodam fora do lock, para não bloquear as leituras das outras threads
+            if atualizado:
                 BasicConfigManager.config_logger.info(f"Atributo '{atributo}' ja esta atualizado com valor: '{novo_valor}'")
-                return
-            
-            config[atributo] = novo_valor
+            else:
+                BasicConfigManager.config_logger.info(f"Atributo '{atributo}' atualizado para: '{novo_valor}'")
+                mudancas[atributo] = novo_valor
+            BasicConfigManager.__notify(mudancas)
 
-            with open(BasicConfigManager.config_file, "w") as file:
-                json.dump(config, file, indent=4)
-            
-            BasicConfigManager.config_logger.info(f"Atributo '{atributo}' atualizado para: '{novo_valor}'")
-        
         except FileNotFoundError as fnf_error:
             error_message = f"Nao foi possível encontrar o arquivo JSON: {fnf_error}"
             BasicConfigManager.error_logger.error(error_message)
@@ -94,4 +246,53 @@ class BasicConfigManager:
         except Exception as e:
             error_message = f"Erro ao atualizar o atributo '{atributo}': {e}"
             BasicConfigManager.error_logger.error(error_message)
-            BasicConfigManager.config_logger.error(error_message)
\ No newline at end of file
+            BasicConfigManager.config_logger.error(error_message)
+
+    @staticmethod
+    def subscribe(atributo: str, callback) -> None:
+        """
+        Inscreve um callback para receber as mudanças de um atributo.
+        O callback é chamado imediatamente com o valor atual e depois a cada mudança,
+        seja por `update_atribute` ou por uma alteração externa do arquivo.
+
+        Métodos de instância são guardados por referência fraca, então a inscrição
+        não impede que o objeto seja coletado.
+
+        Args:
+            atributo (str): O nome do atributo observado.
+            callback: Função chamada como `callback(atributo, valor)`.
+
+        Raises:
+            ValueError: Se o atributo passado não é reconhecido.
+        """
+        if not BasicConfigManager.has_atribute(atributo):
+            raise ValueError(f"Atributo desconhecido: {atributo}")
+
+        if inspect.ismethod(callback):
+            referencia = weakref.WeakMethod(callback)
+        else:
+            referencia = lambda: callback
+
+        with BasicConfigManager.lock:
+            BasicConfigManager.subscribers.setdefault(atributo, []).append(referencia)
+            if BasicConfigManager.watcher_thread is None:
+                BasicConfigManager.watcher_thread = threading.Thread(target=BasicConfigManager.__watch, daemon=True)
+                BasicConfigManager.watcher_thread.start()
+
+        callback(atributo, BasicConfigManager.read_atribute(atributo))
+
+    @staticmethod
+    def unsubscribe(atributo: str, callback) -> None:
+        """
+        Remove a inscrição de um callback (ou da referência guardada para ele).
+
+        Args:
+            atributo (str): O nome do atributo observado.
+            callback: O callback inscrito anteriormente.
+        """
+        with BasicConfigManager.lock:
+            referencias = BasicConfigManager.subscribers.get(atributo, [])
+            BasicConfigManager.subscribers[atributo] = [
+                referencia for referencia in referencias
+                if referencia is not callback and referencia() not in (None, callback)
+            ]
@@ -26,9 +26,9 @@ class ConfigRouter:
             Exception: Qualquer erro inesperado ao tentar ler o atributo será logado.
         """
         try:
-            if atributo in BasicConfigManager.get_atributes():
+            if BasicConfigManager.has_atribute(atributo):
                 valor = BasicConfigManager.read_atribute(atributo)
-            elif atributo in ConfigRouter.state_manager.get_atributes():
+            elif ConfigRouter.state_manager.has_atribute(atributo):
                 valor = ConfigRouter.state_manager.read_atribute(atributo)
             else:
                 raise ValueError(f"Atributo desconhecido: {atributo}")
@@ -58,9 +58,9 @@ class ConfigRouter:
             Exception: Qualquer erro inesperado ao tentar atualizar o atributo será logado.
         """
         try:
-            if atributo in BasicConfigManager.get_atributes():
+            if BasicConfigManager.has_atribute(atributo):
                 BasicConfigManager.update_atribute(atributo, novo_valor)
-            elif atributo in ConfigRouter.state_manager.get_atributes():
+            elif ConfigRouter.state_manager.has_atribute(atributo):
                 ConfigRouter.state_manager.update_atribute(atributo, novo_valor)
             else:
                 raise ValueError(f"Atributo desconhecido: {atributo}")
@@ -74,4 +74,30 @@ class ConfigRouter:
             error_message = f"Erro ao atualizar o atributo '{atributo}': {e}"
             ConfigRouter.error_logger.error(error_message)
             ConfigRouter.config_logger.error(error_message)
-            raise
\ No newline at end of file
+            raise
+
+    @staticmethod
+    def subscribe(atributo: str, callback) -> None:
+        """
+        Inscreve um callback para receber as mudanças de um atributo das configurações básicas.
+
+        Args:
+            atributo (str): O nome do atributo observado.
+            callback: Função chamada como `callback(atributo, valor)` com o valor atual e a cada mudança.
+
+        Raises:
+            ValueError: Se o atributo passado não é uma configuração básica.
+        """
+        if not BasicConfigManager.has_atribute(atributo):
+            error_message = f"Erro: Atributo nao suporta inscricao: {atributo}"
+            ConfigRouter.error_logger.error(error_message)
+            ConfigRouter.config_logger.error(error_message)
+            raise ValueError(f"Atributo nao suporta inscricao: {atributo}")
+        BasicConfigManager.subscribe(atributo, callback)
+
+    @staticmethod
+    def flush() -> None:
+        """
+        Grava em disco qualquer alteração de estado ainda pendente.
+        """
+        ConfigRouter.state_manager.flush()
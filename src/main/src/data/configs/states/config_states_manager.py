@@ -1,115 +1,182 @@
-from src.logger.logger import Logger  
+from src.logger.logger import Logger
+import threading
 import tempfile
+import atexit
 import json
 import os
 
 class ConfigStateManager:
     """
     Classe para gerenciar o estado de configurações relacionadas a gestos.
-    Salva e recupera dados de um arquivo JSON.
+
+    O estado fica em memória, protegido por um lock, e é a fonte da verdade para leituras e escritas.
+    O arquivo JSON é apenas a persistência: as escritas são agrupadas e gravadas em disco após
+    `debounce` segundos, ou imediatamente ao chamar `flush()` (também executado no encerramento).
     """
-    def __init__(self, file_path="src/main/src/data/configs/states/estado_atual.json"):    
+    def __init__(self, file_path="src/main/src/data/configs/states/estado_atual.json", debounce: float = 1.0):
         self.config_file = file_path
-        self.state = {
+        self.default_state = {
             "nome_gesto_direita": "MAO",
             "nome_gesto_esquerda": "MAO",
             "x_ultima_pos_cursor": 0,
             "y_ultima_pos_cursor": 0
         }
+        self.state = dict(self.default_state)
+        self.atributos = frozenset(self.default_state)
+
+        self.debounce = debounce
+        self.lock = threading.RLock()
+        self.write_lock = threading.Lock()
+        self.dirty = False
+        self.flush_timer: threading.Timer = None
+
         self.config_logger = Logger.configure_json_data_logger()
         self.error_logger = Logger.configure_error_logger()
 
-    def __verify_database(self) -> None:
-        """ 
-        Verifica se o arquivo de configuração existe; se não, cria com as configurações padrão.
-        """
-        if len(self.state) == 0: 
-            if not os.path.exists(self.config_file):
-                with open(self.config_file, "w") as file:
-                    json.dump(self.state, file, indent=4)
-                self.state = self.state
-                self.config_logger.info("Arquivo de configuracao criado com as configuracoes padrao.")
-                
+        self.__load_database()
+        atexit.register(self.flush)
+
+    def __load_database(self) -> None:
+        """
+        Carrega o estado salvo no arquivo de configuração; se o arquivo não existir, cria com as configurações padrão.
+        """
+        if not os.path.exists(self.config_file):
+            self.__restaurar_configuracoes_padrao()
+            self.config_logger.info("Arquivo de configuracao criado com as configuracoes padrao.")
+            return
+
+        try:
+            with open(self.config_file, "r") as file:
+                config = json.load(file)
+            for atributo in self.atributos:
+                if atributo in config:
+                    self.state[atributo] = config[atributo]
+        except json.JSONDecodeError:
+            error_message = "Arquivo JSON corrompido. Restaurando para os valores padrão."
+            self.error_logger.error(error_message)
+            self.config_logger.error(error_message)
+            self.__restaurar_configuracoes_padrao()
+        except Exception as e:
+            error_message = f"Ocorreu um erro ao ler o arquivo JSON: {e}"
+            self.error_logger.error(error_message)
+            self.config_logger.error(error_message)
+
     def get_atributes(self) -> list:
         """
-        Retorna as chaves dos atributos padrão definidos em default_config.
+        Retorna as chaves dos atributos padrão definidos em default_state.
 
         Returns:
             list: Lista contendo as chaves dos atributos padrão.
         """
-        self.__verify_database()
-        return list(self.state.keys())
-    
+        return list(self.default_state.keys())
+
+    def has_atribute(self, atributo: str) -> bool:
+        """
+        Verifica se o atributo é gerenciado por esta classe.
+
+        Args:
+            atributo (str): O nome do atributo.
+
+        Returns:
+            bool: True se o atributo for conhecido, False caso contrário.
+        """
+        return atributo in self.atributos
+
     def read_atribute(self, atributo: str) -> str:
-        """ 
-        Lê o valor de um atributo salvo dentro do arquivo de configuração.
-        
+        """
+        Lê o valor de um atributo do estado em memória.
+
         Args:
             atributo (str): O nome do atributo a ser lido.
 
         Returns:
             str: O valor do atributo, ou uma string vazia se não encontrado.
         """
-        self.__verify_database()
-        try:
-            with open(self.config_file, "r") as file:
-                config = json.load(file)
-                valor = config.get(atributo, "")
-                self.config_logger.info(f"Atributo '{atributo}' lido com valor: '{valor}'")
-                return valor
-        except Exception as e:
-            error_message = f"Ocorreu um erro ao ler o arquivo JSON: {e}"
-            self.error_logger.error(error_message)
-            self.config_logger.error(error_message)
-            return ""
+        with self.lock:
+            valor = self.state.get(atributo, "")
+        self.config_logger.info("Atributo '%s' lido com valor: '%s'", atributo, valor)
+        return valor
 
     def update_atribute(self, atributo: str, novo_valor: str) -> None:
-        self.__verify_database()
-        try:
-            with open(self.config_file, "r") as file:
-                config = json.load(file)
+        """
+        Atualiza o valor de um atributo no estado em memória e agenda a escrita em disco.
 
-            if config.get(atributo) == novo_valor:
+        Args:
+            atributo (str): O nome do atributo a ser atualizado.
+            novo_valor (str): O novo valor para o atributo.
+        """
+        with self.lock:
+            if self.state.get(atributo) == novo_valor:
                 self.config_logger.info(f"Atributo '{atributo}' ja esta atualizado com valor: '{novo_valor}'")
                 return
 
-            config[atributo] = novo_valor
+            self.state[atributo] = novo_valor
+            self.dirty = True
+            self.__agendar_flush()
 
-            # Usando um arquivo temporário para evitar corrupção
-            with tempfile.NamedTemporaryFile("w", delete=False) as temp_file:
-                json.dump(config, temp_file, indent=4)
-                temp_file_path = temp_file.name
+        self.config_logger.info(f"Atributo '{atributo}' atualizado para: '{novo_valor}'")
 
-            # Substituir o arquivo original pelo temporário
-            os.replace(temp_file_path, self.config_file)
+    def __agendar_flush(self) -> None:
+        """
+        Agenda a escrita do estado em disco, caso ainda não exista uma escrita agendada.
+        Escritas feitas antes do timer disparar são agrupadas em uma só.
+        """
+        if self.flush_timer is not None:
+            return
+        self.flush_timer = threading.Timer(self.debounce, self.flush)
+        self.flush_timer.daemon = True
+        self.flush_timer.start()
 
-            self.config_logger.info(f"Atributo '{atributo}' atualizado para: '{novo_valor}'")
+    def flush(self) -> None:
+        """
+        Grava imediatamente o estado em memória no arquivo de configuração, caso haja alterações pendentes.
+        """
+        with self.lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            if not self.dirty:
+                return
+            snapshot = dict(self.state)
+            self.dirty = False
 
-        except json.JSONDecodeError:
-            error_message = "Arquivo JSON corrompido. Restaurando para os valores padrão."
-            self.error_logger.error(error_message)
-            self.config_logger.error(error_message)
-            self.__restaurar_configuracoes_padrao()
+        with self.write_lock:
+            try:
+                self.__salvar(snapshot)
+            except Exception as e:
+                with self.lock:
+                    self.dirty = True
+                error_message = f"Erro ao salvar o estado no arquivo JSON: {e}"
+                self.error_logger.error(error_message)
+                self.config_logger.error(error_message)
 
-        except FileNotFoundError as fnf_error:
-            error_message = f"Não foi possível encontrar o arquivo JSON: {fnf_error}"
-            self.error_logger.error(error_message)
-            self.config_logger.error(error_message)
-            
-        except Exception as e:
-            error_message = f"Erro ao atualizar o atributo '{atributo}': {e}"
-            self.error_logger.error(error_message)
-            self.config_logger.error(error_message)
+    def __salvar(self, config: dict) -> None:
+        """
+        Salva o estado no arquivo de configuração.
+
+        Args:
+            config (dict): O estado a ser salvo.
+        """
+        config_dir = os.path.dirname(os.path.abspath(self.config_file))
+
+        # Usando um arquivo temporário (no mesmo diretório) para evitar corrupção
+        with tempfile.NamedTemporaryFile("w", dir=config_dir, delete=False) as temp_file:
+            json.dump(config, temp_file, indent=4)
+            temp_file_path = temp_file.name
+
+        # Substituir o arquivo original pelo temporário
+        os.replace(temp_file_path, self.config_file)
 
     def __restaurar_configuracoes_padrao(self):
         """
         Restaura o arquivo de configuração com os valores padrão.
         """
         try:
-            with open(self.config_file, "w") as file:
-                json.dump(self.state, file, indent=4)
+            with self.lock:
+                self.state = dict(self.default_state)
+            self.__salvar(self.default_state)
             self.config_logger.info("Configurações padrão restauradas com sucesso.")
         except Exception as e:
             error_message = f"Erro ao restaurar as configurações padrão: {e}"
             self.error_logger.error(error_message)
-            self.config_logger.error(error_message)
\ No newline at end of file
+            self.config_logger.error(error_message)
@@ -0,0 +1,244 @@
+from src.gestures.gesture_matcher import FEATURES_ESTATICAS
+import numpy as np
+
+NUM_LANDMARKS = 21
+
+# Definindo os índices dos landmarks para cada dedo
+FINGER_LANDMARKS = {
+    'thumb': [1, 2, 3, 4],
+    'index': [5, 6, 7, 8],
+    'middle': [9, 10, 11, 12],
+    'ring': [13, 14, 15, 16],
+    'pinky': [17, 18, 19, 20]
+}
+
+# Pares de dedos para verificar intercessão
+FINGER_PAIRS = [
+    ('thumb', 'middle'),
+    ('thumb', 'ring'),
+    ('thumb', 'pinky'),
+    ('index', 'middle'),
+    ('middle', 'ring'),
+    ('ring', 'pinky'),
+]
+
+# Pontos de referência para a base do quadrado imaginário: pulso e base de cada dedo
+BASE_POINTS = [0, 1, 5, 9, 13, 17]
+
+# Dimensões usadas para converter as coordenadas normalizadas em pixels no teste de dedo levantado
+IMAGE_HEIGHT, IMAGE_WIDTH = 640, 480
+ESCALA_PIXELS = np.array([IMAGE_WIDTH, IMAGE_HEIGHT], dtype=np.float64)
+MARGEM_QUADRADO = 15
+
+DISTANCIA_TOQUE = 0.05                      # Distância máxima entre as pontas para os dedos se tocarem
+DIFERENCA_PERCENTUAL_DEDOS_JUNTOS = 12.0    # Diferença percentual máxima entre TIPs e PIPs para os dedos estarem juntos
+
+def landmarks_para_array(hand_landmarks) -> np.ndarray:
+    """
+    Converte os landmarks do MediaPipe em um array (21, 3) float32, acessando cada landmark uma única vez.
+
+    Args:
+        hand_landmarks (NormalizedLandmarkList): Os landmarks da mão.
+
+    Returns:
+        np.ndarray: Array (21, 3) com as coordenadas x, y, z de cada landmark.
+    """
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+
+class GestureFeatureExtractor:
+    """
+    Classe responsável por calcular as features de um gesto a partir dos landmarks da mão.
+
+    Todas as features são calculadas de uma vez, com operações vetorizadas sobre arrays (N, 21, 3)
+    de landmarks (uma mão ao vivo, ou lotes de frames gravados). Os cálculos são feitos em float64 para reproduzir exatamente os limiares da
+    implementação anterior, que operava sobre os floats do Python.
+    """
+
+    def __init__(self):
+        inicio = {dedo: indices[0] for dedo, indices in FINGER_LANDMARKS.items()}
+        fim = {dedo: indices[-1] for dedo, indices in FINGER_LANDMARKS.items()}
+
+        # Pares de dedos verificados: os 6 de `fingers_overlap` seguidos de (thumb, index) para `thumb_cross_index`.
+        # Para cada par (p1 -> p2, q1 -> q2), as quatro orientações testadas são (p1, p2, q1), (p1, p2, q2),
+        # (q1, q2, p1) e (q1, q2, p2), calculadas de uma vez como arrays (4, pares).
+        pares = FINGER_PAIRS + [('thumb', 'index')]
+        p1 = [inicio[a] for a, _ in pares]
+        p2 = [fim[a] for a, _ in pares]
+        q1 = [inicio[b] for _, b in pares]
+        q2 = [fim[b] for _, b in pares]
+        self.orientacao_p = np.array([p1, p1, q1, q1])
+        self.orientacao_q = np.array([p2, p2, q2, q2])
+        self.orientacao_r = np.array([q1, q2, p1, p2])
+        self.num_pares_overlap = len(FINGER_PAIRS)
+
+        # Landmarks verificados no teste de dedo levantado, um grupo por dedo (o dedão repete o último índice)
+        self.grupos_dedos = np.array([
+            FINGER_LANDMARKS['thumb'][2:] + FINGER_LANDMARKS['thumb'][-1:],
+            FINGER_LANDMARKS['index'][1:],
+            FINGER_LANDMARKS['middle'][1:],
+            FINGER_LANDMARKS['ring'][1:],
+            FINGER_LANDMARKS['pinky'][1:],
+        ])
+
+        # Índices (ponta, "pip") dos dedos usados em `pointing_down`
+        self.pontas_apontando = np.array([FINGER_LANDMARKS[dedo][3] for dedo in ('index', 'middle', 'ring', 'pinky')])
+        self.pips_apontando = np.array([FINGER_LANDMARKS[dedo][2] for dedo in ('index', 'middle', 'ring', 'pinky')])
+
+        # Distâncias calculadas: ponta do dedão -> ponta do médio, ponta do indicador -> ponta do médio, "pip" -> "pip"
+        self.distancias_origem = np.array([FINGER_LANDMARKS['thumb'][3], FINGER_LANDMARKS['index'][3], FINGER_LANDMARKS['index'][2]])
+        self.distancias_destino = np.array([FINGER_LANDMARKS['middle'][3], FINGER_LANDMARKS['middle'][3], FINGER_LANDMARKS['middle'][2]])
+
+        self.pesos_bits = 1 << np.arange(len(FEATURES_ESTATICAS))
+
+    def extrair(self, pontos: np.ndarray) -> dict:
+        """
+        Calcula o vetor de features de uma mão.
+
+        Args:
+            pontos (np.ndarray): Array (21, 3) com os landmarks da mão.
+
+        Returns:
+            dict: As features do gesto, na ordem usada pelo GestureMatcher.
+        """
+        colunas = self.__calcular_colunas(pontos[np.newaxis, :, :2].astype(np.float64))
+
+        valores = []
+        for coluna in colunas:
+            valores.extend(coluna.ravel().tolist())
+
+        gesto_atual = dict(zip(FEATURES_ESTATICAS, valores))
+        gesto_atual["has_movement"] = False
+        gesto_atual["type_of_movement"] = ""
+        return gesto_atual
+
+    def extrair_mascaras(self, pontos: np.ndarray) -> np.ndarray:
+        """
+        Calcula a máscara de bits das features de várias mãos, no formato usado como índice pelo GestureMatcher.
+
+        Args:
+            pontos (np.ndarray): Array (N, 21, 3) com os landmarks das mãos.
+
+        Returns:
+            np.ndarray: Array (N,) com a máscara de cada mão.
+        """
+        return self.extrair_lote(pontos) @ self.pesos_bits
+
+    def extrair_lote(self, pontos: np.ndarray) -> np.ndarray:
+        """
+        Calcula as features booleanas de várias mãos de uma vez.
+
+        Args:
+            pontos (np.ndarray): Array (N, 21, 3) com os landmarks das mãos.
+
+        Returns:
+            np.ndarray: Array (N, len(FEATURES_ESTATICAS)) de bool, com as colunas na ordem de FEATURES_ESTATICAS.
+        """
+        return np.column_stack(self.__calcular_colunas(pontos[..., :2].astype(np.float64)))
+
+    def __calcular_colunas(self, xy: np.ndarray) -> list:
+        """
+        Calcula as features a partir das coordenadas x, y.
+
+        Args:
+            xy (np.ndarray): Array (N, 21, 2) com as coordenadas normalizadas, em float64.
+
+        Returns:
+            list: Arrays (N,) ou (N, k) de bool que, concatenados, seguem a ordem de FEATURES_ESTATICAS.
+        """
+        dedos_abaixados = self.__dedos_abaixados(xy)
+        intersecoes = self.__segmentos_se_intersectam(xy)
+        distancias = self.__distancias(xy)
+
+        # Com as pontas ou os "pips" do indicador e do médio na mesma posição, a diferença percentual não é definida
+        # (a implementação anterior lançava ZeroDivisionError): ela fica infinita e os dedos não são considerados juntos.
+        distance_tips, distance_pips = distancias[:, 1], distancias[:, 2]
+        menor_distancia = np.minimum(distance_tips, distance_pips)
+        percentage_difference = np.divide(np.abs(distance_tips - distance_pips), menor_distancia,
+                                          out=np.full_like(menor_distancia, np.inf), where=menor_distancia > 0) * 100
+
+        return [
+            self.__is_pointing_down(xy),                                                # pointing_down
+            intersecoes[:, :self.num_pares_overlap].any(axis=1),                        # fingers_overlap
+            dedos_abaixados[:, 0],                                                      # thumb_finger_inside_hand
+            ~dedos_abaixados[:, 1:],                                                    # index/middle/ring/pinky_finger_up
+            distancias[:, 0] <= DISTANCIA_TOQUE,                                        # thumb_middle_touch
+            intersecoes[:, self.num_pares_overlap],                                     # thumb_cross_index
+            percentage_difference <= DIFERENCA_PERCENTUAL_DEDOS_JUNTOS,                 # index_and_middle_together
+            np.zeros(len(xy), dtype=bool),                                              # bent_index
+        ]
+
+    def __dedos_abaixados(self, xy: np.ndarray) -> np.ndarray:
+        """
+        Verifica quais dedos estão abaixados, usando um quadrado imaginário formado pela palma da mão.
+
+        Premissa: se pelo menos um dos landmarks do dedo estiver DENTRO do quadrado, o dedo será considerado como ABAIXADO.
+
+        Args:
+            xy (np.ndarray): Array (N, 21, 2) com as coordenadas normalizadas.
+
+        Returns:
+            np.ndarray: Array (N, 5) de bool (dedão, indicador, médio, anelar, mínimo), True se o dedo estiver abaixado.
+        """
+        pixels = np.trunc(xy * ESCALA_PIXELS)
+
+        base = pixels[:, BASE_POINTS]
+        minimo = base.min(axis=1, keepdims=True) - MARGEM_QUADRADO
+        maximo = base.max(axis=1, keepdims=True) + MARGEM_QUADRADO
+
+        dentro = (pixels >= minimo) & (pixels <= maximo)
+        dentro = dentro[..., 0] & dentro[..., 1]
+        return dentro[:, self.grupos_dedos].any(axis=2)
+
+    def __segmentos_se_intersectam(self, xy: np.ndarray) -> np.ndarray:
+        """
+        Verifica, para todos os pares de dedos de uma vez, se os segmentos (base -> ponta) se intersectam.
+
+        Args:
+            xy (np.ndarray): Array (N, 21, 2) com as coordenadas normalizadas.
+
+        Returns:
+            np.ndarray: Array (N, pares) de bool com o resultado de cada par.
+        """
+        p = xy[:, self.orientacao_p]
+        q = xy[:, self.orientacao_q]
+        r = xy[:, self.orientacao_r]
+
+        # Orientação de (p, q, r): 0 colinear, sinais opostos para horário e anti-horário
+        pq = q - p
+        qr = r - q
+        orientacao = np.sign(pq[..., 1] * qr[..., 0] - pq[..., 0] * qr[..., 1])
+
+        # Caso geral
+        intersecoes = (orientacao[:, 0] != orientacao[:, 1]) & (orientacao[:, 2] != orientacao[:, 3])
+
+        # Casos especiais de colinearidade (raros, então só são calculados quando existem): r está sobre o segmento p -> q
+        colineares = orientacao == 0
+        if colineares.any():
+            no_segmento = ((np.minimum(p, q) <= r) & (r <= np.maximum(p, q))).all(axis=3)
+            intersecoes |= (colineares & no_segmento).any(axis=1)
+
+        return intersecoes
+
+    def __distancias(self, xy: np.ndarray) -> np.ndarray:
+        """
+        Calcula as distâncias usadas em `thumb_middle_touch` (dedão -> médio) e `index_and_middle_together` (TIPs e PIPs).
+
+        Returns:
+            np.ndarray: Array (N, 3) com as distâncias.
+        """
+        diferencas = xy[:, self.distancias_destino] - xy[:, self.distancias_origem]
+        return np.sqrt(np.square(diferencas).sum(axis=2))
+
+    def __is_pointing_down(self, xy: np.ndarray) -> np.ndarray:
+        """
+        Verifica se qualquer um dos dedos (exceto o dedão) está apontando para baixo.
+
+        Premissa: se o landmark da ponta do dedo está abaixo do landmark da base do dedo e do landmark do pulso,
+        a mão será considerada como apontada para baixo.
+
+        Returns:
+            np.ndarray: Array (N,) de bool.
+        """
+        tips_y = xy[:, self.pontas_apontando, 1]
+        pips_y = xy[:, self.pips_apontando, 1]
+        return ((tips_y > pips_y) & (tips_y > xy[:, :1, 1])).any(axis=1)
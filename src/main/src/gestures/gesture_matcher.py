@@ -0,0 +1,167 @@
+from src.logger.logger import Logger
+
+# Features booleanas extraídas de cada frame, na mesma ordem em que o interpretador monta o gesto atual.
+# A ordem importa: é a ordem em que os candidatos são filtrados até sobrar um único gesto.
+FEATURES_ESTATICAS = (
+    "pointing_down",
+    "fingers_overlap",
+    "thumb_finger_inside_hand",
+    "index_finger_up",
+    "middle_finger_up",
+    "ring_finger_up",
+    "pinky_finger_up",
+    "thumb_middle_touch",
+    "thumb_cross_index",
+    "index_and_middle_together",
+    "bent_index",
+)
+
+# Atributos que não vêm da pose da mão e têm valor fixo no momento da filtragem dos candidatos
+# (o movimento só é categorizado depois que o candidato é encontrado).
+VALORES_FIXOS = {
+    "has_movement": False,
+    "type_of_movement": "",
+}
+
+class GestureMatcher:
+    """
+    Índice compilado de um banco de gestos para reconhecimento em tempo constante.
+
+    No carregamento, a filtragem sequencial de candidatos (atributo por atributo, até restar um gesto)
+    é avaliada como uma árvore de decisão sobre as features booleanas, e o resultado para cada
+    combinação possível de features é guardado em uma tabela indexada pela máscara de bits do frame.
+    A tabela já contém apenas candidatos cujos atributos relevantes estáticos conferem com a máscara;
+    os atributos relevantes que dependem de movimento são verificados por `verificar_gesto`.
+    """
+
+    def __init__(self, gestos: dict, atributos_relevantes: dict, features: tuple = FEATURES_ESTATICAS, valores_fixos: dict = VALORES_FIXOS):
+        """
+        Compila o banco de gestos.
+
+        Args:
+            gestos (dict): Dicionário nome do gesto -> atributos do gesto.
+            atributos_relevantes (dict): Dicionário nome do gesto -> lista de atributos relevantes.
+            features (tuple): As features booleanas, na ordem de filtragem.
+            valores_fixos (dict): Atributos filtrados com valor fixo depois das features.
+        """
+        self.gestos_logger = Logger.configure_gestures_logger()
+
+        self.gestos = gestos
+        self.features = tuple(features)
+        self.valores_fixos = dict(valores_fixos)
+        self.feature_bits = {feature: 1 << i for i, feature in enumerate(self.features)}
+
+        self.mascaras_relevantes = {}   # nome -> (máscara dos atributos relevantes estáticos, valores esperados)
+        self.atributos_dinamicos = {}   # nome -> tupla de (atributo, valor esperado) verificados em tempo de execução
+        for nome, gesto in gestos.items():
+            mascara, valor, dinamicos = 0, 0, []
+            for atributo in atributos_relevantes.get(nome, []):
+                if atributo in self.feature_bits:
+                    mascara |= self.feature_bits[atributo]
+                    if gesto.get(atributo):
+                        valor |= self.feature_bits[atributo]
+                else:
+                    dinamicos.append((atributo, gesto.get(atributo)))
+            self.mascaras_relevantes[nome] = (mascara, valor)
+            self.atributos_dinamicos[nome] = tuple(dinamicos)
+
+        self.tabela = [None] * (1 << len(self.features))
+        self.__compilar(list(gestos.keys()), 0, 0)
+
+        self.gestos_logger.info(f"Banco de gestos compilado: {len(gestos)} gestos, {len(self.tabela)} combinacoes de features.")
+
+    def __compilar(self, candidatos: list, profundidade: int, prefixo: int) -> None:
+        """
+        Percorre a árvore de decisão da filtragem e preenche a tabela com o candidato de cada folha.
+
+        Args:
+            candidatos (list): Os candidatos restantes neste nó.
+            profundidade (int): Quantas features já foram usadas para filtrar.
+            prefixo (int): A máscara das features já fixadas.
+        """
+        if len(candidatos) <= 1 or profundidade == len(self.features):
+            candidato = self.__resolver_folha(candidatos)
+            if candidato is not None:
+                mascara, valor = self.mascaras_relevantes[candidato]
+            for sufixo in range(1 << (len(self.features) - profundidade)):
+                indice = prefixo | (sufixo << profundidade)
+                if candidato is not None and indice & mascara == valor:
+                    self.tabela[indice] = candidato
+            return
+
+        feature = self.features[profundidade]
+        bit = self.feature_bits[feature]
+        self.__compilar([c for c in candidatos if self.gestos[c].get(feature) is False], profundidade + 1, prefixo)
+        self.__compilar([c for c in candidatos if self.gestos[c].get(feature) is True], profundidade + 1, prefixo | bit)
+
+    def __resolver_folha(self, candidatos: list) -> str:
+        """
+        Continua a filtragem de uma folha pelos atributos de valor fixo.
+
+        Args:
+            candidatos (list): Os candidatos restantes depois das features.
+
+        Returns:
+            str: O único candidato restante, ou None.
+        """
+        for atributo, valor in self.valores_fixos.items():
+            if len(candidatos) <= 1:
+                break
+            candidatos = [c for c in candidatos if self.gestos[c].get(atributo) == valor]
+        return candidatos[0] if len(candidatos) == 1 else None
+
+    def codificar_features(self, gesto_atual: dict) -> int:
+        """
+        Converte as features de um frame na máscara de bits usada como índice da tabela.
+
+        Args:
+            gesto_atual (dict): As features do frame.
+
+        Returns:
+            int: A máscara de bits das features verdadeiras.
+        """
+        mascara = 0
+        for feature, bit in self.feature_bits.items():
+            if gesto_atual[feature]:
+                mascara |= bit
+        return mascara
+
+    def buscar_candidato(self, mascara: int) -> str:
+        """
+        Retorna o gesto candidato para a máscara de features.
+
+        Args:
+            mascara (int): A máscara de bits das features do frame.
+
+        Returns:
+            str: O nome do gesto candidato, ou None se nenhum gesto corresponder.
+        """
+        return self.tabela[mascara]
+
+    def tem_movimento(self, nome_do_gesto: str) -> bool:
+        """
+        Verifica se o gesto precisa de categorização de movimento.
+        """
+        return bool(self.gestos[nome_do_gesto].get("has_movement"))
+
+    def tipo_de_movimento(self, nome_do_gesto: str) -> str:
+        """
+        Retorna o tipo de movimento esperado pelo gesto.
+        """
+        return self.gestos[nome_do_gesto].get("type_of_movement", "")
+
+    def verificar_gesto(self, nome_do_gesto: str, gesto_atual: dict) -> bool:
+        """
+        Verifica os atributos relevantes do candidato que não fazem parte da máscara (ex.: movimento).
+
+        Args:
+            nome_do_gesto (str): O nome do gesto candidato.
+            gesto_atual (dict): Os atributos do gesto detectado.
+
+        Returns:
+            bool: True se todos os atributos relevantes conferem, False caso contrário.
+        """
+        for atributo, esperado in self.atributos_dinamicos[nome_do_gesto]:
+            if gesto_atual.get(atributo) != esperado:
+                return False
+        return True
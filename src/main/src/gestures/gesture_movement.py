@@ -0,0 +1,76 @@
+from src.gestures.landmark_history import LandmarkHistory
+from src.gestures.gesture_features import FINGER_LANDMARKS
+from typing import Callable, NamedTuple
+import numpy as np
+
+class MovementRule(NamedTuple):
+    """
+    Regra de um tipo de movimento: uma medida calculada em cada frame da janela e a faixa da razão
+    (medida antiga / medida atual) dentro da qual a mão é considerada parada.
+    """
+    medida: Callable[[np.ndarray], np.ndarray]
+    minimo: float
+    maximo: float
+
+INDEX_TIP = FINGER_LANDMARKS['index'][3]
+PINKY_TIP = FINGER_LANDMARKS['pinky'][3]
+INDEX_MCP = FINGER_LANDMARKS['index'][0]
+PINKY_MCP = FINGER_LANDMARKS['pinky'][0]
+
+# Tipos de movimento usados nos bancos de gestos. A medida recebe os pontos (k, 21, 3) da janela.
+MOVEMENT_RULES = {
+    # Largura horizontal da palma (base do indicador -> base do mínimo) muda quando o pulso gira (H)
+    "wrist_rotate": MovementRule(lambda pontos: pontos[:, PINKY_MCP, 0] - pontos[:, INDEX_MCP, 0], 0.9, 1.2),
+    # Ponta do indicador sobe ou desce (K)
+    "y_index_tip_changes": MovementRule(lambda pontos: pontos[:, INDEX_TIP, 1], 0.9, 1.2),
+    # Ponta do indicador vai para os lados (X)
+    "x_index_tip_changes": MovementRule(lambda pontos: pontos[:, INDEX_TIP, 0], 0.9, 1.2),
+    # Ponta do mínimo desenha o J
+    "pinky_pos_changes": MovementRule(lambda pontos: pontos[:, PINKY_TIP, 1], 0.9, 1.5),
+    # Gestos com movimento sem tipo definido (Z): qualquer deslocamento da ponta do indicador
+    "": MovementRule(lambda pontos: pontos[:, INDEX_TIP, :2], 0.9, 1.2),
+}
+
+class MovementDetector:
+    """
+    Classifica o movimento de uma mão a partir do histórico recente de landmarks.
+
+    A cada frame, o frame atual é comparado com todos os frames da janela; há movimento se a
+    razão de alguma medida sair da faixa da regra. Nada é bloqueado esperando frames futuros.
+    """
+
+    def __init__(self, duracao_janela: float = 1.0, regras: dict = MOVEMENT_RULES):
+        """
+        Args:
+            duracao_janela (float): Quantos segundos de histórico são considerados.
+            regras (dict): Tipo de movimento -> MovementRule.
+        """
+        self.duracao_janela = duracao_janela
+        self.regras = regras
+
+    def categorizar(self, historico: LandmarkHistory, type_of_movement: str) -> tuple:
+        """
+        Verifica se houve o movimento esperado na janela do histórico.
+
+        Args:
+            historico (LandmarkHistory): O histórico da mão, com o frame atual já adicionado.
+            type_of_movement (str): O tipo de movimento esperado pelo gesto candidato.
+
+        Returns:
+            tuple: Uma tupla contendo:
+                - str: O tipo de movimento verificado, ou uma string vazia se o tipo não for conhecido.
+                - bool: True se o movimento for detectado, False caso contrário.
+        """
+        regra = self.regras.get(type_of_movement)
+        if regra is None:
+            return "", False
+
+        _, pontos = historico.janela(self.duracao_janela)
+        if len(pontos) < 2:
+            return type_of_movement, False
+
+        medidas = regra.medida(pontos.astype(np.float64))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            razoes = medidas[:-1] / medidas[-1]
+        parado = (razoes > regra.minimo) & (razoes < regra.maximo)
+        return type_of_movement, not parado.all()
@@ -1,4 +1,7 @@
 from src.gestures.gesture_interpretador import GestureInterpretador
+from src.gestures.landmark_stream import LandmarkRecorder
+from src.gestures.hand_roi import HandROI
+from src.pipeline.frame_preprocessor import FramePreprocessor
 from src.data.configs.config_router import ConfigRouter
 from src.logger.logger import Logger
 import mediapipe as mp
@@ -19,6 +22,8 @@ class GestureReader:
 
         self.max_num_maos = 2
 
+        self.recorder: LandmarkRecorder = None  # Gravação opcional dos landmarks, para o modo offline
+
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
         self.hands = self.mp_hands.Hands(
@@ -27,6 +32,10 @@ class GestureReader:
             min_detection_confidence    = 0.75,
             min_tracking_confidence     = 0.75
         )
+        self.preprocessor = FramePreprocessor()  # Entrada da detecção (RGB, resolução de inferência) em buffers reutilizados
+        self.roi: HandROI = None                # Modo de região de interesse (inferência no recorte das mãos)
+        self.hands_roi = {}                     # Quantidade de mãos rastreadas -> instância do MediaPipe usada nos recortes
+        self.hands_roi_lock = threading.Lock()
 
         # Configuração dos loggers
         self.logger = Logger.configure_application_logger()
@@ -37,15 +46,39 @@ class GestureReader:
         """
         Detecta a mão dentro do frame.
 
+        No modo de região de interesse, a detecção roda no recorte em volta das mãos do frame anterior
+        e os landmarks são convertidos para o frame completo; sem mãos no recorte, a detecção é
+        refeita no frame completo.
+
         Args:
-            frame (cv2.Mat): Imagem do frame onde a detecção será realizada.
+            frame (cv2.Mat): Imagem BGR do frame onde a detecção será realizada (ver `preprocessor`).
 
         Returns:
-            results: Resultado da detecção das mãos.
+            results: Resultado da detecção das mãos, com os landmarks normalizados no frame completo.
         """
         try:
-            image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            image_rgb = self.preprocessor.preparar(frame)
+            roi = self.roi
+            if roi is None:
+                return self.hands.process(image_rgb)
+
+            altura, largura = image_rgb.shape[:2]
+            recorte, regiao = roi.recortar(image_rgb)
+            if recorte is not None:
+                hands = self.hands_roi[roi.maos]
+                results = hands.process(recorte)
+                if not results.multi_hand_landmarks:
+                    # O rastreamento da instância dos recortes pode estar em outra região: sem mãos
+                    # rastreadas, a segunda chamada roda a detecção de palma no próprio recorte
+                    results = hands.process(recorte)
+                if results.multi_hand_landmarks:
+                    HandROI.remapear(results, regiao, largura, altura)
+                    roi.atualizar(results, largura, altura)
+                    return results
+                roi.perder()
+
             results = self.hands.process(image_rgb)
+            roi.atualizar(results, largura, altura)
             return results
         except Exception as e:
             error_message = f"Erro ao detectar maos: {e}"
@@ -54,25 +87,35 @@ class GestureReader:
             self.error_logger.error(error_message)
             raise
 
-    def read_gesture(self, results) -> None:
+    def read_gesture(self, results, seq: int = 0, capturado: float = None) -> None:
         """
         Se for possível detectar uma mão no frame, passa para o interpretador.
 
         Args:
             results: Resultados da detecção das mãos.
+            seq (int): A sequência da captura do frame.
+            capturado (float): O instante da captura do frame (`time.perf_counter()`).
         """
         try:
             if not self.stop_event.is_set():
                 mao_direita = self.__filter_hand(results, "Right")
                 mao_esquerda = self.__filter_hand(results, "Left")
+
+                recorder = self.recorder
+                if recorder is not None:
+                    if mao_direita:
+                        recorder.registrar(mao_direita, "Right")
+                    if mao_esquerda:
+                        recorder.registrar(mao_esquerda, "Left")
+
                 if mao_direita:
-                    self.interpretador.interpretar(mao_direita, "Right")
+                    self.interpretador.interpretar(mao_direita, "Right", seq, capturado)
                     self.gestos_logger.info("Gesto da mao direita interpretado com sucesso.")
                 else:
                     ConfigRouter().update_atribute("nome_gesto_direita", "MAO")
                 
                 if mao_esquerda:
-                    self.interpretador.interpretar(mao_esquerda, "Left")
+                    self.interpretador.interpretar(mao_esquerda, "Left", seq, capturado)
                     self.gestos_logger.info("Gesto da mao esquerda interpretado com sucesso.")
                 else:
                     ConfigRouter().update_atribute("nome_gesto_esquerda", "MAO")
@@ -82,6 +125,53 @@ class GestureReader:
             self.gestos_logger.error(error_message)
             self.error_logger.error(error_message)
 
+    def iniciar_modo_roi(self) -> None:
+        """
+        Passa a detectar as mãos no recorte em volta das mãos do frame anterior (ver `HandROI`).
+
+        Na primeira chamada cria as instâncias do MediaPipe usadas nos recortes, o que carrega os modelos
+        e pode levar centenas de milissegundos: chamar fora do event loop (ex.: `run_in_executor`).
+        """
+        with self.hands_roi_lock:
+            for maos in range(1, self.max_num_maos + 1):
+                if maos not in self.hands_roi:
+                    self.hands_roi[maos] = self.mp_hands.Hands(
+                        static_image_mode           = False,
+                        max_num_hands               = maos,
+                        min_detection_confidence    = 0.75,
+                        min_tracking_confidence     = 0.75
+                    )
+            self.roi = HandROI()
+        self.logger.info("Modo de regiao de interesse iniciado.")
+
+    def parar_modo_roi(self) -> None:
+        """
+        Volta a detectar as mãos no frame completo.
+        """
+        roi, self.roi = self.roi, None
+        if roi is not None:
+            self.logger.info(f"Modo de regiao de interesse encerrado: {roi.metricas()}")
+
+    def iniciar_gravacao(self, caminho: str) -> None:
+        """
+        Começa a gravar os landmarks detectados em um arquivo JSONL, que pode ser reproduzido pelo modo offline.
+
+        Args:
+            caminho (str): O arquivo `.jsonl` de destino.
+        """
+        self.parar_gravacao()
+        self.recorder = LandmarkRecorder(caminho)
+        self.logger.info(f"Gravacao de landmarks iniciada em: {caminho}")
+
+    def parar_gravacao(self) -> None:
+        """
+        Para a gravação de landmarks, se houver uma em andamento.
+        """
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            recorder.fechar()
+            self.logger.info(f"Gravacao de landmarks salva em: {recorder.caminho}")
+
     def get_hand_landmarks(self, results) -> list:
         """
         Retorna uma lista com os landmarks das mãos detectadas.
@@ -130,7 +220,7 @@ class GestureReader:
         """
         try:
             classificacao = handedness.classification[0].label
-            self.gestos_logger.info(f"Mao classificada como: {classificacao}.")
+            self.gestos_logger.info("Mao classificada como: %s.", classificacao)
             return classificacao
         except Exception as e:
             error_message = f"Erro ao classificar mao: {e}"
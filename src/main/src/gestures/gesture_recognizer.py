@@ -0,0 +1,182 @@
+from src.data.gestures.data_libras_gestures import DataLibrasGestures
+from src.data.gestures.data_custom_gestures import DataCustomGestures
+from src.gestures.gesture_features import GestureFeatureExtractor
+from src.gestures.gesture_matcher import GestureMatcher, VALORES_FIXOS
+from src.gestures.gesture_movement import MovementDetector
+from src.gestures.landmark_history import LandmarkHistory
+from src.logger.logger import Logger
+import numpy as np
+
+class GestureRecognizer:
+    """
+    Reconhecimento de gestos sem efeitos colaterais: landmarks -> nome do gesto.
+
+    Concentra a extração de features e a busca nos bancos de gestos compilados, sem executar
+    inputs nem atualizar configurações. É usado pelo `GestureInterpretador` no loop ao vivo e
+    pelo modo offline, que reconhece gravações de landmarks em lote.
+    """
+
+    def __init__(self, data_libras: DataLibrasGestures = None, data_custom_gestures: DataCustomGestures = None):
+        """
+        Carrega e compila os bancos de gestos.
+
+        Args:
+            data_libras (DataLibrasGestures): O banco de sinais de Libras. Usa o arquivo padrão se não informado.
+            data_custom_gestures (DataCustomGestures): O banco de gestos personalizados. Usa o arquivo padrão se não informado.
+        """
+        self.gestos_logger = Logger.configure_gestures_logger()
+
+        self.data_libras = data_libras or DataLibrasGestures()
+        self.data_custom_gestures = data_custom_gestures or DataCustomGestures()
+
+        self.gestos_libras = self.data_libras.get_gestos()
+        self.libras_atributos_relevantes = self.data_libras.get_atributos_relevantes()
+
+        self.gestos_custom = self.data_custom_gestures.get_gestos()
+        self.custom_atributos_relevantes = self.data_custom_gestures.get_atributos_relevantes()
+
+        # Bancos de gestos compilados em tabelas de decisão (máscara de features -> gesto)
+        self.libras_matcher = GestureMatcher(self.gestos_libras, self.libras_atributos_relevantes)
+        self.custom_matcher = GestureMatcher(self.gestos_custom, self.custom_atributos_relevantes)
+
+        self.libras_hand = "Right"          # A mão que o programa vai ler os sinais de Libras
+        self.custom_gesture_hand = "Left"   # A mão que o programa vai ler os gestos configurados pelo usuário
+
+        self.feature_extractor = GestureFeatureExtractor()
+        self.movement_detector = MovementDetector()
+
+    def get_matcher(self, mao: str) -> GestureMatcher:
+        """
+        Retorna o banco de gestos lido pela mão.
+
+        Args:
+            mao (str): A mão ("Right" ou "Left").
+
+        Returns:
+            GestureMatcher: O banco de gestos da mão, ou None se a mão não for lida.
+        """
+        if mao == self.libras_hand:
+            return self.libras_matcher
+        if mao == self.custom_gesture_hand:
+            return self.custom_matcher
+        return None
+
+    def extrair_features(self, pontos: np.ndarray) -> dict:
+        """
+        Calcula as features de uma mão.
+
+        Args:
+            pontos (np.ndarray): Array (21, 3) com os landmarks da mão.
+
+        Returns:
+            dict: As features do gesto.
+        """
+        return self.feature_extractor.extrair(pontos)
+
+    def buscar_candidato(self, mao: str, gesto_atual: dict) -> str:
+        """
+        Busca o gesto candidato para as features de uma mão, antes da verificação de movimento.
+
+        Args:
+            mao (str): A mão ("Right" ou "Left").
+            gesto_atual (dict): As features do gesto.
+
+        Returns:
+            str: O nome do gesto candidato, ou None.
+        """
+        matcher = self.get_matcher(mao)
+        if matcher is None:
+            return None
+        return matcher.buscar_candidato(matcher.codificar_features(gesto_atual))
+
+    def verificar_candidato(self, mao: str, candidato: str, gesto_atual: dict, historico: LandmarkHistory = None) -> bool:
+        """
+        Verifica os atributos do candidato que não fazem parte da máscara, categorizando o movimento
+        pelo histórico da mão quando o candidato depende de movimento.
+
+        Args:
+            mao (str): A mão ("Right" ou "Left").
+            candidato (str): O nome do gesto candidato.
+            gesto_atual (dict): As features do gesto. Os atributos de movimento são atualizados.
+            historico (LandmarkHistory): O histórico da mão, com o frame atual já adicionado.
+
+        Returns:
+            bool: True se o candidato for confirmado, False caso contrário.
+        """
+        matcher = self.get_matcher(mao)
+        if historico is not None and matcher.tem_movimento(candidato):
+            tipo_de_movimento, tem_movimento = self.movement_detector.categorizar(historico, matcher.tipo_de_movimento(candidato))
+            gesto_atual["type_of_movement"] = tipo_de_movimento
+            gesto_atual["has_movement"] = tem_movimento
+        return matcher.verificar_gesto(candidato, gesto_atual)
+
+    def reconhecer(self, pontos: np.ndarray, mao: str, historico: LandmarkHistory = None) -> str:
+        """
+        Reconhece o gesto de uma mão em um frame.
+
+        Gestos que dependem de movimento só são reconhecidos quando o histórico da mão é informado.
+
+        Args:
+            pontos (np.ndarray): Array (21, 3) com os landmarks da mão.
+            mao (str): A mão ("Right" ou "Left").
+            historico (LandmarkHistory): O histórico da mão, com o frame atual já adicionado.
+
+        Returns:
+            str: O nome do gesto reconhecido, ou None.
+        """
+        gesto_atual = self.extrair_features(pontos)
+        candidato = self.buscar_candidato(mao, gesto_atual)
+        if candidato is not None and self.verificar_candidato(mao, candidato, gesto_atual, historico):
+            return candidato
+        return None
+
+    def reconhecer_lote(self, pontos: np.ndarray, maos, timestamps: np.ndarray = None, historicos: dict = None) -> list:
+        """
+        Reconhece os gestos de vários frames de uma vez.
+
+        Args:
+            pontos (np.ndarray): Array (N, 21, 3) com os landmarks de cada frame.
+            maos: Sequência (N,) com a mão de cada frame ("Right" ou "Left").
+            timestamps (np.ndarray): O instante de cada frame, em segundos. Quando informado, os frames
+                são tratados como uma sequência e os gestos com movimento também são reconhecidos.
+            historicos (dict): Mão -> LandmarkHistory, para continuar a sequência entre lotes. É preenchido
+                com os frames do lote; criado a cada chamada se não informado.
+
+        Returns:
+            list: O nome do gesto reconhecido em cada frame, ou None.
+        """
+        if len(pontos) == 0:
+            return []
+
+        mascaras = self.feature_extractor.extrair_mascaras(pontos).tolist()
+        maos = np.asarray(maos).tolist()
+        matchers = {mao: self.get_matcher(mao) for mao in set(maos)}
+        if timestamps is not None:
+            historicos = {} if historicos is None else historicos
+            for mao in matchers:
+                historicos.setdefault(mao, LandmarkHistory())
+            timestamps = np.asarray(timestamps).tolist()
+        else:
+            historicos = None
+
+        # Sem histórico, os atributos de movimento ficam com os valores fixos
+        aceitos = {}
+        resultado = []
+        for indice, (mascara, mao) in enumerate(zip(mascaras, maos)):
+            matcher = matchers[mao]
+            if historicos is not None:
+                historicos[mao].adicionar(pontos[indice], timestamps[indice])
+
+            candidato = matcher.tabela[mascara] if matcher is not None else None
+            if candidato is not None:
+                if historicos is not None and matcher.tem_movimento(candidato):
+                    if not self.verificar_candidato(mao, candidato, dict(VALORES_FIXOS), historicos[mao]):
+                        candidato = None
+                else:
+                    chave = (mao, candidato)
+                    if chave not in aceitos:
+                        aceitos[chave] = matcher.verificar_gesto(candidato, VALORES_FIXOS)
+                    if not aceitos[chave]:
+                        candidato = None
+            resultado.append(candidato)
+        return resultado
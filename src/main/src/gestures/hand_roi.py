@@ -0,0 +1,138 @@
+import numpy as np
+import cv2
+
+class HandROI:
+    """
+    Região de interesse da inferência: um recorte quadrado em volta das mãos detectadas no frame anterior.
+
+    Dentro da região, a detecção procura apenas as mãos que já estavam sendo rastreadas (`maos`): com
+    menos mãos do que o máximo, o MediaPipe roda a detecção de palma em todo frame procurando as que
+    faltam, o que custa mais que o próprio recorte economiza.
+
+    A região só é recalculada quando as mãos saem da sua parte central ou ficam pequenas demais para
+    ela, para que o rastreamento do MediaPipe (que trabalha nas coordenadas do recorte) continue
+    valendo entre frames. O recorte é reduzido para no máximo `lado_max` pixels antes da inferência.
+    Sem mãos no recorte, ou a cada `intervalo_completo` frames (para achar mãos que entraram fora da
+    região), a detecção volta para o frame completo.
+    """
+
+    def __init__(self, margem: float = 1.0, lado_max: int = 320, lado_min: float = 0.3, intervalo_completo: int = 30):
+        """
+        Args:
+            margem (float): Folga em volta das mãos, como fração do lado da caixa que as contém.
+            lado_max (int): Lado máximo (pixels) do recorte entregue ao MediaPipe.
+            lado_min (float): Lado mínimo do recorte, como fração do menor lado do frame.
+            intervalo_completo (int): Frames recortados entre duas detecções no frame completo.
+        """
+        self.margem = margem
+        self.lado_max = lado_max
+        self.lado_min = lado_min
+        self.intervalo_completo = intervalo_completo
+        self.regiao: tuple = None           # (x0, y0, x1, y1) em pixels do frame completo
+        self.maos = 0                       # Quantidade de mãos rastreadas na região
+        self.frames_na_regiao = 0
+        self.frames_recortados = 0
+        self.frames_completos = 0
+        self.perdas = 0
+
+    def recortar(self, frame: cv2.Mat) -> tuple:
+        """
+        Recorta e reduz a imagem de inferência na região atual.
+
+        Args:
+            frame (cv2.Mat): A imagem de inferência completa.
+
+        Returns:
+            tuple: (recorte, região), ou (None, None) se o frame completo deve ser usado.
+        """
+        if self.regiao is None or self.frames_na_regiao >= self.intervalo_completo:
+            self.frames_na_regiao = 0
+            self.frames_completos += 1
+            return None, None
+
+        x0, y0, x1, y1 = self.regiao
+        recorte = frame[y0:y1, x0:x1]
+        lado = x1 - x0
+        if lado > self.lado_max:
+            recorte = cv2.resize(recorte, (self.lado_max, self.lado_max), interpolation=cv2.INTER_AREA)
+        else:
+            recorte = np.ascontiguousarray(recorte)
+        self.frames_na_regiao += 1
+        self.frames_recortados += 1
+        return recorte, self.regiao
+
+    def atualizar(self, results, largura: int, altura: int) -> None:
+        """
+        Ajusta a região às mãos detectadas (já nas coordenadas do frame completo).
+
+        Args:
+            results: Os resultados da detecção de mão.
+            largura (int): A largura do frame completo.
+            altura (int): A altura do frame completo.
+        """
+        if not results.multi_hand_landmarks:
+            if self.regiao is not None:
+                self.perdas += 1
+            self.regiao = None
+            self.maos = 0
+            return
+
+        self.maos = len(results.multi_hand_landmarks)
+
+        pontos = np.array([(lm.x, lm.y) for mao in results.multi_hand_landmarks for lm in mao.landmark], dtype=np.float32)
+        pontos *= (largura, altura)
+        x_min, y_min = pontos.min(axis=0)
+        x_max, y_max = pontos.max(axis=0)
+        lado_maos = max(x_max - x_min, y_max - y_min)
+
+        if self.regiao is not None:
+            x0, y0, x1, y1 = self.regiao
+            borda = (x1 - x0) * 0.1
+            dentro = x_min >= x0 + borda and y_min >= y0 + borda and x_max <= x1 - borda and y_max <= y1 - borda
+            if dentro and lado_maos * (1 + 2 * self.margem) >= (x1 - x0) * 0.6:
+                return
+
+        lado = max(lado_maos * (1 + 2 * self.margem), self.lado_min * min(largura, altura))
+        lado = int(min(lado, largura, altura))
+        x0 = int(np.clip((x_min + x_max - lado) / 2, 0, largura - lado))
+        y0 = int(np.clip((y_min + y_max - lado) / 2, 0, altura - lado))
+        self.regiao = (x0, y0, x0 + lado, y0 + lado)
+
+    def perder(self) -> None:
+        """
+        Descarta a região depois de uma detecção sem mãos no recorte.
+        """
+        self.regiao = None
+        self.maos = 0
+        self.frames_na_regiao = 0
+        self.perdas += 1
+
+    @staticmethod
+    def remapear(results, regiao: tuple, largura: int, altura: int) -> None:
+        """
+        Converte, no próprio `results`, os landmarks normalizados no recorte para o frame completo.
+
+        Args:
+            results: Os resultados da detecção de mão no recorte.
+            regiao (tuple): A região (x0, y0, x1, y1) do recorte, em pixels do frame completo.
+            largura (int): A largura do frame completo.
+            altura (int): A altura do frame completo.
+        """
+        x0, y0, x1, y1 = regiao
+        escala_x, escala_y = (x1 - x0) / largura, (y1 - y0) / altura
+        deslocamento_x, deslocamento_y = x0 / largura, y0 / altura
+        for mao in results.multi_hand_landmarks:
+            for lm in mao.landmark:
+                lm.x = lm.x * escala_x + deslocamento_x
+                lm.y = lm.y * escala_y + deslocamento_y
+                lm.z = lm.z * escala_x     # z usa a mesma escala de x (largura da imagem)
+
+    def metricas(self) -> dict:
+        """
+        Retorna quantos frames foram inferidos no recorte e no frame completo, e quantas vezes a região foi perdida.
+        """
+        return {
+            "frames_recortados": self.frames_recortados,
+            "frames_completos": self.frames_completos,
+            "perdas": self.perdas,
+        }
@@ -0,0 +1,189 @@
+from src.camera.stream_profile import StreamProfile
+from mediapipe.framework.formats import landmark_pb2
+from types import SimpleNamespace
+from typing import NamedTuple
+import numpy as np
+
+class InferenceStrideConfig(NamedTuple):
+    """
+    Intervalo entre as detecções de mão do pipeline da câmera.
+    """
+    stride: int = 1                     # Detecta a cada `stride` frames (1 = todo frame)
+    adaptativo: bool = False            # Aumenta o intervalo até `stride_max` enquanto as mãos estão paradas
+    stride_max: int = 4
+    limiar_movimento: float = 0.15      # Velocidade (coordenadas normalizadas por segundo) abaixo da qual a mão está parada
+    horizonte: float = 0.1              # Tempo máximo (s) de extrapolação; depois disso os landmarks são mantidos
+
+    @staticmethod
+    def from_config(valor) -> "InferenceStrideConfig":
+        """
+        Cria a configuração a partir do valor salvo nas configurações básicas.
+
+        Args:
+            valor: Um dicionário com os campos da configuração. Campos ausentes (ou um valor vazio) usam o padrão.
+
+        Returns:
+            InferenceStrideConfig: A configuração validada.
+
+        Raises:
+            ValueError: Se algum campo tiver um valor inválido.
+        """
+        if not valor:
+            return InferenceStrideConfig()
+        if not isinstance(valor, dict):
+            raise ValueError(f"Intervalo de inferencia invalido: {valor}")
+
+        desconhecidos = set(valor) - set(InferenceStrideConfig._fields)
+        if desconhecidos:
+            raise ValueError(f"Campos desconhecidos no intervalo de inferencia: {sorted(desconhecidos)}")
+
+        config = InferenceStrideConfig()._replace(**valor)
+        config = config._replace(stride=InferenceStrideConfig.ler_inteiro(config.stride, "stride"),
+                                 stride_max=InferenceStrideConfig.ler_inteiro(config.stride_max, "stride_max"),
+                                 adaptativo=StreamProfile.ler_booleano(config.adaptativo))
+        if not 1 <= config.stride <= 10:
+            raise ValueError(f"stride deve estar entre 1 e 10: {config.stride}")
+        if not config.stride <= config.stride_max <= 10:
+            raise ValueError(f"stride_max deve estar entre stride e 10: {config.stride_max}")
+        if not config.limiar_movimento > 0:
+            raise ValueError(f"limiar_movimento deve ser positivo: {config.limiar_movimento}")
+        if not 0 <= config.horizonte <= 0.5:
+            raise ValueError(f"horizonte deve estar entre 0 e 0.5: {config.horizonte}")
+        return config._replace(limiar_movimento=float(config.limiar_movimento), horizonte=float(config.horizonte))
+
+    @staticmethod
+    def ler_inteiro(valor, campo: str) -> int:
+        """
+        Converte um campo inteiro salvo nas configurações, sem truncar valores fracionários.
+
+        Args:
+            valor: O valor salvo (um int, ou um float sem parte fracionária, ex.: 2.0).
+            campo (str): O nome do campo, usado na mensagem de erro.
+
+        Returns:
+            int: O valor convertido.
+
+        Raises:
+            ValueError: Se o valor não for um número inteiro.
+        """
+        if isinstance(valor, bool) or not isinstance(valor, (int, float)) or (isinstance(valor, float) and not valor.is_integer()):
+            raise ValueError(f"{campo} deve ser um numero inteiro: {valor}")
+        return int(valor)
+
+class InferenceStride:
+    """
+    Decide em quais frames a detecção de mão roda e estima os landmarks dos frames intermediários.
+
+    Entre duas detecções, os landmarks de cada mão são extrapolados com a velocidade medida entre as
+    duas últimas detecções, por até `horizonte` segundos, e depois mantidos. As estimativas têm o
+    mesmo formato dos resultados do MediaPipe, então o resto do pipeline (gestos, mouse_tracking,
+    desenho) continua recebendo uma atualização por frame. Todos os métodos rodam na thread de inferência.
+    """
+
+    def __init__(self, config: InferenceStrideConfig = None):
+        """
+        Args:
+            config (InferenceStrideConfig): O intervalo entre detecções. Se não informado, detecta todo frame.
+        """
+        self.config = config or InferenceStrideConfig()
+        self.stride_atual = self.config.stride
+        self.frames_sem_inferencia = 0
+        self.handedness = []
+        self.landmarks = []                 # NormalizedLandmarkList de cada mão na última detecção
+        self.pontos: np.ndarray = None      # (maos, 21, 3) da última detecção
+        self.velocidades: np.ndarray = None # (maos, 21, 3) em coordenadas normalizadas por segundo
+        self.instante: float = None
+        self.inferidos = 0
+        self.estimados = 0
+
+    def configurar(self, config: InferenceStrideConfig) -> None:
+        """
+        Troca a configuração. A próxima chamada de `deve_inferir` já usa o novo intervalo.
+        """
+        self.config = config
+        self.stride_atual = config.stride
+
+    def deve_inferir(self) -> bool:
+        """
+        Indica se a detecção deve rodar no frame atual. Deve ser chamado uma vez por frame.
+        """
+        self.frames_sem_inferencia += 1
+        if self.instante is None or self.frames_sem_inferencia >= self.stride_atual:
+            self.frames_sem_inferencia = 0
+            return True
+        return False
+
+    def registrar(self, results, instante: float) -> None:
+        """
+        Guarda o resultado de uma detecção e mede a velocidade de cada mão desde a detecção anterior.
+
+        Args:
+            results: Os resultados da detecção de mão.
+            instante (float): O instante da captura do frame, em segundos (`time.perf_counter()`).
+        """
+        self.inferidos += 1
+        landmarks = list(results.multi_hand_landmarks or [])
+        handedness = list(results.multi_handedness or [])
+        pontos = np.array([[(lm.x, lm.y, lm.z) for lm in mao.landmark] for mao in landmarks], dtype=np.float32).reshape(-1, 21, 3)
+
+        velocidades = np.zeros_like(pontos)
+        if self.pontos is not None and self.instante is not None and instante > self.instante:
+            rotulos = [h.classification[0].label for h in handedness]
+            anteriores = [h.classification[0].label for h in self.handedness]
+            if rotulos == anteriores:
+                velocidades = (pontos - self.pontos) / (instante - self.instante)
+
+        self.landmarks, self.handedness = landmarks, handedness
+        self.pontos, self.velocidades, self.instante = pontos, velocidades, instante
+        self.__ajustar_stride()
+
+    def __ajustar_stride(self) -> None:
+        """
+        No modo adaptativo, aumenta o intervalo um frame por detecção enquanto as mãos estão paradas,
+        e volta ao intervalo base assim que alguma se move (ou nenhuma é detectada).
+        """
+        config = self.config
+        if not config.adaptativo or len(self.pontos) == 0:
+            self.stride_atual = config.stride
+            return
+        velocidade = np.linalg.norm(self.velocidades[..., :2], axis=-1).mean(axis=-1).max()
+        if velocidade < config.limiar_movimento:
+            self.stride_atual = min(self.stride_atual + 1, config.stride_max)
+        else:
+            self.stride_atual = config.stride
+
+    def estimar(self, instante: float):
+        """
+        Estima os landmarks de um frame sem detecção a partir da última detecção.
+
+        Args:
+            instante (float): O instante da captura do frame, em segundos (`time.perf_counter()`).
+
+        Returns:
+            Um objeto com `multi_hand_landmarks` e `multi_handedness`, como os resultados do MediaPipe.
+        """
+        self.estimados += 1
+        if not self.landmarks:
+            return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+        decorrido = min(max(instante - self.instante, 0.0), self.config.horizonte)
+        pontos = self.pontos + self.velocidades * decorrido
+        maos = []
+        for original, coordenadas in zip(self.landmarks, pontos.tolist()):
+            mao = landmark_pb2.NormalizedLandmarkList()
+            mao.CopyFrom(original)
+            for lm, (x, y, z) in zip(mao.landmark, coordenadas):
+                lm.x, lm.y, lm.z = x, y, z
+            maos.append(mao)
+        return SimpleNamespace(multi_hand_landmarks=maos, multi_handedness=self.handedness)
+
+    def metricas(self) -> dict:
+        """
+        Retorna a configuração, o intervalo atual e quantos frames foram detectados e estimados.
+        """
+        return {
+            "config": self.config._asdict(),
+            "stride_atual": self.stride_atual,
+            "inferidos": self.inferidos,
+            "estimados": self.estimados,
+        }
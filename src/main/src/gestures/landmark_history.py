@@ -0,0 +1,69 @@
+from src.gestures.gesture_features import NUM_LANDMARKS
+import numpy as np
+import threading
+import time
+
+class LandmarkHistory:
+    """
+    Buffer circular de tamanho fixo com os landmarks recentes de uma mão e o instante de cada um.
+
+    A memória é alocada uma única vez; cada frame sobrescreve o mais antigo. A leitura de uma
+    janela de tempo devolve uma cópia, então pode ser feita de outra thread enquanto novos frames chegam.
+    """
+
+    def __init__(self, capacidade: int = 64):
+        """
+        Args:
+            capacidade (int): Quantidade máxima de frames guardados (64 frames ~ 2 segundos a 30 fps).
+        """
+        self.capacidade = capacidade
+        self.pontos = np.zeros((capacidade, NUM_LANDMARKS, 3), dtype=np.float32)
+        self.timestamps = np.zeros(capacidade, dtype=np.float64)
+        self.total = 0  # Quantidade de frames já adicionados (a posição do próximo é total % capacidade)
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacidade)
+
+    def adicionar(self, pontos: np.ndarray, timestamp: float = None) -> None:
+        """
+        Adiciona os landmarks de um frame, sobrescrevendo o mais antigo se o buffer estiver cheio.
+
+        Args:
+            pontos (np.ndarray): Array (21, 3) com os landmarks da mão.
+            timestamp (float): O instante do frame, em segundos. Usa `time.monotonic()` se não informado.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        with self.lock:
+            posicao = self.total % self.capacidade
+            self.pontos[posicao] = pontos
+            self.timestamps[posicao] = timestamp
+            self.total += 1
+
+    def janela(self, duracao: float) -> tuple:
+        """
+        Retorna os frames dos últimos `duracao` segundos, contados a partir do frame mais recente.
+
+        Args:
+            duracao (float): A duração da janela, em segundos.
+
+        Returns:
+            tuple: (timestamps (k,), pontos (k, 21, 3)), do mais antigo para o mais recente.
+        """
+        with self.lock:
+            quantidade = len(self)
+            if quantidade == 0:
+                return self.timestamps[:0].copy(), self.pontos[:0].copy()
+
+            ordem = (np.arange(self.total - quantidade, self.total)) % self.capacidade
+            timestamps = self.timestamps[ordem]
+            recentes = timestamps >= timestamps[-1] - duracao
+            return timestamps[recentes], self.pontos[ordem[recentes]]
+
+    def limpar(self) -> None:
+        """
+        Descarta todos os frames guardados.
+        """
+        with self.lock:
+            self.total = 0
@@ -0,0 +1,179 @@
+from src.gestures.gesture_features import NUM_LANDMARKS, landmarks_para_array
+from typing import Iterator, NamedTuple
+import numpy as np
+import threading
+import json
+import time
+import os
+
+class LandmarkFrame(NamedTuple):
+    """
+    Um frame gravado: os landmarks de uma mão em um instante.
+    """
+    timestamp: float
+    mao: str
+    pontos: np.ndarray  # (21, 3) float32
+
+class LandmarkRecording(NamedTuple):
+    """
+    Uma gravação inteira carregada em memória, em arrays prontos para processamento em lote.
+    """
+    timestamps: np.ndarray  # (N,) float64
+    maos: np.ndarray        # (N,) str
+    pontos: np.ndarray      # (N, 21, 3) float32
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def frames(self) -> Iterator[LandmarkFrame]:
+        """
+        Percorre a gravação frame a frame.
+        """
+        for timestamp, mao, pontos in zip(self.timestamps.tolist(), self.maos.tolist(), self.pontos):
+            yield LandmarkFrame(timestamp, mao, pontos)
+
+class LandmarkStream:
+    """
+    Leitura e escrita de gravações de landmarks.
+
+    Formatos suportados, escolhidos pela extensão do arquivo:
+        - `.jsonl`: um frame por linha, `{"timestamp": float, "mao": "Right" | "Left", "landmarks": [[x, y, z], ...]}`.
+        - `.npz`: arrays `timestamps` (N,), `maos` (N,) e `landmarks` (N, 21, 3).
+    """
+
+    @staticmethod
+    def __validar_pontos(pontos: np.ndarray, origem: str) -> np.ndarray:
+        """
+        Garante que os landmarks têm o formato (..., 21, 3).
+
+        Raises:
+            ValueError: Se o formato for inválido.
+        """
+        if pontos.ndim < 2 or pontos.shape[-2:] != (NUM_LANDMARKS, 3):
+            raise ValueError(f"Landmarks com formato invalido em {origem}: {pontos.shape}")
+        return pontos
+
+    @staticmethod
+    def iterar(caminho: str) -> Iterator[LandmarkFrame]:
+        """
+        Lê uma gravação frame a frame. Arquivos JSONL são lidos sob demanda, sem carregar o arquivo inteiro.
+
+        Args:
+            caminho (str): O caminho da gravação.
+
+        Returns:
+            Iterator[LandmarkFrame]: Os frames, na ordem da gravação.
+        """
+        if not caminho.endswith(".jsonl"):
+            yield from LandmarkStream.carregar(caminho).frames()
+            return
+
+        with open(caminho, "r") as file:
+            for numero_linha, linha in enumerate(file, start=1):
+                if not linha.strip():
+                    continue
+                frame = json.loads(linha)
+                pontos = np.asarray(frame["landmarks"], dtype=np.float32)
+                LandmarkStream.__validar_pontos(pontos, f"{caminho}:{numero_linha}")
+                yield LandmarkFrame(float(frame.get("timestamp", 0.0)), frame["mao"], pontos)
+
+    @staticmethod
+    def carregar(caminho: str) -> LandmarkRecording:
+        """
+        Carrega uma gravação inteira em memória.
+
+        Args:
+            caminho (str): O caminho da gravação (`.jsonl` ou `.npz`).
+
+        Returns:
+            LandmarkRecording: A gravação carregada.
+
+        Raises:
+            ValueError: Se a extensão não for suportada ou os landmarks tiverem formato inválido.
+        """
+        if caminho.endswith(".npz"):
+            with np.load(caminho) as data:
+                pontos = LandmarkStream.__validar_pontos(data["landmarks"].astype(np.float32, copy=False), caminho)
+                return LandmarkRecording(data["timestamps"].astype(np.float64), data["maos"].astype(str), pontos)
+
+        if caminho.endswith(".jsonl"):
+            frames = list(LandmarkStream.iterar(caminho))
+            if not frames:
+                return LandmarkRecording(np.empty(0), np.empty(0, dtype=str), np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32))
+            return LandmarkRecording(
+                np.array([frame.timestamp for frame in frames], dtype=np.float64),
+                np.array([frame.mao for frame in frames]),
+                np.stack([frame.pontos for frame in frames])
+            )
+
+        raise ValueError(f"Formato de gravacao nao suportado: {caminho}")
+
+    @staticmethod
+    def salvar(caminho: str, gravacao: LandmarkRecording) -> None:
+        """
+        Salva uma gravação em disco, no formato indicado pela extensão.
+
+        Args:
+            caminho (str): O caminho do arquivo (`.jsonl` ou `.npz`).
+            gravacao (LandmarkRecording): A gravação a ser salva.
+
+        Raises:
+            ValueError: Se a extensão não for suportada.
+        """
+        if caminho.endswith(".npz"):
+            np.savez_compressed(caminho, timestamps=gravacao.timestamps, maos=gravacao.maos.astype(str), landmarks=gravacao.pontos)
+            return
+
+        if caminho.endswith(".jsonl"):
+            with open(caminho, "w") as file:
+                for frame in gravacao.frames():
+                    file.write(LandmarkStream.serializar(frame) + "\n")
+            return
+
+        raise ValueError(f"Formato de gravacao nao suportado: {caminho}")
+
+    @staticmethod
+    def serializar(frame: LandmarkFrame) -> str:
+        """
+        Converte um frame em uma linha JSONL.
+        """
+        return json.dumps({"timestamp": frame.timestamp, "mao": frame.mao, "landmarks": frame.pontos.tolist()})
+
+class LandmarkRecorder:
+    """
+    Grava em JSONL os landmarks detectados ao vivo, para serem reproduzidos depois no modo offline.
+    """
+
+    def __init__(self, caminho: str):
+        """
+        Args:
+            caminho (str): O arquivo `.jsonl` de destino. É sobrescrito se já existir.
+        """
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+
+        self.caminho = caminho
+        self.file = open(caminho, "w")
+        self.lock = threading.Lock()
+        self.inicio = time.monotonic()
+
+    def registrar(self, hand_landmarks, mao: str) -> None:
+        """
+        Grava os landmarks de uma mão.
+
+        Args:
+            hand_landmarks (NormalizedLandmarkList): Os landmarks da mão.
+            mao (str): A mão detectada ("Right" ou "Left").
+        """
+        frame = LandmarkFrame(time.monotonic() - self.inicio, mao, landmarks_para_array(hand_landmarks))
+        with self.lock:
+            if not self.file.closed:
+                self.file.write(LandmarkStream.serializar(frame) + "\n")
+
+    def fechar(self) -> None:
+        """
+        Fecha o arquivo da gravação.
+        """
+        with self.lock:
+            self.file.close()
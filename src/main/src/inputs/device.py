@@ -8,42 +8,35 @@ class Device(ABC):
         ULONG_PTR = ctypes.c_uint32
 
     @abstractmethod
-    def __send_input(self, inputs) -> None:
+    def criar_evento(key: str, pressionado: bool):
         """
-        Envia os eventos de entrada para o sistema. Deve ser implementado nas subclasses.
+        Cria o evento (`InputEvent`) de pressionar ou liberar a tecla, a ser enviado por um `InputBackend`.
+        Vários eventos podem ser enviados juntos, em um único lote.
 
-        Args:
-            input (INPUT): O evento INPUT a ser enviado.
-        """
-        pass
-    
-    @abstractmethod
-    def __create_input(key: str, event_type: str) -> None:
-        """
-        Cria e configura o input para enviar corretamente para o sistema por meio da Windows API.
-        
         Args:
             key (str): A tecla a ser simulada.
-            event_type (str): Tipo de evento.
+            pressionado (bool): True para pressionar, False para liberar.
         """
         pass
 
     @abstractmethod
-    def up(key: str) -> None:
+    def up(key: str, backend) -> None:
         """
-        Envia o evento de pressionar a tecla.
+        Envia o evento de liberar a tecla.
 
         Args:
             key (str): A tecla a ser liberada.
+            backend (InputBackend): O destino do evento.
         """
         pass
 
     @abstractmethod
-    def down(key: str) -> None:
+    def down(key: str, backend) -> None:
         """
-        Envia o evento de liberar a tecla.
-        
+        Envia o evento de pressionar a tecla.
+
         Args:
             key (str): A tecla a ser pressionada.
+            backend (InputBackend): O destino do evento.
         """
         pass
\ No newline at end of file
@@ -1,9 +1,10 @@
 from src.data.binds.data_bind_codes import DataBindCodes
-from src.inputs.keyboard import Keyboard
 from src.logger.logger import Logger
+from src.pipeline.latest_frame_executor import LatestFrameExecutor
+from src.inputs.input_backend import InputBackend
+from src.inputs.keyboard import Keyboard
 from src.inputs.mouse import Mouse
 from src.inputs.input import Input
-import threading
 import time
 
 class ExecuteInput:
@@ -13,8 +14,15 @@ class ExecuteInput:
     A classe `ExecuteInput` gerencia a execução de inputs simulados e o rastreamento do mouse. 
     
     Ela lida com a simulação de inputs de teclado e mouse, liberando inputs anteriores e controlando a execução contínua de inputs.
+    Os eventos são injetados por um `InputBackend` (ver `InputBackend.padrao`).
     """
-    def __init__(self):
+    def __init__(self, backend: InputBackend = None):
+        """
+        Args:
+            backend (InputBackend): O destino dos inputs. Se não informado, usa o backend do sistema atual.
+        """
+        self.backend = backend or InputBackend.padrao()
+        Mouse.inscrever_configuracoes()
         self.ultimo_gesto: str = None
         self.ultimo_input_code: str = None
         self.input_em_andamento: bool = False
@@ -22,22 +30,49 @@ class ExecuteInput:
 
         self.data_bind_codes = DataBindCodes()
 
+        # Uma única thread de longa duração simula os inputs, em vez de uma thread por input
+        self.executor = LatestFrameExecutor(max_workers=1, nome="inputs")
+
         self.logger = Logger.configure_application_logger()
         self.input_logger = Logger.configure_input_logger()
 
+    def _criar_eventos(self, bind: str, pressionado: bool) -> list:
+        """
+        Cria os eventos de pressionar ou liberar uma bind de teclado ou mouse.
+
+        Returns:
+            list[InputEvent]: Os eventos da bind.
+
+        Raises:
+            ValueError: Se a bind não puder ser simulada (ex.: o botão do meio do mouse).
+        """
+        eventos = []
+        bind = bind.lower()  # Como em `bind_type_check`
+        eh_input_teclado, eh_input_mouse = self.data_bind_codes.bind_type_check(bind)
+        if eh_input_teclado:
+            eventos.append(Keyboard.criar_evento(bind, pressionado))
+        if eh_input_mouse:
+            eventos.append(Mouse.criar_evento(bind, pressionado))
+        return eventos
+
+    def _eventos_liberacao(self) -> list:
+        """
+        Retorna os eventos que liberam o input atual em andamento, caso exista, e o marca como liberado.
+        """
+        if self.ultimo_input_code and self.input_em_andamento:
+            self.input_em_andamento = False
+            return self._criar_eventos(self.ultimo_input_code, False)
+        return []
+
     def _liberar_input_atual(self) -> None:
         """
         Libera o input atual em andamento, caso exista.
 
         Interrompe a simulação de qualquer input de teclado ou mouse que esteja ativo.
         """
-        if self.ultimo_input_code and self.input_em_andamento:
-            eh_input_teclado, eh_input_mouse = self.data_bind_codes.bind_type_check(self.ultimo_input_code)
-            if eh_input_teclado:
-                Keyboard.up(self.ultimo_input_code)
-            if eh_input_mouse:
-                Mouse.up(self.ultimo_input_code)
-            self.input_em_andamento = False
+        eventos = self._eventos_liberacao()
+        if eventos:
+            self.backend.enviar(eventos)
 
     def _simular_input(self, bind: str, tempo_pressionado: int, modo_toggle_ativado: bool) -> None:
         """
@@ -48,14 +83,17 @@ class ExecuteInput:
             tempo_pressionado (int): O tempo que o input deve permanecer ativo.
             modo_toggle_ativado (bool): Indica se o modo toggle está ativado.
         """
-        self._liberar_input_atual()
+        # A liberação do input anterior e o pressionamento do novo vão no mesmo lote. Os eventos do novo
+        # são criados antes: se a bind for rejeitada, o input anterior ainda é liberado
+        try:
+            pressionamento = self._criar_eventos(bind, True)
+        except ValueError:
+            self._liberar_input_atual()
+            self.travar_novos_inputs = False
+            raise
+        eventos = self._eventos_liberacao() + pressionamento
         self.input_em_andamento = True
-
-        eh_input_teclado, eh_input_mouse = self.data_bind_codes.bind_type_check(bind)
-        if eh_input_teclado:
-            Keyboard.down(bind)
-        if eh_input_mouse:
-            Mouse.down(bind)
+        self.backend.enviar(eventos)
 
         self.ultimo_input_code = bind
 
@@ -69,13 +107,16 @@ class ExecuteInput:
         self.input_em_andamento = False
         self.travar_novos_inputs = False
 
-    def executar_input(self, gesto: str, input: Input) -> None:
+    def executar_input(self, gesto: str, input: Input) -> bool:
         """
         Executa um input baseado em um gesto e uma configuração de input.
 
         Args:
             gesto (str): O gesto que está sendo executado.
             input (Input): A configuração do input a ser simulado.
+
+        Returns:
+            bool: True se o input foi enviado para simulação, False se outro input ainda estava em andamento.
         """
         self.travar_novos_inputs = True
         
@@ -84,11 +125,31 @@ class ExecuteInput:
         bind = input.get_tecla()
 
         if not self.input_em_andamento:
-            thread = threading.Thread(target=self._simular_input, args=(bind, tempo_pressionado, modo_toggle_ativado))
-            thread.start() 
+            self.executor.submit("input", self._simular_input, bind, tempo_pressionado, modo_toggle_ativado)
             self.ultimo_gesto = gesto
 
             self.input_logger.info(f"Inicio da execucao do input: {bind}")
+            return True
+        return False
+
+    def get_metricas(self) -> dict:
+        """
+        Retorna as métricas do executor de inputs.
+        """
+        return self.executor.metricas()
+
+    def iniciar(self) -> None:
+        """
+        Recria a thread de inputs, se ela foi encerrada por `encerrar`.
+        """
+        if self.executor.encerrado:
+            self.executor = LatestFrameExecutor(max_workers=1, nome="inputs")
+
+    def encerrar(self) -> None:
+        """
+        Encerra a thread de inputs, depois de simular (e liberar) o input pendente.
+        """
+        self.executor.shutdown()
 
     def executar_mouse_tracking(self, x_coords: float, y_coords: float) -> None:
         """
@@ -99,4 +160,4 @@ class ExecuteInput:
             y_coords (float): Coordenada Y para movimentar o mouse.
         """
         self.input_logger.info("Realizando mouse_tracking.")
-        Mouse.move(x_coords, y_coords, 1)
+        Mouse.move(x_coords, y_coords, 1, self.backend)
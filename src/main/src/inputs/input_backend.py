@@ -0,0 +1,144 @@
+from src.logger.logger import Logger
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+from collections import deque
+import threading
+import time
+import sys
+
+EVENTO_TECLA = "tecla"
+EVENTO_BOTAO = "botao"
+EVENTO_MOVIMENTO = "movimento"
+
+class InputEvent(NamedTuple):
+    """
+    Um evento de teclado ou mouse a ser injetado no sistema.
+    """
+    tipo: str                   # EVENTO_TECLA, EVENTO_BOTAO ou EVENTO_MOVIMENTO
+    codigo: str = ""            # A tecla (ex.: "a") ou o botão do mouse (ex.: "m1"); vazio nos movimentos
+    pressionado: bool = False   # True para pressionar, False para soltar
+    dx: int = 0                 # Deslocamento relativo do cursor, em pixels (movimentos)
+    dy: int = 0
+
+class RecordedInput(NamedTuple):
+    """
+    Um evento capturado pelo `RecordingInputBackend`.
+    """
+    instante: float     # `time.perf_counter()` do envio
+    lote: int           # Índice da chamada de `enviar` que trouxe o evento
+    evento: InputEvent
+
+class InputBackend(ABC):
+    """
+    Destino dos inputs simulados pelo `ExecuteInput`.
+
+    `enviar` recebe um lote de eventos, que são injetados juntos, na ordem, em uma única chamada ao
+    sistema quando o backend permite.
+    """
+
+    @abstractmethod
+    def enviar(self, eventos: list) -> int:
+        """
+        Injeta um lote de eventos.
+
+        Args:
+            eventos (list[InputEvent]): Os eventos, na ordem em que devem ser injetados.
+
+        Returns:
+            int: Quantidade de eventos injetados.
+        """
+        pass
+
+    @abstractmethod
+    def posicionar_cursor(self, x: int, y: int) -> None:
+        """
+        Move o cursor para a posição absoluta (x, y) da tela, em pixels.
+        """
+        pass
+
+    @abstractmethod
+    def posicao_cursor(self) -> tuple:
+        """
+        Retorna a posição atual do cursor como uma tupla (x, y), em pixels.
+        """
+        pass
+
+    @abstractmethod
+    def dimensoes_tela(self) -> tuple:
+        """
+        Retorna a largura e a altura da tela, em pixels.
+        """
+        pass
+
+    @staticmethod
+    def padrao() -> "InputBackend":
+        """
+        Retorna o backend do sistema atual: o SendInput da Windows API no Windows. Em outros sistemas
+        (ex.: o pipeline rodando com uma fonte de frames sintética em um Linux sem tela), os inputs
+        são apenas gravados em memória.
+        """
+        if sys.platform == "win32":
+            from src.inputs.windows_input_backend import SendInputBackend
+            return SendInputBackend()
+        return RecordingInputBackend()
+
+class RecordingInputBackend(InputBackend):
+    """
+    Backend que não injeta nada: grava os eventos recebidos com o instante do envio, e mantém um
+    cursor virtual. Serve para medir a latência e conferir a sequência dos inputs em qualquer sistema.
+    """
+
+    def __init__(self, largura_tela: int = 1920, altura_tela: int = 1080, capacidade: int = 100000):
+        """
+        Args:
+            largura_tela (int): Largura da tela virtual, em pixels.
+            altura_tela (int): Altura da tela virtual, em pixels.
+            capacidade (int): Quantidade de eventos mais recentes mantidos na gravação.
+        """
+        self.largura_tela = largura_tela
+        self.altura_tela = altura_tela
+        self.cursor = (largura_tela // 2, altura_tela // 2)
+        self.gravados = deque(maxlen=capacidade)
+        self.lotes = 0
+        self.lock = threading.Lock()
+
+        self.input_logger = Logger.configure_input_logger()
+
+    def enviar(self, eventos: list) -> int:
+        agora = time.perf_counter()
+        with self.lock:
+            lote = self.lotes
+            self.lotes += 1
+            for evento in eventos:
+                if evento.tipo == EVENTO_MOVIMENTO:
+                    self.cursor = (self.cursor[0] + evento.dx, self.cursor[1] + evento.dy)
+                self.gravados.append(RecordedInput(agora, lote, evento))
+        self.input_logger.info("Lote de %s eventos gravado: %s", len(eventos), eventos)
+        return len(eventos)
+
+    def posicionar_cursor(self, x: int, y: int) -> None:
+        with self.lock:
+            self.cursor = (x, y)
+
+    def posicao_cursor(self) -> tuple:
+        return self.cursor
+
+    def dimensoes_tela(self) -> tuple:
+        return self.largura_tela, self.altura_tela
+
+    def eventos(self) -> list:
+        """
+        Retorna uma cópia dos eventos gravados, em ordem de envio.
+
+        Returns:
+            list[RecordedInput]: Os eventos gravados.
+        """
+        with self.lock:
+            return list(self.gravados)
+
+    def limpar(self) -> None:
+        """
+        Descarta os eventos gravados.
+        """
+        with self.lock:
+            self.gravados.clear()
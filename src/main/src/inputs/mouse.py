@@ -1,103 +1,94 @@
 
-from src.inputs.c_structures.c_constants import INPUT_MOUSE, LEFT, MIDDLE, RIGHT, MOUSEEVENTF_LEFTUP, MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_MOVE, MOUSEEVENTF_RIGHTUP, MOUSEEVENTF_RIGHTDOWN
-from src.inputs.c_structures.c_mouse_input import MOUSEINPUT, INPUT
+from src.inputs.c_structures.c_constants import LEFT, MIDDLE, RIGHT, MOUSEEVENTF_MOVE
+from src.inputs.input_backend import InputBackend, InputEvent, EVENTO_BOTAO, EVENTO_MOVIMENTO
 from src.data.configs.config_router import ConfigRouter
 from src.inputs.device import Device
 from src.logger.logger import Logger
 import numpy as np
-import ctypes
+import threading
 
 RELATIVE_MOVE = MOUSEEVENTF_MOVE
 ABSOLUTE_MOVE = 0
 
 class Mouse(Device):
     """
-    A classe Mouse lida com eventos de mouse, sendo possível enviar eventos (com SendInput) de Clicks, e MoveCursor. 
+    A classe Mouse lida com eventos de mouse, sendo possível enviar eventos (por um `InputBackend`) de Clicks, e MoveCursor. 
     """
+    # Dimensões da webcam, mantidas atualizadas pelo ConfigRouter (ver `atualizar_dimensoes_webcam`)
+    webcam_width: int = 640
+    webcam_height: int = 480
+    inscrito: bool = False
+    lock_inscricao = threading.Lock()
 
     @staticmethod
-    def __get_screen_dimensions() -> tuple:
+    def inscrever_configuracoes() -> None:
         """
-        Obtém as dimensões da tela do sistema.
-
-        Returns:
-            tuple: Largura e altura da tela.
+        Inscreve o Mouse no ConfigRouter para acompanhar 'webcam_width' e 'webcam_height'.
+        Feito sob demanda (ver `ExecuteInput`), e não na importação do módulo; chamadas repetidas não fazem nada.
         """
-        screen_width = ctypes.windll.user32.GetSystemMetrics(0)
-        screen_height = ctypes.windll.user32.GetSystemMetrics(1)
-        return screen_width, screen_height
+        with Mouse.lock_inscricao:
+            if Mouse.inscrito:
+                return
+            Mouse.inscrito = True
+        ConfigRouter.subscribe("webcam_width", Mouse.atualizar_dimensoes_webcam)
+        ConfigRouter.subscribe("webcam_height", Mouse.atualizar_dimensoes_webcam)
 
     @staticmethod
-    def __get_cursor_pos() -> tuple:
-        """
-        Retorna a posição atual do cursor como uma tupla (x, y).
-
-        Returns:
-            tuple: Coordenadas (x, y) do cursor.
+    def atualizar_dimensoes_webcam(atributo: str, valor) -> None:
         """
-        class POINT(ctypes.Structure):
-            _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
-        cursor_pos = POINT()
-        ctypes.windll.user32.GetCursorPos(ctypes.byref(cursor_pos))
-        return cursor_pos.x, cursor_pos.y
-
-    @staticmethod
-    def __send_input(inputs) -> None:
-        """
-        Envia os eventos de entrada para o sistema.
+        Callback inscrito no ConfigRouter para receber as mudanças de 'webcam_width' e 'webcam_height'.
+        Valores vazios ou inválidos (ex.: configuração ilegível) são ignorados, mantendo a dimensão atual.
 
         Args:
-            inputs (list): Lista de eventos INPUT a serem enviados.
+            atributo (str): O nome do atributo alterado.
+            valor: O novo valor do atributo.
         """
         try:
-            ctypes.windll.user32.SendInput(len(inputs), ctypes.byref(inputs[0]), ctypes.sizeof(INPUT))
-        except Exception as e:
-            error_message = f"Ocorreu um erro ao enviar o input: {e}."
-            Logger.configure_error_logger().error(error_message)
-            Logger.configure_input_logger().error(error_message)
-            raise ValueError(error_message)
+            dimensao = int(valor)
+        except (TypeError, ValueError):
+            Logger.configure_error_logger().error(f"Dimensao da webcam invalida para '{atributo}': {valor!r}. Mantendo a atual.")
+            return
+        if dimensao <= 0:
+            return
+        if atributo == "webcam_width":
+            Mouse.webcam_width = dimensao
+        elif atributo == "webcam_height":
+            Mouse.webcam_height = dimensao
 
     @staticmethod
-    def __create_input(button: str, event_type: str) -> None:
+    def criar_evento(button: str, pressionado: bool) -> InputEvent:
         """
-        Cria e configura o input para simular o clique do mouse.
+        Cria o evento que simula o clique do mouse.
 
         Args:
             button (str): Botão do mouse (LEFT, MIDDLE, RIGHT).
-            event_type (str): Tipo de evento (DOWN ou UP).
+            pressionado (bool): True para pressionar (DOWN), False para soltar (UP).
 
         Raises:
-            ValueError: Se 'button' não for 'left', 'middle' ou 'right', ou se 'event_type' não for 'UP' ou 'DOWN'.
+            ValueError: Se 'button' não for 'left' ou 'right'.
         """
-        if button == LEFT:
-            flags = MOUSEEVENTF_LEFTDOWN if event_type == "DOWN" else MOUSEEVENTF_LEFTUP
-        elif button == RIGHT:
-            flags = MOUSEEVENTF_RIGHTDOWN if event_type == "DOWN" else MOUSEEVENTF_RIGHTUP
-        else:
+        if button not in (LEFT, RIGHT):
             error_message = f"'{button}' nao eh um botao do mouse valido. Deve ser 'm1' (botao esquerdo do mouse), 'm2' (botao direito do mouse) ou 'm3' (botao do meio do mouse)."
             Logger.configure_error_logger().error(error_message)
             Logger.configure_input_logger().error(error_message)
             raise ValueError(error_message)
-
-        mi = MOUSEINPUT(0, 0, 0, flags, 0, 0)
-        inputs = [INPUT(INPUT_MOUSE, mi)]
-        Mouse.__send_input(inputs)
-        Logger.configure_input_logger().info(f"Simulacao de clique: '{button}' ({event_type}) realizado com sucesso.")
+        return InputEvent(EVENTO_BOTAO, button, pressionado)
 
     @staticmethod
-    def __move_mouse_absolute(x: int, y: int, min_diff: int = 2) -> None:
+    def __move_mouse_absolute(x: int, y: int, backend: InputBackend, min_diff: int = 2) -> None:
         """
         Move o cursor do mouse para as coordenadas absolutas especificadas.
 
         Args:
             x (int): Coordenada x.
             y (int): Coordenada y.
+            backend (InputBackend): O destino do movimento.
         """
-        screen_width, screen_height = Mouse.__get_screen_dimensions()
-        webcam_width = int(ConfigRouter().read_atribute("webcam_width"))
-        webcam_height = int(ConfigRouter().read_atribute("webcam_height"))
+        screen_width, screen_height = backend.dimensoes_tela()
+        webcam_width = Mouse.webcam_width
+        webcam_height = Mouse.webcam_height
 
-        x_atual, y_atual = Mouse.__get_cursor_pos()
+        x_atual, y_atual = backend.posicao_cursor()
         x_proporcional = np.interp(webcam_width * x, (0, webcam_width), (0, screen_width))
         y_proporcional = np.interp(webcam_height * y, (0, webcam_height), (0, screen_height))
 
@@ -109,23 +100,24 @@ class Mouse(Device):
             diff_y = abs(y_novo - y_atual) / screen_height * 100
 
             if diff_x > min_diff or diff_y > min_diff:
-                ctypes.windll.user32.SetCursorPos(x_novo, y_novo)
-                Logger.configure_input_logger().info(f"Cursor movido para ({x_novo}, {y_novo}) com sucesso.")
+                backend.posicionar_cursor(x_novo, y_novo)
+                Logger.configure_input_logger().info("Cursor movido para (%s, %s) com sucesso.", x_novo, y_novo)
 
     @staticmethod
-    def __move_mouse_relative(x: int, y: int, cursor_speed: int = 10) -> None:
+    def __move_mouse_relative(x: int, y: int, backend: InputBackend, cursor_speed: int = 10) -> None:
         """
         Cria o input que move o cursor do mouse considerando a posição atual do mouse.
 
         Args:
             x (int): Coordenada adicionada à x.
             y (int): Coordenada adicionada à y.
+            backend (InputBackend): O destino do movimento.
         """        
-        screen_width, screen_height = Mouse.__get_screen_dimensions()
-        webcam_width = int(ConfigRouter().read_atribute("webcam_width"))
-        webcam_height = int(ConfigRouter().read_atribute("webcam_height"))
+        screen_width, screen_height = backend.dimensoes_tela()
+        webcam_width = Mouse.webcam_width
+        webcam_height = Mouse.webcam_height
 
-        x_atual, y_atual = Mouse.__get_cursor_pos()
+        x_atual, y_atual = backend.posicao_cursor()
         x_ultima_pos_proporcional =  ConfigRouter().read_atribute("x_ultima_pos_cursor") 
         y_ultima_pos_proporcional = ConfigRouter().read_atribute("y_ultima_pos_cursor") 
 
@@ -151,37 +143,35 @@ class Mouse(Device):
         if x_novo > screen_width or y_novo > screen_height:
             return
         
-        mi = MOUSEINPUT(dx=x_diff_proporcional, dy=y_diff_proporcional, mouseData=0, dwFlags=MOUSEEVENTF_MOVE, time=0, dwExtraInfo=0)
-        
-        input_structure = INPUT(type=INPUT_MOUSE, mi=mi)
-        
-        Mouse.__send_input([input_structure])
-        Logger.configure_input_logger().info(f"Enviando input para mover o mouse para ({x_novo}, {y_novo}).")
+        backend.enviar([InputEvent(EVENTO_MOVIMENTO, dx=x_diff_proporcional, dy=y_diff_proporcional)])
+        Logger.configure_input_logger().info("Enviando input para mover o mouse para (%s, %s).", x_novo, y_novo)
 
     @staticmethod
-    def up(button: str) -> None:
+    def up(button: str, backend: InputBackend) -> None:
         """
         Simula o evento de soltar o botão do mouse.
 
         Args:
             button (str): Botão do mouse (LEFT, MIDDLE, RIGHT).
+            backend (InputBackend): O destino do evento.
         """
-        Logger.configure_input_logger().info(f"Iniciando clique UP no botao {button}.")
-        Mouse.__create_input(button, "UP")
+        Logger.configure_input_logger().info("Iniciando clique UP no botao %s.", button)
+        backend.enviar([Mouse.criar_evento(button, False)])
 
     @staticmethod
-    def down(button: str) -> None:
+    def down(button: str, backend: InputBackend) -> None:
         """
         Simula o evento de pressionar o botão do mouse.
 
         Args:
             button (str): Botão do mouse (LEFT, MIDDLE, RIGHT).
+            backend (InputBackend): O destino do evento.
         """
-        Logger.configure_input_logger().info(f"Iniciando clique DOWN no botao {button}.")
-        Mouse.__create_input(button, "DOWN")
+        Logger.configure_input_logger().info("Iniciando clique DOWN no botao %s.", button)
+        backend.enviar([Mouse.criar_evento(button, True)])
 
     @staticmethod
-    def move(x: float, y: float, event_type: int) -> None:
+    def move(x: float, y: float, event_type: int, backend: InputBackend) -> None:
         """
         Move o cursor do mouse de acordo com as coordenadas dadas, proporcionalmente ao tamanho da webcam.
 
@@ -189,9 +179,10 @@ class Mouse(Device):
             x (float): Coordenada x normalizada (proporcional à largura da webcam).
             y (float): Coordenada y normalizada (proporcional à altura da webcam).
             event_type (int): Tipo de input de movimento de mouse. (ABSOLUTE_MOVE: 0, RELATIVE_MOVE: 1)
+            backend (InputBackend): O destino do movimento.
         """
         if event_type == ABSOLUTE_MOVE:
-            Mouse.__move_mouse_absolute(x, y)
+            Mouse.__move_mouse_absolute(x, y, backend)
         if event_type == RELATIVE_MOVE:
-            Mouse.__move_mouse_relative(x, y)
-        Logger.configure_input_logger().info(f"Tentando mover o cursor para ({x}, {y}). | Tipo de input: {event_type}")
+            Mouse.__move_mouse_relative(x, y, backend)
+        Logger.configure_input_logger().info("Tentando mover o cursor para (%s, %s). | Tipo de input: %s", x, y, event_type)
@@ -0,0 +1,115 @@
+from src.inputs.c_structures.c_constants import (INPUT_KEYBOARD, INPUT_MOUSE, KEYBOARD_KEYS, KEYEVENTF_KEYDOWN, KEYEVENTF_KEYUP,
+                                                  LEFT, RIGHT, MAPVK_VK_TO_VSC, MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP,
+                                                  MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP, MOUSEEVENTF_MOVE)
+from src.inputs.c_structures.c_input import INPUT
+from src.inputs.input_backend import InputBackend, EVENTO_TECLA, EVENTO_BOTAO, EVENTO_MOVIMENTO
+from src.logger.logger import Logger
+import threading
+import ctypes
+
+user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+FLAGS_BOTOES = {
+    (LEFT, True): MOUSEEVENTF_LEFTDOWN,
+    (LEFT, False): MOUSEEVENTF_LEFTUP,
+    (RIGHT, True): MOUSEEVENTF_RIGHTDOWN,
+    (RIGHT, False): MOUSEEVENTF_RIGHTUP,
+}
+
+class POINT(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
+
+class SendInputBackend(InputBackend):
+    """
+    Backend que injeta os eventos com o `SendInput` da Windows API.
+
+    As estruturas INPUT ficam em um array ctypes alocado uma única vez: cada lote é escrito no
+    array e enviado em uma única chamada ao `SendInput`, o que também garante que os eventos do
+    lote não sejam intercalados com inputs de outras origens.
+    """
+
+    def __init__(self, capacidade: int = 16):
+        """
+        Args:
+            capacidade (int): Quantidade de eventos por chamada ao `SendInput`; lotes maiores são divididos.
+        """
+        self.capacidade = capacidade
+        self.estruturas = (INPUT * capacidade)()
+        self.tamanho_estrutura = ctypes.sizeof(INPUT)
+        self.cursor = POINT()
+        self.scan_codes = {}    # Virtual-key code -> scan code, consultado uma única vez por tecla
+        self.lock = threading.Lock()
+
+        self.input_logger = Logger.configure_input_logger()
+        self.error_logger = Logger.configure_error_logger()
+
+    def __scan_code(self, codigo_virtual: int) -> int:
+        scan_code = self.scan_codes.get(codigo_virtual)
+        if scan_code is None:
+            scan_code = self.scan_codes[codigo_virtual] = user32.MapVirtualKeyExW(codigo_virtual, MAPVK_VK_TO_VSC, 0)
+        return scan_code
+
+    def __preencher(self, estrutura: INPUT, evento) -> None:
+        """
+        Escreve o evento na estrutura INPUT, sobrescrevendo todos os campos do membro usado.
+
+        Raises:
+            ValueError: Se a tecla ou o botão do evento não for suportado.
+        """
+        if evento.tipo == EVENTO_TECLA:
+            codigo_virtual = KEYBOARD_KEYS.get(evento.codigo)
+            if codigo_virtual is None:
+                raise ValueError(f"Tecla nao suportada: {evento.codigo}")
+            estrutura.type = INPUT_KEYBOARD
+            ki = estrutura.ki
+            ki.wVk = codigo_virtual
+            ki.wScan = self.__scan_code(codigo_virtual)
+            ki.dwFlags = KEYEVENTF_KEYDOWN if evento.pressionado else KEYEVENTF_KEYUP
+            ki.time = 0
+            ki.dwExtraInfo = 0
+            return
+
+        if evento.tipo == EVENTO_BOTAO:
+            flags = FLAGS_BOTOES.get((evento.codigo, evento.pressionado))
+            if flags is None:
+                raise ValueError(f"Botao do mouse nao suportado: {evento.codigo}")
+            dx = dy = 0
+        elif evento.tipo == EVENTO_MOVIMENTO:
+            flags, dx, dy = MOUSEEVENTF_MOVE, evento.dx, evento.dy
+        else:
+            raise ValueError(f"Tipo de evento desconhecido: {evento.tipo}")
+        estrutura.type = INPUT_MOUSE
+        mi = estrutura.mi
+        mi.dx = dx
+        mi.dy = dy
+        mi.mouseData = 0
+        mi.dwFlags = flags
+        mi.time = 0
+        mi.dwExtraInfo = 0
+
+    def enviar(self, eventos: list) -> int:
+        enviados = 0
+        with self.lock:
+            for inicio in range(0, len(eventos), self.capacidade):
+                lote = eventos[inicio:inicio + self.capacidade]
+                for estrutura, evento in zip(self.estruturas, lote):
+                    self.__preencher(estrutura, evento)
+                inseridos = user32.SendInput(len(lote), self.estruturas, self.tamanho_estrutura)
+                enviados += inseridos
+                if inseridos != len(lote):
+                    error_message = f"SendInput inseriu {inseridos} de {len(lote)} eventos (erro {ctypes.get_last_error()})."
+                    self.error_logger.error(error_message)
+                    self.input_logger.error(error_message)
+                    break
+        return enviados
+
+    def posicionar_cursor(self, x: int, y: int) -> None:
+        user32.SetCursorPos(x, y)
+
+    def posicao_cursor(self) -> tuple:
+        with self.lock:
+            user32.GetCursorPos(ctypes.byref(self.cursor))
+            return self.cursor.x, self.cursor.y
+
+    def dimensoes_tela(self) -> tuple:
+        return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
@@ -1,6 +1,75 @@
 import os
+import time
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+class RateLimitFilter(logging.Filter):
+    """
+    Limita quantas mensagens cada ponto do código (arquivo e linha) registra por janela de tempo.
+
+    Mensagens chamadas a cada frame (classificação da mão, leitura de atributos, movimento do mouse)
+    passam no máximo `limite` vezes por `janela` segundos; as excedentes são descartadas antes de
+    qualquer formatação, e a próxima mensagem aceita informa quantas foram suprimidas. Erros sempre passam.
+    """
+
+    def __init__(self, limite: int = 10, janela: float = 1.0):
+        """
+        Args:
+            limite (int): Mensagens aceitas por ponto do código em cada janela.
+            janela (float): Duração da janela, em segundos.
+        """
+        super().__init__()
+        self.limite = limite
+        self.janela = janela
+        self.contagens = {}     # (arquivo, linha) -> [inicio da janela, aceitas, suprimidas]
+        self.suprimidas = 0
+        self.lock = threading.Lock()    # Os loggers são chamados de várias threads (captura, inferência, executores)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR:
+            return True
+
+        agora = time.monotonic()
+        chave = (record.pathname, record.lineno)
+        with self.lock:
+            contagem = self.contagens.get(chave)
+            if contagem is None or agora - contagem[0] >= self.janela:
+                suprimidas = contagem[2] if contagem else 0
+                self.contagens[chave] = [agora, 1, 0]
+            elif contagem[1] < self.limite:
+                contagem[1] += 1
+                return True
+            else:
+                contagem[2] += 1
+                self.suprimidas += 1
+                return False
+
+        if suprimidas:
+            record.msg = f"{record.getMessage()} ({suprimidas} mensagens suprimidas)"
+            record.args = None
+        return True
+
+class _FileRouter(logging.Handler):
+    """
+    Handler da thread de escrita: encaminha cada registro para o arquivo do logger que o gerou.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.arquivos = {}      # nome do logger -> RotatingFileHandler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        handler = self.arquivos.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+
+    def close(self) -> None:
+        for handler in self.arquivos.values():
+            handler.close()
+        super().close()
 
 class Logger:
     """
@@ -9,8 +78,19 @@ class Logger:
     A classe `Logger` fornece métodos estáticos para criar e configurar loggers para diferentes propósitos,
     como logs gerais da aplicação, entradas e erros. Garante que os diretórios necessários para os arquivos de log
     existam e configura os loggers com os níveis e formatos apropriados, incluindo rotação de arquivos de log.
+
+    Os loggers não escrevem em disco na thread que os chama: cada registro é colocado em uma fila e
+    uma única thread de escrita (`QueueListener`) grava os arquivos. Os loggers configurados ficam em
+    cache, então chamar `configure_*_logger` repetidamente é só uma consulta a um dicionário.
     """
 
+    _loggers = {}
+    _lock = threading.Lock()
+    _fila: queue.SimpleQueue = None
+    _roteador: _FileRouter = None
+    _listener: QueueListener = None
+    _direto: bool = False   # Após `encerrar`, os loggers escrevem direto nos arquivos
+
     @staticmethod
     def _ensure_log_dir_exists() -> None:
         """
@@ -22,6 +102,19 @@ class Logger:
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
 
+    @staticmethod
+    def _iniciar_escrita() -> None:
+        """
+        Cria a fila de registros e inicia a thread de escrita na primeira configuração de logger.
+        """
+        if Logger._fila is not None:
+            return
+        Logger._fila = queue.SimpleQueue()
+        Logger._roteador = _FileRouter()
+        Logger._listener = QueueListener(Logger._fila, Logger._roteador)
+        Logger._listener.start()
+        atexit.register(Logger.encerrar)
+
     @staticmethod
     def _configure_logger(name: str, file_name: str) -> logging.Logger:
         """
@@ -34,13 +127,21 @@ class Logger:
         Returns:
             logging.Logger: O logger configurado.
         """
-        Logger._ensure_log_dir_exists()
-        
-        logger = logging.getLogger(name)
-        logger.setLevel(logging.INFO)
-        
-        if not logger.hasHandlers():
-            # Configuração do handler de rotação de arquivos
+        logger = Logger._loggers.get(name)
+        if logger is not None:
+            return logger
+
+        with Logger._lock:
+            if name in Logger._loggers:
+                return Logger._loggers[name]
+
+            Logger._ensure_log_dir_exists()
+            Logger._iniciar_escrita()
+
+            logger = logging.getLogger(name)
+            logger.setLevel(logging.INFO)
+
+            # Configuração do handler de rotação de arquivos, usado só pela thread de escrita
             file_handler = RotatingFileHandler(
                 f'src/data/logs/{file_name}',
                 maxBytes=5 * 1024 * 1024,  # 5 MB por arquivo
@@ -48,9 +149,35 @@ class Logger:
             )
             formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(module)s - %(message)s')
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-        
-        return logger
+            Logger._roteador.arquivos[name] = file_handler
+
+            if not logger.hasHandlers():
+                logger.addHandler(file_handler if Logger._direto else QueueHandler(Logger._fila))
+                logger.addFilter(RateLimitFilter())
+
+            Logger._loggers[name] = logger
+            return logger
+
+    @staticmethod
+    def encerrar() -> None:
+        """
+        Grava os registros pendentes na fila e para a thread de escrita. Chamado na saída do processo.
+
+        Os loggers deixam de usar a fila e passam a escrever direto nos arquivos, na thread que os chama,
+        para que os registros feitos depois do encerramento não se percam nem se acumulem na fila.
+        """
+        with Logger._lock:
+            if Logger._listener is None:
+                return
+            # Troca os handlers antes de parar a thread: o que já está na fila ainda é gravado por ela
+            Logger._direto = True
+            for name, logger in Logger._loggers.items():
+                for handler in list(logger.handlers):
+                    if isinstance(handler, QueueHandler):
+                        logger.removeHandler(handler)
+                logger.addHandler(Logger._roteador.arquivos[name])
+            Logger._listener.stop()
+            Logger._listener = None
 
     @staticmethod
     def configure_application_logger() -> logging.Logger:
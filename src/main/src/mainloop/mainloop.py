@@ -1,22 +1,26 @@
 from src.websockets.data_websocket.data_websocket import DataWebsocketServer
 from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer 
+from src.websockets.landmarks_websocket.landmarks_websocket import LandmarksWebsocketServer
+from src.data.configs.config_router import ConfigRouter
 from src.logger.logger import Logger
 import asyncio
 
 class MainLoop:
-    def __init__(self, data_port: int, frames_port: int):
+    def __init__(self, data_port: int, frames_port: int, landmarks_port: int = None):
         """
-        Inicializa o MainLoop com os servidores WebSocket de dados e frames.
+        Inicializa o MainLoop com os servidores WebSocket de dados, frames e, opcionalmente, landmarks.
 
         Args:
             data_port (int): Porta para o servidor WebSocket de dados.
             frames_port (int): Porta para o servidor WebSocket de frames.
+            landmarks_port (int): Porta para o servidor WebSocket de landmarks. Se não informada, o servidor não é aberto.
         """
         self.logger = Logger.configure_application_logger()
         self.stop_flag = asyncio.Event()  
 
         self.frames_server = FramesWebsocketServer(port=frames_port)
-        self.data_server = DataWebsocketServer(port=data_port, frames_server=self.frames_server)
+        self.landmarks_server = LandmarksWebsocketServer(port=landmarks_port) if landmarks_port else None
+        self.data_server = DataWebsocketServer(port=data_port, frames_server=self.frames_server, landmarks_server=self.landmarks_server)
 
     async def start(self) -> None:
         """
@@ -25,10 +29,10 @@ class MainLoop:
         try:
             self.logger.info("Iniciando os servidores WebSocket...")
 
-            await asyncio.gather(
-                self.frames_server.start(),
-                self.data_server.start(),
-            )
+            servidores = [self.frames_server.start(), self.data_server.start()]
+            if self.landmarks_server:
+                servidores.append(self.landmarks_server.start())
+            await asyncio.gather(*servidores)
         except Exception as e:
             error_message = f"Erro durante a execução dos servidores WebSocket: {e}"
             self.logger.error(error_message)
@@ -44,5 +48,9 @@ class MainLoop:
 
         await self.frames_server.stop()
         await self.data_server.stop()
+        if self.landmarks_server:
+            await self.landmarks_server.stop()
+
+        ConfigRouter.flush()
 
         self.logger.info("MainLoop e servidores parados.")
\ No newline at end of file
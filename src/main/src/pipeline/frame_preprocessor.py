@@ -0,0 +1,66 @@
+import numpy as np
+import cv2
+
+class FramePreprocessor:
+    """
+    Prepara a entrada da detecção de mão: reduz o frame para a resolução de inferência, converte
+    de BGR para RGB e espelha, escrevendo sempre nos mesmos buffers pré-alocados.
+
+    O frame original não é alterado, então continua disponível para a exibição. A imagem devolvida
+    é sobrescrita na próxima chamada: deve ser consumida (o MediaPipe copia a entrada) antes disso.
+    """
+
+    def __init__(self, largura_max: int = 0, espelhar: bool = False):
+        """
+        Args:
+            largura_max (int): Largura máxima da imagem de inferência. 0 mantém a resolução original.
+            espelhar (bool): Espelha a imagem horizontalmente, como a exibição da câmera.
+        """
+        self.largura_max = largura_max
+        self.espelhar = espelhar
+        self.reduzido: np.ndarray = None    # Frame BGR na resolução de inferência
+        self.rgb: np.ndarray = None         # Entrada da detecção (RGB, espelhada)
+        self.alocacoes = 0
+
+    def configurar(self, largura_max: int) -> None:
+        """
+        Troca a resolução de inferência. Os buffers são realocados no próximo frame.
+
+        Args:
+            largura_max (int): Largura máxima da imagem de inferência. 0 mantém a resolução original.
+        """
+        self.largura_max = largura_max
+
+    def preparar(self, frame: cv2.Mat) -> np.ndarray:
+        """
+        Gera a entrada da detecção a partir de um frame BGR.
+
+        Args:
+            frame (cv2.Mat): O frame BGR capturado.
+
+        Returns:
+            np.ndarray: A imagem RGB na resolução de inferência, em um buffer reutilizado.
+        """
+        altura, largura = frame.shape[:2]
+        if 0 < self.largura_max < largura:
+            tamanho = (self.largura_max, max(1, round(altura * self.largura_max / largura)))
+            self.reduzido = self.__buffer(self.reduzido, tamanho)
+            cv2.resize(frame, tamanho, dst=self.reduzido, interpolation=cv2.INTER_LINEAR)
+            frame = self.reduzido
+            altura, largura = frame.shape[:2]
+
+        self.rgb = self.__buffer(self.rgb, (largura, altura))
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.rgb)
+        if self.espelhar:
+            cv2.flip(self.rgb, 1, dst=self.rgb)
+        return self.rgb
+
+    def __buffer(self, buffer: np.ndarray, tamanho: tuple) -> np.ndarray:
+        """
+        Reaproveita o buffer se ele já tiver o tamanho (largura, altura) pedido; senão, aloca outro.
+        """
+        largura, altura = tamanho
+        if buffer is None or buffer.shape[:2] != (altura, largura):
+            buffer = np.empty((altura, largura, 3), dtype=np.uint8)
+            self.alocacoes += 1
+        return buffer
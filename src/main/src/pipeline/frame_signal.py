@@ -0,0 +1,65 @@
+import threading
+import asyncio
+
+class AsyncFrameSignal:
+    """
+    Ponte entre uma thread produtora (ex.: a renderização da `Camera`) e corrotinas no event loop.
+
+    O produtor chama `notificar` a cada item novo; as corrotinas esperam com `aguardar` sem bloquear o
+    event loop e sem consultar o estado em intervalos. O event loop só é acordado, via
+    `call_soon_threadsafe`, quando alguma corrotina está de fato esperando.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.seq = None
+        self.esperas = []   # (loop, future) das corrotinas esperando um item novo
+
+    def notificar(self, seq) -> None:
+        """
+        Avisa que há um item novo. Pode ser chamado de qualquer thread.
+
+        Args:
+            seq: O identificador do item novo (ex.: o número de sequência do frame).
+        """
+        with self.lock:
+            self.seq = seq
+            esperas, self.esperas = self.esperas, []
+        for loop, future in esperas:
+            try:
+                loop.call_soon_threadsafe(AsyncFrameSignal.__resolver, future, seq)
+            except RuntimeError:
+                pass  # O event loop da corrotina já foi encerrado
+
+    @staticmethod
+    def __resolver(future: asyncio.Future, seq) -> None:
+        if not future.done():
+            future.set_result(seq)
+
+    async def aguardar(self, ultimo_seq, timeout: float = None):
+        """
+        Espera um item diferente de `ultimo_seq`.
+
+        Args:
+            ultimo_seq: O identificador do último item já processado pelo consumidor.
+            timeout (float): Tempo máximo de espera, em segundos.
+
+        Returns:
+            O identificador do item mais recente, ou `ultimo_seq` se o tempo acabar.
+        """
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            if self.seq is not None and self.seq != ultimo_seq:
+                return self.seq
+            future = loop.create_future()
+            espera = (loop, future)
+            self.esperas.append(espera)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return ultimo_seq
+        finally:
+            with self.lock:
+                if espera in self.esperas:
+                    self.esperas.remove(espera)
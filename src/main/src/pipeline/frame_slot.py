@@ -0,0 +1,67 @@
+import threading
+
+class FrameSlot:
+    """
+    Canal de tamanho 1 entre dois estágios do pipeline: o produtor sempre sobrescreve o item anterior,
+    e o consumidor sempre recebe o item mais recente.
+
+    Cada item publicado recebe um número de sequência. O consumidor informa o último número que já
+    processou, e a diferença indica quantos itens foram sobrescritos sem serem lidos.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.item = None
+        self.seq = 0
+        self.fechado = False
+
+    def publicar(self, item) -> int:
+        """
+        Publica um item, substituindo o anterior.
+
+        Args:
+            item: O item publicado.
+
+        Returns:
+            int: O número de sequência do item.
+        """
+        with self.condition:
+            self.seq += 1
+            self.item = item
+            self.condition.notify_all()
+            return self.seq
+
+    def aguardar(self, ultimo_seq: int, timeout: float = None) -> tuple:
+        """
+        Espera um item mais novo que `ultimo_seq`.
+
+        Args:
+            ultimo_seq (int): O número de sequência do último item processado pelo consumidor.
+            timeout (float): Tempo máximo de espera, em segundos.
+
+        Returns:
+            tuple: (seq, item) do item mais recente, ou (ultimo_seq, None) se o tempo acabar ou o canal for fechado.
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.seq > ultimo_seq or self.fechado, timeout)
+            if self.seq <= ultimo_seq:
+                return ultimo_seq, None
+            return self.seq, self.item
+
+    def fechar(self) -> None:
+        """
+        Fecha o canal, liberando os consumidores que estão esperando.
+        """
+        with self.condition:
+            self.fechado = True
+            self.condition.notify_all()
+
+    def reabrir(self) -> None:
+        """
+        Reabre o canal, descarta o item atual e recomeça a sequência, para que os consumidores
+        de uma nova execução comecem de `ultimo_seq = 0`.
+        """
+        with self.condition:
+            self.fechado = False
+            self.item = None
+            self.seq = 0
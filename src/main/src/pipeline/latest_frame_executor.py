@@ -0,0 +1,140 @@
+from src.pipeline.metrics import RollingStats
+from src.logger.logger import Logger
+from collections import deque
+import threading
+import time
+
+class LatestFrameExecutor:
+    """
+    Executor com um número fixo de threads e uma fila de tamanho 1 por chave ("o frame mais recente vence").
+
+    Cada chave (ex.: a mão) tem no máximo uma tarefa em execução e uma pendente. Uma tarefa enviada
+    enquanto outra da mesma chave ainda está pendente a substitui, e a antiga é contada como descartada:
+    frames atrasados nunca se acumulam, e as tarefas de uma mesma chave executam em ordem.
+    """
+
+    def __init__(self, max_workers: int = 2, nome: str = "executor"):
+        """
+        Args:
+            max_workers (int): Quantidade de threads de trabalho.
+            nome (str): Nome usado nas threads e nos logs.
+        """
+        self.nome = nome
+        self.logger = Logger.configure_application_logger()
+        self.error_logger = Logger.configure_error_logger()
+
+        self.condition = threading.Condition()
+        self.pendentes = {}         # chave -> (funcao, args, instante do envio)
+        self.em_execucao = set()    # chaves com uma tarefa em execução
+        self.prontas = deque()      # chaves com tarefa pendente e sem tarefa em execução
+        self.encerrado = False
+
+        self.submetidos = 0
+        self.descartados = 0
+        self.executados = 0
+        self.erros = 0
+        self.latencia_ms = RollingStats()   # Do envio até o fim da execução
+        self.execucao_ms = RollingStats()   # Apenas a execução
+
+        self.workers = [
+            threading.Thread(target=self.__worker, name=f"{nome}-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, chave, funcao, *args) -> bool:
+        """
+        Agenda a execução de `funcao(*args)` para a chave, substituindo a tarefa pendente da mesma chave.
+
+        Args:
+            chave: A chave da fila (ex.: "Right" ou "Left").
+            funcao: A função a ser executada.
+            *args: Os argumentos da função.
+
+        Returns:
+            bool: True se uma tarefa pendente foi descartada, False caso contrário.
+        """
+        with self.condition:
+            if self.encerrado:
+                return False
+
+            descartou = chave in self.pendentes
+            self.pendentes[chave] = (funcao, args, time.perf_counter())
+            self.submetidos += 1
+            if descartou:
+                self.descartados += 1
+            elif chave not in self.em_execucao:
+                self.prontas.append(chave)
+                self.condition.notify()
+            return descartou
+
+    def __worker(self) -> None:
+        """
+        Loop das threads de trabalho: executa a tarefa pendente de cada chave pronta.
+        """
+        while True:
+            with self.condition:
+                while not self.prontas and not self.encerrado:
+                    self.condition.wait()
+                if not self.prontas:
+                    return
+                chave = self.prontas.popleft()
+                funcao, args, enviado = self.pendentes.pop(chave)
+                self.em_execucao.add(chave)
+
+            inicio = time.perf_counter()
+            erro = False
+            try:
+                funcao(*args)
+            except Exception as e:
+                erro = True
+                self.error_logger.error(f"Erro na tarefa '{chave}' do {self.nome}: {e}")
+            fim = time.perf_counter()
+
+            self.execucao_ms.adicionar((fim - inicio) * 1000)
+            self.latencia_ms.adicionar((fim - enviado) * 1000)
+
+            with self.condition:
+                self.executados += 1
+                self.erros += erro
+                self.em_execucao.discard(chave)
+                if chave in self.pendentes:
+                    self.prontas.append(chave)
+                    self.condition.notify()
+
+    def metricas(self) -> dict:
+        """
+        Retorna as métricas do executor.
+
+        Returns:
+            dict: Contadores, profundidade atual da fila e latências (ms) de envio até o fim e de execução.
+        """
+        with self.condition:
+            contadores = {
+                "submetidos": self.submetidos,
+                "descartados": self.descartados,
+                "executados": self.executados,
+                "erros": self.erros,
+                "fila": len(self.pendentes),
+                "em_execucao": len(self.em_execucao),
+            }
+        contadores["latencia_ms"] = self.latencia_ms.resumo()
+        contadores["execucao_ms"] = self.execucao_ms.resumo()
+        return contadores
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Encerra o executor. As tarefas já pendentes ainda são executadas.
+
+        Args:
+            wait (bool): Espera as threads de trabalho terminarem.
+        """
+        with self.condition:
+            self.encerrado = True
+            self.condition.notify_all()
+        if wait:
+            for worker in self.workers:
+                if worker is not threading.current_thread():
+                    worker.join()
+        self.logger.info(f"{self.nome} encerrado: {self.metricas()}")
@@ -0,0 +1,133 @@
+import numpy as np
+import threading
+import time
+import os
+import re
+
+class RollingStats:
+    """
+    Estatísticas de uma janela com as últimas amostras de uma medida (ex.: latência em milissegundos).
+
+    As amostras ficam em um buffer circular de tamanho fixo; o resumo é calculado sob demanda.
+    O instante de cada amostra também é guardado, para medir a taxa (amostras por segundo) da janela.
+    """
+
+    def __init__(self, capacidade: int = 512):
+        """
+        Args:
+            capacidade (int): Quantidade de amostras recentes consideradas no resumo.
+        """
+        self.amostras = np.zeros(capacidade, dtype=np.float64)
+        self.instantes = np.zeros(capacidade, dtype=np.float64)
+        self.total = 0
+        self.lock = threading.Lock()
+
+    def adicionar(self, valor: float) -> None:
+        """
+        Adiciona uma amostra, sobrescrevendo a mais antiga se a janela estiver cheia.
+        """
+        agora = time.perf_counter()
+        with self.lock:
+            posicao = self.total % len(self.amostras)
+            self.amostras[posicao] = valor
+            self.instantes[posicao] = agora
+            self.total += 1
+
+    def resumo(self) -> dict:
+        """
+        Retorna o resumo das amostras da janela.
+
+        Returns:
+            dict: `total` (amostras desde o início), `media`, `p50`, `p95`, `p99` e `max` da janela,
+            e `fps` (amostras por segundo na janela).
+        """
+        with self.lock:
+            total = self.total
+            tamanho = min(total, len(self.amostras))
+            janela = self.amostras[:tamanho].copy()
+            primeiro = self.instantes[total % len(self.amostras) if total > tamanho else 0]
+            ultimo = self.instantes[(total - 1) % len(self.amostras)] if total else 0.0
+
+        if len(janela) == 0:
+            return {"total": 0, "media": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0, "fps": 0.0}
+
+        p50, p95, p99 = np.percentile(janela, [50, 95, 99]).tolist()
+        return {
+            "total": total,
+            "media": float(janela.mean()),
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "max": float(janela.max()),
+            "fps": float((len(janela) - 1) / (ultimo - primeiro)) if ultimo > primeiro else 0.0,
+        }
+
+class PrometheusText:
+    """
+    Converte as métricas do pipeline (dicionários aninhados) para o formato de texto do Prometheus.
+
+    Cada valor numérico vira uma métrica com o caminho das chaves no nome (ex.: `camera_frames_descartados_render`).
+    Os percentis de um resumo do `RollingStats` viram o rótulo `quantile`, e chaves que não são
+    identificadores (ex.: o endereço de um cliente) viram o rótulo `chave`.
+    """
+
+    QUANTIS = {"p50": "0.5", "p95": "0.95", "p99": "0.99"}
+
+    @staticmethod
+    def formatar(metricas: dict, prefixo: str = "librascontroller") -> str:
+        """
+        Args:
+            metricas (dict): As métricas.
+            prefixo (str): O prefixo do nome de todas as métricas.
+
+        Returns:
+            str: As métricas no formato de texto do Prometheus.
+        """
+        linhas = []
+        PrometheusText.__percorrer(metricas, prefixo, {}, linhas)
+        return "\n".join(linhas) + "\n"
+
+    @staticmethod
+    def salvar(metricas: dict, caminho: str, prefixo: str = "librascontroller") -> None:
+        """
+        Grava as métricas em um arquivo de texto do Prometheus (ex.: para o textfile collector do
+        node_exporter). O arquivo é substituído de uma vez, então um leitor nunca o vê pela metade.
+
+        Args:
+            metricas (dict): As métricas.
+            caminho (str): O arquivo de destino.
+            prefixo (str): O prefixo do nome de todas as métricas.
+        """
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        temporario = f"{caminho}.tmp"
+        with open(temporario, "w") as file:
+            file.write(PrometheusText.formatar(metricas, prefixo))
+        os.replace(temporario, caminho)
+
+    @staticmethod
+    def __rotulos(rotulos: dict) -> str:
+        if not rotulos:
+            return ""
+        escapados = {chave: str(valor).replace("\\", "\\\\").replace('"', '\\"') for chave, valor in rotulos.items()}
+        return "{" + ",".join(f'{chave}="{valor}"' for chave, valor in escapados.items()) + "}"
+
+    @staticmethod
+    def __percorrer(valor, nome: str, rotulos: dict, linhas: list) -> None:
+        if isinstance(valor, bool):
+            valor = int(valor)
+        if isinstance(valor, (int, float)):
+            linhas.append(f"{nome}{PrometheusText.__rotulos(rotulos)} {valor if isinstance(valor, int) else repr(float(valor))}")
+            return
+        if not isinstance(valor, dict):
+            return  # Textos (ex.: o formato de um cliente) não são métricas
+
+        for chave, filho in valor.items():
+            chave = str(chave)
+            if chave in PrometheusText.QUANTIS and isinstance(filho, (int, float)):
+                PrometheusText.__percorrer(filho, nome, {**rotulos, "quantile": PrometheusText.QUANTIS[chave]}, linhas)
+            elif re.fullmatch(r"[a-zA-Z_][a-zA-Z0-9_]*", chave):
+                PrometheusText.__percorrer(filho, f"{nome}_{chave}", rotulos, linhas)
+            else:
+                PrometheusText.__percorrer(filho, nome, {**rotulos, "chave": chave}, linhas)
@@ -0,0 +1,137 @@
+from src.telemetry.telemetry_recorder import CABECALHO, EVENTO, MAGICO, VERSAO, TIPO_FRAME, TIPO_GESTO, MAOS, FLAG_INFERIDO, FLAG_INPUT
+from typing import NamedTuple
+import numpy as np
+
+class GestureSegment(NamedTuple):
+    """
+    Um trecho da linha do tempo em que uma mão manteve o mesmo gesto.
+    """
+    mao: str
+    gesto: str          # Vazio enquanto nenhum gesto é reconhecido
+    inicio: float       # Instante (segundos desde a época) do primeiro frame do trecho
+    fim: float          # Instante do último frame do trecho
+    frames: int
+    inputs: int         # Frames do trecho que dispararam um input
+
+class TelemetryReader:
+    """
+    Leitura e análise de um arquivo de telemetria gravado pelo `TelemetryRecorder`.
+
+    Os eventos são carregados em um array estruturado (`EVENTO`), em ordem cronológica, e todas as
+    análises são vetorizadas: horas de operação (milhões de eventos) são processadas em segundos.
+    """
+
+    def __init__(self, caminho: str):
+        """
+        Carrega os eventos do arquivo. O arquivo pode estar sendo gravado: são lidos os eventos
+        completos até o momento da leitura.
+
+        Args:
+            caminho (str): O arquivo da telemetria.
+
+        Raises:
+            ValueError: Se o arquivo não for um arquivo de telemetria deste formato.
+        """
+        cabecalho = np.fromfile(caminho, dtype=CABECALHO, count=1)
+        if len(cabecalho) == 0 or cabecalho[0]["magico"] != MAGICO:
+            raise ValueError(f"Arquivo de telemetria invalido: {caminho}")
+        cabecalho = cabecalho[0]
+        if cabecalho["versao"] != VERSAO or cabecalho["tamanho_evento"] != EVENTO.itemsize:
+            raise ValueError(f"Versao de telemetria nao suportada em {caminho}: {cabecalho['versao']}")
+
+        capacidade, escritos = int(cabecalho["capacidade"]), int(cabecalho["escritos"])
+        anel = np.memmap(caminho, dtype=EVENTO, mode="r", offset=CABECALHO.itemsize, shape=(capacidade,))
+        if escritos <= capacidade:
+            eventos = np.array(anel[:escritos])
+        else:
+            posicao = escritos % capacidade
+            eventos = np.concatenate((anel[posicao:], anel[:posicao]))
+        del anel
+
+        self.caminho = caminho
+        self.escritos = escritos
+        self.sobrescritos = max(0, escritos - capacidade)
+        self.eventos = eventos
+
+    def frames(self) -> np.ndarray:
+        """
+        Retorna os eventos de frame (um por frame que passou pela inferência).
+        """
+        return self.eventos[self.eventos["tipo"] == TIPO_FRAME]
+
+    def gestos(self, mao: str = None) -> np.ndarray:
+        """
+        Retorna os eventos de interpretação, de todas as mãos ou só de `mao` ("Right" ou "Left").
+        """
+        eventos = self.eventos[self.eventos["tipo"] == TIPO_GESTO]
+        if mao is not None:
+            eventos = eventos[eventos["mao"] == MAOS[mao]]
+        return eventos
+
+    @staticmethod
+    def histograma(valores: np.ndarray, limites: tuple = (5, 10, 20, 33, 50, 100, 200)) -> list:
+        """
+        Conta os valores em faixas.
+
+        Args:
+            valores (np.ndarray): Os valores (ms).
+            limites (tuple): Os limites superiores das faixas; a última faixa não tem limite.
+
+        Returns:
+            list: Tuplas (limite inferior, limite superior ou None, quantidade).
+        """
+        bordas = (0,) + tuple(limites)
+        contagem = np.bincount(np.searchsorted(np.asarray(limites), valores, side="right"), minlength=len(bordas))
+        return [(bordas[i], limites[i] if i < len(limites) else None, int(contagem[i])) for i in range(len(bordas))]
+
+    @staticmethod
+    def percentis(valores: np.ndarray) -> dict:
+        """
+        Retorna `total`, `media`, `p50`, `p95`, `p99` e `max` dos valores.
+        """
+        if len(valores) == 0:
+            return {"total": 0, "media": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        p50, p95, p99 = np.percentile(valores, [50, 95, 99]).tolist()
+        return {"total": len(valores), "media": float(valores.mean()), "p50": p50, "p95": p95, "p99": p99, "max": float(valores.max())}
+
+    def latencias(self) -> dict:
+        """
+        Resume as latências gravadas.
+
+        Returns:
+            dict: Percentis do tempo de detecção (frames inferidos), da captura até os landmarks e da captura até o gesto.
+        """
+        frames = self.frames()
+        inferidos = frames[(frames["flags"] & FLAG_INFERIDO) != 0]
+        return {
+            "inferencia_ms": self.percentis(inferidos["inferencia_ms"]),
+            "captura_ate_landmarks_ms": self.percentis(frames["latencia_ms"]),
+            "captura_ate_gesto_ms": self.percentis(self.gestos()["latencia_ms"]),
+        }
+
+    def linha_do_tempo(self, mao: str, intervalo_max: float = 0.5) -> list:
+        """
+        Agrupa os eventos de interpretação de uma mão em trechos com o mesmo gesto.
+
+        Args:
+            mao (str): A mão ("Right" ou "Left").
+            intervalo_max (float): Intervalo (s) sem eventos a partir do qual o trecho é encerrado (a mão saiu da imagem).
+
+        Returns:
+            list[GestureSegment]: Os trechos, em ordem cronológica.
+        """
+        eventos = self.gestos(mao)
+        if len(eventos) == 0:
+            return []
+        eventos = eventos[np.argsort(eventos["instante"], kind="stable")]
+        instantes, nomes = eventos["instante"], eventos["gesto"]
+
+        quebras = np.flatnonzero((nomes[1:] != nomes[:-1]) | (np.diff(instantes) > intervalo_max)) + 1
+        inicios = np.concatenate(([0], quebras))
+        fins = np.concatenate((quebras, [len(eventos)]))
+        inputs = np.concatenate(([0], np.cumsum((eventos["flags"] & FLAG_INPUT) != 0)))
+
+        return [
+            GestureSegment(mao, nomes[i].decode("utf-8", "replace"), float(instantes[i]), float(instantes[j - 1]), int(j - i), int(inputs[j] - inputs[i]))
+            for i, j in zip(inicios.tolist(), fins.tolist())
+        ]
@@ -0,0 +1,163 @@
+import numpy as np
+import threading
+import mmap
+import time
+import os
+
+MAGICO = b"LCTELEM1"
+VERSAO = 1
+
+# Cabeçalho do arquivo (64 bytes): `escritos` conta todos os eventos já gravados, inclusive os sobrescritos
+CABECALHO = np.dtype([
+    ("magico", "S8"),
+    ("versao", "<u4"),
+    ("tamanho_evento", "<u4"),
+    ("capacidade", "<u8"),
+    ("escritos", "<u8"),
+    ("reservado", "V32"),
+])
+
+# Um evento do pipeline (48 bytes)
+EVENTO = np.dtype([
+    ("instante", "<f8"),        # Instante da captura do frame, em segundos desde a época
+    ("seq", "<u4"),             # Sequência da captura
+    ("tipo", "u1"),             # TIPO_FRAME ou TIPO_GESTO
+    ("mao", "u1"),              # MAO_NENHUMA, MAO_DIREITA ou MAO_ESQUERDA
+    ("maos", "u1"),             # Mãos detectadas no frame
+    ("flags", "u1"),            # FLAG_*
+    ("inferencia_ms", "<f4"),   # Tempo da detecção de mão (0 nos frames estimados)
+    ("latencia_ms", "<f4"),     # Da captura até os landmarks (frame) ou até o gesto reconhecido (gesto)
+    ("features", "<u8"),        # Máscara de bits das features (GestureMatcher.codificar_features)
+    ("gesto", "S16"),           # Gesto reconhecido, vazio se nenhum
+])
+
+TIPO_FRAME = 0
+TIPO_GESTO = 1
+
+MAO_NENHUMA = 0
+MAO_DIREITA = 1
+MAO_ESQUERDA = 2
+MAOS = {"Right": MAO_DIREITA, "Left": MAO_ESQUERDA}
+
+FLAG_INFERIDO = 1       # A detecção rodou no frame (senão, os landmarks foram estimados)
+FLAG_RECONHECIDO = 2    # Algum gesto foi reconhecido
+FLAG_INPUT = 4          # O gesto disparou um input (tecla, clique ou mouse_tracking)
+
+class TelemetryRecorder:
+    """
+    Grava os eventos de cada frame do pipeline em um arquivo circular mapeado em memória.
+
+    Cada evento é um registro de tamanho fixo (`EVENTO`) escrito direto no mapeamento, sem formatação
+    de texto nem chamada de sistema: o sistema operacional grava as páginas no disco em segundo plano.
+    Quando o arquivo enche, os eventos mais antigos são sobrescritos. Um arquivo existente com o
+    mesmo formato é continuado, não apagado. Pode ser usado de várias threads.
+    """
+
+    def __init__(self, caminho: str, capacidade: int = 1 << 20):
+        """
+        Args:
+            caminho (str): O arquivo da telemetria.
+            capacidade (int): Quantidade de eventos guardados (48 bytes cada). O padrão cobre algumas
+                horas de operação a 30 fps.
+
+        Raises:
+            ValueError: Se o arquivo já existir e não for um arquivo de telemetria (ele não é sobrescrito).
+        """
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+
+        self.caminho = caminho
+        self.lock = threading.Lock()
+        self.origem = time.time() - time.perf_counter()     # Converte instantes do perf_counter para a época
+
+        tamanho = CABECALHO.itemsize + capacidade * EVENTO.itemsize
+        existente = TelemetryRecorder.__ler_cabecalho(caminho)
+        if existente is None and os.path.isfile(caminho) and os.path.getsize(caminho) > 0:
+            raise ValueError(f"O arquivo {caminho} existe e nao eh um arquivo de telemetria.")
+        continuar = existente is not None and int(existente["capacidade"]) == capacidade
+
+        self.file = open(caminho, "r+b" if continuar else "w+b")
+        self.file.truncate(tamanho)
+        self.mapa = mmap.mmap(self.file.fileno(), tamanho)
+        self.cabecalho = np.ndarray((), dtype=CABECALHO, buffer=self.mapa)
+        self.eventos = np.ndarray((capacidade,), dtype=EVENTO, buffer=self.mapa, offset=CABECALHO.itemsize)
+        if not continuar:
+            self.cabecalho[()] = (MAGICO, VERSAO, EVENTO.itemsize, capacidade, 0, b"")
+
+        self.capacidade = capacidade
+        self.escritos = int(self.cabecalho["escritos"])
+
+    @staticmethod
+    def __ler_cabecalho(caminho: str):
+        """
+        Lê o cabeçalho de um arquivo de telemetria existente, ou None se não existir ou tiver outro formato.
+        """
+        try:
+            cabecalho = np.fromfile(caminho, dtype=CABECALHO, count=1)
+        except (OSError, ValueError):
+            return None
+        if len(cabecalho) == 0:
+            return None
+        cabecalho = cabecalho[0]
+        if cabecalho["magico"] != MAGICO or cabecalho["versao"] != VERSAO or cabecalho["tamanho_evento"] != EVENTO.itemsize:
+            return None
+        return cabecalho
+
+    def __gravar(self, evento: tuple) -> None:
+        """
+        Grava um evento na próxima posição do anel e só depois o conta no cabeçalho,
+        para que um leitor nunca veja um evento pela metade.
+        """
+        with self.lock:
+            if self.eventos is None:
+                return
+            self.eventos[self.escritos % self.capacidade] = evento
+            self.escritos += 1
+            self.cabecalho["escritos"] = self.escritos
+
+    def registrar_frame(self, seq: int, capturado: float, maos: int, inferido: bool, inferencia_ms: float, latencia_ms: float) -> None:
+        """
+        Registra um frame que passou pelo estágio de inferência.
+
+        Args:
+            seq (int): A sequência da captura.
+            capturado (float): O instante da captura (`time.perf_counter()`).
+            maos (int): Quantidade de mãos detectadas.
+            inferido (bool): Se a detecção rodou no frame (False quando os landmarks foram estimados).
+            inferencia_ms (float): O tempo da detecção.
+            latencia_ms (float): O tempo da captura até os landmarks.
+        """
+        flags = FLAG_INFERIDO if inferido else 0
+        self.__gravar((capturado + self.origem, seq, TIPO_FRAME, MAO_NENHUMA, maos, flags, inferencia_ms, latencia_ms, 0, b""))
+
+    def registrar_gesto(self, seq: int, capturado: float, mao: str, features: int, gesto: str, input_disparado: bool) -> None:
+        """
+        Registra o resultado da interpretação de uma mão.
+
+        Args:
+            seq (int): A sequência da captura do frame interpretado.
+            capturado (float): O instante da captura (`time.perf_counter()`).
+            mao (str): A mão interpretada ("Right" ou "Left").
+            features (int): A máscara de bits das features do frame.
+            gesto (str): O gesto reconhecido, ou None.
+            input_disparado (bool): Se o gesto disparou um input.
+        """
+        flags = (FLAG_RECONHECIDO if gesto else 0) | (FLAG_INPUT if input_disparado else 0)
+        latencia_ms = (time.perf_counter() - capturado) * 1000
+        # Nomes longos são cortados em um limite de caractere, para não gravar um caractere UTF-8 pela metade
+        nome = gesto.encode("utf-8")[:EVENTO["gesto"].itemsize].decode("utf-8", "ignore").encode("utf-8") if gesto else b""
+        self.__gravar((capturado + self.origem, seq, TIPO_GESTO, MAOS.get(mao, MAO_NENHUMA), 0, flags, 0.0, latencia_ms, features, nome))
+
+    def fechar(self) -> None:
+        """
+        Grava as páginas pendentes e fecha o arquivo. Eventos registrados depois disso são ignorados.
+        """
+        with self.lock:
+            if self.eventos is None:
+                return
+            self.eventos = None
+            self.cabecalho = None
+            self.mapa.flush()
+            self.mapa.close()
+            self.file.close()
@@ -1,19 +1,32 @@
 from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+from src.websockets.landmarks_websocket.landmarks_websocket import LandmarksWebsocketServer
 from src.data.gestures.data_libras_gestures import DataLibrasGestures
 from src.data.gestures.data_custom_gestures import DataCustomGestures 
 from src.data.binds.data_binds_salvas import DataBindsSalvas
 from src.data.configs.config_router import ConfigRouter
 from src.camera.camera_stream import CameraStream
 from src.websockets.websocket import WebSocket
-from src.camera.camera_manager import Camera
+from src.camera.frame_source import CameraSource
+from src.camera.stream_profile import StreamProfile
+from src.gestures.inference_stride import InferenceStrideConfig
+from src.pipeline.metrics import PrometheusText
+import asyncio
+import time
+import os
+import re
+
+# Pastas dos arquivos pedidos pelos clientes: o cliente escolhe no máximo o nome do arquivo
+PASTA_TELEMETRIA = "src/data/telemetry"
+PASTA_GRAVACOES = "src/data/recordings"
+PASTA_METRICAS = "src/data/metrics"
 
 class DataWebsocketServer(WebSocket):
-    def __init__(self, port: int, frames_server: FramesWebsocketServer):
+    def __init__(self, port: int, frames_server: FramesWebsocketServer, landmarks_server: LandmarksWebsocketServer = None):
         super().__init__(port)
         self.data_gestos = self.load_data_gestos() # Nome dos gestos
         self.data_binds = self.load_data_binds() # Atributos dos gestos (bind, toggle, tempo pressionado, customizable)
         self.config = ConfigRouter()
-        self.camera_stream = CameraStream(frames_server) 
+        self.camera_stream = CameraStream(frames_server, landmarks_server=landmarks_server)
 
     def load_data_gestos(self) -> dict:
         gestos_custom = DataCustomGestures().get_gestos()
@@ -24,6 +37,32 @@ class DataWebsocketServer(WebSocket):
         data_libras = DataBindsSalvas().get_all_binds()
         return data_libras
 
+    @staticmethod
+    def resolver_arquivo(valor, pasta: str, padrao: str) -> str:
+        """
+        Resolve o arquivo pedido por um cliente dentro de uma pasta fixa do servidor.
+
+        Args:
+            valor: O valor da mensagem: um booleano (usa o nome padrão) ou o nome do arquivo. De um
+                caminho, só o nome (`os.path.basename`) é usado.
+            pasta (str): A pasta onde o arquivo fica.
+            padrao (str): O nome usado quando o cliente não informa um.
+
+        Returns:
+            str: O caminho do arquivo dentro de `pasta`.
+
+        Raises:
+            ValueError: Se o valor não for um booleano nem um nome de arquivo válido.
+        """
+        if isinstance(valor, bool) or valor is None or valor == "":
+            return os.path.join(pasta, padrao)
+        if not isinstance(valor, str):
+            raise ValueError(f"Nome de arquivo invalido: {valor!r}")
+        nome = os.path.basename(valor)
+        if not re.fullmatch(r"[A-Za-z0-9_-][A-Za-z0-9_.-]*", nome):
+            raise ValueError(f"Nome de arquivo invalido: {valor!r}")
+        return os.path.join(pasta, nome)
+
     async def handle_message(self, websocket, message) -> None:
         try:
             if isinstance(message, dict):
@@ -71,6 +110,72 @@ class DataWebsocketServer(WebSocket):
                     await self.send_data(websocket, {"status": "success", "message": msg})  
                     return
 
+                if "START_ROI_INFERENCE" in message:
+                    msg = "Iniciando a deteccao na regiao das maos."
+                    self.logger.info(msg)
+                    # Criar as instâncias do MediaPipe carrega os modelos: roda fora do event loop
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(None, self.camera_stream.camera_capture.gesture_reader.iniciar_modo_roi)
+                    await self.send_data(websocket, {"status": "success", "message": msg})
+                    return
+
+                if "STOP_ROI_INFERENCE" in message:
+                    msg = "Encerrando a deteccao na regiao das maos."
+                    self.logger.info(msg)
+                    self.camera_stream.camera_capture.gesture_reader.parar_modo_roi()
+                    await self.send_data(websocket, {"status": "success", "message": msg})
+                    return
+
+                if "START_LANDMARK_RECORDING" in message:
+                    if not self.camera_stream.camera_capture:
+                        await self.send_data(websocket, {"error": "Nao existe um processo de deteccao ativo no momento, envie 'START_DETECTION' antes de fazer esta requisição."})
+                        return
+                    try:
+                        caminho = self.resolver_arquivo(message["START_LANDMARK_RECORDING"], PASTA_GRAVACOES, f"landmarks_{int(time.time())}.jsonl")
+                    except ValueError as e:
+                        await self.send_data(websocket, {"error": f"Nao foi possivel iniciar a gravacao: {e}"})
+                        return
+                    self.camera_stream.camera_capture.gesture_reader.iniciar_gravacao(caminho)
+                    msg = f"Gravando landmarks em: {caminho}"
+                    self.logger.info(msg)
+                    await self.send_data(websocket, {"status": "success", "message": msg})
+                    return
+
+                if "STOP_LANDMARK_RECORDING" in message:
+                    msg = "Encerrando a gravacao de landmarks."
+                    self.logger.info(msg)
+                    if not self.camera_stream.camera_capture:
+                        await self.send_data(websocket, {"error": "Nao existe um processo de deteccao ativo no momento."})
+                        return
+                    self.camera_stream.camera_capture.gesture_reader.parar_gravacao()
+                    await self.send_data(websocket, {"status": "success", "message": msg})
+                    return
+
+                if "START_TELEMETRY" in message:
+                    if not self.camera_stream.camera_capture:
+                        await self.send_data(websocket, {"error": "Nao existe um processo de deteccao ativo no momento, envie 'START_DETECTION' antes de fazer esta requisição."})
+                        return
+                    try:
+                        caminho = self.resolver_arquivo(message["START_TELEMETRY"], PASTA_TELEMETRIA, f"telemetria_{int(time.time())}.bin")
+                        self.camera_stream.camera_capture.iniciar_telemetria(caminho)
+                    except ValueError as e:
+                        await self.send_data(websocket, {"error": f"Nao foi possivel iniciar a telemetria: {e}"})
+                        return
+                    msg = f"Gravando telemetria em: {caminho}"
+                    self.logger.info(msg)
+                    await self.send_data(websocket, {"status": "success", "message": msg})
+                    return
+
+                if "STOP_TELEMETRY" in message:
+                    msg = "Encerrando a telemetria."
+                    self.logger.info(msg)
+                    if not self.camera_stream.camera_capture:
+                        await self.send_data(websocket, {"error": "Nao existe um processo de deteccao ativo no momento."})
+                        return
+                    self.camera_stream.camera_capture.parar_telemetria()
+                    await self.send_data(websocket, {"status": "success", "message": msg})
+                    return
+
                 if "GET_ALL_GESTOS" in message:
                     self.data_logger.info("Retornando todos os gestos.")
                     await self.send_data(websocket, {"allGestos": self.data_binds})
@@ -122,10 +227,61 @@ class DataWebsocketServer(WebSocket):
                     await self.send_data(websocket, {"cameraSelecionada": camera})
                     return
 
+                if "SET_STREAM_PROFILE" in message:
+                    atual = self.config.read_atribute("stream_profile") or {}
+                    try:
+                        profile = StreamProfile.from_config({**atual, **message["SET_STREAM_PROFILE"]})
+                    except (ValueError, TypeError) as e:
+                        await self.send_data(websocket, {"error": f"Perfil de stream invalido: {e}"})
+                        return
+                    self.config.update_atribute("stream_profile", profile._asdict())
+                    msg = f"Perfil de stream atualizado: {profile._asdict()}"
+                    self.data_logger.info(msg)
+                    await self.send_data(websocket, {"status": "success", "message": msg})
+                    return
+
+                if "GET_STREAM_PROFILE" in message:
+                    profile = StreamProfile.from_config(self.config.read_atribute("stream_profile"))
+                    self.data_logger.info(f"Retornando o perfil de stream: {profile._asdict()}")
+                    await self.send_data(websocket, {"streamProfile": profile._asdict()})
+                    return
+
+                if "SET_INFERENCE_STRIDE" in message:
+                    atual = self.config.read_atribute("inference_stride") or {}
+                    try:
+                        config = InferenceStrideConfig.from_config({**atual, **message["SET_INFERENCE_STRIDE"]})
+                    except (ValueError, TypeError) as e:
+                        await self.send_data(websocket, {"error": f"Intervalo de inferencia invalido: {e}"})
+                        return
+                    self.config.update_atribute("inference_stride", config._asdict())
+                    msg = f"Intervalo de inferencia atualizado: {config._asdict()}"
+                    self.data_logger.info(msg)
+                    await self.send_data(websocket, {"status": "success", "message": msg})
+                    return
+
+                if "GET_INFERENCE_STRIDE" in message:
+                    config = InferenceStrideConfig.from_config(self.config.read_atribute("inference_stride"))
+                    self.data_logger.info(f"Retornando o intervalo de inferencia: {config._asdict()}")
+                    await self.send_data(websocket, {"inferenceStride": config._asdict()})
+                    return
+
+                if "GET_METRICS" in message:
+                    metricas = self.camera_stream.get_metricas()
+                    arquivo = message["GET_METRICS"]
+                    if isinstance(arquivo, str) and arquivo:
+                        try:
+                            caminho = self.resolver_arquivo(arquivo, PASTA_METRICAS, "librascontroller.prom")
+                        except ValueError as e:
+                            await self.send_data(websocket, {"error": f"Nao foi possivel salvar as metricas: {e}"})
+                            return
+                        PrometheusText.salvar(metricas, caminho)
+                        self.data_logger.info(f"Metricas salvas em: {caminho}")
+                    await self.send_data(websocket, {"metrics": metricas})
+                    return
+
                 if "GET_CAMERAS_DISPONIVEIS" in message:
                     self.data_logger.info("Retornando cameras disponiveis.")
-                    camera_manager = Camera()
-                    cameras = camera_manager.list_cameras()
+                    cameras = CameraSource.listar_cameras()
                     if cameras: await self.send_data(websocket, {"camerasDisponiveis": cameras})
                     else: await self.send_data(websocket, {"error": "Nao foi possivel retornar as cameras disponiveis."})
                     return
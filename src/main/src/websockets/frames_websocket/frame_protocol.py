@@ -0,0 +1,118 @@
+import base64
+import struct
+import json
+import cv2
+
+# Cabeçalho dos frames binários (little-endian, 20 bytes), seguido dos bytes do JPEG:
+#   magic (2s) | versão (B) | flags (B) | seq (I) | timestamp em segundos desde a época (d) | largura (H) | altura (H)
+FRAME_HEADER = struct.Struct("<2sBBIdHH")
+FRAME_MAGIC = b"LF"
+FRAME_VERSION = 1
+
+FLAG_PLACEHOLDER = 0x01     # O frame é a imagem de câmera desligada
+
+FORMATO_JSON = "json"       # {"frame": "<jpeg em base64>"}, formato original
+FORMATO_BINARIO = "binary"  # Cabeçalho + JPEG, em uma mensagem binária
+FORMATOS = (FORMATO_JSON, FORMATO_BINARIO)
+
+class EncodedFrame:
+    """
+    Frame já codificado em JPEG, pronto para ser enviado em qualquer um dos formatos.
+
+    O JPEG é escrito uma única vez, logo após o cabeçalho, no buffer da mensagem binária. A mensagem JSON
+    (base64) só é gerada se algum cliente no formato antigo pedir, e fica guardada para os demais.
+    """
+
+    __slots__ = ("seq", "timestamp", "largura", "altura", "flags", "binario", "__json")
+
+    def __init__(self, seq: int, timestamp: float, largura: int, altura: int, flags: int, binario: bytearray):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.largura = largura
+        self.altura = altura
+        self.flags = flags
+        self.binario = binario
+        self.__json: str = None
+
+    @property
+    def jpeg(self) -> memoryview:
+        """
+        Os bytes do JPEG, sem cópia.
+        """
+        return memoryview(self.binario)[FRAME_HEADER.size:]
+
+    def json(self) -> str:
+        """
+        Retorna a mensagem no formato JSON original ({"frame": base64}).
+        """
+        if self.__json is None:
+            self.__json = json.dumps({"frame": base64.b64encode(self.jpeg).decode('ascii')})
+        return self.__json
+
+    def mensagem(self, formato: str):
+        """
+        Retorna a mensagem do frame no formato pedido.
+
+        Args:
+            formato (str): FORMATO_BINARIO ou FORMATO_JSON.
+
+        Returns:
+            bytearray | str: A mensagem binária ou o texto JSON.
+        """
+        return self.binario if formato == FORMATO_BINARIO else self.json()
+
+class FrameProtocol:
+    """
+    Codificação e leitura das mensagens do servidor de frames.
+    """
+
+    @staticmethod
+    def codificar(frame: cv2.Mat, seq: int, timestamp: float, flags: int = 0, qualidade_jpeg: int = 95) -> EncodedFrame:
+        """
+        Codifica um frame BGR em JPEG, já com o cabeçalho binário.
+
+        Args:
+            frame (cv2.Mat): O frame BGR.
+            seq (int): O número de sequência do frame.
+            timestamp (float): O instante da captura, em segundos desde a época.
+            flags (int): Flags do cabeçalho (ex.: FLAG_PLACEHOLDER).
+            qualidade_jpeg (int): A qualidade do JPEG (0 a 100).
+
+        Returns:
+            EncodedFrame: O frame codificado.
+
+        Raises:
+            ValueError: Se o frame não puder ser codificado.
+        """
+        if frame is None:
+            raise TypeError("O frame deve estar no formato cv2.Mat")
+        ok, buffer = cv2.imencode('.jpg', frame, (cv2.IMWRITE_JPEG_QUALITY, qualidade_jpeg))
+        if not ok:
+            raise ValueError("Falha na codificacao do frame para JPEG.")
+
+        altura, largura = frame.shape[:2]
+        binario = bytearray(FRAME_HEADER.size + buffer.size)
+        FRAME_HEADER.pack_into(binario, 0, FRAME_MAGIC, FRAME_VERSION, flags, seq & 0xFFFFFFFF, timestamp, largura, altura)
+        memoryview(binario)[FRAME_HEADER.size:] = buffer.ravel()
+        return EncodedFrame(seq, timestamp, largura, altura, flags, binario)
+
+    @staticmethod
+    def decodificar(mensagem: bytes) -> tuple:
+        """
+        Lê uma mensagem binária de frame.
+
+        Args:
+            mensagem (bytes): A mensagem recebida.
+
+        Returns:
+            tuple: (seq, timestamp, largura, altura, flags, jpeg) com o JPEG como memoryview.
+
+        Raises:
+            ValueError: Se a mensagem não for um frame binário válido.
+        """
+        if len(mensagem) < FRAME_HEADER.size:
+            raise ValueError("Mensagem menor que o cabecalho do frame.")
+        magic, versao, flags, seq, timestamp, largura, altura = FRAME_HEADER.unpack_from(mensagem)
+        if magic != FRAME_MAGIC or versao != FRAME_VERSION:
+            raise ValueError(f"Cabecalho de frame invalido: {magic!r} v{versao}")
+        return seq, timestamp, largura, altura, flags, memoryview(mensagem)[FRAME_HEADER.size:]
@@ -0,0 +1,158 @@
+from src.websockets.frames_websocket.frame_protocol import EncodedFrame, FORMATO_JSON
+from src.pipeline.metrics import RollingStats
+from src.logger.logger import Logger
+from collections import deque
+import asyncio
+import socket
+import time
+
+BUFFER_ENVIO_BYTES = 128 * 1024
+FOLGA_FPS = 0.005   # Tolerância (s) no intervalo entre frames, para o jitter da fonte não descartar frames a mais
+
+class FrameSubscriber:
+    """
+    Um cliente do servidor de frames, com a sua própria fila e a sua própria tarefa de envio.
+
+    A fila é pequena e descarta o frame mais antigo quando enche: um cliente lento perde frames,
+    mas não atrasa os outros clientes nem o loop do stream. Todos os métodos rodam no event loop.
+    """
+
+    def __init__(self, websocket, capacidade: int = 2, limite_lento: int = 15):
+        """
+        Args:
+            websocket: A conexão do cliente.
+            capacidade (int): Quantidade de frames aguardando envio antes de descartar os mais antigos.
+            limite_lento (int): Quantidade de descartes seguidos para o cliente ser considerado lento.
+        """
+        self.websocket = websocket
+        self.formato = FORMATO_JSON
+        self.fps_max: float = None              # Limite pedido pelo cliente ({"MAX_FPS": n}); sem limite se None
+        self.proximo_frame = 0.0
+        self.fila = deque(maxlen=capacidade)    # (frame, instante em que entrou na fila)
+        self.evento = asyncio.Event()
+        self.limite_lento = limite_lento
+        self.lento = False
+        self.descartes_seguidos = 0
+        self.tarefa: asyncio.Task = None
+
+        self.enfileirados = 0
+        self.ignorados = 0                      # Frames acima do fps pedido pelo cliente
+        self.enviados = 0
+        self.descartados = 0
+        self.vezes_lento = 0
+        self.latencia_ms = RollingStats(capacidade=256)    # Da entrada na fila até o fim do envio
+        self.latencia_recente_ms = 0.0                      # Média móvel exponencial da mesma latência
+        self.ultimo_envio = time.perf_counter()
+
+        self.logger = Logger.configure_application_logger()
+        self.error_logger = Logger.configure_error_logger()
+
+    def iniciar(self) -> None:
+        """
+        Inicia a tarefa de envio do cliente.
+
+        O buffer de envio do socket é reduzido para poucos frames: com o buffer padrão (alguns MB),
+        o sistema operacional acumularia segundos de vídeo atrasado antes de a fila perceber que o
+        cliente não acompanha o stream.
+        """
+        transport = getattr(self.websocket, "transport", None)
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, BUFFER_ENVIO_BYTES)
+            except OSError as e:
+                self.error_logger.error(f"Nao foi possivel ajustar o buffer de envio ({self.descricao()}): {e}")
+        self.tarefa = asyncio.create_task(self.__enviar_frames())
+
+    def parar(self) -> None:
+        """
+        Cancela a tarefa de envio do cliente.
+        """
+        if self.tarefa:
+            self.tarefa.cancel()
+            self.tarefa = None
+
+    def enfileirar(self, frame: EncodedFrame) -> None:
+        """
+        Coloca um frame na fila do cliente, descartando o mais antigo se a fila estiver cheia.
+        Frames que chegam antes do intervalo do fps pedido pelo cliente são ignorados.
+
+        Args:
+            frame (EncodedFrame): O frame já codificado, compartilhado entre todos os clientes.
+        """
+        if self.fps_max:
+            agora = time.perf_counter()
+            if agora < self.proximo_frame - FOLGA_FPS:
+                self.ignorados += 1
+                return
+            self.proximo_frame = max(self.proximo_frame + 1 / self.fps_max, agora)
+        if len(self.fila) == self.fila.maxlen:
+            self.descartados += 1
+            self.descartes_seguidos += 1
+            if not self.lento and self.descartes_seguidos >= self.limite_lento:
+                self.lento = True
+                self.vezes_lento += 1
+                self.logger.warning(f"Cliente de frames lento ({self.descricao()}): {self.metricas()}")
+        self.fila.append((frame, time.perf_counter()))
+        self.enfileirados += 1
+        self.evento.set()
+
+    async def __enviar_frames(self) -> None:
+        """
+        Envia os frames da fila, um de cada vez, enquanto a conexão estiver aberta.
+        """
+        try:
+            while True:
+                while not self.fila:
+                    self.evento.clear()
+                    await self.evento.wait()
+                frame, enfileirado = self.fila.popleft()
+                await self.websocket.send(frame.mensagem(self.formato))
+                self.ultimo_envio = time.perf_counter()
+                latencia = (self.ultimo_envio - enfileirado) * 1000
+                self.enviados += 1
+                self.latencia_ms.adicionar(latencia)
+                self.latencia_recente_ms += 0.2 * (latencia - self.latencia_recente_ms)
+
+                if not self.fila:
+                    self.descartes_seguidos = 0
+                    if self.lento:
+                        self.lento = False
+                        self.logger.info(f"Cliente de frames voltou a acompanhar o stream ({self.descricao()}).")
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.error_logger.error(f"Falha ao enviar frame ({self.descricao()}): {e}")
+
+    def travado(self, segundos: float = 2.0) -> bool:
+        """
+        Verifica se o cliente tem frames esperando e não conclui um envio há `segundos`.
+        """
+        return bool(self.fila) and time.perf_counter() - self.ultimo_envio > segundos
+
+    def descricao(self) -> str:
+        """
+        Identifica o cliente nos logs.
+        """
+        endereco = getattr(self.websocket, "remote_address", None)
+        return f"{endereco[0]}:{endereco[1]}" if endereco else str(id(self.websocket))
+
+    def metricas(self) -> dict:
+        """
+        Retorna as métricas do cliente.
+
+        Returns:
+            dict: Formato, contadores, se o cliente está lento e a latência (ms) da fila até o envio.
+        """
+        return {
+            "formato": self.formato,
+            "fps_max": self.fps_max,
+            "enfileirados": self.enfileirados,
+            "ignorados": self.ignorados,
+            "enviados": self.enviados,
+            "descartados": self.descartados,
+            "fila": len(self.fila),
+            "lento": self.lento,
+            "vezes_lento": self.vezes_lento,
+            "latencia_ms": self.latencia_ms.resumo(),
+        }
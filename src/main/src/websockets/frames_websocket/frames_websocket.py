@@ -1,42 +1,169 @@
+from src.websockets.frames_websocket.frame_subscriber import FrameSubscriber
+from src.websockets.frames_websocket.frame_protocol import EncodedFrame, FORMATO_JSON, FORMATOS
 from src.websockets.websocket import WebSocket
+import asyncio
+import json
 
 class FramesWebsocketServer(WebSocket):
-    def __init__(self, port: int):
+    formato_padrao = FORMATO_JSON   # Formato usado até o cliente pedir outro
+
+    def __init__(self, port: int, capacidade_fila: int = 2):
+        """
+        Args:
+            port (int): A porta do servidor.
+            capacidade_fila (int): Quantidade de frames na fila de cada cliente antes de descartar os mais antigos.
+        """
         super().__init__(port)
-        self.connections = set()
+        self.capacidade_fila = capacidade_fila
+        self.connections: dict = {}     # websocket -> FrameSubscriber
+        self.com_assinantes = asyncio.Event()
 
     async def handler(self, websocket) -> None:
         """
         Este método é executado quando uma nova conexão é estabelecida.
-        Ele gerencia as conexões e garante que o envio contínuo de frames 
+        Ele gerencia as conexões e garante que o envio contínuo de frames
         funcione corretamente.
+
+        Os clientes recebem os frames em JSON (base64) até pedirem outro formato com
+        {"FORMAT": "binary"}. O cliente pode limitar os frames que recebe com {"MAX_FPS": n}
+        ({"MAX_FPS": null} remove o limite).
         """
-        self.connections.add(websocket)
+        assinante = FrameSubscriber(websocket, self.capacidade_fila)
+        assinante.formato = self.formato_padrao
+        self.connections[websocket] = assinante
+        self.com_assinantes.set()
+        assinante.iniciar()
         self.data_logger.info("Nova conexao WebSocket estabelecida.")
-        
+
         try:
             async for message in websocket:
-                pass 
+                await self.__tratar_mensagem(assinante, message)
         except Exception as e:
             self.error_logger.error(f"Erro na conexao WebSocket: {e}")
         finally:
-            self.connections.remove(websocket)
-            self.logger.info("Conexao WebSocket encerrada.")
-
-    async def send_frame(self, frame: str) -> None:
-        """
-        Envia um frame para todas as conexões ativas.
-        """
-        if self.connections:
-            to_remove = []
-            for websocket in self.connections:
-                try:
-                    await self.send_data(websocket, {"frame": frame})
-                except Exception as e:
-                    self.error_logger.error(f"Falha ao enviar frame: {e}")
-                    to_remove.append(websocket)
-            
-            for websocket in to_remove:
-                self.connections.discard(websocket)
-        else:
-            self.data_logger.warning("Nenhuma conexao ativa para enviar frames.")
\ No newline at end of file
+            assinante.parar()
+            self.connections.pop(websocket, None)
+            if not self.connections:
+                self.com_assinantes.clear()
+            self.logger.info(f"Conexao WebSocket encerrada: {assinante.metricas()}")
+
+    async def __tratar_mensagem(self, assinante: FrameSubscriber, message) -> None:
+        """
+        Trata as mensagens do cliente: a escolha do formato (FORMAT) e o limite de fps (MAX_FPS).
+
+        Args:
+            assinante (FrameSubscriber): O cliente que enviou a mensagem.
+            message: Mensagem recebida.
+        """
+        try:
+            message = json.loads(message)
+        except (json.JSONDecodeError, TypeError):
+            await self.send_data(assinante.websocket, {"error": "JSON invalido."})
+            return
+
+        if not isinstance(message, dict):
+            return
+        if "MAX_FPS" in message:
+            await self.__limitar_fps(assinante, message["MAX_FPS"])
+        if "FORMAT" not in message:
+            return
+
+        formato = message["FORMAT"]
+        if formato not in FORMATOS:
+            await self.send_data(assinante.websocket, {"error": f"Formato de frame desconhecido: {formato}"})
+            return
+
+        assinante.formato = formato
+        msg = f"Formato dos frames: {formato}"
+        self.data_logger.info(msg)
+        await self.send_data(assinante.websocket, {"status": "success", "message": msg})
+
+    async def __limitar_fps(self, assinante: FrameSubscriber, fps) -> None:
+        """
+        Aplica o limite de fps pedido pelo cliente.
+
+        Args:
+            assinante (FrameSubscriber): O cliente que pediu o limite.
+            fps: Frames por segundo (número positivo), ou None para remover o limite.
+        """
+        if fps is not None and (isinstance(fps, bool) or not isinstance(fps, (int, float)) or fps <= 0):
+            await self.send_data(assinante.websocket, {"error": f"MAX_FPS invalido: {fps}"})
+            return
+
+        assinante.fps_max = float(fps) if fps is not None else None
+        msg = f"Limite de fps: {assinante.fps_max}"
+        self.data_logger.info(msg)
+        await self.send_data(assinante.websocket, {"status": "success", "message": msg})
+
+    async def send_frame(self, frame: EncodedFrame) -> None:
+        """
+        Entrega um frame a todas as conexões ativas, sem esperar os envios.
+
+        O frame é codificado uma única vez e o mesmo buffer vai para a fila de cada cliente;
+        a tarefa de envio de cada cliente o transmite no formato pedido.
+
+        Args:
+            frame (EncodedFrame): O frame já codificado.
+        """
+        for assinante in list(self.connections.values()):
+            assinante.enfileirar(frame)
+
+    def has_subscribers(self) -> bool:
+        """
+        Verifica se há algum cliente conectado.
+        """
+        return bool(self.connections)
+
+    def get_fps_pedido(self) -> float:
+        """
+        Retorna o maior fps pedido pelos clientes conectados.
+
+        Returns:
+            float: O maior limite de fps, None se algum cliente não tem limite ou 0 se não há clientes.
+        """
+        assinantes = list(self.connections.values())
+        if not assinantes:
+            return 0
+        if any(assinante.fps_max is None for assinante in assinantes):
+            return None
+        return max(assinante.fps_max for assinante in assinantes)
+
+    async def aguardar_assinantes(self, timeout: float = None) -> bool:
+        """
+        Espera até haver algum cliente conectado.
+
+        Args:
+            timeout (float): Tempo máximo de espera, em segundos.
+
+        Returns:
+            bool: True se há clientes conectados, False se o tempo acabou.
+        """
+        try:
+            await asyncio.wait_for(self.com_assinantes.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.has_subscribers()
+
+    def get_congestionamento(self) -> tuple:
+        """
+        Resume o estado das filas dos clientes para o controle adaptativo do stream.
+
+        Clientes travados (sem concluir envios há alguns segundos) são ignorados, para que uma
+        conexão parada não derrube a qualidade do stream de todos os outros.
+
+        Returns:
+            tuple: (maior latência recente de envio em ms, maior quantidade de frames esperando envio).
+        """
+        assinantes = [assinante for assinante in list(self.connections.values()) if not assinante.travado()]
+        if not assinantes:
+            return 0.0, 0
+        return max(a.latencia_recente_ms for a in assinantes), max(len(a.fila) for a in assinantes)
+
+    def get_metricas(self) -> dict:
+        """
+        Retorna as métricas de envio de cada cliente conectado.
+
+        Returns:
+            dict: Descrição do cliente -> métricas do cliente.
+        """
+        return {assinante.descricao(): assinante.metricas() for assinante in list(self.connections.values())}
@@ -0,0 +1,113 @@
+from src.websockets.frames_websocket.frame_protocol import FORMATO_BINARIO
+import numpy as np
+import struct
+import json
+
+# Registro binário de landmarks (little-endian). Todos os blocos têm tamanho múltiplo de 4 bytes, para que
+# os landmarks possam ser lidos direto como Float32Array pelo cliente.
+#   Cabeçalho (20 bytes): magic (2s) | versão (B) | flags (B) | seq (I) | timestamp em segundos desde a época (d) | quantidade de mãos (B) | 3 bytes livres
+#   Para cada mão: mão (B, 0 = Left, 1 = Right) | 1 byte livre | tamanho do nome do gesto em bytes (H)
+#                  | 21 x 3 float32 (x, y, z normalizados) | nome do gesto em UTF-8, completado com zeros até múltiplo de 4
+LANDMARK_HEADER = struct.Struct("<2sBBIdB3x")
+HAND_HEADER = struct.Struct("<BxH")
+LANDMARK_MAGIC = b"LL"
+LANDMARK_VERSION = 1
+PONTOS_POR_MAO = 21 * 3
+
+MAOS = ("Left", "Right")
+
+class LandmarkRecord:
+    """
+    Registro dos landmarks e gestos reconhecidos em um frame, pronto para ser enviado em qualquer formato.
+    """
+
+    __slots__ = ("seq", "timestamp", "maos", "binario", "__json")
+
+    def __init__(self, seq: int, timestamp: float, maos: list, binario: bytes):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.maos = maos
+        self.binario = binario
+        self.__json: str = None
+
+    def json(self) -> str:
+        """
+        Retorna o registro em JSON: {"landmarks": {"seq", "timestamp", "maos": [{"mao", "gesto", "pontos"}]}}.
+        """
+        if self.__json is None:
+            self.__json = json.dumps({"landmarks": {
+                "seq": self.seq,
+                "timestamp": self.timestamp,
+                "maos": [{"mao": mao, "gesto": gesto, "pontos": pontos.tolist()} for mao, gesto, pontos in self.maos],
+            }})
+        return self.__json
+
+    def mensagem(self, formato: str):
+        """
+        Retorna a mensagem do registro no formato pedido.
+
+        Args:
+            formato (str): FORMATO_BINARIO ou FORMATO_JSON.
+
+        Returns:
+            bytes | str: A mensagem binária ou o texto JSON.
+        """
+        return self.binario if formato == FORMATO_BINARIO else self.json()
+
+class LandmarkProtocol:
+    """
+    Codificação e leitura dos registros do servidor de landmarks.
+    """
+
+    @staticmethod
+    def codificar(seq: int, timestamp: float, maos: list) -> LandmarkRecord:
+        """
+        Empacota os landmarks das mãos de um frame.
+
+        Args:
+            seq (int): O número de sequência do frame.
+            timestamp (float): O instante da captura, em segundos desde a época.
+            maos (list): Tuplas (mão, nome do gesto, pontos (21, 3)) de cada mão detectada.
+
+        Returns:
+            LandmarkRecord: O registro empacotado.
+        """
+        partes = [LANDMARK_HEADER.pack(LANDMARK_MAGIC, LANDMARK_VERSION, 0, seq & 0xFFFFFFFF, timestamp, len(maos))]
+        for mao, gesto, pontos in maos:
+            nome = str(gesto).encode("utf-8")[:0xFFFF]
+            partes.append(HAND_HEADER.pack(MAOS.index(mao), len(nome)))
+            partes.append(np.ascontiguousarray(pontos, dtype="<f4").reshape(PONTOS_POR_MAO).tobytes())
+            partes.append(nome + b"\0" * (-len(nome) % 4))
+        return LandmarkRecord(seq, timestamp, maos, b"".join(partes))
+
+    @staticmethod
+    def decodificar(mensagem: bytes) -> tuple:
+        """
+        Lê um registro binário de landmarks.
+
+        Args:
+            mensagem (bytes): A mensagem recebida.
+
+        Returns:
+            tuple: (seq, timestamp, maos) com as mãos como tuplas (mão, nome do gesto, pontos (21, 3) float32).
+
+        Raises:
+            ValueError: Se a mensagem não for um registro válido.
+        """
+        if len(mensagem) < LANDMARK_HEADER.size:
+            raise ValueError("Mensagem menor que o cabecalho do registro de landmarks.")
+        magic, versao, _, seq, timestamp, quantidade = LANDMARK_HEADER.unpack_from(mensagem)
+        if magic != LANDMARK_MAGIC or versao != LANDMARK_VERSION:
+            raise ValueError(f"Cabecalho de landmarks invalido: {magic!r} v{versao}")
+
+        maos = []
+        offset = LANDMARK_HEADER.size
+        for _ in range(quantidade):
+            indice_mao, tamanho_nome = HAND_HEADER.unpack_from(mensagem, offset)
+            offset += HAND_HEADER.size
+            pontos = np.frombuffer(mensagem, dtype="<f4", count=PONTOS_POR_MAO, offset=offset).reshape(21, 3)
+            offset += PONTOS_POR_MAO * 4
+            nome = bytes(mensagem[offset:offset + tamanho_nome]).decode("utf-8")
+            offset += tamanho_nome + (-tamanho_nome % 4)
+            maos.append((MAOS[indice_mao], nome, pontos))
+        return seq, timestamp, maos
@@ -0,0 +1,51 @@
+from src.websockets.landmarks_websocket.landmark_protocol import LandmarkProtocol, LandmarkRecord
+from src.websockets.frames_websocket.frames_websocket import FramesWebsocketServer
+from src.websockets.frames_websocket.frame_protocol import FORMATO_BINARIO
+import asyncio
+
+class LandmarksWebsocketServer(FramesWebsocketServer):
+    """
+    Servidor para clientes que precisam apenas dos landmarks e dos gestos reconhecidos, sem vídeo.
+
+    A cada frame processado pela detecção, cada cliente recebe um registro com o timestamp, a mão,
+    os 21 landmarks (float32) e o gesto reconhecido de cada mão detectada. O formato padrão é o
+    binário (ver `landmark_protocol`); {"FORMAT": "json"} muda para JSON. As filas por cliente são
+    as mesmas do servidor de frames.
+    """
+
+    formato_padrao = FORMATO_BINARIO
+
+    def __init__(self, port: int, capacidade_fila: int = 8):
+        """
+        Args:
+            port (int): A porta do servidor.
+            capacidade_fila (int): Quantidade de registros na fila de cada cliente antes de descartar os mais antigos.
+        """
+        super().__init__(port, capacidade_fila)
+        self.loop: asyncio.AbstractEventLoop = None
+
+    async def handler(self, websocket) -> None:
+        self.loop = asyncio.get_running_loop()
+        await super().handler(websocket)
+
+    def publicar(self, seq: int, timestamp: float, maos: list) -> None:
+        """
+        Empacota e entrega os landmarks de um frame a todos os clientes. Pode ser chamado de qualquer thread.
+
+        Args:
+            seq (int): O número de sequência do frame.
+            timestamp (float): O instante da captura, em segundos desde a época.
+            maos (list): Tuplas (mão, nome do gesto, pontos (21, 3)) de cada mão detectada.
+        """
+        loop = self.loop
+        if loop is None or not self.connections:
+            return
+        registro = LandmarkProtocol.codificar(seq, timestamp, maos)
+        try:
+            loop.call_soon_threadsafe(self.__distribuir, registro)
+        except RuntimeError:
+            pass  # O event loop do servidor já foi encerrado
+
+    def __distribuir(self, registro: LandmarkRecord) -> None:
+        for assinante in list(self.connections.values()):
+            assinante.enfileirar(registro)
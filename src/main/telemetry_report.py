@@ -0,0 +1,65 @@
+from src.telemetry.telemetry_reader import TelemetryReader
+import argparse
+import datetime
+import json
+import sys
+
+def imprimir_histograma(nome: str, faixas: list) -> None:
+    """
+    Imprime um histograma de latência em texto.
+
+    Args:
+        nome (str): O nome da medida.
+        faixas (list): As faixas de `TelemetryReader.histograma`.
+    """
+    total = sum(quantidade for _, _, quantidade in faixas) or 1
+    print(f"{nome}:")
+    for inferior, superior, quantidade in faixas:
+        faixa = f"{inferior}-{superior} ms" if superior is not None else f">= {inferior} ms"
+        print(f"  {faixa:>12} {quantidade:10d} {quantidade / total * 100:6.1f}% {'#' * round(quantidade / total * 50)}")
+
+def gerar_relatorio(caminho: str, intervalo_max: float, trechos_min: int) -> dict:
+    """
+    Analisa um arquivo de telemetria: histogramas de latência e linha do tempo dos gestos de cada mão.
+
+    Args:
+        caminho (str): O arquivo da telemetria.
+        intervalo_max (float): Intervalo (s) sem eventos que encerra um trecho da linha do tempo.
+        trechos_min (int): Quantidade mínima de frames para um trecho aparecer na linha do tempo.
+
+    Returns:
+        dict: Resumo (eventos, latências e quantidade de frames e inputs de cada gesto).
+    """
+    leitor = TelemetryReader(caminho)
+    frames = leitor.frames()
+    print(f"{caminho}: {leitor.escritos} eventos gravados ({leitor.sobrescritos} sobrescritos), {len(frames)} frames")
+
+    imprimir_histograma("Deteccao de mao", leitor.histograma(frames["inferencia_ms"][frames["inferencia_ms"] > 0]))
+    imprimir_histograma("Captura ate landmarks", leitor.histograma(frames["latencia_ms"]))
+    imprimir_histograma("Captura ate gesto", leitor.histograma(leitor.gestos()["latencia_ms"]))
+
+    gestos = {}
+    for mao in ("Right", "Left"):
+        trechos = leitor.linha_do_tempo(mao, intervalo_max)
+        if not trechos:
+            continue
+        print(f"Linha do tempo ({mao}):")
+        for trecho in trechos:
+            contagem = gestos.setdefault(trecho.gesto or "MAO", {"frames": 0, "inputs": 0})
+            contagem["frames"] += trecho.frames
+            contagem["inputs"] += trecho.inputs
+            if trecho.frames >= trechos_min:
+                inicio = datetime.datetime.fromtimestamp(trecho.inicio).strftime("%H:%M:%S.%f")[:-3]
+                print(f"  {inicio} {trecho.fim - trecho.inicio:7.2f} s {trecho.gesto or 'MAO':<16} {trecho.frames:6d} frames {trecho.inputs:4d} inputs")
+
+    return {"eventos": leitor.escritos, "sobrescritos": leitor.sobrescritos, "latencias": leitor.latencias(), "gestos": gestos}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Histogramas de latencia e linha do tempo dos gestos de um arquivo de telemetria.")
+    parser.add_argument("telemetria", help="Arquivo de telemetria gravado com START_TELEMETRY.")
+    parser.add_argument("--intervalo", type=float, default=0.5, help="Segundos sem eventos que encerram um trecho da linha do tempo.")
+    parser.add_argument("--min-frames", type=int, default=3, help="Frames minimos para um trecho aparecer na linha do tempo.")
+    args = parser.parse_args()
+
+    resumo = gerar_relatorio(args.telemetria, args.intervalo, args.min_frames)
+    print(json.dumps(resumo), file=sys.stderr)
@@ -3,6 +3,21 @@ interface Gesto {
     tempo_pressionado: number;
 }
 
+export interface StreamProfile {
+    max_fps: number;
+    max_width: number;
+    jpeg_quality: number;
+    adaptativo: boolean;
+}
+
+export interface InferenceStride {
+    stride: number;
+    adaptativo: boolean;
+    stride_max: number;
+    limiar_movimento: number;
+    horizonte: number;
+}
+
 export default class WebSocketClient {
     public socket: WebSocket | null = null;
     public uri: string;
@@ -155,6 +170,18 @@ export default class WebSocketClient {
             if (message.cameraSelecionada) {
                 this.handleCameraSelecionada(message.cameraSelecionada);
             }
+
+            if (message.streamProfile) {
+                this.handleStreamProfile(message.streamProfile);
+            }
+
+            if (message.inferenceStride) {
+                this.handleInferenceStride(message.inferenceStride);
+            }
+
+            if (message.metrics) {
+                this.handleMetrics(message.metrics);
+            }
         } catch (e) {
             console.error('Falha no JSON:', e);
         }
@@ -165,6 +192,9 @@ export default class WebSocketClient {
     public handleGesto(gesto: Gesto) { }
     public handleCustomizableState(is_custom: boolean) { }
     public handleCameraSelecionada(camera_selecionada: string) { }
+    public handleStreamProfile(profile: StreamProfile) { }
+    public handleInferenceStride(config: InferenceStride) { }
+    public handleMetrics(metrics: { [key: string]: any }) { }
 
     public sendStartDetection() {
         this.send({ START_DETECTION: true });
@@ -210,6 +240,27 @@ export default class WebSocketClient {
         this.send({ GET_CAMERAS_DISPONIVEIS: true });
     }
 
+    public sendSetStreamProfile(profile: Partial<StreamProfile>) {
+        this.send({ SET_STREAM_PROFILE: profile });
+    }
+
+    public sendGetStreamProfile() {
+        this.send({ GET_STREAM_PROFILE: true });
+    }
+
+    public sendSetInferenceStride(config: Partial<InferenceStride>) {
+        this.send({ SET_INFERENCE_STRIDE: config });
+    }
+
+    public sendGetInferenceStride() {
+        this.send({ GET_INFERENCE_STRIDE: true });
+    }
+
+    // arquivoPrometheus: só o nome do arquivo, gravado pelo servidor em src/data/metrics
+    public sendGetMetrics(arquivoPrometheus?: string) {
+        this.send({ GET_METRICS: arquivoPrometheus || true });
+    }
+
     protected send(data: object) {
         if (this.socket && this.socket.readyState === WebSocket.OPEN) {
             const message = JSON.stringify(data)
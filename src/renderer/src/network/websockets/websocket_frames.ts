@@ -1,21 +1,93 @@
 import WebSocketClient from "./websocket_client";
 
+// Cabeçalho dos frames binários (little-endian), seguido dos bytes do JPEG:
+// magic "LF" | versão (u8) | flags (u8) | seq (u32) | timestamp em segundos (f64) | largura (u16) | altura (u16)
+const FRAME_HEADER_SIZE = 20;
+const FRAME_VERSION = 1;
+// URLs de Blob mantidas válidas: a do frame atual e a do anterior, que a <img> ainda pode estar carregando
+const FRAME_URLS_VIVAS = 2;
+
+export interface FrameInfo {
+    seq: number;
+    timestamp: number;
+    largura: number;
+    altura: number;
+    placeholder: boolean;
+}
+
 export default class WebSocketFrames extends WebSocketClient {
+    private frameUrls: string[] = [];
+
     constructor(uri: string) {
         super(uri);
     }
 
-    protected handleMessage(data: string) {
+    protected setupListeners() {
+        super.setupListeners();
+        if (!this.socket) return;
+
+        this.socket.binaryType = "arraybuffer";
+        this.socket.addEventListener("open", () => {
+            this.send({ FORMAT: "binary" });
+        });
+    }
+
+    protected handleMessage(data: string | ArrayBuffer) {
+        if (data instanceof ArrayBuffer) {
+            this.handleBinaryFrame(data);
+            return;
+        }
+
         try {
             const message = JSON.parse(data);
 
             if (message.frame) {
-                this.handleFrame(message.frame);
+                this.handleFrame(`data:image/jpeg;base64,${message.frame}`, null);
+            }
+
+            if (message.error) {
+                console.error(`Erro: ${message.error}`);
             }
         } catch (e) {
             console.error('Falha no JSON:', e);
         }
     }
 
-    public handleFrame(frame: string) { };
-}
\ No newline at end of file
+    private handleBinaryFrame(data: ArrayBuffer) {
+        if (data.byteLength < FRAME_HEADER_SIZE) return;
+
+        const view = new DataView(data);
+        const magic = String.fromCharCode(view.getUint8(0), view.getUint8(1));
+        if (magic !== "LF" || view.getUint8(2) !== FRAME_VERSION) {
+            console.error('Cabeçalho de frame inválido.');
+            return;
+        }
+
+        const info: FrameInfo = {
+            seq: view.getUint32(4, true),
+            timestamp: view.getFloat64(8, true),
+            largura: view.getUint16(16, true),
+            altura: view.getUint16(18, true),
+            placeholder: (view.getUint8(3) & 0x01) !== 0,
+        };
+
+        // Cada frame vira uma URL de Blob. Liberar a anterior assim que o próximo frame chega pode quebrar a
+        // imagem ainda em carregamento, então só as URLs mais antigas que as FRAME_URLS_VIVAS últimas são liberadas
+        const blob = new Blob([new Uint8Array(data, FRAME_HEADER_SIZE)], { type: "image/jpeg" });
+        const url = URL.createObjectURL(blob);
+        this.frameUrls.push(url);
+        const antigas = this.frameUrls.splice(0, Math.max(0, this.frameUrls.length - FRAME_URLS_VIVAS));
+        antigas.forEach((antiga) => URL.revokeObjectURL(antiga));
+
+        this.handleFrame(url, info);
+    }
+
+    public close() {
+        super.close();
+        this.frameUrls.forEach((url) => URL.revokeObjectURL(url));
+        this.frameUrls = [];
+    }
+
+    // `frame` é uma URL pronta para o `src` de uma <img> (URL de Blob ou data URL, no formato JSON)
+    public handleFrame(frame: string, info: FrameInfo | null) { };
+}
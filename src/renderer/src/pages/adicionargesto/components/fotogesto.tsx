@@ -9,7 +9,7 @@ export default function FotoGesto({frame, handleTirarFoto}: FotoGestoProps) {
             <div className="cropped-video-container">
                 {frame && (
                     <img
-                        src={`data:image/jpeg;base64,${frame}`}
+                        src={frame}
                         alt="Video Stream"
                         className="video"
                     />
@@ -27,7 +27,7 @@ export default function VideoContainer({
         <div className="video-container">
             {frame && (
                 <img
-                    src={`data:image/jpeg;base64,${frame}`}
+                    src={frame}
                     alt="Video Stream"
                     className="video"
                 />
@@ -0,0 +1,25 @@
+"""
+Configuração comum dos testes do LibrasController.
+
+Os testes devem ser executados a partir da raiz do repositório:
+
+    python -m pytest tests
+"""
+import tempfile
+import sys
+import os
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+MAIN_DIR = os.path.join(REPO_ROOT, "src", "main")
+if MAIN_DIR not in sys.path:
+    sys.path.insert(0, MAIN_DIR)
+os.chdir(REPO_ROOT)  # Os caminhos dos arquivos de dados são relativos à raiz do repositório
+
+from src.data.configs.config_router import ConfigRouter
+from src.data.configs.states.config_states_manager import ConfigStateManager
+from src.data.configs.basic.basic_configs_manager import BasicConfigManager
+
+# O estado e as configurações básicas ficam em arquivos temporários, para os testes não alterarem os dados do repositório
+PASTA_DADOS = tempfile.mkdtemp(prefix="librascontroller_testes_")
+ConfigRouter.state_manager = ConfigStateManager(os.path.join(PASTA_DADOS, "estado_atual.json"))
+BasicConfigManager.config_file = os.path.join(PASTA_DADOS, "config_basica.json")
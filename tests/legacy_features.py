@@ -0,0 +1,268 @@
+"""
+Reprodução da extração de features anterior do GestureInterpretador (um landmark por vez, via acesso
+aos atributos do protobuf). Usada como referência de paridade em `test_gesture_features.py` e pelo
+benchmark `bench_features.py`.
+"""
+import numpy as np
+import math
+
+FINGER_LANDMARKS = {
+    'thumb': [1, 2, 3, 4],
+    'index': [5, 6, 7, 8],
+    'middle': [9, 10, 11, 12],
+    'ring': [13, 14, 15, 16],
+    'pinky': [17, 18, 19, 20]
+}
+
+FINGER_PAIRS = [
+    ('thumb', 'middle'),
+    ('thumb', 'ring'),
+    ('thumb', 'pinky'),
+    ('index', 'middle'),
+    ('middle', 'ring'),
+    ('ring', 'pinky'),
+]
+
+class LegacyFeatureExtractor:
+    def __init__(self):
+        self.finger_landmarks = FINGER_LANDMARKS
+        self.finger_pairs = FINGER_PAIRS
+
+    def extrair(self, hand_landmarks) -> dict:
+        return {
+            "pointing_down": self.__is_pointing_down(hand_landmarks, self.finger_landmarks['index'], self.finger_landmarks['middle'], self.finger_landmarks['ring'], self.finger_landmarks['pinky']),
+            "fingers_overlap": self.__are_fingers_overlapping(hand_landmarks, self.finger_pairs),
+            "thumb_finger_inside_hand": not self.__is_finger_up(hand_landmarks, self.finger_landmarks['thumb'][2:]),
+            "index_finger_up": self.__is_finger_up(hand_landmarks, self.finger_landmarks['index'][1:]),
+            "middle_finger_up": self.__is_finger_up(hand_landmarks, self.finger_landmarks['middle'][1:]),
+            "ring_finger_up": self.__is_finger_up(hand_landmarks, self.finger_landmarks['ring'][1:]),
+            "pinky_finger_up": self.__is_finger_up(hand_landmarks, self.finger_landmarks['pinky'][1:]),
+            "thumb_middle_touch": self.__are_finger_tips_touching(hand_landmarks, self.finger_landmarks['thumb'][3:], self.finger_landmarks['middle'][3:]),
+            "thumb_cross_index": self.__are_fingers_overlapping(hand_landmarks, [('thumb', 'index')]),
+            "index_and_middle_together": self.__are_fingers_together(hand_landmarks, self.finger_landmarks['index'], self.finger_landmarks['middle']),
+            "bent_index": self.__is_index_bent(),
+            "has_movement": False,
+            "type_of_movement": ""
+        }
+
+    def __is_finger_up(self, hand_landmarks, finger_indices: list) -> bool:
+        """
+        Verifica se o dedo está levantado.
+
+        Args:
+            hand_landmarks (NormalizedLandmarkList): Os landmarks da mão.
+            finger_indices (list): Os índices do dedo a ser verificado.
+
+        Returns:
+            bool: True se o dedo estiver levantado. 
+            bool: False caso contrário.
+        """
+        # Pontos de referência para a base do quadrado imaginário
+        base_points = [
+            hand_landmarks.landmark[0],  # Pulso
+            hand_landmarks.landmark[1],  # Base do dedão
+            hand_landmarks.landmark[5],  # Base do dedo indicador
+            hand_landmarks.landmark[9],  # Base do dedo médio
+            hand_landmarks.landmark[13], # Base do dedo anelar
+            hand_landmarks.landmark[17]  # Base do dedo mínimo
+        ]
+        
+        # Criando um quadrado imaginário na tela, usando as coordenadas das extremidades da mão.
+        image_height, image_width = 640, 480
+
+        x_coords = [int(point.x * image_width) for point in base_points]
+        y_coords = [int(point.y * image_height) for point in base_points]
+
+        min_x, max_x = min(x_coords) - 15, max(x_coords) + 15
+        min_y, max_y = min(y_coords) - 15, max(y_coords) + 15
+
+        for index in finger_indices:
+            finger_point = hand_landmarks.landmark[index]           #      Premissa:
+            finger_point_x = int(finger_point.x * image_width)      #       Se pelo menos um dos landmarks do dedo estiver DENTRO do quadrado,
+            finger_point_y = int(finger_point.y * image_height)     #       o dedo será considerado como ABAIXADO
+
+            if max_x >= finger_point_x >= min_x and max_y >= finger_point_y >= min_y:
+                return False
+        return True
+
+    def __are_fingers_overlapping(self, hand_landmarks, finger_pairs: list) -> bool:
+        """
+        Verifica se os dedos estão sobrepostos.
+
+        Args:
+            hand_landmarks (NormalizedLandmarkList): Os landmarks da mão.
+            finger_pairs (list): Os pares de dedos a serem verificados.
+
+        Returns:
+            bool: True se os dedos estiverem sobrepostos.
+            bool: False caso contrário.
+        """
+
+        for pair in finger_pairs:
+            if self.__retas_se_intersectam(
+                hand_landmarks, 
+                self.finger_landmarks[pair[0]], 
+                self.finger_landmarks[pair[1]]
+            ):
+                return True
+
+        return False
+
+    def __retas_se_intersectam(self, hand_landmarks, finger1: list, finger2: list) -> bool:
+        """
+        Verifica se há interseção entre as linhas dos dedos fornecidos.
+
+        Args:
+            hand_landmarks (NormalizedLandmarkList): Lista de pontos de referência das mãos.
+            finger1 (list): Lista de índices de landmarks para o primeiro dedo.
+            finger2 (list): Lista de índices de landmarks para o segundo dedo.
+
+        Returns:
+            bool: True se as linhas entre os dedos se intersectarem.
+            bool: False caso contrário.
+        """
+        p1 = np.array([hand_landmarks.landmark[finger1[0]].x, hand_landmarks.landmark[finger1[0]].y])
+        p2 = np.array([hand_landmarks.landmark[finger1[-1]].x, hand_landmarks.landmark[finger1[-1]].y])
+        q1 = np.array([hand_landmarks.landmark[finger2[0]].x, hand_landmarks.landmark[finger2[0]].y])
+        q2 = np.array([hand_landmarks.landmark[finger2[-1]].x, hand_landmarks.landmark[finger2[-1]].y])
+
+        return self.__do_intersect(p1, p2, q1, q2)
+
+    def __do_intersect(self, p1, p2, q1, q2) -> bool:
+        """
+        Verifica se duas linhas definidas por quatro pontos se intersectam.
+
+        Args:
+            p1, p2 (numpy.ndarray): Pontos que definem a primeira linha.
+            q1, q2 (numpy.ndarray): Pontos que definem a segunda linha.
+
+        Returns:
+            bool: True se as linhas se intersectam.
+            bool: False caso contrário.
+        """
+        def orientation(p, q, r):
+            val = (q[1] - p[1]) * (r[0] - q[0]) - (q[0] - p[0]) * (r[1] - q[1])
+            if val == 0:
+                return 0  # Colinear
+            return 1 if val > 0 else 2  # Horário ou anti-horário
+
+        def is_on_the_segment(p, q, r):
+            if (min(p[0], r[0]) <= q[0] <= max(p[0], r[0]) and
+                    min(p[1], r[1]) <= q[1] <= max(p[1], r[1])):
+                return True
+            return False
+
+        # Obter as orientações para diferentes combinações de pontos
+        o1 = orientation(p1, p2, q1)
+        o2 = orientation(p1, p2, q2)
+        o3 = orientation(q1, q2, p1)
+        o4 = orientation(q1, q2, p2)
+
+        # Caso geral
+        if o1 != o2 and o3 != o4:
+            return True
+
+        # Casos especiais de colinearidade
+        if o1 == 0 and is_on_the_segment(p1, q1, p2):
+            return True
+        if o2 == 0 and is_on_the_segment(p1, q2, p2):
+            return True
+        if o3 == 0 and is_on_the_segment(q1, p1, q2):
+            return True
+        if o4 == 0 and is_on_the_segment(q1, p2, q2):
+            return True
+
+        return False
+    
+    def __are_finger_tips_touching(self, hand_landmarks, finger1: list, finger2: list, min_distance=0.05) -> bool:
+        """
+        Verifica se o a ponta dos dedos estão se tocando.
+
+        Args:
+            hand_landmarks (NormalizedLandmarkList): Lista de pontos de referência das mãos.
+            finger1 (list): Lista de índices de landmarks para o primeiro dedo.
+            finger2 (list): Lista de índices de landmarks para o segundo dedo.
+            min_distance (float): Distancia mínima para os dedos serem considerados separados.
+
+        Returns:
+            bool: True se a ponta dos dedos estiverem se tocando.
+            bool: False caso contrário.
+        """
+
+        finger1_tip_x, finger1_tip_y = hand_landmarks.landmark[finger1[-1]].x, hand_landmarks.landmark[finger1[-1]].y
+        finger2_tip_x, finger2_tip_y = hand_landmarks.landmark[finger2[-1]].x, hand_landmarks.landmark[finger2[-1]].y
+
+        distance = math.sqrt((finger2_tip_x - finger1_tip_x) ** 2 + (finger2_tip_y - finger1_tip_y) ** 2)
+
+        return distance <= min_distance
+
+    def __is_pointing_down(self, hand_landmarks, finger1: list, finger2: list, finger3: list, finger4: list) -> bool:
+        """
+        Verifica se qualquer um dos dedos especificados está apontando para baixo.
+
+        Args:
+            hand_landmarks (NormalizedLandmarkList): Lista de landmarks da mão.
+            finger1 (list): Lista de índices de landmarks para o primeiro dedo.
+            finger2 (list): Lista de índices de landmarks para o segundo dedo.
+            finger3 (list): Lista de índices de landmarks para o terceiro dedo.
+            finger4 (list): Lista de índices de landmarks para o quarto dedo.
+        
+        Returns:
+            bool: True se qualquer um dos dedos especificados estiver apontando para baixo.
+            bool: False caso contrário.
+        """
+        
+        # tip: Landmark da ponta do dedo
+        # pip: Landmark da base do dedo
+
+        wrist_y = hand_landmarks.landmark[0].y
+        finger1_tip_y, finger1_pip_y = hand_landmarks.landmark[finger1[3]].y, hand_landmarks.landmark[finger1[2]].y
+        finger2_tip_y, finger2_pip_y = hand_landmarks.landmark[finger2[3]].y, hand_landmarks.landmark[finger2[2]].y
+        finger3_tip_y, finger3_pip_y = hand_landmarks.landmark[finger3[3]].y, hand_landmarks.landmark[finger3[2]].y
+        finger4_tip_y, finger4_pip_y = hand_landmarks.landmark[finger4[3]].y, hand_landmarks.landmark[finger4[2]].y
+
+        return ((finger1_tip_y > finger1_pip_y and finger1_tip_y > wrist_y) or      #      Premissa:
+                (finger2_tip_y > finger2_pip_y and finger2_tip_y > wrist_y) or      #       Se o landmark da ponta do dedo está abaixo do  
+                (finger3_tip_y > finger3_pip_y and finger3_tip_y > wrist_y) or      #       landmark da base do dedo e do landmark do pulso,
+                (finger4_tip_y > finger4_pip_y and finger4_tip_y > wrist_y))        #       a mão será considerada como apontada para baixo
+    
+    def __are_fingers_together(self, hand_landmarks, finger1: list, finger2: list, min_percentage_difference=12.0) -> bool:
+        """
+        Verifica se os dedos estão juntos com base na porcentagem de diferença de distância entre PIPs e TIPs.
+
+        Args:
+            hand_landmarks (NormalizedLandmarkList): Objeto que contém as landmarks da mão.
+            finger1 (list): Índices dos landmarks do primeiro dedo.
+            finger2 (list): Índices dos landmarks do segundo dedo.
+            min_percentage_difference (float): Diferença percentual mínima para considerar os dedos juntos.
+
+        Returns:
+            bool: True se os dedos estiverem juntos.
+            bool: False caso contrário.
+        """
+
+        # tip: Landmark da ponta do dedo
+        # pip: Landmark da base do dedo
+
+        finger1_tip_x, finger1_tip_y = hand_landmarks.landmark[finger1[3]].x, hand_landmarks.landmark[finger1[3]].y
+        finger2_tip_x, finger2_tip_y = hand_landmarks.landmark[finger2[3]].x, hand_landmarks.landmark[finger2[3]].y
+        
+        finger1_pip_x, finger1_pip_y = hand_landmarks.landmark[finger1[2]].x, hand_landmarks.landmark[finger1[2]].y
+        finger2_pip_x, finger2_pip_y = hand_landmarks.landmark[finger2[2]].x, hand_landmarks.landmark[finger2[2]].y
+
+        distance_tips = math.sqrt((finger2_tip_x - finger1_tip_x) ** 2 + (finger2_tip_y - finger1_tip_y) ** 2)
+        distance_pips = math.sqrt((finger2_pip_x - finger1_pip_x) ** 2 + (finger2_pip_y - finger1_pip_y) ** 2)
+
+        percentage_difference = abs(distance_tips - distance_pips) / min(distance_tips, distance_pips) * 100
+
+        return percentage_difference <= min_percentage_difference
+
+    def __is_index_bent(self) -> bool:
+        """
+        Verifica se o dedo indicador está dobrado.
+
+        Returns:
+            bool: True se o indicador estiver dobrado.
+            bool: False caso contrário.
+        """
+        return False
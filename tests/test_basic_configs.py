@@ -0,0 +1,40 @@
+from src.data.configs.basic.basic_configs_manager import BasicConfigManager
+import threading
+import json
+import os
+
+def lock_livre_em_outra_thread() -> bool:
+    resultado = []
+
+    def tentar():
+        adquirido = BasicConfigManager.lock.acquire(timeout=0.5)
+        if adquirido:
+            BasicConfigManager.lock.release()
+        resultado.append(adquirido)
+
+    thread = threading.Thread(target=tentar)
+    thread.start()
+    thread.join()
+    return resultado[0]
+
+def test_callbacks_rodam_fora_do_lock_quando_o_valor_nao_muda(monkeypatch):
+    # Inscritos isolados e sem o watcher, para a mudança externa ser vista só pelo `update_atribute`
+    monkeypatch.setattr(BasicConfigManager, "subscribers", {})
+    monkeypatch.setattr(BasicConfigManager, "watcher_thread", threading.current_thread())
+
+    altura = BasicConfigManager.read_atribute("webcam_height")
+    chamadas = []
+    BasicConfigManager.subscribe("webcam_width", lambda atributo, valor: chamadas.append((valor, lock_livre_em_outra_thread())))
+    chamadas.clear()
+
+    # Alteração externa do arquivo, detectada na próxima verificação do mtime
+    with open(BasicConfigManager.config_file) as arquivo:
+        config = json.load(arquivo)
+    config["webcam_width"] = 1234
+    with open(BasicConfigManager.config_file, "w") as arquivo:
+        json.dump(config, arquivo)
+    os.utime(BasicConfigManager.config_file, ns=(BasicConfigManager.cache_mtime + 10**9,) * 2)
+    monkeypatch.setattr(BasicConfigManager, "ultima_verificacao", float("-inf"))
+
+    BasicConfigManager.update_atribute("webcam_height", altura)
+    assert chamadas == [(1234, True)]
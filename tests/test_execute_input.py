@@ -0,0 +1,66 @@
+from src.inputs.input_backend import RecordingInputBackend, InputEvent, EVENTO_TECLA, EVENTO_BOTAO
+from src.inputs.execute_input import ExecuteInput
+from src.inputs.mouse import Mouse
+import pytest
+
+@pytest.fixture
+def execute_input():
+    backend = RecordingInputBackend()
+    executor = ExecuteInput(backend)
+    yield executor
+    executor.executor.shutdown()
+
+def segurar(execute_input: ExecuteInput, bind: str) -> None:
+    """
+    Deixa `bind` pressionada, como no meio de um input em modo toggle.
+    """
+    execute_input.backend.enviar(execute_input._criar_eventos(bind, True))
+    execute_input.ultimo_input_code = bind
+    execute_input.input_em_andamento = True
+
+def eventos(execute_input: ExecuteInput) -> list:
+    return [gravado.evento for gravado in execute_input.backend.eventos()]
+
+def test_input_libera_anterior_e_pressiona_no_mesmo_lote(execute_input):
+    segurar(execute_input, "a")
+    execute_input._simular_input("m1", 0, False)
+
+    gravados = execute_input.backend.eventos()
+    assert [gravado.evento for gravado in gravados] == [
+        InputEvent(EVENTO_TECLA, "a", True),
+        InputEvent(EVENTO_TECLA, "a", False),
+        InputEvent(EVENTO_BOTAO, "m1", True),
+        InputEvent(EVENTO_BOTAO, "m1", False),
+    ]
+    assert gravados[1].lote == gravados[2].lote
+    assert not execute_input.input_em_andamento
+
+@pytest.mark.parametrize("bind", ["m3", "M3"])
+def test_bind_rejeitada_libera_a_tecla_pressionada(execute_input, bind):
+    segurar(execute_input, "a")
+
+    with pytest.raises(ValueError):
+        execute_input._simular_input(bind, 0, False)
+
+    assert eventos(execute_input) == [InputEvent(EVENTO_TECLA, "a", True), InputEvent(EVENTO_TECLA, "a", False)]
+    assert not execute_input.input_em_andamento
+
+def test_bind_maiuscula(execute_input):
+    segurar(execute_input, "a")
+    execute_input._simular_input("B", 0, False)
+
+    assert eventos(execute_input)[1:] == [
+        InputEvent(EVENTO_TECLA, "a", False),
+        InputEvent(EVENTO_TECLA, "b", True),
+        InputEvent(EVENTO_TECLA, "b", False),
+    ]
+
+def test_dimensoes_webcam_invalidas_sao_ignoradas(execute_input):
+    largura = Mouse.webcam_width
+    Mouse.atualizar_dimensoes_webcam("webcam_width", "")
+    Mouse.atualizar_dimensoes_webcam("webcam_width", None)
+    assert Mouse.webcam_width == largura
+
+    Mouse.atualizar_dimensoes_webcam("webcam_width", "1280")
+    assert Mouse.webcam_width == 1280
+    Mouse.atualizar_dimensoes_webcam("webcam_width", largura)
@@ -0,0 +1,56 @@
+from src.pipeline.frame_slot import FrameSlot
+from src.camera.camera_manager import Camera
+from src.camera.frame_source import SyntheticSource
+import threading
+import asyncio
+
+def test_reabrir_recomeca_a_sequencia():
+    slot = FrameSlot()
+    for i in range(5):
+        slot.publicar(i)
+    slot.fechar()
+    assert slot.aguardar(5, timeout=0.1) == (5, None)
+
+    slot.reabrir()
+    # Um consumidor novo (ultimo_seq = 0) espera o primeiro item da nova execução
+    assert slot.aguardar(0, timeout=0.05) == (0, None)
+    assert slot.publicar("novo") == 1
+    assert slot.aguardar(0, timeout=0.1) == (1, "novo")
+
+async def rodar(camera: Camera, segundos: float) -> dict:
+    await camera.start()
+    await asyncio.sleep(segundos)
+    camera.stop()
+    return camera.get_metricas()
+
+def test_camera_parar_e_iniciar_recomeca_as_contagens():
+    camera = Camera(SyntheticSource(320, 240, fps=30.0))
+    camera.fps_render = 0
+
+    primeira = asyncio.run(rodar(camera, 1.0))
+    segunda = asyncio.run(rodar(camera, 0.5))
+
+    assert primeira["frames_capturados"] > 10
+    # A segunda execução conta só os próprios frames, e nenhum frame da anterior vira descartado
+    assert 0 < segunda["frames_capturados"] < primeira["frames_capturados"]
+    assert segunda["frames_descartados"]["inferencia"] < segunda["frames_capturados"]
+    assert segunda["inferencia_ms"]["total"] > primeira["inferencia_ms"]["total"]
+
+def threads_vivas(prefixo: str) -> int:
+    return sum(thread.name.startswith(prefixo) for thread in threading.enumerate())
+
+def test_camera_parar_encerra_as_threads_da_interpretacao():
+    camera = Camera(SyntheticSource(320, 240, fps=30.0))
+    camera.fps_render = 0
+
+    for _ in range(3):
+        asyncio.run(rodar(camera, 0.3))
+        assert threads_vivas("interpretador-") == 0
+        assert threads_vivas("inputs-") == 0
+
+    async def iniciar():
+        await camera.start()
+        assert threads_vivas("interpretador-") == 2
+        assert threads_vivas("inputs-") == 1
+        camera.stop()
+    asyncio.run(iniciar())
@@ -0,0 +1,98 @@
+from src.gestures.gesture_features import GestureFeatureExtractor
+from src.gestures.gesture_matcher import GestureMatcher, FEATURES_ESTATICAS
+from legacy_features import LegacyFeatureExtractor
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+# Mão direita aberta, de frente para a câmera, em coordenadas normalizadas (y crescendo para baixo)
+MAO_ABERTA = [
+    (0.50, 0.80),                                           # Pulso
+    (0.44, 0.76), (0.40, 0.72), (0.36, 0.68), (0.32, 0.64), # Dedão
+    (0.45, 0.62), (0.44, 0.54), (0.43, 0.48), (0.42, 0.42), # Indicador
+    (0.50, 0.61), (0.50, 0.52), (0.50, 0.46), (0.50, 0.40), # Médio
+    (0.55, 0.62), (0.56, 0.54), (0.57, 0.48), (0.58, 0.42), # Anelar
+    (0.59, 0.65), (0.61, 0.57), (0.62, 0.53), (0.63, 0.49), # Mínimo
+]
+
+def mao(**alteracoes) -> np.ndarray:
+    """
+    Cria uma mão a partir da mão aberta, substituindo os landmarks passados como `l<índice>=(x, y)`.
+    """
+    pontos = np.zeros((21, 3), dtype=np.float32)
+    pontos[:, :2] = MAO_ABERTA
+    for nome, xy in alteracoes.items():
+        pontos[int(nome[1:]), :2] = xy
+    return pontos
+
+def como_landmark_list(pontos: np.ndarray):
+    return SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in pontos])
+
+# Na mão fechada, as pontas dos dedos ficam dentro da palma
+MAO_FECHADA = dict(l3=(0.47, 0.70), l4=(0.50, 0.68), l6=(0.45, 0.58), l7=(0.46, 0.64), l8=(0.46, 0.68),
+                   l10=(0.50, 0.57), l11=(0.51, 0.64), l12=(0.51, 0.68), l14=(0.55, 0.58), l15=(0.55, 0.64),
+                   l16=(0.55, 0.68), l18=(0.60, 0.60), l19=(0.59, 0.65), l20=(0.58, 0.68))
+
+POSES = {
+    "aberta": mao(),
+    "fechada": mao(**MAO_FECHADA),
+    "apontando_para_baixo": mao(**{f"l{i}": (x, 1.6 - y) for i, (x, y) in enumerate(MAO_ABERTA) if i}),
+    "indicador_cruza_medio": mao(l8=(0.53, 0.42)),
+    "anelar_cruza_minimo": mao(l16=(0.66, 0.44)),
+    "indicador_e_medio_juntos": mao(l8=(0.43, 0.42)),
+    # Dedão dobrado sobre a palma até a ponta do médio: cruza o indicador e toca o médio
+    "dedao_toca_medio": mao(l3=(0.42, 0.55), l4=(0.49, 0.42)),
+    # Dedão cruzando o indicador sem tocar o médio
+    "dedao_cruza_indicador": mao(l3=(0.42, 0.62), l4=(0.47, 0.52)),
+    # Dedão e indicador sobre a mesma reta vertical (orientação exatamente zero, coordenadas exatas em float32):
+    # sobrepostos, a interseção vem só dos casos especiais de colinearidade; separados, não há interseção.
+    "dedao_colinear_sobreposto": mao(l1=(0.375, 0.75), l2=(0.375, 0.6875), l3=(0.375, 0.625), l4=(0.375, 0.5),
+                                     l5=(0.375, 0.625), l6=(0.375, 0.5), l7=(0.375, 0.375), l8=(0.375, 0.25)),
+    "dedao_colinear_separado": mao(l1=(0.375, 0.75), l2=(0.375, 0.6875), l3=(0.375, 0.625), l4=(0.375, 0.5),
+                                   l5=(0.375, 0.4375), l6=(0.375, 0.375), l7=(0.375, 0.3125), l8=(0.375, 0.25)),
+}
+
+@pytest.fixture(scope="module")
+def extractor():
+    return GestureFeatureExtractor()
+
+@pytest.mark.parametrize("nome", POSES)
+def test_paridade_com_a_extracao_anterior(extractor, nome):
+    pontos = POSES[nome]
+    assert extractor.extrair(pontos) == LegacyFeatureExtractor().extrair(como_landmark_list(pontos))
+
+def test_lote_igual_a_extracao_por_mao(extractor):
+    lote = np.stack(list(POSES.values()))
+    matcher = GestureMatcher({}, {})
+    legacy = LegacyFeatureExtractor()
+
+    esperado = [matcher.codificar_features(legacy.extrair(como_landmark_list(pontos))) for pontos in lote]
+    assert extractor.extrair_mascaras(lote).tolist() == esperado
+
+def test_poses_cobrem_os_dois_valores_de_cada_feature(extractor):
+    valores = {feature: set() for feature in FEATURES_ESTATICAS}
+    for pontos in POSES.values():
+        for feature, valor in LegacyFeatureExtractor().extrair(como_landmark_list(pontos)).items():
+            if feature in valores:
+                valores[feature].add(valor)
+
+    # bent_index ainda não é calculado: é sempre False nas duas implementações
+    assert valores.pop("bent_index") == {False}
+    assert {feature: v for feature, v in valores.items() if v != {True, False}} == {}
+
+def test_colinearidade_decide_o_cruzamento_do_dedao(extractor):
+    assert extractor.extrair(POSES["dedao_colinear_sobreposto"])["thumb_cross_index"] is True
+    assert extractor.extrair(POSES["dedao_colinear_separado"])["thumb_cross_index"] is False
+
+@pytest.mark.parametrize("alteracoes", [
+    dict(l8=(0.50, 0.40)),                      # Pontas do indicador e do médio na mesma posição
+    dict(l7=(0.50, 0.46)),                      # "Pips" na mesma posição
+    dict(l7=(0.50, 0.46), l8=(0.50, 0.40)),     # Os dois
+])
+def test_dedos_juntos_sem_distancia_nao_estao_juntos(extractor, alteracoes):
+    pontos = mao(**alteracoes)
+    with pytest.raises(ZeroDivisionError):
+        LegacyFeatureExtractor().extrair(como_landmark_list(pontos))
+
+    assert extractor.extrair(pontos)["index_and_middle_together"] is False
+    assert not extractor.extrair_lote(pontos[np.newaxis]).any(axis=0)[FEATURES_ESTATICAS.index("index_and_middle_together")]
@@ -0,0 +1,25 @@
+from src.gestures.inference_stride import InferenceStrideConfig
+import pytest
+
+@pytest.mark.parametrize("valor, esperado", [
+    (False, False), (True, True), ("false", False), ("0", False), (0, False), ("true", True), (1, True),
+])
+def test_adaptativo_convertido(valor, esperado):
+    assert InferenceStrideConfig.from_config({"stride": 2, "adaptativo": valor}).adaptativo is esperado
+
+@pytest.mark.parametrize("valor", ["no", "talvez", 2, None])
+def test_adaptativo_invalido(valor):
+    with pytest.raises(ValueError):
+        InferenceStrideConfig.from_config({"stride": 2, "adaptativo": valor})
+
+def test_stride_inteiro_aceita_float_sem_fracao():
+    config = InferenceStrideConfig.from_config({"stride": 2.0, "stride_max": 6.0})
+    assert (config.stride, config.stride_max) == (2, 6)
+    assert isinstance(config.stride, int) and isinstance(config.stride_max, int)
+
+@pytest.mark.parametrize("campos", [
+    {"stride": 2.5}, {"stride_max": 4.7}, {"stride": "2"}, {"stride": True}, {"stride_max": None},
+])
+def test_stride_nao_inteiro_invalido(campos):
+    with pytest.raises(ValueError):
+        InferenceStrideConfig.from_config(campos)
@@ -0,0 +1,44 @@
+from src.logger.logger import Logger, RateLimitFilter
+from logging.handlers import QueueHandler
+import threading
+import logging
+import uuid
+
+def ler_log(nome_arquivo: str) -> str:
+    with open(f"src/data/logs/{nome_arquivo}", encoding="utf-8") as arquivo:
+        return arquivo.read()
+
+def test_registros_depois_de_encerrar_vao_direto_para_o_arquivo(monkeypatch):
+    # O pytest instala handlers no logger raiz, e o Logger só adiciona os próprios a loggers sem handlers
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    logger = Logger._configure_logger("teste_encerrar", "teste_encerrar.log")
+    antes, depois, novo = (f"marca-{uuid.uuid4()}" for _ in range(3))
+
+    logger.info(antes)
+    Logger.encerrar()
+    logger.info(depois)
+    logger_novo = Logger._configure_logger("teste_encerrar_novo", "teste_encerrar_novo.log")
+    logger_novo.info(novo)
+
+    assert not any(isinstance(handler, QueueHandler) for handler in logger.handlers + logger_novo.handlers)
+    assert Logger._fila.empty()
+    conteudo = ler_log("teste_encerrar.log")
+    assert antes in conteudo and depois in conteudo
+    assert novo in ler_log("teste_encerrar_novo.log")
+
+def test_rate_limit_conta_certo_entre_threads():
+    filtro = RateLimitFilter(limite=10, janela=60.0)
+    aceitas = []
+
+    def registrar():
+        record = logging.LogRecord("teste", logging.INFO, "arquivo.py", 1, "mensagem", None, None)
+        aceitas.append(sum(filtro.filter(record) for _ in range(2000)))
+
+    threads = [threading.Thread(target=registrar) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(aceitas) == 10
+    assert filtro.suprimidas == 8 * 2000 - 10
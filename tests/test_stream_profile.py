@@ -0,0 +1,30 @@
+from src.camera.stream_profile import StreamProfile, AdaptiveStreamController, NIVEIS_ADAPTATIVOS, FPS_MINIMO
+import pytest
+
+def descer_ate_o_fim(controller: AdaptiveStreamController) -> None:
+    for _ in range(len(NIVEIS_ADAPTATIVOS) * controller.frames_para_descer):
+        controller.atualizar(1000.0, 1)
+
+def test_fps_nunca_passa_do_max_fps():
+    controller = AdaptiveStreamController(StreamProfile.from_config({"max_fps": 2}))
+    assert controller.configuracao.fps == 2.0
+
+    descer_ate_o_fim(controller)
+    assert controller.nivel == len(NIVEIS_ADAPTATIVOS) - 1
+    assert controller.configuracao.fps <= 2.0
+
+def test_fps_respeita_o_piso():
+    controller = AdaptiveStreamController(StreamProfile.from_config({"max_fps": 8}))
+    descer_ate_o_fim(controller)
+    assert controller.configuracao.fps == FPS_MINIMO
+
+@pytest.mark.parametrize("valor, esperado", [
+    (False, False), (True, True), ("false", False), ("False", False), ("0", False), (0, False), ("true", True), (1, True),
+])
+def test_adaptativo_convertido(valor, esperado):
+    assert StreamProfile.from_config({"adaptativo": valor}).adaptativo is esperado
+
+@pytest.mark.parametrize("valor", ["talvez", 2, None, [True]])
+def test_adaptativo_invalido(valor):
+    with pytest.raises(ValueError):
+        StreamProfile.from_config({"adaptativo": valor})
@@ -0,0 +1,30 @@
+from src.telemetry.telemetry_recorder import TelemetryRecorder, EVENTO, TIPO_GESTO, MAOS, FLAG_RECONHECIDO
+from src.telemetry.telemetry_reader import TelemetryReader
+import time
+import os
+
+NOME_LONGO = "Gesto_de_sauda_çao"   # 19 bytes em UTF-8, com o "ç" (2 bytes) cruzando o limite de 16
+
+def test_nome_de_gesto_nao_ascii_cortado_em_limite_de_caractere(tmp_path):
+    caminho = os.path.join(tmp_path, "telemetria.bin")
+    recorder = TelemetryRecorder(caminho, capacidade=16)
+    agora = time.perf_counter()
+    recorder.registrar_gesto(1, agora, "Right", 0, NOME_LONGO, False)
+    recorder.registrar_gesto(2, agora + 0.03, "Right", 0, "Olá", True)
+    recorder.fechar()
+
+    trechos = TelemetryReader(caminho).linha_do_tempo("Right")
+    assert [trecho.gesto for trecho in trechos] == ["Gesto_de_sauda_", "Olá"]
+    assert len(NOME_LONGO.encode("utf-8")) > EVENTO["gesto"].itemsize
+
+def test_leitor_tolera_nome_cortado_no_meio_de_um_caractere(tmp_path):
+    caminho = os.path.join(tmp_path, "telemetria.bin")
+    recorder = TelemetryRecorder(caminho, capacidade=16)
+    # Um arquivo gravado antes do corte em limite de caractere: os 16 primeiros bytes terminam no meio do "ç"
+    recorder.eventos[0] = (time.time(), 1, TIPO_GESTO, MAOS["Right"], 0, FLAG_RECONHECIDO, 0.0, 0.0, 0, NOME_LONGO.encode("utf-8")[:16])
+    recorder.escritos = 1
+    recorder.cabecalho["escritos"] = 1
+    recorder.fechar()
+
+    trechos = TelemetryReader(caminho).linha_do_tempo("Right")
+    assert [trecho.gesto for trecho in trechos] == ["Gesto_de_sauda_�"]